@@ -0,0 +1,10 @@
+"""Reproducible benchmarks for baobaobot hot paths (``python -m benchmarks.run``)
+and the end-to-end load harness (``python -m benchmarks.load``)."""
+
+import sys
+from pathlib import Path
+
+# Run from a source checkout without installing the package
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
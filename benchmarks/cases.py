@@ -0,0 +1,309 @@
+"""Benchmark cases for the bot's hot paths.
+
+Each case is registered with ``@case(name)`` and is a (possibly async)
+setup function ``(root, scale) -> Bench``.  Setup builds fixtures under
+*root* and is not timed; ``Bench.run`` is what gets timed, with
+``Bench.before`` (also untimed) called ahead of every run to reset or
+advance state.  ``Bench.items`` is the unit of work per run, used to
+report a per-item time.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Awaitable, Callable
+
+from . import fixtures
+from .fake_tmux import FakeTmuxManager
+
+_REPO = Path(__file__).resolve().parent.parent
+_BIN_DIR = _REPO / "src" / "baobaobot" / "workspace" / "bin"
+
+
+@dataclass
+class Bench:
+    run: Callable[[], Any]
+    items: int = 1
+    before: Callable[[], Any] | None = None
+    # Upper bound on timed runs (for cases that take seconds per run)
+    max_repeat: int | None = None
+
+
+Setup = Callable[[Path, float], "Bench | Awaitable[Bench]"]
+CASES: dict[str, Setup] = {}
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    def register(fn: Setup) -> Setup:
+        CASES[name] = fn
+        return fn
+
+    return register
+
+
+def _n(base: int, scale: float, minimum: int = 1) -> int:
+    return max(minimum, int(base * scale))
+
+
+def _load_memory_common() -> ModuleType:
+    """Import the stdlib-only bin helper module (it is not part of the package)."""
+    spec = importlib.util.spec_from_file_location(
+        "_bench_memory_common", _BIN_DIR / "_memory_common.py"
+    )
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# ---------------------------------------------------------------------------
+# Transcript parsing
+# ---------------------------------------------------------------------------
+
+
+@case("transcript.parse_entries")
+def _parse_entries(root: Path, scale: float) -> Bench:
+    from baobaobot.transcript_parser import TranscriptParser
+
+    entries = fixtures.claude_entries(_n(20_000, scale, 50))
+    return Bench(run=lambda: TranscriptParser.parse_entries(entries), items=len(entries))
+
+
+@case("gemini.parse_session")
+def _gemini_parse(root: Path, scale: float) -> Bench:
+    from baobaobot.backends.gemini_parser import GeminiTranscriptParser
+
+    raw = json.dumps(fixtures.gemini_session(_n(5_000, scale, 20)))
+
+    def run() -> None:
+        data = GeminiTranscriptParser.parse_session_json(raw)
+        assert data is not None
+        GeminiTranscriptParser.parse_entries(data["messages"])
+
+    return Bench(run=run, items=_n(5_000, scale, 20))
+
+
+@case("markdown.convert")
+def _convert_markdown(root: Path, scale: float) -> Bench:
+    from baobaobot.markdown_v2 import convert_markdown
+
+    rng = fixtures._rng(10)
+    texts = [fixtures.markdown_reply(rng, 8) for _ in range(_n(200, scale, 5))]
+
+    def run() -> None:
+        for t in texts:
+            convert_markdown(t)
+
+    return Bench(run=run, items=len(texts))
+
+
+# ---------------------------------------------------------------------------
+# Session monitor / history
+# ---------------------------------------------------------------------------
+
+
+@case("monitor.check_for_updates")
+async def _check_for_updates(root: Path, scale: float) -> Bench:
+    from baobaobot.session_monitor import SessionMonitor
+
+    n_active = 10
+    cwds = [root / "work" / f"ws{i}" for i in range(n_active)]
+    for c in cwds:
+        c.mkdir(parents=True)
+    projects = root / "projects"
+    active = fixtures.projects_tree(projects, _n(2_000, scale, n_active + 1), cwds)
+
+    tmux = FakeTmuxManager()
+    for i, c in enumerate(cwds):
+        tmux.add_window(f"@{i}", f"bench/ws{i}", str(c))
+    monitor = SessionMonitor(
+        tmux_manager=tmux,  # type: ignore[arg-type]
+        session_manager=SimpleNamespace(window_states={}),  # type: ignore[arg-type]
+        session_map_file=root / "session_map.json",
+        tmux_session_name="bench",
+        poll_interval=1.0,
+        state_file=root / "monitor_state.json",
+        agent_name="bench",
+    )
+    monitor.projects_path = projects
+    sids = set(active)
+    await monitor.check_for_updates(sids)  # start tracking at end of file
+
+    new_per_tick = 20
+    tick = [0]
+
+    def before() -> None:
+        # Each poll sees a fresh batch of entries in every active transcript
+        tick[0] += 1
+        for n, (sid, path) in enumerate(active.items()):
+            fixtures.write_jsonl(
+                path,
+                fixtures.claude_entries(
+                    new_per_tick, session_id=sid, salt=tick[0] * 1000 + n
+                ),
+                append=True,
+            )
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + tick[0] * 1_000_000))
+
+    async def run() -> None:
+        await monitor.check_for_updates(sids)
+
+    return Bench(run=run, before=before, items=n_active * new_per_tick)
+
+
+@case("session.get_recent_messages")
+async def _get_recent_messages(root: Path, scale: float) -> Bench:
+    from baobaobot.session import SessionManager
+
+    path = root / "history" / "session.jsonl"
+    n = _n(20_000, scale, 50)
+    fixtures.write_jsonl(path, fixtures.claude_entries(n))
+
+    sm = SessionManager(
+        state_file=root / "state.json",
+        session_map_file=root / "session_map.json",
+        tmux_session_name="bench",
+        tmux_manager=None,  # type: ignore[arg-type]
+    )
+
+    async def _resolve(window_id: str) -> Any:
+        return SimpleNamespace(file_path=str(path))
+
+    sm.resolve_session_for_window = _resolve  # type: ignore[method-assign]
+
+    async def run() -> None:
+        await sm.get_recent_messages("@1")
+
+    return Bench(run=run, items=n)
+
+
+# ---------------------------------------------------------------------------
+# Memory
+# ---------------------------------------------------------------------------
+
+
+def _memory_setup(root: Path, scale: float) -> tuple[ModuleType, Path, list[Path]]:
+    os.environ["BAOBAOBOT_EMBEDDING_PROVIDER"] = "hash"
+    mc = _load_memory_common()
+    ws = root / "workspace_bench"
+    files = fixtures.memory_workspace(ws, _n(100_000, scale, 500))
+    return mc, ws, files
+
+
+@case("memory.sync_workspace_full")
+def _sync_full(root: Path, scale: float) -> Bench:
+    mc, ws, _files = _memory_setup(root, scale)
+    n_lines = _n(100_000, scale, 500)
+
+    def before() -> None:
+        for name in ("memory.db", "memory.db-wal", "memory.db-shm"):
+            (ws / name).unlink(missing_ok=True)
+
+    def run() -> None:
+        conn = mc.connect_db(ws)
+        try:
+            mc.sync_workspace(conn, ws)
+        finally:
+            conn.close()
+
+    return Bench(run=run, before=before, items=n_lines, max_repeat=3)
+
+
+@case("memory.sync_workspace_incremental")
+def _sync_incremental(root: Path, scale: float) -> Bench:
+    mc, ws, files = _memory_setup(root, scale)
+    conn = mc.connect_db(ws)
+    mc.sync_workspace(conn, ws)
+    counter = [0]
+
+    def before() -> None:
+        # One changed daily file, the common case after a memory-append
+        counter[0] += 1
+        with files[0].open("a", encoding="utf-8") as f:
+            f.write(f"- appended line {counter[0]}\n")
+
+    return Bench(run=lambda: mc.sync_workspace(conn, ws), before=before)
+
+
+@case("memory.search_hybrid")
+def _search_hybrid(root: Path, scale: float) -> Bench:
+    mc, ws, _files = _memory_setup(root, scale)
+    conn = mc.connect_db(ws)
+    mc.sync_workspace(conn, ws)
+    mc._compute_embeddings(conn, timeout=3600)
+    queries = fixtures.memory_queries(20)
+
+    def run() -> None:
+        for q in queries:
+            mc.search(conn, q, mode="hybrid")
+
+    return Bench(run=run, items=len(queries))
+
+
+# ---------------------------------------------------------------------------
+# Rendering / status polling
+# ---------------------------------------------------------------------------
+
+
+@case("screenshot.text_to_image")
+async def _text_to_image(root: Path, scale: float) -> Bench:
+    from baobaobot.screenshot import text_to_image
+
+    pane = fixtures.claude_pane(ansi=True)
+
+    async def run() -> None:
+        await text_to_image(pane, with_ansi=True)
+
+    return Bench(run=run)
+
+
+@case("status_polling.tick")
+async def _status_tick(root: Path, scale: float) -> Bench:
+    from baobaobot.agent_context import InteractiveUIState, MessageQueueState
+    from baobaobot.backends import create_backend
+    from baobaobot.handlers.message_queue import MessageQueue
+    from baobaobot.handlers.status_polling import update_status_message
+
+    n_windows = _n(20, scale, 2)
+    tmux = FakeTmuxManager()
+    windows = [tmux.add_window(f"@{i}", f"bench/ws{i}", "/tmp") for i in range(n_windows)]
+    variants = [
+        {w.window_id: fixtures.claude_pane(salt=v * 100 + i) for i, w in enumerate(windows)}
+        for v in range(4)
+    ]
+    backend = create_backend("claude")
+    queue_state = MessageQueueState()
+    for i in range(n_windows):
+        # Pre-created queues: status updates are enqueued, not sent
+        queue_state.queues[i] = MessageQueue()
+    agent_ctx = SimpleNamespace(
+        session_manager=SimpleNamespace(),
+        tmux_manager=tmux,
+        queue_state=queue_state,
+        ui_state=InteractiveUIState(),
+        get_window_backend=lambda wid: backend,
+    )
+    tick = [0]
+
+    def before() -> None:
+        # Panes change between ticks, as they do while the agent works
+        tick[0] += 1
+        tmux.panes.update(variants[tick[0] % len(variants)])
+
+    async def run() -> None:
+        for i, w in enumerate(windows):
+            await update_status_message(
+                None,  # type: ignore[arg-type]
+                i,
+                w.window_id,
+                thread_id=i,
+                agent_ctx=agent_ctx,  # type: ignore[arg-type]
+            )
+
+    return Bench(run=run, before=before, items=n_windows)
@@ -0,0 +1,211 @@
+"""Local fake of the Telegram Bot API for load tests.
+
+Serves ``/bot<token>/<method>`` like api.telegram.org, so a real
+``telegram.Bot`` (and everything built on it) can point its ``base_url``
+here.  Write methods (``send*``/``edit*``) pay a configurable latency and
+go through token-bucket flood limits modelled on Telegram's published
+guidance; over the limit they get the same 429 + ``retry_after`` reply
+Telegram sends, which PTB surfaces as ``RetryAfter``.
+
+Every call is counted per method, and reply markers written by
+``TranscriptWriter`` are timestamped on arrival to measure delivery
+latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass
+
+from aiohttp import web
+
+from .fake_tmux import DeliveryLog
+
+_MARKER_RE = re.compile(r"zq\d+x\d+qz")
+
+
+@dataclass(frozen=True)
+class FloodLimits:
+    """Approximations of Telegram's bot limits (per bot token)."""
+
+    global_per_sec: float = 30.0  # across all chats
+    chat_per_sec: float = 1.0  # one private chat
+    group_per_min: float = 20.0  # one group / forum (all topics together)
+    chat_burst: int = 5  # short bursts Telegram tolerates per chat
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Round-trip time added to every write call (uniform mean ± jitter)."""
+
+    mean: float = 0.08
+    jitter: float = 0.04
+
+
+class _Bucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def wait(self) -> float:
+        """Refill; return 0 if a token is available, else seconds until one is."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+def _is_write(method: str) -> bool:
+    return (method.startswith("send") and method != "sendChatAction") or method.startswith(
+        "edit"
+    )
+
+
+class FakeBotAPI:
+    """aiohttp server standing in for api.telegram.org."""
+
+    def __init__(
+        self,
+        log: DeliveryLog | None = None,
+        *,
+        limits: FloodLimits | None = None,
+        latency: Latency | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.log = log or DeliveryLog()
+        self.limits = limits or FloodLimits()
+        self.latency = latency or Latency()
+        self.calls: collections.Counter[str] = collections.Counter()
+        self.rate_limited: collections.Counter[str] = collections.Counter()
+        self._rng = random.Random(seed)
+        self._global = _Bucket(self.limits.global_per_sec, self.limits.global_per_sec)
+        self._chats: dict[int, _Bucket] = {}
+        self._message_ids: dict[int, int] = collections.defaultdict(int)
+        self._runner: web.AppRunner | None = None
+        self.port = 0
+
+        self._app = web.Application()
+        self._app.router.add_route("*", "/bot{token}/{method}", self._handle)
+
+    @property
+    def base_url(self) -> str:
+        """Value for ``telegram.Bot(base_url=...)``."""
+        return f"http://127.0.0.1:{self.port}/bot"
+
+    async def start(self) -> None:
+        runner = self._runner = web.AppRunner(self._app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        self.port = runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # --- flood control ---
+
+    def _chat_bucket(self, chat_id: int) -> _Bucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            rate = (
+                self.limits.group_per_min / 60.0
+                if chat_id < 0
+                else self.limits.chat_per_sec
+            )
+            bucket = self._chats[chat_id] = _Bucket(rate, self.limits.chat_burst)
+        return bucket
+
+    def _retry_after(self, chat_id: int) -> int:
+        chat = self._chat_bucket(chat_id)
+        wait = max(self._global.wait(), chat.wait())
+        if wait:
+            # A rejected write must not use up either bucket
+            return math.ceil(wait)
+        self._global.take()
+        chat.take()
+        return 0
+
+    # --- request handling ---
+
+    async def _params(self, request: web.Request) -> dict[str, str]:
+        if request.content_type == "application/json":
+            body = await request.json()
+            return {k: v if isinstance(v, str) else json.dumps(v) for k, v in body.items()}
+        form = await request.post()
+        return {k: v for k, v in form.items() if isinstance(v, str)}
+
+    def _message(self, params: dict[str, str], chat_id: int, message_id: int) -> dict:
+        msg: dict = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "supergroup" if chat_id < 0 else "private"},
+        }
+        if "text" in params:
+            msg["text"] = params["text"]
+        if "caption" in params:
+            msg["caption"] = params["caption"]
+        if "message_thread_id" in params:
+            msg["message_thread_id"] = int(params["message_thread_id"])
+            msg["is_topic_message"] = True
+        return msg
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        params = await self._params(request)
+        self.calls[method] += 1
+        chat_id = int(params.get("chat_id", "0") or 0)
+
+        if _is_write(method):
+            retry_after = self._retry_after(chat_id)
+            if retry_after:
+                self.rate_limited[method] += 1
+                return web.json_response(
+                    {
+                        "ok": False,
+                        "error_code": 429,
+                        "description": f"Too Many Requests: retry after {retry_after}",
+                        "parameters": {"retry_after": retry_after},
+                    },
+                    status=429,
+                )
+            lat = self.latency
+            await asyncio.sleep(
+                max(0.0, self._rng.uniform(lat.mean - lat.jitter, lat.mean + lat.jitter))
+            )
+            now = time.monotonic()
+            for tag in _MARKER_RE.findall(params.get("text", "") + params.get("caption", "")):
+                self.log.delivered.setdefault(tag, now)
+
+        return web.json_response({"ok": True, "result": self._result(method, params, chat_id)})
+
+    def _result(self, method: str, params: dict[str, str], chat_id: int) -> object:
+        if method == "getMe":
+            return {
+                "id": 1,
+                "is_bot": True,
+                "first_name": "Fake",
+                "username": "fake_bot",
+                "can_join_groups": True,
+                "can_read_all_group_messages": True,
+                "supports_inline_queries": False,
+            }
+        if method.startswith("send") and method != "sendChatAction":
+            self._message_ids[chat_id] += 1
+            return self._message(params, chat_id, self._message_ids[chat_id])
+        if method.startswith("edit"):
+            return self._message(params, chat_id, int(params.get("message_id", "0") or 0))
+        return True
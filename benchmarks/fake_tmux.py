@@ -0,0 +1,200 @@
+"""In-process stand-ins for tmux and the agent CLI writing its transcript.
+
+``FakeTmuxManager`` implements the TmuxManager methods the monitor, the
+status poller and the message pipeline call, backed by a dict of scriptable
+panes.  ``TranscriptWriter`` plays one agent session: it appends Claude
+JSONL turns to the session file and updates the pane's spinner line, and
+tags every assistant reply with a unique marker so the fake Bot API can
+measure when it was delivered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from baobaobot.tmux_manager import TmuxWindow
+
+from . import fixtures
+
+
+class FakeTmuxManager:
+    """Just enough of TmuxManager, with panes set by the caller."""
+
+    def __init__(self) -> None:
+        self.windows: dict[str, TmuxWindow] = {}
+        self.panes: dict[str, str] = {}
+        self.sent_keys: list[tuple[str, str]] = []
+        self.calls: dict[str, int] = {}
+
+    def _count(self, op: str) -> None:
+        self.calls[op] = self.calls.get(op, 0) + 1
+
+    def add_window(self, window_id: str, name: str, cwd: str, pane: str = "") -> TmuxWindow:
+        window = TmuxWindow(window_id=window_id, window_name=name, cwd=cwd)
+        self.windows[window_id] = window
+        self.panes[window_id] = pane
+        return window
+
+    def set_pane(self, window_id: str, text: str) -> None:
+        self.panes[window_id] = text
+
+    async def list_windows(self) -> list[TmuxWindow]:
+        self._count("list_windows")
+        return list(self.windows.values())
+
+    async def find_window_by_id(self, window_id: str) -> TmuxWindow | None:
+        self._count("find_window_by_id")
+        return self.windows.get(window_id)
+
+    async def find_window_by_name(self, window_name: str) -> TmuxWindow | None:
+        self._count("find_window_by_name")
+        return next(
+            (w for w in self.windows.values() if w.window_name == window_name), None
+        )
+
+    async def capture_pane(self, window_id: str, with_ansi: bool = False) -> str | None:
+        self._count("capture_pane")
+        return self.panes.get(window_id)
+
+    async def send_keys(
+        self, window_id: str, text: str, enter: bool = True, literal: bool = True
+    ) -> bool:
+        self._count("send_keys")
+        self.sent_keys.append((window_id, text))
+        return window_id in self.windows
+
+    async def rename_window(self, window_id: str, new_name: str) -> bool:
+        self._count("rename_window")
+        window = self.windows.get(window_id)
+        if window is not None:
+            window.window_name = new_name
+        return window is not None
+
+    async def kill_window(self, window_id: str) -> bool:
+        self._count("kill_window")
+        self.panes.pop(window_id, None)
+        return self.windows.pop(window_id, None) is not None
+
+
+@dataclass
+class Topic:
+    """One simulated Telegram topic bound to one fake agent window."""
+
+    index: int
+    user_id: int
+    chat_id: int
+    thread_id: int
+    window_id: str
+    session_id: str
+    cwd: Path
+    transcript: Path
+
+
+@dataclass
+class DeliveryLog:
+    """Marker → write time, filled by writers and matched by the fake API."""
+
+    written: dict[str, float] = field(default_factory=dict)
+    delivered: dict[str, float] = field(default_factory=dict)
+
+    def latencies(self) -> list[float]:
+        return [
+            self.delivered[m] - t for m, t in self.written.items() if m in self.delivered
+        ]
+
+
+def marker(topic: int, seq: int) -> str:
+    # Letters and digits only: survives MarkdownV2 escaping unchanged
+    return f"zq{topic}x{seq}qz"
+
+
+class TranscriptWriter:
+    """Appends agent turns to one topic's transcript at a fixed rate."""
+
+    def __init__(
+        self,
+        topic: Topic,
+        tmux: FakeTmuxManager,
+        log: DeliveryLog,
+        *,
+        interval: float,
+        tools_per_turn: int = 1,
+        seed: int = 0,
+    ) -> None:
+        self.topic = topic
+        self._tmux = tmux
+        self._log = log
+        self._interval = interval
+        self._tools_per_turn = tools_per_turn
+        self._rng = random.Random(fixtures.SEED + seed)
+        self._seq = 0
+        self.turns = 0
+
+    def _entry(self, msg_type: str, content: list) -> dict:
+        return {
+            "type": msg_type,
+            "message": {"content": content},
+            "sessionId": self.topic.session_id,
+            "cwd": str(self.topic.cwd),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        }
+
+    def write_turn(self) -> str:
+        """Append one turn (tool calls + a tagged reply); return its marker."""
+        rng = self._rng
+        entries: list[dict] = []
+        for _ in range(self._tools_per_turn):
+            self._seq += 1
+            tool_id = f"toolu_{self.topic.index}_{self._seq}"
+            entries.append(
+                self._entry(
+                    "assistant",
+                    [
+                        {
+                            "type": "tool_use",
+                            "id": tool_id,
+                            "name": "Read",
+                            "input": {"file_path": f"/src/{rng.choice(fixtures._WORDS)}.py"},
+                        }
+                    ],
+                )
+            )
+            entries.append(
+                self._entry(
+                    "user",
+                    [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tool_id,
+                            "content": fixtures.sentence(rng, 30),
+                        }
+                    ],
+                )
+            )
+        self._seq += 1
+        tag = marker(self.topic.index, self._seq)
+        text = f"{tag} {fixtures.markdown_reply(rng, 2)}"
+        entries.append(self._entry("assistant", [{"type": "text", "text": text}]))
+
+        with self.topic.transcript.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries))
+        self._log.written[tag] = time.monotonic()
+        self._tmux.set_pane(
+            self.topic.window_id, fixtures.claude_pane(salt=self.topic.index * 1000 + self._seq)
+        )
+        self.turns += 1
+        return tag
+
+    async def run(self, duration: float) -> None:
+        """Write turns every ``interval`` for *duration* seconds."""
+        # Spread topics over the first interval instead of writing in lockstep
+        await asyncio.sleep(self._rng.uniform(0, self._interval))
+        deadline = time.monotonic() + duration
+        while time.monotonic() < deadline:
+            self.write_turn()
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,253 @@
+"""Synthetic, seeded fixture generators for the benchmark suite.
+
+Everything is generated from a fixed ``random.Random`` seed so two runs (or
+two commits) time exactly the same inputs.  Sizes are given explicitly by
+the cases in ``cases.py``, which scale them with ``--scale``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+SEED = 20260218
+
+_WORDS = [
+    "".join(random.Random(SEED + i).choices(string.ascii_lowercase, k=3 + i % 7))
+    for i in range(2000)
+]
+_TOOLS = ["Read", "Edit", "Bash", "Grep", "Glob", "Write", "WebFetch"]
+
+
+def _rng(salt: int = 0) -> random.Random:
+    return random.Random(SEED + salt)
+
+
+def sentence(rng: random.Random, n_words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n_words))
+
+
+def markdown_reply(rng: random.Random, paragraphs: int = 8) -> str:
+    """An assistant reply with headings, lists, inline code and a code block."""
+    parts: list[str] = []
+    for i in range(paragraphs):
+        if i % 4 == 0:
+            parts.append(f"## {sentence(rng, 3).title()}")
+        parts.append(
+            f"{sentence(rng, 20)} `{rng.choice(_WORDS)}()` **{rng.choice(_WORDS)}** "
+            f"_{rng.choice(_WORDS)}_ [link](https://example.com/{rng.choice(_WORDS)})."
+        )
+        if i % 3 == 1:
+            parts.append("\n".join(f"- {sentence(rng, 6)}" for _ in range(4)))
+        if i % 4 == 2:
+            body = "\n".join(
+                f"    {rng.choice(_WORDS)} = {rng.choice(_WORDS)}({rng.randint(0, 99)})"
+                for _ in range(6)
+            )
+            parts.append(f"```python\ndef {rng.choice(_WORDS)}():\n{body}\n```")
+    return "\n\n".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Claude JSONL transcripts
+# ---------------------------------------------------------------------------
+
+
+def claude_entries(
+    n: int, *, session_id: str = "bench-session", cwd: str = "/tmp/bench", salt: int = 0
+) -> list[dict]:
+    """*n* Claude Code transcript entries: turns of user text, thinking,
+    assistant text and tool_use/tool_result pairs."""
+    rng = _rng(salt)
+    entries: list[dict] = []
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    def _entry(msg_type: str, content: list | str) -> dict:
+        return {
+            "type": msg_type,
+            "message": {"content": content},
+            "sessionId": session_id,
+            "cwd": cwd,
+            "timestamp": ts,
+        }
+
+    tool_seq = 0
+    while len(entries) < n:
+        entries.append(_entry("user", [{"type": "text", "text": sentence(rng, 15)}]))
+        entries.append(
+            _entry("assistant", [{"type": "thinking", "thinking": sentence(rng, 30)}])
+        )
+        for _ in range(rng.randint(1, 3)):
+            tool_seq += 1
+            tool_id = f"toolu_{salt}_{tool_seq}"
+            name = rng.choice(_TOOLS)
+            entries.append(
+                _entry(
+                    "assistant",
+                    [
+                        {
+                            "type": "tool_use",
+                            "id": tool_id,
+                            "name": name,
+                            "input": {"file_path": f"/src/{rng.choice(_WORDS)}.py"},
+                        }
+                    ],
+                )
+            )
+            entries.append(
+                _entry(
+                    "user",
+                    [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tool_id,
+                            "content": "\n".join(sentence(rng, 10) for _ in range(8)),
+                        }
+                    ],
+                )
+            )
+        entries.append(
+            _entry("assistant", [{"type": "text", "text": markdown_reply(rng, 4)}])
+        )
+    return entries[:n]
+
+
+def write_jsonl(path: Path, entries: list[dict], *, append: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a" if append else "w", encoding="utf-8") as f:
+        for e in entries:
+            f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Gemini chat JSON
+# ---------------------------------------------------------------------------
+
+
+def gemini_session(n_messages: int, *, session_id: str = "bench-gemini") -> dict:
+    """A Gemini CLI chat file (single JSON document) with *n_messages*."""
+    rng = _rng(1)
+    messages: list[dict] = []
+    for i in range(n_messages):
+        if i % 2 == 0:
+            messages.append({"id": f"m{i}", "type": "user", "content": sentence(rng, 15)})
+        else:
+            messages.append(
+                {
+                    "id": f"m{i}",
+                    "type": "gemini",
+                    "content": markdown_reply(rng, 3),
+                    "thoughts": [
+                        {"subject": sentence(rng, 3), "description": sentence(rng, 25)}
+                    ],
+                }
+            )
+    return {"sessionId": session_id, "messages": messages}
+
+
+# ---------------------------------------------------------------------------
+# Claude projects directory
+# ---------------------------------------------------------------------------
+
+
+def projects_tree(
+    root: Path,
+    n_projects: int,
+    active_cwds: list[Path],
+    *,
+    entries_per_session: int = 20,
+) -> dict[str, Path]:
+    """Create ``root/-<cwd>/<sid>.jsonl`` project dirs like ~/.claude/projects.
+
+    The first ``len(active_cwds)`` projects belong to *active_cwds*; the rest
+    are idle history.  Returns ``{session_id: transcript_path}`` for the
+    active ones.
+    """
+    active: dict[str, Path] = {}
+    for i in range(n_projects):
+        cwd = str(active_cwds[i]) if i < len(active_cwds) else f"/home/bench/proj{i}"
+        sid = f"{i:08d}-bench-0000-0000-000000000000"
+        project_dir = root / cwd.replace("/", "-")
+        path = project_dir / f"{sid}.jsonl"
+        write_jsonl(
+            path, claude_entries(entries_per_session, session_id=sid, cwd=cwd, salt=i)
+        )
+        (project_dir / "sessions-index.json").write_text(
+            json.dumps(
+                {
+                    "originalPath": cwd,
+                    "entries": [
+                        {"sessionId": sid, "fullPath": str(path), "projectPath": cwd}
+                    ],
+                }
+            )
+        )
+        if i < len(active_cwds):
+            active[sid] = path
+    return active
+
+
+# ---------------------------------------------------------------------------
+# Memory store
+# ---------------------------------------------------------------------------
+
+
+def memory_workspace(ws: Path, n_lines: int, *, lines_per_day: int = 250) -> list[Path]:
+    """Daily memory files totalling *n_lines* bullet lines (plus headings)."""
+    rng = _rng(2)
+    files: list[Path] = []
+    day = date(2026, 2, 18)
+    written = 0
+    while written < n_lines:
+        count = min(lines_per_day, n_lines - written)
+        path = ws / "memory" / "daily" / day.strftime("%Y-%m") / f"{day.isoformat()}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines: list[str] = []
+        for j in range(count):
+            if j % 10 == 0:
+                lines.append(f"\n## {sentence(rng, 2).title()}")
+            tag = f" #{rng.choice(_WORDS[:50])}" if j % 7 == 0 else ""
+            lines.append(f"- {sentence(rng, rng.randint(6, 18))}{tag}")
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        files.append(path)
+        written += count
+        day -= timedelta(days=1)
+    return files
+
+
+def memory_queries(n: int) -> list[str]:
+    rng = _rng(3)
+    return [" ".join(rng.choice(_WORDS[:400]) for _ in range(2)) for _ in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# tmux panes
+# ---------------------------------------------------------------------------
+
+
+def claude_pane(salt: int = 0, *, rows: int = 50, ansi: bool = False) -> str:
+    """A captured Claude Code pane: output, a spinner status line and the
+    input box chrome."""
+    rng = _rng(100 + salt)
+    body = [sentence(rng, rng.randint(4, 14)) for _ in range(rows - 6)]
+    if ansi:
+        body = [
+            f"\x1b[3{i % 7 + 1}m{line}\x1b[0m" if i % 3 == 0 else line
+            for i, line in enumerate(body)
+        ]
+    return "\n".join(
+        body
+        + [
+            f"✻ {rng.choice(['Reading', 'Thinking', 'Editing'])} {rng.choice(_WORDS)}… "
+            f"({rng.randint(1, 90)}s · esc to interrupt)",
+            "",
+            "─" * 80,
+            "> ",
+            "─" * 80,
+            "  ? for shortcuts",
+        ]
+    )
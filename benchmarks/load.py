@@ -0,0 +1,349 @@
+"""End-to-end load test: many topics streaming through the real pipeline.
+
+Drives the real SessionMonitor, ``handle_new_message``, per-user message
+queues and the status poller against in-process fakes for tmux and agent
+transcripts (``fake_tmux``) and a local fake Bot API with flood limits and
+latency (``fake_bot_api``).  Each scenario reports delivery latency
+percentiles (transcript write → Bot API request) and API call counts.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.load                    # all scenarios except smoke
+    python -m benchmarks.load steady --json out.json
+    python -m benchmarks.load burst --topics 20 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from telegram import Bot
+from telegram.request import HTTPXRequest
+
+from baobaobot.agent_context import AgentContext
+from baobaobot.backends import create_backend
+from baobaobot.bot import handle_new_message
+from baobaobot.handlers.message_queue import shutdown_workers
+from baobaobot.handlers.status_polling import status_poll_loop
+from baobaobot.routers import create_router
+from baobaobot.session import SessionManager
+from baobaobot.session_monitor import SessionMonitor
+from baobaobot.settings import AgentConfig
+
+from . import fixtures
+from .fake_bot_api import FakeBotAPI, FloodLimits, Latency
+from .fake_tmux import DeliveryLog, FakeTmuxManager, Topic, TranscriptWriter
+from .run import SCHEMA, _git_info
+
+_TMUX_SESSION = "load"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    topics: int = 50
+    users: int = 1
+    chats: int = 1  # forum groups the topics are spread over
+    duration: float = 30.0  # seconds of transcript writing
+    turn_interval: float = 5.0  # seconds between turns, per topic
+    tools_per_turn: int = 1
+    poll_interval: float = 2.0  # SessionMonitor poll interval
+    drain_timeout: float = 60.0  # wait for outstanding replies after writing
+    limits: FloodLimits = field(default_factory=FloodLimits)
+    latency: Latency = field(default_factory=Latency)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    # One user, one forum group, 50 topics replying every 5s
+    "steady": Scenario("steady"),
+    # Same load over 10 users in 10 groups (separate queues and chat limits)
+    "spread": Scenario("spread", users=10, chats=10),
+    # Every topic replying every second
+    "burst": Scenario("burst", turn_interval=1.0, duration=10.0),
+    # Tiny, fast scenario for CI
+    "smoke": Scenario(
+        "smoke",
+        topics=3,
+        duration=1.0,
+        turn_interval=0.5,
+        tools_per_turn=0,
+        poll_interval=0.2,
+        drain_timeout=20.0,
+        limits=FloodLimits(group_per_min=6000.0, chat_burst=100),
+        latency=Latency(mean=0.005, jitter=0.0),
+    ),
+}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of *values* (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(q * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+async def _wait_until(predicate: Callable[[], bool], timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(0.05)
+    return True
+
+
+def _build_context(
+    root: Path, sc: Scenario, tmux: FakeTmuxManager
+) -> AgentContext:
+    """An AgentContext like create_agent_context's, on fake tmux and a temp tree."""
+    users = frozenset(1000 + u for u in range(sc.users))
+    config = AgentConfig(
+        name="load",
+        allowed_users=users,
+        tmux_session_name=_TMUX_SESSION,
+        config_dir=root,
+        agent_dir=root / "agents" / "load",
+        monitor_poll_interval=sc.poll_interval,
+    )
+    config.agent_dir.mkdir(parents=True, exist_ok=True)
+    backend = create_backend("claude")
+    backend.projects_path = root / "projects"  # type: ignore[misc]
+    session_mgr = SessionManager(
+        state_file=config.state_file,
+        session_map_file=config.session_map_file,
+        tmux_session_name=_TMUX_SESSION,
+        backend=backend,  # type: ignore[arg-type]
+        tmux_manager=tmux,  # type: ignore[arg-type]
+        agent_name=config.name,
+    )
+    return AgentContext(
+        config=config,
+        backend=backend,
+        tmux_manager=tmux,  # type: ignore[arg-type]
+        session_manager=session_mgr,
+        router=create_router("forum"),
+    )
+
+
+def _create_topics(
+    root: Path, sc: Scenario, tmux: FakeTmuxManager, ctx: AgentContext
+) -> list[Topic]:
+    """Windows, transcripts, thread bindings and session_map for each topic."""
+    sm = ctx.session_manager
+    session_map: dict[str, dict[str, str]] = {}
+    topics: list[Topic] = []
+    for i in range(sc.topics):
+        cwd = root / "work" / f"topic{i}"
+        cwd.mkdir(parents=True)
+        sid = f"{i:08d}-load-0000-0000-000000000000"
+        transcript = root / "projects" / str(cwd).replace("/", "-") / f"{sid}.jsonl"
+        fixtures.write_jsonl(
+            transcript, fixtures.claude_entries(1, session_id=sid, cwd=str(cwd), salt=i)
+        )
+        topic = Topic(
+            index=i,
+            user_id=1000 + i % sc.users,
+            chat_id=-1_000_000 - i % sc.chats,
+            thread_id=100 + i,
+            window_id=f"@{i + 1}",
+            session_id=sid,
+            cwd=cwd,
+            transcript=transcript,
+        )
+        name = f"{ctx.config.name}/topic{i}"
+        tmux.add_window(topic.window_id, name, str(cwd), fixtures.claude_pane(salt=i))
+        sm.bind_thread(topic.user_id, topic.thread_id, topic.window_id, name)
+        sm.set_group_chat_id(topic.user_id, topic.thread_id, topic.chat_id)
+        session_map[f"{_TMUX_SESSION}:{topic.window_id}"] = {
+            "session_id": sid,
+            "cwd": str(cwd),
+            "window_name": name,
+        }
+        topics.append(topic)
+    ctx.config.session_map_file.write_text(json.dumps(session_map))
+    return topics
+
+
+async def run_scenario(sc: Scenario, root: Path) -> dict[str, Any]:
+    log = DeliveryLog()
+    api = FakeBotAPI(log, limits=sc.limits, latency=sc.latency)
+    await api.start()
+    tmux = FakeTmuxManager()
+    ctx = _build_context(root, sc, tmux)
+    topics = _create_topics(root, sc, tmux, ctx)
+
+    bot = Bot(
+        "123456:LOADTEST",
+        base_url=api.base_url,
+        request=HTTPXRequest(connection_pool_size=64, pool_timeout=30.0),
+    )
+    await bot.initialize()
+
+    monitor = SessionMonitor(
+        tmux_manager=tmux,  # type: ignore[arg-type]
+        session_manager=ctx.session_manager,
+        session_map_file=ctx.config.session_map_file,
+        tmux_session_name=_TMUX_SESSION,
+        poll_interval=sc.poll_interval,
+        state_file=ctx.config.monitor_state_file,
+        agent_name=ctx.config.name,
+        backend=ctx.backend,  # type: ignore[arg-type]
+    )
+
+    async def message_callback(msg: Any) -> None:
+        await handle_new_message(msg, bot, ctx)
+
+    monitor.set_message_callback(message_callback)
+    monitor.start()
+    ctx.session_monitor = monitor
+    poller = asyncio.create_task(status_poll_loop(bot, agent_ctx=ctx))
+
+    try:
+        # New sessions are tracked from end-of-file; write only after that
+        ready = await _wait_until(
+            lambda: all(monitor.state.get_session(t.session_id) for t in topics),
+            timeout=max(10.0, sc.poll_interval * 5),
+        )
+        if not ready:
+            raise RuntimeError("SessionMonitor did not pick up the topics")
+
+        writers = [
+            TranscriptWriter(
+                t,
+                tmux,
+                log,
+                interval=sc.turn_interval,
+                tools_per_turn=sc.tools_per_turn,
+                seed=t.index,
+            )
+            for t in topics
+        ]
+        started = time.monotonic()
+        await asyncio.gather(*(w.run(sc.duration) for w in writers))
+        written_until = time.monotonic()
+        drained = await _wait_until(
+            lambda: len(log.delivered) >= len(log.written), sc.drain_timeout
+        )
+        finished = time.monotonic()
+    finally:
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+        monitor.stop()
+        await shutdown_workers(ctx)
+        ctx.session_manager.flush_state()
+        await bot.shutdown()
+        await api.stop()
+
+    latencies = log.latencies()
+    return {
+        "name": sc.name,
+        "topics": sc.topics,
+        "users": sc.users,
+        "chats": sc.chats,
+        "duration": sc.duration,
+        "turn_interval": sc.turn_interval,
+        "poll_interval": sc.poll_interval,
+        "written": len(log.written),
+        "delivered": len(log.delivered),
+        "drained": drained,
+        "drain_seconds": finished - written_until,
+        "elapsed": finished - started,
+        "latency": {
+            "p50": _percentile(latencies, 0.50),
+            "p90": _percentile(latencies, 0.90),
+            "p99": _percentile(latencies, 0.99),
+            "max": max(latencies, default=0.0),
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+        },
+        "api_calls": dict(sorted(api.calls.items())),
+        "rate_limited": dict(sorted(api.rate_limited.items())),
+        "tmux_calls": dict(sorted(tmux.calls.items())),
+    }
+
+
+def _format(r: dict[str, Any]) -> str:
+    lat = r["latency"]
+    calls = r["api_calls"]
+    writes = sum(n for m, n in calls.items() if m.startswith(("send", "edit")))
+    limited = sum(r["rate_limited"].values())
+    return (
+        f"{r['name']}: {r['delivered']}/{r['written']} replies delivered"
+        f"{'' if r['drained'] else ' (drain timed out)'}\n"
+        f"  latency p50 {lat['p50']:.2f}s · p90 {lat['p90']:.2f}s · "
+        f"p99 {lat['p99']:.2f}s · max {lat['max']:.2f}s\n"
+        f"  api calls {sum(calls.values())} (writes {writes}, 429s {limited}): "
+        + ", ".join(f"{m} {n}" for m, n in calls.items())
+    )
+
+
+async def run_all(scenarios: list[Scenario]) -> list[dict[str, Any]]:
+    results = []
+    for sc in scenarios:
+        with tempfile.TemporaryDirectory(prefix="baobaobot-load-") as tmp:
+            result = await run_scenario(sc, Path(tmp).resolve())
+        print(_format(result), flush=True)
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description="End-to-end load test against fake tmux and a fake Bot API.",
+    )
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"Scenarios to run ({', '.join(SCENARIOS)})"
+    )
+    parser.add_argument("--topics", type=int, help="Override topics per scenario")
+    parser.add_argument("--duration", type=float, help="Override seconds of writing")
+    parser.add_argument("--json", type=Path, help="Write results JSON here")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show bot logs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    names = args.scenarios or [n for n in SCENARIOS if n != "smoke"]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    overrides: dict[str, Any] = {}
+    if args.topics:
+        overrides["topics"] = args.topics
+    if args.duration:
+        overrides["duration"] = args.duration
+    scenarios = [dataclasses.replace(SCENARIOS[n], **overrides) for n in names]
+
+    results = asyncio.run(run_all(scenarios))
+    if args.json:
+        report = {
+            "schema": SCHEMA,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git": _git_info(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scenarios": results,
+        }
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
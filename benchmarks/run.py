@@ -0,0 +1,200 @@
+"""Run the benchmark suite and write machine-readable results.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.run                       # all cases, table to stdout
+    python -m benchmarks.run --json out.json       # also write results JSON
+    python -m benchmarks.run --only memory --scale 0.1
+    python -m benchmarks.run --compare base.json   # exit 1 on regression
+
+Fixtures are generated from a fixed seed into a temporary directory, so
+results from two commits time identical inputs and can be compared with
+``--compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from . import cases
+
+SCHEMA = 1
+
+
+def _git_info() -> dict[str, Any]:
+    repo = Path(__file__).resolve().parent.parent
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=repo, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+
+    try:
+        return {
+            "commit": git("rev-parse", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        }
+    except (OSError, subprocess.SubprocessError):
+        return {"commit": "", "dirty": None}
+
+
+async def _call(fn: Any) -> None:
+    result = fn()
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _run_case(
+    name: str, root: Path, scale: float, repeat: int, warmup: int
+) -> dict[str, Any]:
+    setup = cases.CASES[name]
+    bench = setup(root, scale)
+    if inspect.isawaitable(bench):
+        bench = await bench
+    if bench.max_repeat is not None:
+        repeat = min(repeat, bench.max_repeat)
+
+    timings: list[float] = []
+    for i in range(warmup + repeat):
+        if bench.before is not None:
+            await _call(bench.before)
+        start = time.perf_counter()
+        await _call(bench.run)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+
+    median = statistics.median(timings)
+    return {
+        "name": name,
+        "runs": len(timings),
+        "min": min(timings),
+        "median": median,
+        "mean": statistics.fmean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "items": bench.items,
+        "per_item": median / bench.items,
+    }
+
+
+async def run_suite(
+    names: list[str], scale: float, repeat: int, warmup: int
+) -> list[dict[str, Any]]:
+    results = []
+    for name in names:
+        with tempfile.TemporaryDirectory(prefix="baobaobot-bench-") as tmp:
+            result = await _run_case(name, Path(tmp), scale, repeat, warmup)
+        print(_format_row(result), flush=True)
+        results.append(result)
+    return results
+
+
+def _fmt_time(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:8.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.1f} us"
+
+
+def _format_row(r: dict[str, Any]) -> str:
+    return (
+        f"{r['name']:<36} median {_fmt_time(r['median'])}  "
+        f"min {_fmt_time(r['min'])}  per item {_fmt_time(r['per_item'])}  "
+        f"(n={r['runs']}, items={r['items']})"
+    )
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print median ratios against *baseline*; return names that regressed."""
+    base = {r["name"]: r for r in baseline.get("results", [])}
+    if baseline.get("scale") is not None:
+        print(f"\nComparing against {baseline.get('git', {}).get('commit', '?')[:12]}"
+              f" (scale {baseline['scale']})")
+    regressed: list[str] = []
+    for r in results:
+        old = base.get(r["name"])
+        if old is None or not old.get("median"):
+            print(f"  {r['name']:<36} (no baseline)")
+            continue
+        ratio = r["median"] / old["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressed.append(r["name"])
+        print(f"  {r['name']:<36} {ratio:6.2f}x{flag}")
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run", description="Run baobaobot benchmarks."
+    )
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Multiply fixture sizes (default 1.0)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per case")
+    parser.add_argument("--only", action="append", default=[],
+                        help="Run cases whose name contains this (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    parser.add_argument("--json", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Regression threshold for --compare (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(cases.CASES))
+        return 0
+
+    names = [
+        n for n in cases.CASES if not args.only or any(o in n for o in args.only)
+    ]
+    if not names:
+        parser.error("no benchmark matches --only")
+
+    # The memory scripts must never call out to an embedding API here
+    os.environ.setdefault("BAOBAOBOT_EMBEDDING_PROVIDER", "hash")
+    results = asyncio.run(
+        run_suite(names, args.scale, max(1, args.repeat), max(0, args.warmup))
+    )
+
+    report = {
+        "schema": SCHEMA,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git": _git_info(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline.get("scale") != args.scale:
+            print(f"warning: baseline scale {baseline.get('scale')} != {args.scale}",
+                  file=sys.stderr)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from .backends.base import Backend
     from .cron.service import CronService
+    from .memory.embedding_backfill import EmbeddingBackfill
     from .router import Router
     from .session import SessionManager
     from .session_monitor import SessionMonitor
@@ -33,18 +34,18 @@ class MessageQueueState:
     shared ``user_id`` keys.
     """
 
-    # user_id -> asyncio.Queue[MessageTask]
+    # user_id -> MessageQueue
     queues: dict[int, Any] = field(default_factory=dict)
     # user_id -> asyncio.Task
     workers: dict[int, Any] = field(default_factory=dict)
-    # user_id -> asyncio.Lock
-    locks: dict[int, Any] = field(default_factory=dict)
     # (tool_use_id, user_id, thread_id_or_0) -> telegram message_id
     tool_msg_ids: dict[tuple[str, int, int], int] = field(default_factory=dict)
     # (user_id, thread_id_or_0) -> (message_id, window_id, last_text)
     status_msg_info: dict[tuple[int, int], tuple[int, str, str]] = field(
         default_factory=dict
     )
+    # window_id -> (monotonic time, status line or None) last parsed by the poller
+    latest_status: dict[str, tuple[float, str | None]] = field(default_factory=dict)
 
 
 @dataclass
@@ -72,6 +73,7 @@ class AgentContext:
     session_monitor: SessionMonitor | None = None
     cron_service: CronService | None = None
     system_scheduler: SystemScheduler | None = None
+    embedding_backfill: EmbeddingBackfill | None = None
     share_server: ShareServer | None = None
     tunnel_manager: TunnelManager | None = None
 
@@ -99,6 +101,55 @@ class AgentContext:
         self._backend_cache[agent_type] = backend
         return backend
 
+    def collect_metrics(self) -> None:
+        """Refresh this agent's gauges in the metrics registry.
+
+        Registered as a collector in post_init, so values are read from the
+        owning services only when metrics are scraped.
+        """
+        from .metrics import QUEUE_DEPTH, registry
+
+        agent = self.config.name
+        QUEUE_DEPTH.set(
+            sum(q.qsize() for q in self.queue_state.queues.values()), agent=agent
+        )
+        if self.system_scheduler is not None:
+            stats = self.system_scheduler.headless_stats()
+            registry.gauge(
+                "baobaobot_headless_active", "Headless CLI jobs holding a slot"
+            ).set(stats["active"], agent=agent)  # type: ignore[arg-type]
+            registry.gauge(
+                "baobaobot_headless_queued", "Headless CLI jobs waiting for a slot"
+            ).set(stats["queued"], agent=agent)  # type: ignore[arg-type]
+        if self.cron_service is not None:
+            lag = self.cron_service.lag_stats()
+            registry.gauge(
+                "baobaobot_cron_lag_max_seconds", "Worst cron scheduling lag"
+            ).set(lag["max"], agent=agent)
+        if self.embedding_backfill is not None:
+            missing = registry.gauge(
+                "baobaobot_embedding_missing", "Paragraphs still missing embeddings"
+            )
+            embedded = registry.gauge(
+                "baobaobot_embedding_embedded", "Paragraphs with a current embedding"
+            )
+            running = registry.gauge(
+                "baobaobot_embedding_backfill_running",
+                "1 while a workspace is being backfilled",
+            )
+            failed = registry.gauge(
+                "baobaobot_embedding_backfill_error",
+                "1 if the last backfill pass for a workspace failed",
+            )
+            for gauge in (missing, embedded, running, failed):
+                gauge.remove(agent=agent)  # drop workspaces that went away
+            workspaces = self.embedding_backfill.stats()["workspaces"]
+            for ws, w in workspaces.items():  # type: ignore[union-attr]
+                missing.set(w["missing"], agent=agent, workspace=ws)
+                embedded.set(w["embedded"], agent=agent, workspace=ws)
+                running.set(1 if w["running"] else 0, agent=agent, workspace=ws)
+                failed.set(1 if w["error"] else 0, agent=agent, workspace=ws)
+
     def get_window_backend(self, window_id: str) -> Backend:
         """Resolve the Backend for a specific window.
 
@@ -37,6 +37,7 @@ import asyncio
 import io
 import logging
 import os
+import time
 import urllib.parse
 import uuid
 from datetime import datetime, timezone
@@ -87,6 +88,7 @@ from .handlers.callback_data import (
     CB_LS_PAGE,
     CB_LS_UP,
     CB_LS_VIEW,
+    CB_MEMORY_PAGE,
     CB_MENU_AGENT,
     CB_MENU_CONFIG,
     CB_MENU_SYSTEM,
@@ -128,7 +130,7 @@ from .handlers.message_sender import (
     safe_edit,
     safe_reply,
 )
-from .markdown_v2 import convert_markdown
+from .markdown_v2 import convert_markdown_async
 from .handlers.response_builder import build_response_parts
 from .handlers.status_polling import (
     clear_window_health,
@@ -154,7 +156,11 @@ from .handlers.persona_handler import (
     handle_edit_mode_message,
 )
 from .handlers.profile_handler import profile_command
-from .handlers.memory_handler import forget_command, memory_command
+from .handlers.memory_handler import (
+    forget_command,
+    handle_memory_search_callback,
+    memory_command,
+)
 from .handlers.verbosity_handler import (
     handle_verbosity_callback,
     should_skip_message,
@@ -1099,6 +1105,84 @@ def _resolve_tmp_dir(agent_ctx: AgentContext, window_id: str) -> Path | None:
     return tmp_dir
 
 
+# Minimum seconds between edits of the voice transcription preview
+_VOICE_PREVIEW_INTERVAL = 2.0
+
+
+async def _edit_preview(message: Message, text: str, **kwargs: object) -> bool:
+    """Edit a sent message with MarkdownV2, falling back to plain text.
+
+    Returns False if the message could not be edited at all.
+    """
+    try:
+        await message.edit_text(
+            await convert_markdown_async(text),
+            parse_mode="MarkdownV2",
+            link_preview_options=NO_LINK_PREVIEW,
+            **kwargs,  # type: ignore[arg-type]
+        )
+    except Exception:
+        try:
+            await message.edit_text(
+                text, link_preview_options=NO_LINK_PREVIEW, **kwargs  # type: ignore[arg-type]
+            )
+        except Exception as e:
+            logger.debug("Failed to edit preview message: %s", e)
+            return False
+    return True
+
+
+async def _transcribe_with_preview(
+    message: Message, path: Path, whisper_model: str
+) -> tuple[str | None, Message | None]:
+    """Transcribe a voice note, streaming progress into a preview reply.
+
+    The preview shows the queue position while waiting and the partial
+    transcript as segments arrive.  Returns ``(transcript, preview)``; the
+    preview is deleted when there is no transcript.
+    """
+    from .transcribe import submit_transcription
+
+    preview: Message | None = None
+    pending_edit: asyncio.Task[bool] | None = None
+    last_edit = 0.0
+
+    def _on_partial(text: str) -> None:
+        nonlocal pending_edit, last_edit
+        now = time.monotonic()
+        if preview is None or now - last_edit < _VOICE_PREVIEW_INTERVAL:
+            return
+        if pending_edit is not None and not pending_edit.done():
+            return
+        last_edit = now
+        snippet = text if len(text) <= 500 else "…" + text[-500:]
+        pending_edit = asyncio.create_task(
+            _edit_preview(preview, f"🎤 Transcribing…\n{snippet}")  # type: ignore[arg-type]
+        )
+
+    job = submit_transcription(path, whisper_model, on_partial=_on_partial)
+    if job is None:
+        return None, None
+
+    waiting = f" ({job.position} ahead in queue)" if job.position else ""
+    try:
+        preview = await safe_reply(message, f"🎤 Transcribing…{waiting}")
+    except Exception as e:
+        logger.debug("Voice preview failed: %s", e)
+    last_edit = time.monotonic()
+
+    transcript = await job.wait()
+    if pending_edit is not None:
+        await asyncio.gather(pending_edit, return_exceptions=True)
+    if not transcript and preview is not None:
+        try:
+            await preview.delete()
+        except Exception:
+            pass
+        preview = None
+    return transcript, preview
+
+
 async def file_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle photo/document/video/audio/voice — download to tmp/ and forward path to Claude."""
     user = update.effective_user
@@ -1222,10 +1306,8 @@ async def file_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
     # Voice message: attempt transcription before sending to Claude
     if msg.voice:
-        from .transcribe import transcribe_voice
-
-        transcript = await transcribe_voice(
-            dest, whisper_model=ctx.config.whisper_model
+        transcript, preview = await _transcribe_with_preview(
+            update.message, dest, ctx.config.whisper_model
         )
         if transcript:
             caption = msg.caption or ""
@@ -1266,11 +1348,14 @@ async def file_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
                     ]
                 ]
             )
-            await safe_reply(
-                update.message,
-                f"🎤 *Transcript:*\n{display}",
-                reply_markup=keyboard,
-            )
+            if preview is None or not await _edit_preview(
+                preview, f"🎤 *Transcript:*\n{display}", reply_markup=keyboard
+            ):
+                await safe_reply(
+                    update.message,
+                    f"🎤 *Transcript:*\n{display}",
+                    reply_markup=keyboard,
+                )
             return
 
     # Check caption for memory trigger words — delegate to Claude Code for analysis
@@ -1594,7 +1679,7 @@ async def _capture_bash_output(
                     await bot.edit_message_text(
                         chat_id=chat_id,
                         message_id=msg_id,
-                        text=convert_markdown(output),
+                        text=await convert_markdown_async(output),
                         parse_mode="MarkdownV2",
                         link_preview_options=NO_LINK_PREVIEW,
                     )
@@ -2091,6 +2176,10 @@ async def callback_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     elif data.startswith(CB_VERBOSITY):
         await handle_verbosity_callback(query, ctx)
 
+    # Memory search pagination
+    elif data.startswith(CB_MEMORY_PAGE):
+        await handle_memory_search_callback(query, context)
+
     # Heartbeat toggle
     elif data.startswith(CB_HEARTBEAT):
         from .handlers.heartbeat_handler import handle_heartbeat_callback
@@ -2753,6 +2842,8 @@ async def _deliver_message(
         thread_id: message_thread_id for replies (None in group mode).
     """
     sm = agent_ctx.session_manager
+    # msg is rebuilt below when markers are rewritten; keep the read time
+    written_at = msg.written_at
 
     # Handle interactive tools specially - capture terminal and send UI
     if msg.tool_name in INTERACTIVE_TOOL_NAMES and msg.content_type == "tool_use":
@@ -3063,6 +3154,7 @@ async def _deliver_message(
             text=msg.text,
             thread_id=thread_id,
             agent_ctx=agent_ctx,
+            written_at=written_at,
         )
 
         # Update read offset to current file position
@@ -3172,6 +3264,12 @@ async def post_init(application: Application) -> None:
                 _wscfg.set_agent_type(ws_path, resolved_at)
                 logger.info("Backfilled workspace.toml agent_type=%s for %s", resolved_at, ws_path)
 
+    # Load the whisper model in the background so the first voice note is fast
+    if agent_ctx.config.whisper_model:
+        from .transcribe import preload_model
+
+        preload_model(agent_ctx.config.whisper_model)
+
     # Per-window backend resolver (used by SessionManager, SessionMonitor, SystemScheduler)
     def _resolve_cli_backend(wid: str) -> TmuxCliBackend | None:
         b = agent_ctx.get_window_backend(wid)
@@ -3225,6 +3323,24 @@ async def post_init(application: Application) -> None:
         await agent_ctx.cron_service.start()
         logger.info("Cron service started")
 
+    # Backfill memory embeddings in the background (not inline in memory-search)
+    sched_cfg = agent_ctx.config.scheduler
+    if sched_cfg.embedding_backfill_interval > 0:
+        from .memory.embedding_backfill import EmbeddingBackfill
+
+        agent_ctx.embedding_backfill = EmbeddingBackfill(
+            agent_ctx.config.iter_workspace_dirs,
+            interval=sched_cfg.embedding_backfill_interval,
+            batch_timeout=sched_cfg.embedding_backfill_timeout,
+        )
+        await agent_ctx.embedding_backfill.start()
+        logger.info("Embedding backfill started")
+
+    # Queue depths and service counters are read on each metrics scrape
+    from .metrics import registry as _metrics_registry
+
+    _metrics_registry.add_collector(agent_ctx.collect_metrics)
+
     # Start share server + tunnel (only once across all agents — skip if already running)
     # Use a module-level flag (not env var, which may persist from parent process)
     # Clear stale env var from previous process on first init
@@ -3282,6 +3398,7 @@ async def post_init(application: Application) -> None:
                 port=_SHARE_PORT,
                 workspace_roots=workspace_roots,
                 on_upload=_on_upload,
+                share_config=agent_ctx.config.share,
             )
             await share_server.start()
             agent_ctx.share_server = share_server
@@ -3368,6 +3485,14 @@ async def post_shutdown(application: Application) -> None:
         await agent_ctx.cron_service.stop()
         logger.info("Cron service stopped")
 
+    if agent_ctx.embedding_backfill:
+        await agent_ctx.embedding_backfill.stop()
+        logger.info("Embedding backfill stopped")
+
+    from .metrics import registry as _metrics_registry
+
+    _metrics_registry.remove_collector(agent_ctx.collect_metrics)
+
     # Stop system scheduler
     if agent_ctx.system_scheduler:
         await agent_ctx.system_scheduler.stop()
@@ -3388,6 +3513,9 @@ async def post_shutdown(application: Application) -> None:
         runtime_file = agent_ctx.config.config_dir / ".runtime_env"
         runtime_file.unlink(missing_ok=True)
 
+    # Write out any debounced session state
+    agent_ctx.session_manager.flush_state()
+
 
 def create_bot(agent_ctx: AgentContext) -> Application:
     request = HTTPXRequest(
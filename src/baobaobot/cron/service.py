@@ -3,6 +3,10 @@
 Scans workspaces on startup, runs a single asyncio timer loop,
 and dispatches due jobs to tmux windows via session_manager.
 
+Enabled jobs are indexed in a min-heap keyed by next_run_at, so a tick only
+touches the jobs that are actually due. Mutated jobs are tracked per
+workspace and only those rows are written back.
+
 System tasks (hourly summary, consolidation, heartbeat) are handled
 by SystemScheduler, not CronService.
 """
@@ -10,6 +14,8 @@ by SystemScheduler, not CronService.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import shutil
 import time
@@ -20,7 +26,14 @@ from typing import TYPE_CHECKING, Callable
 
 from ..persona.profile import get_user_display_name
 from .schedule import compute_next_run
-from .store import cleanup_history, load_store, record_history, save_store, store_mtime
+from .store import (
+    cleanup_history,
+    load_store,
+    record_history,
+    save_changes,
+    store_mtime,
+    store_version,
+)
 from .types import CronJob, CronJobState, CronSchedule, CronStoreFile, WorkspaceMeta
 
 if TYPE_CHECKING:
@@ -36,6 +49,9 @@ _BACKOFF_SECONDS = [30, 60, 300, 900, 3600]
 # If a job has been running for more than this, consider it stuck
 _STUCK_TIMEOUT_S = 7200  # 2 hours
 
+# Log a warning when a scheduled run starts this many seconds late
+_LAG_WARN_S = 60.0
+
 # Maximum sleep between ticks
 _MAX_TICK_INTERVAL = 60.0
 
@@ -130,6 +146,27 @@ class CronService:
         self._stores: dict[str, CronStoreFile] = {}  # workspace_name → store
         self._workspace_dirs: dict[str, Path] = {}  # workspace_name → dir
         self._mtimes: dict[str, float] = {}  # workspace_name → last seen mtime
+        self._versions: dict[str, int] = {}  # workspace_name → last seen cron version
+        # Schedule heap of (next_run_at, seq, workspace_name, job). An entry is
+        # live only while _heap_seqs[ws][job.id] still equals its seq; stale
+        # entries are skipped when popped.
+        self._heap: list[tuple[float, int, str, CronJob]] = []
+        self._heap_seqs: dict[str, dict[str, int]] = {}
+        self._seq = itertools.count()
+        # Unsaved changes: workspace_name → {job_id: job} / deleted ids / meta
+        self._dirty: dict[str, dict[str, CronJob]] = {}
+        self._deleted: dict[str, set[str]] = {}
+        self._meta_dirty: set[str] = set()
+        # Concurrent dispatch: global and per-workspace slots, in-flight runs
+        self._global_slots = asyncio.Semaphore(max(1, self._cfg.cron_max_concurrent))
+        self._workspace_slots: dict[str, asyncio.Semaphore] = {}
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._inflight_per_ws: dict[str, int] = {}
+        # Scheduling lag (fire time − next_run_at) of scheduled runs
+        self._lag_count = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last = 0.0
         self._timer_task: asyncio.Task[None] | None = None
         self._running = False
         self._wake_event: asyncio.Event = asyncio.Event()
@@ -143,44 +180,38 @@ class CronService:
         now = time.time()
 
         # Catch-up: execute jobs that were due while bot was offline
-        # Cache resolved windows per workspace to avoid redundant recreation
-        catchup_count = 0
-        window_cache: dict[str, str | None] = {}
         for ws_name, store in self._stores.items():
             for job in store.jobs:
                 if not job.enabled:
                     continue
-                # Clear stuck jobs
+                if job.state.running_at:
+                    if (now - job.state.running_at) > _STUCK_TIMEOUT_S:
+                        # Clear stuck jobs
+                        job.state.last_status = "error"
+                        job.state.last_error = "stuck (timeout)"
+                        job.state.consecutive_errors += 1
+                    # Nothing survives a restart — don't wait out the stuck timeout
+                    job.state.running_at = None
+                    self._mark_dirty(ws_name, job)
+                # System consolidation: just reschedule on startup, don't catch up
                 if (
-                    job.state.running_at
-                    and (now - job.state.running_at) > _STUCK_TIMEOUT_S
+                    job.system
+                    and job.name == _SYSTEM_CONSOLIDATION_JOB_NAME
+                    and job.state.next_run_at
+                    and job.state.next_run_at < now
                 ):
-                    job.state.running_at = None
-                    job.state.last_status = "error"
-                    job.state.last_error = "stuck (timeout)"
-                    job.state.consecutive_errors += 1
-                # Catch up missed runs
-                if job.state.next_run_at and job.state.next_run_at < now:
-                    # System consolidation: just reschedule on startup, don't catch up
-                    if job.system and job.name == _SYSTEM_CONSOLIDATION_JOB_NAME:
-                        job.state.next_run_at = compute_next_run(
-                            job.schedule, time.time(), self._cron_default_tz
-                        )
-                        continue
-                    # Pre-resolve window once per workspace
-                    if ws_name not in window_cache:
-                        wid = self._resolve_window(ws_name)
-                        if not wid:
-                            wid = await self._recreate_window(ws_name)
-                        window_cache[ws_name] = wid
-                    catchup_count += 1
-                    await self._execute_job(
-                        ws_name, job, window_id=window_cache[ws_name]
+                    job.state.next_run_at = compute_next_run(
+                        job.schedule, time.time(), self._cron_default_tz
                     )
-            save_store(self._workspace_dirs[ws_name], store)
-
-        if catchup_count:
-            logger.info("Caught up %d missed cron job(s)", catchup_count)
+                    self._schedule(ws_name, job)
+                    self._mark_dirty(ws_name, job)
+
+        catchup = self._dispatch_due_jobs()
+        if catchup:
+            await asyncio.gather(*catchup)
+            logger.info("Caught up %d missed cron job(s)", len(catchup))
+        for ws_name in self._stores:
+            self._save(ws_name)
 
         self._running = True
         self._timer_task = asyncio.create_task(self._timer_loop())
@@ -200,11 +231,13 @@ class CronService:
             except asyncio.CancelledError:
                 pass
             self._timer_task = None
-        # Save all stores on shutdown
-        for ws_name, store in self._stores.items():
-            ws_dir = self._workspace_dirs.get(ws_name)
-            if ws_dir:
-                save_store(ws_dir, store)
+        for task in list(self._inflight):
+            task.cancel()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        # Flush any unsaved changes on shutdown
+        for ws_name in list(self._stores):
+            self._save(ws_name)
         logger.info("CronService stopped")
 
     # --- CRUD ---
@@ -222,6 +255,7 @@ class CronService:
         store = self._ensure_store(workspace_name)
         if meta:
             store.workspace_meta = meta
+            self._meta_dirty.add(workspace_name)
 
         now = time.time()
         job_id = uuid.uuid4().hex[:8]
@@ -241,6 +275,8 @@ class CronService:
             state=CronJobState(next_run_at=next_run),
         )
         store.jobs.append(job)
+        self._schedule(workspace_name, job)
+        self._mark_dirty(workspace_name, job)
         self._save(workspace_name)
         self._wake_timer()
         logger.info(
@@ -260,6 +296,7 @@ class CronService:
         before = len(store.jobs)
         store.jobs = [j for j in store.jobs if j.id != job_id]
         if len(store.jobs) < before:
+            self._mark_deleted(workspace_name, job_id)
             self._save(workspace_name)
             return True
         return False
@@ -281,6 +318,8 @@ class CronService:
             job.schedule, time.time(), self._cron_default_tz
         )
         job.state.consecutive_errors = 0
+        self._schedule(workspace_name, job)
+        self._mark_dirty(workspace_name, job)
         self._save(workspace_name)
         self._wake_timer()
         return job
@@ -292,6 +331,8 @@ class CronService:
             return None
         job.enabled = False
         job.updated_at = time.time()
+        self._schedule(workspace_name, job)
+        self._mark_dirty(workspace_name, job)
         self._save(workspace_name)
         return job
 
@@ -301,6 +342,8 @@ class CronService:
         if not job:
             return False
         await self._execute_job(workspace_name, job)
+        self._save(workspace_name)
+        self._wake_timer()
         return True
 
     # --- Timer loop ---
@@ -320,7 +363,7 @@ class CronService:
                 next_due = self._find_next_due_time()
 
                 if next_due is not None and next_due <= now:
-                    await self._execute_due_jobs()
+                    self._dispatch_due_jobs()
                     continue  # Immediately re-check
 
                 # Sleep until next due time (capped), interruptible by _wake_event
@@ -343,79 +386,157 @@ class CronService:
                 await asyncio.sleep(_MAX_TICK_INTERVAL)
 
     async def _execute_due_jobs(self) -> None:
-        """Scan all workspaces and execute due jobs."""
+        """Dispatch all due jobs and wait for them to finish."""
+        tasks = self._dispatch_due_jobs()
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def _dispatch_due_jobs(self) -> list[asyncio.Task[None]]:
+        """Pop due jobs off the schedule heap and start them concurrently.
+
+        Each run waits for a per-workspace slot (jobs in one workspace share
+        its tmux window) and then a global slot, so a workspace whose window
+        has to be recreated only delays its own jobs. Returns the started
+        tasks; the timer loop does not wait for them.
+        """
         now = time.time()
-        for ws_name, store in list(self._stores.items()):
-            jobs_to_delete: list[str] = []
-            for job in store.jobs:
-                if not job.enabled:
-                    continue
-                if job.state.running_at:
-                    # Check for stuck
-                    if (now - job.state.running_at) > _STUCK_TIMEOUT_S:
-                        job.state.running_at = None
-                        job.state.last_status = "error"
-                        job.state.last_error = "stuck (timeout)"
-                        job.state.consecutive_errors += 1
-                    continue
-                if job.state.next_run_at is None or job.state.next_run_at > now:
-                    continue
+        started: list[asyncio.Task[None]] = []
+        # Jobs that are due but must wait (running / backing off); re-queued
+        # after this pass so they are not popped again straight away
+        deferred: list[tuple[float, str, CronJob]] = []
+        touched: set[str] = set()
+
+        for ws_name, job in self._pop_due(now):
+            if job.state.running_at:
+                # Check for stuck
+                if (now - job.state.running_at) > _STUCK_TIMEOUT_S:
+                    job.state.running_at = None
+                    job.state.last_status = "error"
+                    job.state.last_error = "stuck (timeout)"
+                    job.state.consecutive_errors += 1
+                    self._mark_dirty(ws_name, job)
+                    touched.add(ws_name)
+                    deferred.append((now, ws_name, job))
+                else:
+                    deferred.append(
+                        (job.state.running_at + _STUCK_TIMEOUT_S, ws_name, job)
+                    )
+                continue
 
-                # Check backoff
-                backoff = _backoff_delay(job.state.consecutive_errors)
-                if backoff > 0 and job.state.last_run_at:
-                    if (now - job.state.last_run_at) < backoff:
-                        continue
+            # Check backoff
+            backoff = _backoff_delay(job.state.consecutive_errors)
+            if backoff > 0 and job.state.last_run_at:
+                if (now - job.state.last_run_at) < backoff:
+                    deferred.append((job.state.last_run_at + backoff, ws_name, job))
+                    continue
 
-                # System consolidation jobs: check for old daily memories
-                if job.system and job.name == _SYSTEM_CONSOLIDATION_JOB_NAME:
-                    if not self._should_run_consolidation(ws_name):
-                        job.state.next_run_at = compute_next_run(
-                            job.schedule, time.time(), self._cron_default_tz
-                        )
-                        job.state.last_status = "skipped"
-                        continue
+            touched.add(ws_name)
 
-                # System tmp cleanup: run directly, no tmux needed
-                if job.system and job.name == _SYSTEM_TMP_CLEANUP_JOB_NAME:
-                    ws_dir = self._workspace_dirs.get(ws_name)
-                    if ws_dir:
-                        deleted = self._run_tmp_cleanup(ws_dir)
-                        job.state.last_run_at = now
-                        job.state.last_status = "ok"
-                        job.state.last_error = ""
-                        job.state.consecutive_errors = 0
-                        job.state.next_run_at = compute_next_run(
-                            job.schedule, time.time(), self._cron_default_tz
-                        )
-                        logger.info(
-                            "Tmp cleanup job %s: deleted %d file(s) in %s",
-                            job.id,
-                            deleted,
-                            ws_name,
-                        )
+            # System consolidation jobs: check for old daily memories
+            if job.system and job.name == _SYSTEM_CONSOLIDATION_JOB_NAME:
+                if not self._should_run_consolidation(ws_name):
+                    job.state.next_run_at = compute_next_run(
+                        job.schedule, time.time(), self._cron_default_tz
+                    )
+                    job.state.last_status = "skipped"
+                    self._schedule(ws_name, job)
+                    self._mark_dirty(ws_name, job)
                     continue
 
-                await self._execute_job(ws_name, job)
+            # System tmp cleanup: run directly, no tmux needed
+            if job.system and job.name == _SYSTEM_TMP_CLEANUP_JOB_NAME:
+                ws_dir = self._workspace_dirs.get(ws_name)
+                if ws_dir:
+                    deleted = self._run_tmp_cleanup(ws_dir)
+                    job.state.last_run_at = now
+                    job.state.last_status = "ok"
+                    job.state.last_error = ""
+                    job.state.consecutive_errors = 0
+                    job.state.next_run_at = compute_next_run(
+                        job.schedule, time.time(), self._cron_default_tz
+                    )
+                    self._schedule(ws_name, job)
+                    self._mark_dirty(ws_name, job)
+                    logger.info(
+                        "Tmp cleanup job %s: deleted %d file(s) in %s",
+                        job.id,
+                        deleted,
+                        ws_name,
+                    )
+                continue
 
-                # Handle delete_after_run
-                if job.delete_after_run:
-                    jobs_to_delete.append(job.id)
+            # Mark running now so the job is not dispatched twice while queued
+            scheduled_at = job.state.next_run_at
+            job.state.running_at = now
+            task = asyncio.create_task(
+                self._run_due_job(ws_name, job, scheduled_at),
+                name=f"cron:{ws_name}:{job.id}",
+            )
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+            self._inflight_per_ws[ws_name] = self._inflight_per_ws.get(ws_name, 0) + 1
+            started.append(task)
 
-            if jobs_to_delete:
-                store.jobs = [j for j in store.jobs if j.id not in jobs_to_delete]
+        for when, ws_name, job in deferred:
+            self._schedule(ws_name, job, when)
 
+        for ws_name in touched:
             self._save(ws_name)
 
+        return started
+
+    async def _run_due_job(
+        self, workspace_name: str, job: CronJob, scheduled_at: float | None
+    ) -> None:
+        """Run one dispatched job within its workspace and global slots."""
+        slots = self._workspace_slots.get(workspace_name)
+        if slots is None:
+            slots = asyncio.Semaphore(max(1, self._cfg.cron_workspace_concurrent))
+            self._workspace_slots[workspace_name] = slots
+        try:
+            async with slots, self._global_slots:
+                await self._execute_job(
+                    workspace_name, job, scheduled_at=scheduled_at
+                )
+
+            # Handle delete_after_run
+            if job.delete_after_run:
+                store = self._stores.get(workspace_name)
+                if store:
+                    store.jobs = [j for j in store.jobs if j.id != job.id]
+                self._mark_deleted(workspace_name, job.id)
+        finally:
+            remaining = self._inflight_per_ws.get(workspace_name, 1) - 1
+            if remaining > 0:
+                self._inflight_per_ws[workspace_name] = remaining
+            else:
+                self._inflight_per_ws.pop(workspace_name, None)
+            self._save(workspace_name)
+            self._wake_timer()
+
     async def _execute_job(
         self,
         workspace_name: str,
         job: CronJob,
         window_id: str | None = None,
+        *,
+        scheduled_at: float | None = None,
     ) -> None:
-        """Execute a single cron job by sending message to its tmux window."""
+        """Execute a single cron job by sending message to its tmux window.
+
+        ``scheduled_at`` is the next_run_at this run fires for; when given,
+        the start delay is recorded as scheduling lag.
+        """
         now = time.time()
         job.state.running_at = now
+        lag = 0.0
+        if scheduled_at is not None:
+            lag = max(0.0, now - scheduled_at)
+            self._record_lag(lag)
+            if lag > _LAG_WARN_S:
+                logger.warning(
+                    "Cron job %s '%s' started %.0fs late", job.id, job.name, lag
+                )
 
         try:
             if not window_id:
@@ -485,6 +606,8 @@ class CronService:
                     status=job.state.last_status,
                     error=job.state.last_error,
                     duration_s=job.state.last_duration_s,
+                    scheduled_at=scheduled_at,
+                    lag_s=round(lag, 3),
                 )
             except Exception:
                 logger.warning("Failed to record history for job %s", job.id, exc_info=True)
@@ -501,6 +624,10 @@ class CronService:
                 logger.warning("Cron job %s: no next run computed, disabling", job.id)
                 job.enabled = False
                 job.state.last_error = "invalid schedule"
+        # Skip jobs removed (or reloaded from disk) while they were running
+        if self._find_job(workspace_name, job.id) is job:
+            self._schedule(workspace_name, job)
+            self._mark_dirty(workspace_name, job)
 
     # --- Consolidation checks ---
 
@@ -679,29 +806,35 @@ class CronService:
 
     def _scan_workspaces(self) -> None:
         """Scan config_dir for all workspace directories."""
+        loaded: list[str] = []
         for ws_dir in self._iter_workspace_dirs():
             ws_name = ws_dir.name.removeprefix("workspace_")
             if ws_name in self._stores:
                 continue
             # Load from DB (auto-migrates from jobs.json if needed)
-            store = load_store(ws_dir)
             self._mtimes[ws_name] = store_mtime(ws_dir)
+            self._versions[ws_name] = store_version(ws_dir)
+            store = load_store(ws_dir)
             self._stores[ws_name] = store
             self._workspace_dirs[ws_name] = ws_dir
+            self._index_store(ws_name)
+            loaded.append(ws_name)
 
-        # Ensure system jobs exist in all known workspaces
-        self._ensure_system_jobs()
+        # Ensure system jobs exist in newly loaded workspaces
+        self._ensure_system_jobs(loaded)
 
-    def _ensure_system_jobs(self) -> None:
-        """Ensure every workspace has the built-in system jobs."""
+    def _ensure_system_jobs(self, workspace_names: list[str]) -> None:
+        """Ensure the given workspaces have the built-in system jobs."""
         now = time.time()
-        for ws_name, store in self._stores.items():
+        for ws_name in workspace_names:
+            store = self._stores[ws_name]
             changed = False
 
             # Remove legacy hourly summary jobs (now handled by SystemScheduler)
             legacy = [j for j in store.jobs if j.name == "_system:hourly_summary"]
             for j in legacy:
                 store.jobs.remove(j)
+                self._mark_deleted(ws_name, j.id)
                 changed = True
                 logger.info(
                     "Removed legacy summary job %s from workspace %s", j.id, ws_name
@@ -731,6 +864,8 @@ class CronService:
                     state=CronJobState(next_run_at=next_run),
                 )
                 store.jobs.append(job)
+                self._schedule(ws_name, job)
+                self._mark_dirty(ws_name, job)
                 changed = True
                 logger.info(
                     "Created system consolidation job %s in workspace %s",
@@ -759,6 +894,8 @@ class CronService:
                     state=CronJobState(next_run_at=next_run),
                 )
                 store.jobs.append(job)
+                self._schedule(ws_name, job)
+                self._mark_dirty(ws_name, job)
                 changed = True
                 logger.info(
                     "Created system tmp cleanup job %s in workspace %s",
@@ -770,14 +907,34 @@ class CronService:
                 self._save(ws_name)
 
     def _reload_changed_stores(self) -> None:
-        """Reload stores whose JSON file has been modified externally."""
+        """Reload stores whose cron rows have been modified externally.
+
+        The mtime check is a cheap gate; memory.db is also written by memory
+        sync and others, so the cron version decides whether to reload.
+        """
+        reloaded: list[str] = []
         for ws_name in list(self._stores.keys()):
             ws_dir = self._workspace_dirs[ws_name]
+            if ws_name in self._inflight_per_ws:
+                # Reloading would swap out job objects mid-run; retry next tick
+                continue
             current_mtime = store_mtime(ws_dir)
-            if current_mtime != self._mtimes.get(ws_name, 0):
+            if current_mtime == self._mtimes.get(ws_name, 0):
+                continue
+            self._mtimes[ws_name] = current_mtime
+            version = store_version(ws_dir)
+            if version != self._versions.get(ws_name, 0):
+                self._versions[ws_name] = version
                 self._stores[ws_name] = load_store(ws_dir)
-                self._mtimes[ws_name] = current_mtime
+                # In-memory changes are superseded by what is on disk
+                self._dirty.pop(ws_name, None)
+                self._deleted.pop(ws_name, None)
+                self._meta_dirty.discard(ws_name)
+                self._index_store(ws_name)
+                reloaded.append(ws_name)
                 logger.debug("Reloaded cron store for %s", ws_name)
+        if reloaded:
+            self._ensure_system_jobs(reloaded)
 
     def _ensure_store(self, workspace_name: str) -> CronStoreFile:
         """Get or create store for a workspace name."""
@@ -785,6 +942,8 @@ class CronService:
             ws_dir = self._workspace_dir_for(workspace_name)
             self._stores[workspace_name] = CronStoreFile()
             self._workspace_dirs[workspace_name] = ws_dir
+            self._index_store(workspace_name)
+            self._meta_dirty.add(workspace_name)
         return self._stores[workspace_name]
 
     def _find_job(self, workspace_name: str, job_id: str) -> CronJob | None:
@@ -797,24 +956,111 @@ class CronService:
                 return job
         return None
 
-    def _find_next_due_time(self) -> float | None:
-        """Find the earliest next_run_at across all enabled jobs."""
-        earliest: float | None = None
-        for store in self._stores.values():
+    # --- Schedule heap ---
+
+    def _index_store(self, workspace_name: str) -> None:
+        """(Re)build heap entries for every job in a workspace's store.
+
+        Entries for the previous job objects become stale and are skipped.
+        """
+        self._heap_seqs[workspace_name] = {}
+        store = self._stores.get(workspace_name)
+        if store:
             for job in store.jobs:
-                if not job.enabled or job.state.next_run_at is None:
-                    continue
-                if earliest is None or job.state.next_run_at < earliest:
-                    earliest = job.state.next_run_at
-        return earliest
+                self._schedule(workspace_name, job)
+        # Drop stale entries once they dominate the heap
+        live = sum(len(seqs) for seqs in self._heap_seqs.values())
+        if len(self._heap) > 2 * live + 64:
+            self._heap = [
+                e
+                for e in self._heap
+                if self._heap_seqs.get(e[2], {}).get(e[3].id) == e[1]
+            ]
+            heapq.heapify(self._heap)
+
+    def _schedule(
+        self, workspace_name: str, job: CronJob, when: float | None = None
+    ) -> None:
+        """Push a job onto the heap at ``when`` (default: its next_run_at).
+
+        Disabled or unscheduled jobs are removed from the heap instead.
+        """
+        seqs = self._heap_seqs.setdefault(workspace_name, {})
+        if when is None:
+            when = job.state.next_run_at
+        if not job.enabled or when is None:
+            seqs.pop(job.id, None)
+            return
+        seq = next(self._seq)
+        seqs[job.id] = seq
+        heapq.heappush(self._heap, (when, seq, workspace_name, job))
+
+    def _pop_due(self, now: float) -> list[tuple[str, CronJob]]:
+        """Pop all live heap entries whose time has come, soonest first."""
+        due: list[tuple[str, CronJob]] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, ws_name, job = heapq.heappop(self._heap)
+            seqs = self._heap_seqs.get(ws_name, {})
+            if seqs.get(job.id) != seq:
+                continue  # superseded by a newer entry
+            next_run = job.state.next_run_at
+            if not job.enabled or next_run is None:
+                seqs.pop(job.id, None)
+                continue
+            if next_run > now:
+                # next_run_at moved later since this entry was pushed
+                self._schedule(ws_name, job)
+                continue
+            seqs.pop(job.id, None)
+            due.append((ws_name, job))
+        return due
+
+    def _find_next_due_time(self) -> float | None:
+        """Return the time of the soonest live heap entry."""
+        while self._heap:
+            when, seq, ws_name, job = self._heap[0]
+            if self._heap_seqs.get(ws_name, {}).get(job.id) == seq:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    # --- Persistence ---
+
+    def _mark_dirty(self, workspace_name: str, job: CronJob) -> None:
+        """Record that a job's row needs writing on the next _save."""
+        self._dirty.setdefault(workspace_name, {})[job.id] = job
+
+    def _mark_deleted(self, workspace_name: str, job_id: str) -> None:
+        """Record that a job's row needs deleting on the next _save."""
+        self._heap_seqs.get(workspace_name, {}).pop(job_id, None)
+        self._dirty.get(workspace_name, {}).pop(job_id, None)
+        self._deleted.setdefault(workspace_name, set()).add(job_id)
 
     def _save(self, workspace_name: str) -> None:
-        """Save a workspace's store and update mtime cache."""
+        """Write a workspace's changed rows (if any) and update mtime cache."""
         store = self._stores.get(workspace_name)
         ws_dir = self._workspace_dirs.get(workspace_name)
-        if store and ws_dir:
-            save_store(ws_dir, store)
-            self._mtimes[workspace_name] = store_mtime(ws_dir)
+        if not store or not ws_dir:
+            return
+        dirty = self._dirty.pop(workspace_name, {})
+        deleted = self._deleted.pop(workspace_name, set())
+        meta_dirty = workspace_name in self._meta_dirty
+        if not dirty and not deleted and not meta_dirty:
+            return
+        self._meta_dirty.discard(workspace_name)
+        self._versions[workspace_name] = save_changes(
+            ws_dir,
+            jobs=dirty.values(),
+            deleted_ids=deleted,
+            meta=store.workspace_meta if meta_dirty else None,
+        )
+        self._mtimes[workspace_name] = store_mtime(ws_dir)
+
+    def _record_lag(self, lag: float) -> None:
+        self._lag_count += 1
+        self._lag_total += lag
+        self._lag_max = max(self._lag_max, lag)
+        self._lag_last = lag
 
     def _wake_timer(self) -> None:
         """Signal the timer loop to re-evaluate schedule immediately."""
@@ -831,3 +1077,16 @@ class CronService:
     @property
     def workspace_count(self) -> int:
         return len(self._stores)
+
+    @property
+    def running_jobs(self) -> int:
+        return len(self._inflight)
+
+    def lag_stats(self) -> dict[str, float | int]:
+        """Scheduling lag (seconds between next_run_at and actual start)."""
+        return {
+            "count": self._lag_count,
+            "avg": self._lag_total / self._lag_count if self._lag_count else 0.0,
+            "max": self._lag_max,
+            "last": self._lag_last,
+        }
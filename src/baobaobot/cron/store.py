@@ -1,8 +1,8 @@
 """SQLite persistence for per-workspace cron stores.
 
-Stores cron jobs in workspace/memory.db (cron_jobs, cron_meta, cron_history
-tables).  On first connect, auto-migrates from legacy cron/jobs.json if
-present.
+Stores cron jobs in workspace/memory.db (cron_jobs, cron_meta, cron_history,
+cron_version tables).  On first connect, auto-migrates from legacy
+cron/jobs.json if present.
 
 Retains the same CronStoreFile / CronJob / CronSchedule dataclass interface
 so that service.py needs minimal changes.
@@ -16,6 +16,7 @@ import os
 import sqlite3
 import time
 from pathlib import Path
+from typing import Iterable
 
 from .types import CronJob, CronJobState, CronSchedule, CronStoreFile, WorkspaceMeta
 
@@ -64,14 +65,45 @@ CREATE TABLE IF NOT EXISTS cron_history (
     finished_at REAL,
     status      TEXT NOT NULL DEFAULT '',
     error       TEXT NOT NULL DEFAULT '',
-    duration_s  REAL NOT NULL DEFAULT 0.0
+    duration_s  REAL NOT NULL DEFAULT 0.0,
+    scheduled_at REAL,
+    lag_s       REAL NOT NULL DEFAULT 0.0
 );
 
 CREATE INDEX IF NOT EXISTS idx_cron_jobs_enabled ON cron_jobs(enabled);
 CREATE INDEX IF NOT EXISTS idx_cron_history_job ON cron_history(job_id);
 CREATE INDEX IF NOT EXISTS idx_cron_history_time ON cron_history(started_at);
+-- Bumped by the triggers below whenever cron jobs or workspace_meta change,
+-- so the scheduler can tell those writes apart from other memory.db traffic.
+CREATE TABLE IF NOT EXISTS cron_version (
+    id      INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cron_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_ins AFTER INSERT ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_upd AFTER UPDATE ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_del AFTER DELETE ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_ins AFTER INSERT ON cron_meta
+WHEN NEW.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_upd AFTER UPDATE ON cron_meta
+WHEN NEW.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_del AFTER DELETE ON cron_meta
+WHEN OLD.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
 """
 
+# Columns added to cron_history after its first release: name → definition
+_HISTORY_ADDED_COLUMNS = {
+    "scheduled_at": "REAL",
+    "lag_s": "REAL NOT NULL DEFAULT 0.0",
+}
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -81,6 +113,10 @@ CREATE INDEX IF NOT EXISTS idx_cron_history_time ON cron_history(started_at);
 def _ensure_tables(conn: sqlite3.Connection) -> None:
     """Ensure all cron tables exist (safe to run every time due to IF NOT EXISTS)."""
     conn.executescript(_CRON_SCHEMA)
+    have = {r[1] for r in conn.execute("PRAGMA table_info(cron_history)")}
+    for name, decl in _HISTORY_ADDED_COLUMNS.items():
+        if name not in have:
+            conn.execute(f"ALTER TABLE cron_history ADD COLUMN {name} {decl}")
     conn.commit()
 
 
@@ -286,12 +322,7 @@ def save_store(workspace_dir: Path, store: CronStoreFile) -> None:
     conn = _connect(workspace_dir)
     try:
         # Upsert workspace_meta
-        meta_dict = store.workspace_meta.to_dict()
-        for k, v in meta_dict.items():
-            conn.execute(
-                "INSERT OR REPLACE INTO cron_meta (key, value) VALUES (?, ?)",
-                (f"workspace_meta.{k}", str(v)),
-            )
+        _write_meta(conn, store.workspace_meta)
 
         # Collect current job IDs in the store
         store_ids = {j.id for j in store.jobs}
@@ -313,13 +344,83 @@ def save_store(workspace_dir: Path, store: CronStoreFile) -> None:
         conn.close()
 
 
+def save_changes(
+    workspace_dir: Path,
+    *,
+    jobs: Iterable[CronJob] = (),
+    deleted_ids: Iterable[str] = (),
+    meta: WorkspaceMeta | None = None,
+) -> int:
+    """Persist only the given job rows (and meta, if passed) in one transaction.
+
+    Unlike save_store(), rows not mentioned are left untouched, so the cost
+    is proportional to what changed rather than to the size of the store.
+    Returns the store version (see store_version()) after this write.
+    """
+    conn = _connect(workspace_dir)
+    try:
+        with conn:
+            if meta is not None:
+                _write_meta(conn, meta)
+            conn.executemany(
+                "DELETE FROM cron_jobs WHERE id = ?", [(i,) for i in deleted_ids]
+            )
+            conn.executemany(_UPSERT_SQL, [_job_to_params(j) for j in jobs])
+            return _read_version(conn)
+    finally:
+        conn.close()
+
+
+def _write_meta(conn: sqlite3.Connection, meta: WorkspaceMeta) -> None:
+    conn.executemany(
+        "INSERT OR REPLACE INTO cron_meta (key, value) VALUES (?, ?)",
+        [(f"workspace_meta.{k}", str(v)) for k, v in meta.to_dict().items()],
+    )
+
+
 def store_mtime(workspace_dir: Path) -> float:
-    """Return mtime of memory.db, or 0.0 if not found."""
+    """Return the newest mtime of memory.db and its WAL, or 0.0 if not found.
+
+    memory.db runs in WAL mode, so committed writes land in memory.db-wal and
+    only reach the main file at checkpoint time.
+    """
     db_path = workspace_dir / "memory.db"
     try:
-        return db_path.stat().st_mtime
+        mtime = db_path.stat().st_mtime
     except OSError:
         return 0.0
+    try:
+        return max(mtime, db_path.with_name("memory.db-wal").stat().st_mtime)
+    except OSError:
+        return mtime
+
+
+def _read_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT version FROM cron_version WHERE id = 1").fetchone()
+    return row[0] if row else 0
+
+
+def store_version(workspace_dir: Path) -> int:
+    """Return the cron change counter of memory.db, or 0 if not found.
+
+    memory.db is shared with memory sync, the query cache and the system
+    scheduler, so its mtime moves on every one of their writes.  The counter
+    is bumped by triggers only when cron_jobs or workspace_meta rows change,
+    whoever the writer is.
+    """
+    db_path = workspace_dir / "memory.db"
+    if not db_path.is_file():
+        return 0
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=5.0)
+    except sqlite3.Error:
+        return 0
+    try:
+        return _read_version(conn)
+    except sqlite3.Error:
+        return 0
+    finally:
+        conn.close()
 
 
 def record_history(
@@ -331,14 +432,29 @@ def record_history(
     status: str = "",
     error: str = "",
     duration_s: float = 0.0,
+    scheduled_at: float | None = None,
+    lag_s: float = 0.0,
 ) -> None:
-    """Insert a cron_history record."""
+    """Insert a cron_history record.
+
+    ``scheduled_at`` is the next_run_at the run was fired for (None for
+    manual runs) and ``lag_s`` how late it started relative to that.
+    """
     conn = _connect(workspace_dir)
     try:
         conn.execute(
-            "INSERT INTO cron_history (job_id, started_at, finished_at, status, error, duration_s) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (job_id, started_at, finished_at, status, error, duration_s),
+            "INSERT INTO cron_history (job_id, started_at, finished_at, status, error, "
+            "duration_s, scheduled_at, lag_s) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                started_at,
+                finished_at,
+                status,
+                error,
+                duration_s,
+                scheduled_at,
+                lag_s,
+            ),
         )
         conn.commit()
     finally:
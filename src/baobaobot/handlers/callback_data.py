@@ -13,6 +13,7 @@ Constants:
   - CB_KEYS_PREFIX: Screenshot control keys (kb:<key_id>:<window>)
   - CB_LS_*: File browser (/ls command)
   - CB_MENU_*: Menu commands (/agent, /system, /config)
+  - CB_MEMORY_*: /memory search result pagination
 """
 
 # History pagination
@@ -81,3 +82,6 @@ CB_MENU_CONFIG = "mn:c:"  # mn:c:<action>
 
 # Heartbeat toggle
 CB_HEARTBEAT = "hb:"  # hb:<window_id>:<on|off>
+
+# Memory search pagination
+CB_MEMORY_PAGE = "ms:p:"  # ms:p:<page>
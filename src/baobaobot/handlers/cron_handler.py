@@ -247,11 +247,19 @@ async def _cmd_run(update: Update, ws_name: str, job_id: str, cron_svc) -> None:
 async def _cmd_status(update: Update, cron_svc) -> None:
     assert update.message
     running = "✅ Running" if cron_svc.is_running else "❌ Stopped"
+    lag = cron_svc.lag_stats()
+    lag_line = (
+        f"\nStart lag: avg {lag['avg']:.1f}s, max {lag['max']:.1f}s"
+        if lag["count"]
+        else ""
+    )
     await safe_reply(
         update.message,
         f"⏰ Cron Service: {running}\n"
         f"Workspaces: {cron_svc.workspace_count}\n"
-        f"Total jobs: {cron_svc.total_jobs}",
+        f"Total jobs: {cron_svc.total_jobs}\n"
+        f"In progress: {cron_svc.running_jobs}"
+        f"{lag_line}",
     )
 
 
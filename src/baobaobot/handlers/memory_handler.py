@@ -4,19 +4,29 @@ Provides listing, viewing, searching, and deleting memory files
 through Telegram bot commands. Memory is per-topic (each topic has
 its own workspace with its own memory directory).
 
-Key functions: memory_command(), forget_command().
+``/memory search`` queries the SQLite index (FTS5 / trigram, BM25-ranked)
+in a worker thread and shows results in pages with ◀ ▶ buttons; the
+result list is kept in ``user_data`` so paging doesn't search again.  Only
+the user's latest result message pages — memory is per topic, so buttons on
+an older message (possibly another topic's search) report it as expired.
+
+Key functions: memory_command(), forget_command(),
+handle_memory_search_callback().
 """
 
+import asyncio
 import logging
 from datetime import date
 from pathlib import Path
 
-from telegram import Update
+from telegram import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 
-from ..handlers.message_sender import safe_reply
+from ..handlers.callback_data import CB_MEMORY_PAGE
+from ..handlers.message_sender import safe_edit, safe_reply
 from ..handlers.workspace_resolver import resolve_workspace_for_update
 from ..memory.manager import MemoryManager
+from ..memory.search import MemorySearchResult
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +43,56 @@ def _get_memory_manager(workspace_dir: Path) -> MemoryManager:
     return MemoryManager(workspace_dir)
 
 
+# user_data key for the last /memory search:
+# {"query": str, "results": [...], "chat_id": int, "message_id": int}
+MEMORY_SEARCH_KEY = "memory_search"
+
+_SEARCH_PAGE_SIZE = 10
+_SEARCH_MAX_RESULTS = 200
+
+
+def _search_index(workspace_dir: Path, query: str) -> list[MemorySearchResult]:
+    """Run an indexed search (blocking — call via ``asyncio.to_thread``).
+
+    The MemoryDB connection is opened and closed on the calling thread.
+    """
+    mm = _get_memory_manager(workspace_dir)
+    try:
+        return mm.search(query)[:_SEARCH_MAX_RESULTS]
+    finally:
+        mm.db.close()
+
+
+def build_search_page(
+    query: str, results: list[MemorySearchResult], page: int
+) -> tuple[str, InlineKeyboardMarkup | None]:
+    """Render one page of search results and its navigation keyboard."""
+    total_pages = max(1, -(-len(results) // _SEARCH_PAGE_SIZE))
+    page = max(0, min(page, total_pages - 1))
+    start = page * _SEARCH_PAGE_SIZE
+
+    lines = [f'🔍 Search "{query}" — {len(results)} results\n']
+    for r in results[start : start + _SEARCH_PAGE_SIZE]:
+        lines.append(f"📄 `{r.file}:{r.line_num}` {r.line}")
+
+    if total_pages <= 1:
+        return "\n".join(lines), None
+
+    nav: list[InlineKeyboardButton] = []
+    if page > 0:
+        nav.append(
+            InlineKeyboardButton("◀", callback_data=f"{CB_MEMORY_PAGE}{page - 1}")
+        )
+    nav.append(
+        InlineKeyboardButton(f"{page + 1}/{total_pages}", callback_data="noop")
+    )
+    if page < total_pages - 1:
+        nav.append(
+            InlineKeyboardButton("▶", callback_data=f"{CB_MEMORY_PAGE}{page + 1}")
+        )
+    return "\n".join(lines), InlineKeyboardMarkup([nav])
+
+
 async def memory_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /memory command — list, view, or search memories."""
     user = update.effective_user
@@ -61,19 +121,20 @@ async def memory_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     # /memory search <query>
     if len(parts) >= 3 and parts[1].lower() == "search":
         query = parts[2]
-        results = mm.search(query)
+        results = await asyncio.to_thread(_search_index, workspace_dir, query)
         if not results:
             await safe_reply(update.message, f'🔍 No results for "{query}".')
             return
 
-        lines = [f'🔍 Search "{query}" — {len(results)} results\n']
-        for r in results[:20]:  # Limit to 20 results
-            lines.append(f"📄 `{r.file}:{r.line_num}` {r.line}")
-
-        if len(results) > 20:
-            lines.append(f"\n…{len(results) - 20} more results")
-
-        await safe_reply(update.message, "\n".join(lines))
+        text, keyboard = build_search_page(query, results, 0)
+        sent = await safe_reply(update.message, text, reply_markup=keyboard)
+        if context.user_data is not None:
+            context.user_data[MEMORY_SEARCH_KEY] = {
+                "query": query,
+                "results": results,
+                "chat_id": sent.chat_id,
+                "message_id": sent.message_id,
+            }
         return
 
     # /memory <date> — view specific date
@@ -138,3 +199,30 @@ async def forget_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await safe_reply(update.message, f"🗑️ Deleted memory for {target}.")
     else:
         await safe_reply(update.message, f"❌ No memory found for {target}.")
+
+
+async def handle_memory_search_callback(
+    query: CallbackQuery, context: ContextTypes.DEFAULT_TYPE
+) -> None:
+    """Show another page of the last /memory search results."""
+    data = query.data or ""
+    try:
+        page = int(data[len(CB_MEMORY_PAGE) :])
+    except ValueError:
+        await query.answer("Invalid data")
+        return
+
+    state = (context.user_data or {}).get(MEMORY_SEARCH_KEY)
+    msg = query.message
+    if (
+        not state
+        or msg is None
+        or (msg.chat_id, msg.message_id) != (state["chat_id"], state["message_id"])
+    ):
+        # A newer search (maybe in another topic) replaced this message's results
+        await query.answer("Search expired — run /memory search again", show_alert=True)
+        return
+
+    text, keyboard = build_search_page(state["query"], state["results"], page)
+    await safe_edit(query, text, reply_markup=keyboard)
+    await query.answer()
@@ -2,7 +2,7 @@
 
 Provides inline keyboard menus that group related bot actions:
   - /agent: Claude Code operations (Esc, Clear, Compact, Status)
-  - /system: System management (History, Screenshot, Restart, Rebuild, Cron, Verbosity, Files, Summary, Heartbeat)
+  - /system: System management (History, Screenshot, Restart, Rebuild, Cron, Verbosity, Files, Summary, Heartbeat, Metrics)
   - /config: Personal settings (Agent Soul, Profile)
 """
 
@@ -135,6 +135,12 @@ def _build_system_keyboard(
                 callback_data=f"{CB_MENU_SYSTEM}heartbeat:{wid}"[:64],
             ),
         ],
+        [
+            InlineKeyboardButton(
+                "📈 Metrics",
+                callback_data=f"{CB_MENU_SYSTEM}metrics:{wid}"[:64],
+            ),
+        ],
     ]
     # Backend switch button
     if backend_label:
@@ -388,6 +394,8 @@ async def _dispatch_system(
         await _handle_summary(query, ctx, wid)
     elif action == "heartbeat":
         await _handle_heartbeat(query, ctx, wid)
+    elif action == "metrics":
+        await _handle_metrics(query, ctx)
     elif action == "backend":
         await _handle_backend(query, ctx, wid)
     elif action.startswith("bsw_"):
@@ -761,6 +769,32 @@ async def _handle_summary(
             await safe_reply(query.message, f"ℹ️ [{display}] No new content to summarize.")
 
 
+async def _handle_metrics(query: CallbackQuery, ctx: AgentContext) -> None:
+    """Show a latency/throughput summary, plus a /metrics link if shared."""
+    await query.answer()
+    if not query.message:
+        return
+
+    from ..metrics import registry
+
+    text = f"📈 *Metrics*\n```\n{registry.summary()}\n```"
+    if ctx.embedding_backfill is not None:
+        progress = ctx.embedding_backfill.summary()
+        if progress:
+            text += f"\n🧠 *Embeddings*\n```\n{progress}\n```"
+    public_url = os.environ.get("SHARE_PUBLIC_URL", "")
+    if public_url and ctx.share_server:
+        from ..share_server import METRICS_TOKEN_PATH, generate_token
+
+        from ..loop_watchdog import get_active
+
+        token = generate_token(METRICS_TOKEN_PATH, ttl=600)
+        text += f"\n[Prometheus endpoint]({public_url}/metrics?token={token})"
+        if get_active() is not None:
+            text += f" · [Loop stalls]({public_url}/debug/loop?token={token})"
+    await safe_reply(query.message, text)
+
+
 async def _handle_heartbeat(
     query: CallbackQuery,
     ctx: AgentContext,
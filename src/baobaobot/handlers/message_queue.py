@@ -10,6 +10,8 @@ Provides a queue-based message processing system that ensures:
 
 Key components:
   - MessageTask: Dataclass representing a queued message task (with thread_id)
+  - MessageQueue: Deque-backed per-destination queue (merge at head,
+    push-front retries, pending status replacement)
   - get_or_create_queue: Get or create queue and worker for a user
   - Message queue worker: Background task processing user's queue
   - Content task processing with tool_use/tool_result handling
@@ -23,13 +25,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
 from telegram import Bot
 from telegram.error import NetworkError, RetryAfter, TimedOut
 
-from ..markdown_v2 import convert_markdown
+from ..markdown_v2 import convert_markdown_async
+from ..metrics import (
+    MESSAGE_END_TO_END,
+    MESSAGES_SENT,
+    QUEUE_WAIT_SECONDS,
+    TELEGRAM_SEND_SECONDS,
+)
 from ..terminal_parser import parse_status_line
 from .message_sender import NO_LINK_PREVIEW, rate_limit_send_message
 
@@ -41,6 +51,10 @@ logger = logging.getLogger(__name__)
 # Merge limit for content messages
 MERGE_MAX_LENGTH = 3800  # Leave room for markdown conversion overhead
 
+# How long the status poller's last parsed status line may be reused
+# instead of capturing the pane again after a content message
+_STATUS_REUSE_MAX_AGE = 3.0  # seconds
+
 # Maximum retries for transient network errors in queue worker
 _WORKER_MAX_RETRIES = 3
 _WORKER_RETRY_DELAY = 5  # seconds
@@ -59,11 +73,104 @@ class MessageTask:
     content_type: str = "text"
     thread_id: int | None = None  # Telegram topic thread_id for targeted send
     retry_count: int = 0  # Number of times this task has been retried
+    superseded: bool = False  # Status task replaced by a newer one; skip it
+    enqueued_at: float = field(default_factory=time.monotonic)
+    written_at: float = 0.0  # transcript mtime (wall clock), 0 if unknown
+
 
+class MessageQueue:
+    """Per-destination FIFO of MessageTasks.
+
+    Keeps asyncio.Queue's get()/task_done()/join() contract, and adds the
+    operations the worker needs without draining the backlog: peek/pop at
+    the head (merging), push_front (retries) and last-writer-wins status
+    updates (at most one pending status task per topic). All are O(1).
+    """
 
-def get_message_queue(
-    agent_ctx: AgentContext, user_id: int
-) -> asyncio.Queue[MessageTask] | None:
+    def __init__(self) -> None:
+        self._items: deque[MessageTask] = deque()
+        self._not_empty = asyncio.Event()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        # thread_id_or_0 -> most recently enqueued task for that topic
+        # (only while it is still pending)
+        self._tails: dict[int, MessageTask] = {}
+        # thread_id_or_0 -> the topic's single pending status task
+        self._pending_status: dict[int, MessageTask] = {}
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def _count_new(self) -> None:
+        self._unfinished += 1
+        self._finished.clear()
+        self._not_empty.set()
+
+    def put_nowait(self, task: MessageTask) -> None:
+        self._items.append(task)
+        self._tails[task.thread_id or 0] = task
+        self._count_new()
+
+    def push_front(self, task: MessageTask) -> None:
+        """Re-insert a dequeued task at the head (e.g. retry after an error)."""
+        self._items.appendleft(task)
+        self._count_new()
+
+    def put_status(self, task: MessageTask) -> None:
+        """Enqueue a status task; the newest status for a topic wins.
+
+        A pending status that is still the topic's newest task is rewritten
+        in place. One that already has content queued behind it is marked
+        superseded and the new status is appended, so a status never moves
+        ahead of earlier content and stale spinner texts are never sent.
+        (A topic is bound to one window, so this is per destination+window.)
+        """
+        key = task.thread_id or 0
+        pending = self._pending_status.get(key)
+        if pending is not None:
+            if self._tails.get(key) is pending:
+                pending.task_type = task.task_type
+                pending.text = task.text
+                pending.window_id = task.window_id
+                return
+            pending.superseded = True
+        self._pending_status[key] = task
+        self.put_nowait(task)
+
+    def peek(self) -> MessageTask | None:
+        return self._items[0] if self._items else None
+
+    def popleft(self) -> MessageTask:
+        task = self._items.popleft()
+        key = task.thread_id or 0
+        if self._tails.get(key) is task:
+            del self._tails[key]
+        if self._pending_status.get(key) is task:
+            del self._pending_status[key]
+        return task
+
+    async def get(self) -> MessageTask:
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.popleft()
+
+    def task_done(self) -> None:
+        if self._unfinished <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def join(self) -> None:
+        await self._finished.wait()
+
+
+def get_message_queue(agent_ctx: AgentContext, user_id: int) -> MessageQueue | None:
     """Get the message queue for a user (if exists)."""
     return agent_ctx.queue_state.queues.get(user_id)
 
@@ -72,12 +179,11 @@ def get_or_create_queue(
     bot: Bot,
     user_id: int,
     agent_ctx: AgentContext,
-) -> asyncio.Queue[MessageTask]:
+) -> MessageQueue:
     """Get or create message queue and worker for a user."""
     qs = agent_ctx.queue_state
     if user_id not in qs.queues:
-        qs.queues[user_id] = asyncio.Queue()
-        qs.locks[user_id] = asyncio.Lock()
+        qs.queues[user_id] = MessageQueue()
         # Start worker task for this user
         qs.workers[user_id] = asyncio.create_task(
             _message_queue_worker(bot, user_id, agent_ctx)
@@ -85,21 +191,6 @@ def get_or_create_queue(
     return qs.queues[user_id]
 
 
-def _inspect_queue(queue: asyncio.Queue[MessageTask]) -> list[MessageTask]:
-    """Non-destructively inspect all items in queue.
-
-    Drains the queue and returns all items. Caller must refill.
-    """
-    items: list[MessageTask] = []
-    while not queue.empty():
-        try:
-            item = queue.get_nowait()
-            items.append(item)
-        except asyncio.QueueEmpty:
-            break
-    return items
-
-
 def _can_merge_tasks(base: MessageTask, candidate: MessageTask) -> bool:
     """Check if two content tasks can be merged."""
     if base.window_id != candidate.window_id:
@@ -116,53 +207,28 @@ def _can_merge_tasks(base: MessageTask, candidate: MessageTask) -> bool:
     return True
 
 
-async def _merge_content_tasks(
-    queue: asyncio.Queue[MessageTask],
-    first: MessageTask,
-    lock: asyncio.Lock,
+def _merge_content_tasks(
+    queue: MessageQueue, first: MessageTask
 ) -> tuple[MessageTask, int]:
-    """Merge consecutive content tasks from queue.
+    """Merge consecutive content tasks from the head of the queue.
 
     Returns: (merged_task, merge_count) where merge_count is the number of
-    additional tasks merged (0 if no merging occurred).
-
-    Note on queue counter management:
-        When we put items back, we call task_done() to compensate for the
-        internal counter increment caused by put_nowait(). This is necessary
-        because the items were already counted when originally enqueued.
-        Without this compensation, queue.join() would wait indefinitely.
+    additional tasks merged (0 if no merging occurred). Merged tasks are
+    popped from the queue; the caller marks them done.
     """
     merged_parts = list(first.parts)
     current_length = sum(len(p) for p in merged_parts)
     merge_count = 0
 
-    async with lock:
-        items = _inspect_queue(queue)
-        remaining: list[MessageTask] = []
-
-        for i, task in enumerate(items):
-            if not _can_merge_tasks(first, task):
-                # Can't merge, keep this and all remaining items
-                remaining = items[i:]
-                break
-
-            # Check length before merging
-            task_length = sum(len(p) for p in task.parts)
-            if current_length + task_length > MERGE_MAX_LENGTH:
-                # Too long, stop merging
-                remaining = items[i:]
-                break
-
-            merged_parts.extend(task.parts)
-            current_length += task_length
-            merge_count += 1
-
-        # Put remaining items back into the queue
-        for item in remaining:
-            queue.put_nowait(item)
-            # Compensate: this item was already counted when first enqueued,
-            # put_nowait adds a duplicate count that must be removed
-            queue.task_done()
+    while (task := queue.peek()) is not None and _can_merge_tasks(first, task):
+        # Check length before merging
+        task_length = sum(len(p) for p in task.parts)
+        if current_length + task_length > MERGE_MAX_LENGTH:
+            break
+        queue.popleft()
+        merged_parts.extend(task.parts)
+        current_length += task_length
+        merge_count += 1
 
     if merge_count == 0:
         return first, 0
@@ -175,6 +241,9 @@ async def _merge_content_tasks(
             tool_use_id=first.tool_use_id,
             content_type=first.content_type,
             thread_id=first.thread_id,
+            retry_count=first.retry_count,
+            enqueued_at=first.enqueued_at,
+            written_at=first.written_at,
         ),
         merge_count,
     )
@@ -186,24 +255,30 @@ async def _message_queue_worker(
     """Process message tasks for a user sequentially."""
     qs = agent_ctx.queue_state
     queue = qs.queues[user_id]
-    lock = qs.locks[user_id]
     logger.info(f"Message queue worker started for user {user_id}")
 
     while True:
         try:
             task = await queue.get()
+            started = time.monotonic()
+            QUEUE_WAIT_SECONDS.observe(started - task.enqueued_at, kind=task.task_type)
             try:
-                if task.task_type == "content":
+                if task.superseded:
+                    logger.debug(f"Skipped superseded status for user {user_id}")
+                elif task.task_type == "content":
                     # Try to merge consecutive content tasks
-                    merged_task, merge_count = await _merge_content_tasks(
-                        queue, task, lock
-                    )
+                    merged_task, merge_count = _merge_content_tasks(queue, task)
                     if merge_count > 0:
                         logger.debug(f"Merged {merge_count} tasks for user {user_id}")
                         # Mark merged tasks as done
                         for _ in range(merge_count):
                             queue.task_done()
-                    await _process_content_task(bot, user_id, merged_task, agent_ctx)
+                        # Retries below re-queue the merged task as a whole
+                        task = merged_task
+                    await _process_content_task(bot, user_id, task, agent_ctx)
+                    MESSAGES_SENT.inc()
+                    if task.written_at:
+                        MESSAGE_END_TO_END.observe(time.time() - task.written_at)
                 elif task.task_type == "status_update":
                     await _process_status_update_task(bot, user_id, task, agent_ctx)
                 elif task.task_type == "status_clear":
@@ -230,13 +305,7 @@ async def _message_queue_worker(
                             f"Flood control for user {user_id}, {remaining}s remaining"
                         )
                 # Re-insert task at front of queue to retry after waiting
-                async with lock:
-                    remaining_items = _inspect_queue(queue)
-                    queue.put_nowait(task)
-                    queue.task_done()  # compensate for put_nowait counter
-                    for item in remaining_items:
-                        queue.put_nowait(item)
-                        queue.task_done()  # compensate
+                queue.push_front(task)
             except (TimedOut, NetworkError) as e:
                 if task.retry_count < _WORKER_MAX_RETRIES:
                     task.retry_count += 1
@@ -250,14 +319,7 @@ async def _message_queue_worker(
                         _WORKER_RETRY_DELAY,
                     )
                     await asyncio.sleep(_WORKER_RETRY_DELAY)
-                    # Re-insert at front of queue by draining and re-filling
-                    async with lock:
-                        remaining_items = _inspect_queue(queue)
-                        queue.put_nowait(task)
-                        queue.task_done()  # compensate for put_nowait counter
-                        for item in remaining_items:
-                            queue.put_nowait(item)
-                            queue.task_done()  # compensate
+                    queue.push_front(task)
                 else:
                     logger.error(
                         "Network error for user %d after %d retries, dropping task: %s",
@@ -268,6 +330,9 @@ async def _message_queue_worker(
             except Exception as e:
                 logger.error(f"Error processing message task for user {user_id}: {e}")
             finally:
+                TELEGRAM_SEND_SECONDS.observe(
+                    time.monotonic() - started, kind=task.task_type
+                )
                 queue.task_done()
         except asyncio.CancelledError:
             logger.info(f"Message queue worker cancelled for user {user_id}")
@@ -306,7 +371,7 @@ async def _process_content_task(
                 await bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=edit_msg_id,
-                    text=convert_markdown(full_text),
+                    text=await convert_markdown_async(full_text),
                     parse_mode="MarkdownV2",
                     link_preview_options=NO_LINK_PREVIEW,
                 )
@@ -410,7 +475,7 @@ async def _convert_status_to_content(
         await bot.edit_message_text(
             chat_id=chat_id,
             message_id=msg_id,
-            text=convert_markdown(content_text),
+            text=await convert_markdown_async(content_text),
             parse_mode="MarkdownV2",
             link_preview_options=NO_LINK_PREVIEW,
         )
@@ -481,7 +546,7 @@ async def _process_status_update_task(
                 await bot.edit_message_text(
                     chat_id=chat_id,
                     message_id=msg_id,
-                    text=convert_markdown(status_text),
+                    text=await convert_markdown_async(status_text),
                     parse_mode="MarkdownV2",
                     link_preview_options=NO_LINK_PREVIEW,
                 )
@@ -555,6 +620,13 @@ async def _do_clear_status_message(
             logger.debug(f"Failed to delete status message {msg_id}: {e}")
 
 
+def record_window_status(
+    agent_ctx: AgentContext, window_id: str, status_line: str | None
+) -> None:
+    """Remember the latest status line parsed for a window (by the poller)."""
+    agent_ctx.queue_state.latest_status[window_id] = (time.monotonic(), status_line)
+
+
 async def _check_and_send_status(
     bot: Bot,
     user_id: int,
@@ -562,23 +634,32 @@ async def _check_and_send_status(
     thread_id: int | None,
     agent_ctx: AgentContext,
 ) -> None:
-    """Check terminal for status line and send status message if present."""
+    """Send the window's status line as a status message, if it has one.
+
+    Reuses the status poller's latest parse when it is recent; otherwise
+    captures the pane.
+    """
     tm = agent_ctx.tmux_manager
     qs = agent_ctx.queue_state
     # Skip if there are more messages pending in the queue
     queue = qs.queues.get(user_id)
     if queue and not queue.empty():
         return
-    w = await tm.find_window_by_id(window_id)
-    if not w:
-        return
 
-    pane_text = await tm.capture_pane(w.window_id)
-    if not pane_text:
-        return
+    cached = qs.latest_status.get(window_id)
+    if cached is not None and time.monotonic() - cached[0] <= _STATUS_REUSE_MAX_AGE:
+        status_line = cached[1]
+    else:
+        w = await tm.find_window_by_id(window_id)
+        if not w:
+            return
+        pane_text = await tm.capture_pane(w.window_id)
+        if not pane_text:
+            return
+        status_line = parse_status_line(pane_text)
+        record_window_status(agent_ctx, window_id, status_line)
 
     tid = thread_id or 0
-    status_line = parse_status_line(pane_text)
     if status_line:
         await _do_send_status_message(
             bot, user_id, tid, window_id, status_line, agent_ctx
@@ -596,8 +677,13 @@ async def enqueue_content_message(
     thread_id: int | None = None,
     *,
     agent_ctx: AgentContext,
+    written_at: float = 0.0,
 ) -> None:
-    """Enqueue a content message task."""
+    """Enqueue a content message task.
+
+    *written_at* is the transcript mtime the message was read from; it
+    feeds the end-to-end latency metric.
+    """
     logger.debug(
         "Enqueue content: user=%d, window_id=%s, content_type=%s",
         user_id,
@@ -614,6 +700,7 @@ async def enqueue_content_message(
         tool_use_id=tool_use_id,
         content_type=content_type,
         thread_id=thread_id,
+        written_at=written_at,
     )
     queue.put_nowait(task)
 
@@ -640,7 +727,7 @@ async def enqueue_status_update(
     else:
         task = MessageTask(task_type="status_clear", thread_id=thread_id)
 
-    queue.put_nowait(task)
+    queue.put_status(task)
 
 
 def clear_status_msg_info(
@@ -683,5 +770,4 @@ async def shutdown_workers(agent_ctx: AgentContext) -> None:
             pass
     qs.workers.clear()
     qs.queues.clear()
-    qs.locks.clear()
     logger.info("Message queue workers stopped")
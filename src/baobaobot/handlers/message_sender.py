@@ -20,7 +20,8 @@ from typing import Any
 from telegram import Bot, LinkPreviewOptions, Message
 from telegram.error import NetworkError, RetryAfter, TimedOut
 
-from ..markdown_v2 import convert_markdown
+from ..markdown_v2 import convert_markdown_async
+from ..metrics import RETRY_AFTER
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,7 @@ async def _send_with_retry(
         try:
             return await send_fn(*args, **kwargs)
         except RetryAfter:
+            RETRY_AFTER.inc(call=getattr(send_fn, "__name__", "unknown"))
             raise
         except (TimedOut, NetworkError) as e:
             if attempt == _SEND_MAX_RETRIES - 1:
@@ -93,7 +95,7 @@ async def _send_with_fallback(
         return await _send_with_retry(
             bot.send_message,
             chat_id=chat_id,
-            text=convert_markdown(text),
+            text=await convert_markdown_async(text),
             parse_mode="MarkdownV2",
             **kwargs,
         )
@@ -134,7 +136,7 @@ async def safe_reply(message: Message, text: str, **kwargs: Any) -> Message:
     try:
         return await _send_with_retry(
             message.reply_text,
-            convert_markdown(text),
+            await convert_markdown_async(text),
             parse_mode="MarkdownV2",
             **kwargs,
         )
@@ -150,7 +152,7 @@ async def safe_edit(target: Any, text: str, **kwargs: Any) -> None:
     try:
         await _send_with_retry(
             target.edit_message_text,
-            convert_markdown(text),
+            await convert_markdown_async(text),
             parse_mode="MarkdownV2",
             **kwargs,
         )
@@ -180,7 +182,7 @@ async def safe_send(
         await _send_with_retry(
             bot.send_message,
             chat_id=chat_id,
-            text=convert_markdown(text),
+            text=await convert_markdown_async(text),
             parse_mode="MarkdownV2",
             **kwargs,
         )
@@ -27,6 +27,7 @@ from typing import TYPE_CHECKING
 
 from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 
+from ..metrics import POLL_LOOP_SECONDS
 from ..terminal_parser import is_interactive_ui, parse_status_line
 from .callback_data import CB_RESTART_SESSION
 from .cleanup import clear_topic_state
@@ -35,7 +36,11 @@ from .interactive_ui import (
     get_interactive_window,
     handle_interactive_ui,
 )
-from .message_queue import enqueue_status_update, get_message_queue
+from .message_queue import (
+    enqueue_status_update,
+    get_message_queue,
+    record_window_status,
+)
 from .message_sender import rate_limit_send_message
 
 if TYPE_CHECKING:
@@ -190,6 +195,7 @@ async def update_status_message(
 
     # Normal status line check
     status_line = parse_status_line(pane_text)
+    record_window_status(agent_ctx, window_id, status_line)
 
     # Freeze detection: unchanged pane + stale spinner → notify user
     if _check_freeze(window_id, pane_text):
@@ -238,6 +244,7 @@ async def status_poll_loop(
     logger.info("Status polling started (interval: %ss)", STATUS_POLL_INTERVAL)
     last_topic_check = 0.0
     while True:
+        loop_started = time.monotonic()
         try:
             if _shutting_down:
                 break
@@ -311,5 +318,6 @@ async def status_poll_loop(
                     logger.debug(f"Status update error for key {rk.session_key}: {e}")
         except Exception as e:
             logger.error(f"Status poll loop error: {e}")
+        POLL_LOOP_SECONDS.observe(time.monotonic() - loop_started, loop="status")
 
         await asyncio.sleep(STATUS_POLL_INTERVAL)
@@ -0,0 +1,211 @@
+"""HeadlessPool — bounded, prioritised executor for headless CLI jobs.
+
+SystemScheduler runs summaries through one-shot `claude -p` / `gemini -p`
+subprocesses. Each is a full CLI process (hundreds of MB resident), so the
+number in flight is bounded by a slot count derived from CPU count and
+physical memory unless configured explicitly. Waiting jobs are granted slots
+in priority order (user-triggered before background), FIFO within a class.
+
+Every job runs under a timeout budget, and the pool keeps queue-depth and
+latency counters per priority class for logging and status displays.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+from .metrics import HEADLESS_JOB_SECONDS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Priority classes — lower runs first
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 10
+
+_PRIORITY_NAMES = {PRIORITY_USER: "user", PRIORITY_BACKGROUND: "background"}
+
+# Rough resident size of one headless CLI process (node + model client)
+_WORKER_MEMORY_BYTES = 768 * 1024 * 1024
+
+# Bounds for the auto-derived concurrency
+_MIN_WORKERS = 1
+_MAX_WORKERS = 8
+
+
+def default_concurrency() -> int:
+    """Derive a worker count from CPU count and physical memory.
+
+    Uses half the CPUs (headless runs are mostly waiting on the API, but the
+    CLI start-up is CPU-heavy) and at most half of RAM at
+    ``_WORKER_MEMORY_BYTES`` per worker, clamped to ``[1, 8]``.
+    """
+    cpus = os.cpu_count() or 1
+    by_cpu = max(1, cpus // 2)
+
+    by_mem = _MAX_WORKERS
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        by_mem = max(1, (total // 2) // _WORKER_MEMORY_BYTES)
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    return max(_MIN_WORKERS, min(_MAX_WORKERS, by_cpu, by_mem))
+
+
+@dataclass
+class _ClassStats:
+    """Counters for one priority class."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    wait_total: float = 0.0
+    wait_max: float = 0.0
+    run_total: float = 0.0
+    run_max: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        started = self.completed + self.failed + self.timeouts
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "wait_avg": self.wait_total / started if started else 0.0,
+            "wait_max": self.wait_max,
+            "run_avg": self.run_total / started if started else 0.0,
+            "run_max": self.run_max,
+        }
+
+
+class HeadlessPool:
+    """Priority-ordered slot pool for headless CLI jobs.
+
+    ``run()`` waits for a slot (user priority jumps ahead of background),
+    then awaits the job under ``asyncio.wait_for(timeout)``. A cancelled
+    waiter gives up its place without consuming a slot.
+    """
+
+    def __init__(self, max_workers: int = 0, *, default_timeout: float = 0.0) -> None:
+        self.max_workers = max_workers if max_workers > 0 else default_concurrency()
+        self._default_timeout = default_timeout
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._stats: dict[int, _ClassStats] = {}
+
+    # --- Slot management ---
+
+    async def _acquire(self, priority: int) -> None:
+        if self._active < self.max_workers and not self._waiters:
+            self._active += 1
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was handed over just as we were cancelled — pass it on
+                self._release()
+            else:
+                self._waiters = [w for w in self._waiters if w[2] is not fut]
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                # Hand the slot straight to the next waiter (_active unchanged)
+                fut.set_result(None)
+                return
+        self._active -= 1
+
+    # --- Public API ---
+
+    async def run(
+        self,
+        job: Callable[[], Awaitable[T]],
+        *,
+        priority: int = PRIORITY_BACKGROUND,
+        timeout: float | None = None,
+    ) -> T:
+        """Run ``job()`` once a slot is free.
+
+        ``timeout`` bounds the job's run time (not its queue wait); ``None``
+        uses the pool default, ``0`` disables it. Raises ``asyncio.TimeoutError``
+        when the budget is exceeded.
+        """
+        stats = self._stats.setdefault(priority, _ClassStats())
+        stats.submitted += 1
+        budget = self._default_timeout if timeout is None else timeout
+
+        queued_at = time.monotonic()
+        await self._acquire(priority)
+        started = time.monotonic()
+        waited = started - queued_at
+        stats.wait_total += waited
+        stats.wait_max = max(stats.wait_max, waited)
+        if waited > 1.0:
+            logger.debug(
+                "HeadlessPool: %s job waited %.1fs (queued=%d)",
+                _PRIORITY_NAMES.get(priority, priority),
+                waited,
+                len(self._waiters),
+            )
+
+        try:
+            if budget and budget > 0:
+                result = await asyncio.wait_for(job(), timeout=budget)
+            else:
+                result = await job()
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise
+        except BaseException:
+            stats.failed += 1
+            raise
+        else:
+            stats.completed += 1
+            return result
+        finally:
+            elapsed = time.monotonic() - started
+            HEADLESS_JOB_SECONDS.observe(
+                elapsed, priority=_PRIORITY_NAMES.get(priority, str(priority))
+            )
+            stats.run_total += elapsed
+            stats.run_max = max(stats.run_max, elapsed)
+            self._release()
+
+    @property
+    def active(self) -> int:
+        """Number of jobs currently holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a slot."""
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    def stats(self) -> dict[str, object]:
+        """Snapshot of pool state and per-priority counters."""
+        return {
+            "max_workers": self.max_workers,
+            "active": self._active,
+            "queued": self.queued,
+            "classes": {
+                _PRIORITY_NAMES.get(p, str(p)): s.as_dict()
+                for p, s in sorted(self._stats.items())
+            },
+        }
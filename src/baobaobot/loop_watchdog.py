@@ -0,0 +1,303 @@
+"""Event-loop stall detector and slow-callback profiler.
+
+Every agent, poller, the share server and all Telegram handlers run on one
+asyncio loop, so a synchronous call anywhere (state saves, memory sync,
+transcript parsing) stalls every topic at once.  LoopWatchdog makes that
+visible:
+
+- a heartbeat task sleeps ``interval`` and records how late it woke up
+  (``baobaobot_event_loop_lag_seconds``, stalls counted in
+  ``baobaobot_event_loop_stalls_total``);
+- a daemon thread notices when the heartbeat is overdue by more than
+  ``threshold`` and, while the stall lasts, samples the loop thread's stack
+  via ``sys._current_frames()``.  The stall is attributed to the call site
+  seen most often — the innermost frame inside this package, so
+  ``json.loads`` under ``_get_session_direct`` is reported as the latter;
+- offenders are aggregated per call site (count, total/max duration and
+  the stack of the longest stall), and the stack is logged at most once
+  per site per ``log_interval``.
+
+Opt-in via ``[watchdog] enabled = true`` in settings.toml.  The report is
+served by ShareServer at ``/debug/loop``.
+
+Key objects: LoopWatchdog, StallSite, get_active.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import FrameType
+
+from .metrics import registry
+
+logger = logging.getLogger(__name__)
+
+_PKG_DIR = str(Path(__file__).resolve().parent)
+_PKG_PARENT = str(Path(__file__).resolve().parent.parent)
+_THIS_FILE = str(Path(__file__).resolve())
+
+# Frames kept in an example stack
+_STACK_LIMIT = 25
+
+LOOP_LAG_SECONDS = registry.histogram(
+    "baobaobot_event_loop_lag_seconds",
+    "How late the event-loop heartbeat woke up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+LOOP_STALLS = registry.counter(
+    "baobaobot_event_loop_stalls_total",
+    "Heartbeats delayed by more than the watchdog threshold",
+)
+
+_active: LoopWatchdog | None = None
+
+
+def get_active() -> LoopWatchdog | None:
+    """The running watchdog, or None when disabled."""
+    return _active
+
+
+def _describe(frame: FrameType) -> str:
+    filename = frame.f_code.co_filename
+    if filename.startswith(_PKG_PARENT):
+        filename = filename[len(_PKG_PARENT) + 1 :]
+    return f"{filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def call_site(frame: FrameType) -> str:
+    """Innermost frame inside the package, else the innermost frame."""
+    f: FrameType | None = frame
+    while f is not None:
+        filename = f.f_code.co_filename
+        if filename.startswith(_PKG_DIR) and filename != _THIS_FILE:
+            return _describe(f)
+        f = f.f_back
+    return _describe(frame)
+
+
+@dataclass
+class StallSite:
+    """Aggregated stalls attributed to one call site."""
+
+    site: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last_seen: float = 0.0  # wall-clock time of the latest stall
+    stack: str = ""  # stack of the longest stall
+    last_logged: float = 0.0  # monotonic
+
+
+class _Stall:
+    """Samples collected while one heartbeat is overdue."""
+
+    def __init__(self, beat: float) -> None:
+        self.beat = beat
+        self.samples: collections.Counter[str] = collections.Counter()
+        self.stacks: dict[str, str] = {}
+
+    def sample(self, frame: FrameType) -> None:
+        site = call_site(frame)
+        self.samples[site] += 1
+        if site not in self.stacks:
+            self.stacks[site] = "".join(traceback.format_stack(frame, limit=_STACK_LIMIT))
+
+
+class LoopWatchdog:
+    """Measures event-loop lag and profiles the callbacks that cause it."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.25,
+        interval: float = 0.1,
+        sample_interval: float = 0.05,
+        log_interval: float = 60.0,
+        max_sites: int = 200,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.sample_interval = sample_interval
+        self.log_interval = log_interval
+        self._max_sites = max_sites
+        self._sites: dict[str, StallSite] = {}
+        self._lock = threading.Lock()
+        # (previous beat, lag) for heartbeats that came in late
+        self._late_beats: collections.deque[tuple[float, float]] = collections.deque(
+            maxlen=64
+        )
+        self._last_beat = 0.0
+        self._max_lag = 0.0
+        self._started_at = 0.0
+        self._loop_thread_id = 0
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    # --- lifecycle ---
+
+    async def start(self) -> None:
+        """Start the heartbeat and the sampler (call from the loop thread)."""
+        global _active
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._started_at = time.time()
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+        _active = self
+        logger.info(
+            "Event-loop watchdog started (threshold %.0f ms)", self.threshold * 1000
+        )
+
+    async def stop(self) -> None:
+        global _active
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if _active is self:
+            _active = None
+
+    # --- loop side ---
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            prev = self._last_beat
+            lag = max(0.0, now - prev - self.interval)
+            if lag > self.threshold:
+                # Before publishing the beat, so the sampler finds the lag
+                LOOP_STALLS.inc()
+                self._late_beats.append((prev, lag))
+            self._last_beat = now
+            LOOP_LAG_SECONDS.observe(lag)
+            self._max_lag = max(self._max_lag, lag)
+
+    # --- sampler thread ---
+
+    def _watch(self) -> None:
+        stall: _Stall | None = None
+        while not self._stop_event.wait(self.sample_interval):
+            beat = self._last_beat
+            if stall is not None and stall.beat != beat:
+                # The overdue heartbeat finally ran: the stall is over
+                self._finish(stall)
+                stall = None
+            if time.monotonic() - beat - self.interval <= self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            if stall is None:
+                stall = _Stall(beat)
+            stall.sample(frame)
+            del frame
+
+    def _finish(self, stall: _Stall) -> None:
+        duration = next(
+            (lag for prev, lag in reversed(self._late_beats) if prev == stall.beat),
+            0.0,
+        )
+        if not duration or not stall.samples:
+            return
+        site, _n = stall.samples.most_common(1)[0]
+        self.record(site, duration, stall.stacks[site])
+
+    def record(self, site: str, duration: float, stack: str) -> None:
+        """Attribute one stall of *duration* seconds to *site*."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sites.get(site)
+            if entry is None:
+                if len(self._sites) >= self._max_sites:
+                    # Drop the least significant site to bound memory
+                    victim = min(self._sites.values(), key=lambda s: s.total)
+                    del self._sites[victim.site]
+                entry = self._sites[site] = StallSite(site=site)
+            entry.count += 1
+            entry.total += duration
+            entry.last_seen = time.time()
+            if duration >= entry.max:
+                entry.max = duration
+                entry.stack = stack
+            should_log = now - entry.last_logged >= self.log_interval
+            if should_log:
+                entry.last_logged = now
+        if should_log:
+            logger.warning(
+                "Event loop blocked for %.0f ms at %s\n%s", duration * 1000, site, stack
+            )
+        else:
+            logger.debug("Event loop blocked for %.0f ms at %s", duration * 1000, site)
+
+    # --- reporting ---
+
+    def sites(self) -> list[StallSite]:
+        """Stall sites, worst (total blocked time) first."""
+        with self._lock:
+            return sorted(
+                (StallSite(**asdict(s)) for s in self._sites.values()),
+                key=lambda s: s.total,
+                reverse=True,
+            )
+
+    def snapshot(self, limit: int = 50) -> dict:
+        """JSON-serialisable state for ``/debug/loop?format=json``."""
+        return {
+            "threshold": self.threshold,
+            "interval": self.interval,
+            "started_at": self._started_at,
+            "stalls": int(LOOP_STALLS.total()),
+            "lag_p50": LOOP_LAG_SECONDS.quantile(0.5),
+            "lag_p99": LOOP_LAG_SECONDS.quantile(0.99),
+            "lag_max": self._max_lag,
+            "sites": [
+                {k: v for k, v in asdict(s).items() if k != "last_logged"}
+                for s in self.sites()[:limit]
+            ],
+        }
+
+    def report(self, limit: int = 20, stacks: int = 5) -> str:
+        """Plain-text report: lag summary, top offenders, worst stacks."""
+        snap = self.snapshot(limit)
+        lines = [
+            f"Event-loop watchdog — threshold {self.threshold * 1000:.0f} ms, "
+            f"heartbeat {self.interval * 1000:.0f} ms",
+            f"Lag p50 {snap['lag_p50'] * 1000:.1f} ms · p99 {snap['lag_p99'] * 1000:.1f} ms"
+            f" · max {snap['lag_max'] * 1000:.0f} ms · stalls {snap['stalls']}",
+            "",
+        ]
+        sites = snap["sites"]
+        if not sites:
+            lines.append("No stalls attributed yet.")
+            return "\n".join(lines) + "\n"
+        lines.append(f"{'count':>6} {'total':>9} {'max':>8}  call site")
+        for s in sites:
+            lines.append(
+                f"{s['count']:>6} {s['total']:>8.2f}s {s['max'] * 1000:>6.0f}ms  {s['site']}"
+            )
+        for s in sites[:stacks]:
+            lines += ["", f"--- {s['site']} (max {s['max'] * 1000:.0f} ms) ---", s["stack"].rstrip()]
+        return "\n".join(lines) + "\n"
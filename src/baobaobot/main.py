@@ -339,6 +339,24 @@ monitor_poll_interval = 2.0    # seconds between session polling cycles
 # Cron
 # cron_default_tz = "Asia/Taipei"  # default timezone for cron jobs
 
+# Scheduler
+# [scheduler]
+# headless_concurrency = 0     # parallel headless summary runs (0 = auto from CPU/RAM)
+# cron_max_concurrent = 8      # cron jobs dispatched at once across workspaces
+# cron_workspace_concurrent = 1  # cron jobs dispatched at once per workspace
+# embedding_backfill_interval = 300  # seconds between memory embedding passes (0 = off)
+# embedding_backfill_timeout = 60    # embedding compute budget (seconds) per workspace per pass
+
+# Share server (web terminal / VS Code / port proxy)
+# [share]
+# terminal_ws_compress = true  # permessage-deflate for web terminal output
+# code_server_warm_pool = 1     # pre-started VS Code Web instances (0 = off)
+
+# Event-loop stall detector (report at /debug/loop on the share server)
+# [watchdog]
+# enabled = true
+# threshold_ms = 250           # log callbacks that block the loop longer than this
+
 # Each [[agents]] entry creates one bot instance.
 # Per-agent keys override [global] values.
 [[agents]]
@@ -855,6 +873,20 @@ def main() -> None:
                 await asyncio.sleep(_INIT_RETRY_DELAY)
 
     async def _run_bot() -> None:
+        # One event loop serves every agent, so one watchdog per process
+        watchdog = None
+        watchdog_cfg = agent_configs[0].watchdog
+        if watchdog_cfg.enabled:
+            from .loop_watchdog import LoopWatchdog
+
+            watchdog = LoopWatchdog(
+                threshold=watchdog_cfg.threshold_ms / 1000,
+                interval=watchdog_cfg.interval_ms / 1000,
+                sample_interval=watchdog_cfg.sample_interval_ms / 1000,
+                log_interval=watchdog_cfg.log_interval,
+            )
+            await watchdog.start()
+
         apps = []
         for ctx in agent_contexts:
             app = create_bot(ctx)
@@ -892,6 +924,9 @@ def main() -> None:
             except Exception as e:
                 logger.error("Error shutting down app %d: %s", i, e)
 
+        if watchdog is not None:
+            await watchdog.stop()
+
         if _stop_with_tmux_kill:
             _kill_tmux_session()
 
@@ -5,10 +5,20 @@ blockquotes (delimited by sentinel tokens from TranscriptParser).
 Expandable quotes are escaped and formatted as Telegram >…|| syntax
 separately, so the library doesn't mangle them.
 
-Key function: convert_markdown(text) → MarkdownV2 string.
+Conversions are memoised in a bounded LRU keyed by content hash, so the
+same part sent to several destinations (or re-sent after a retry) is only
+rendered once. Plain text without Markdown metacharacters skips the parser.
+
+Key functions: convert_markdown(text) → MarkdownV2 string;
+convert_markdown_async(text) for event-loop callers (large inputs are
+rendered in a worker thread).
 """
 
+import asyncio
+import hashlib
 import re
+import threading
+from collections import OrderedDict
 
 import mistletoe
 from mistletoe.block_token import BlockCode, remove_token
@@ -95,7 +105,98 @@ def _markdownify(text: str) -> str:
     return result
 
 
+# Text made only of characters the renderer passes through unchanged
+# (no MarkdownV2 specials, no HTML/entity starters, no whitespace besides
+# space and newline).
+_PLAIN_RE = re.compile(r"(?:[^\s_*\[\]()~`>#+\-=|{}.!\\<&]|[ \n])*")
+
+_CACHE_SIZE = 512
+# Inputs at least this long are rendered off the event loop
+_THREAD_THRESHOLD = 2048
+
+_cache: OrderedDict[bytes, str] = OrderedDict()
+_cache_lock = threading.Lock()
+# mistletoe's token registry is process-global (remove_token/reset_tokens),
+# so renders must not overlap.
+_render_lock = threading.Lock()
+
+
+def _plain_fast_path(text: str) -> str | None:
+    """Return the rendering of metacharacter-free text, or None.
+
+    Matches what the renderer produces for such text: unchanged lines plus a
+    trailing newline. Lines with leading/trailing whitespace are left to the
+    parser (it strips them).
+    """
+    if not text or not _PLAIN_RE.fullmatch(text):
+        return None
+    for line in text.split("\n"):
+        if line != line.strip():
+            return None
+    return text if text.endswith("\n") else text + "\n"
+
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+
+
+def _cache_get(key: bytes) -> str | None:
+    with _cache_lock:
+        result = _cache.get(key)
+        if result is not None:
+            _cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key: bytes, result: str) -> None:
+    with _cache_lock:
+        _cache[key] = result
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
 def convert_markdown(text: str) -> str:
+    """Convert standard Markdown to Telegram MarkdownV2 format (memoised)."""
+    fast = _plain_fast_path(text)
+    if fast is not None:
+        return fast
+    key = _cache_key(text)
+    result = _cache_get(key)
+    if result is None:
+        with _render_lock:
+            result = _convert(text)
+        _cache_put(key, result)
+    return result
+
+
+async def convert_markdown_async(text: str) -> str:
+    """Event-loop friendly convert_markdown().
+
+    Cache hits and plain text return immediately. Short inputs are rendered
+    inline when no other render is in progress; large inputs (or a busy
+    renderer) are handed to a worker thread so polling is not stalled.
+    """
+    fast = _plain_fast_path(text)
+    if fast is not None:
+        return fast
+    key = _cache_key(text)
+    result = _cache_get(key)
+    if result is not None:
+        return result
+    if len(text) < _THREAD_THRESHOLD and _render_lock.acquire(blocking=False):
+        try:
+            result = _convert(text)
+        finally:
+            _render_lock.release()
+        _cache_put(key, result)
+        return result
+    return await asyncio.to_thread(convert_markdown, text)
+
+
+def _convert(text: str) -> str:
     """Convert standard Markdown to Telegram MarkdownV2 format.
 
     Expandable blockquote sections (marked by sentinel tokens from
@@ -16,6 +16,7 @@ import json
 import logging
 import re
 import sqlite3
+import struct
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -25,7 +26,7 @@ logger = logging.getLogger(__name__)
 
 # Schema version — bump to force DB recreation on next connect.
 # IMPORTANT: keep in sync with _memory_common.py (standalone bin scripts).
-_SCHEMA_VERSION = 6
+_SCHEMA_VERSION = 9
 
 # ---------------------------------------------------------------------------
 # Dedup helpers — character-bigram Jaccard similarity
@@ -55,27 +56,98 @@ def _jaccard(a: set[str], b: set[str]) -> float:
     return len(a & b) / len(a | b)
 
 
+# MinHash signatures over the same character bigrams.  Stored per memories
+# row at sync time; LSH bands over them pick the pairs worth an exact check.
+_MINHASH_PERM = 32
+_MINHASH_MASKS = tuple(
+    int.from_bytes(hashlib.blake2b(b"minhash%d" % i, digest_size=4).digest(), "little")
+    for i in range(_MINHASH_PERM)
+)
+_MINHASH_EMPTY = (0xFFFFFFFF,) * _MINHASH_PERM
+_MINHASH_STRUCT = struct.Struct(f"<{_MINHASH_PERM}I")
+# Up to this many results every pair is compared; LSH only pays off beyond
+_EXACT_DEDUP_MAX = 64
+
+
+def _minhash(text: str) -> tuple[int, ...]:
+    """MinHash signature (``_MINHASH_PERM`` 32-bit values) of *text*'s bigrams."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=4).digest(), "little")
+        for g in _char_bigrams(text)
+    ]
+    if not hashes:
+        return _MINHASH_EMPTY
+    return tuple(min(h ^ m for h in hashes) for m in _MINHASH_MASKS)
+
+
+def _minhash_blob(text: str) -> bytes:
+    """Serialized ``_minhash`` for the memories.minhash column."""
+    return _MINHASH_STRUCT.pack(*_minhash(text))
+
+
+def _result_signature(result: dict) -> tuple[int, ...]:
+    """Pop the stored ``_minhash`` blob off *result*, or compute it."""
+    blob = result.pop("_minhash", None)
+    if blob and len(blob) == _MINHASH_STRUCT.size:
+        return _MINHASH_STRUCT.unpack(blob)
+    return _minhash(result["content"])
+
+
+def _lsh_candidates(
+    signatures: list[tuple[int, ...]], threshold: float
+) -> list[set[int]]:
+    """For each index, the later indices sharing at least one LSH band."""
+    # Narrower bands for low thresholds so dissimilar-ish pairs still collide
+    rows = 1 if threshold < 0.3 else 2
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    candidates: list[set[int]] = [set() for _ in signatures]
+    for idx, sig in enumerate(signatures):
+        for band in range(0, _MINHASH_PERM, rows):
+            members = buckets.setdefault((band, sig[band : band + rows]), [])
+            for other in members:
+                candidates[other].add(idx)
+            members.append(idx)
+    return candidates
+
+
 def _dedup_results(results: list[dict], threshold: float = 0.55) -> list[dict]:
     """Remove near-duplicate search results, keeping higher-priority sources.
 
     Priority: experience > daily > summary.
-    Uses character-bigram Jaccard similarity.
-    O(n²) pairwise comparison — fine for typical search result sizes (<200).
+    Uses character-bigram Jaccard similarity.  Up to ``_EXACT_DEDUP_MAX``
+    results every pair is compared.  Larger sets only compare pairs that
+    share an LSH band of their MinHash signatures, which is approximate:
+    a small fraction of pairs just above the threshold never share a band
+    and are both kept.
     """
-    if len(results) <= 1:
-        return results
+    n = len(results)
+    if n <= _EXACT_DEDUP_MAX:
+        for r in results:
+            r.pop("_minhash", None)
+        if n <= 1:
+            return results
+        candidates = [set(range(i + 1, n)) for i in range(n)]
+    else:
+        candidates = _lsh_candidates(
+            [_result_signature(r) for r in results], threshold
+        )
+
+    bigrams: dict[int, set[str]] = {}
+
+    def grams(idx: int) -> set[str]:
+        if idx not in bigrams:
+            bigrams[idx] = _char_bigrams(results[idx]["content"])
+        return bigrams[idx]
 
-    # Pre-compute bigrams
-    bigrams = [_char_bigrams(r["content"]) for r in results]
     keep = [True] * len(results)
 
     for i in range(len(results)):
         if not keep[i]:
             continue
-        for j in range(i + 1, len(results)):
+        for j in sorted(candidates[i]):
             if not keep[j]:
                 continue
-            if _jaccard(bigrams[i], bigrams[j]) >= threshold:
+            if _jaccard(grams(i), grams(j)) >= threshold:
                 # Drop the lower-priority one
                 pri_i = _SOURCE_PRIORITY.get(results[i]["source"], 9)
                 pri_j = _SOURCE_PRIORITY.get(results[j]["source"], 9)
@@ -96,7 +168,8 @@ CREATE TABLE IF NOT EXISTS memories (
     date        TEXT    NOT NULL,  -- 'YYYY-MM-DD' or topic name or 'YYYY-MM-DD_HH00'
     line_num    INTEGER NOT NULL,
     content     TEXT    NOT NULL,
-    updated_at  TEXT    NOT NULL
+    updated_at  TEXT    NOT NULL,
+    minhash     BLOB             -- _minhash() signature for dedup
 );
 
 CREATE TABLE IF NOT EXISTS file_meta (
@@ -141,6 +214,14 @@ CREATE TABLE IF NOT EXISTS embedding_cache (
     PRIMARY KEY (content_hash, model_name)
 );
 
+CREATE TABLE IF NOT EXISTS query_embedding_cache (
+    query_norm   TEXT    NOT NULL,
+    model_name   TEXT    NOT NULL,
+    embedding    BLOB    NOT NULL,
+    last_used    REAL    NOT NULL,
+    PRIMARY KEY (query_norm, model_name)
+);
+
 CREATE INDEX IF NOT EXISTS idx_memories_date    ON memories(date);
 CREATE INDEX IF NOT EXISTS idx_memories_source  ON memories(source);
 CREATE INDEX IF NOT EXISTS idx_memories_path    ON memories(path);
@@ -149,6 +230,22 @@ CREATE INDEX IF NOT EXISTS idx_paragraphs_path  ON paragraphs(path);
 CREATE INDEX IF NOT EXISTS idx_paragraphs_hash  ON paragraphs(content_hash);
 """
 
+# Trigram index for non-ASCII (CJK) queries.  The default unicode61 tokenizer
+# treats a run of CJK characters as one token, so substring queries can't use
+# memories_fts.  Created separately: the trigram tokenizer needs SQLite 3.34+.
+# IMPORTANT: keep in sync with _memory_common.py
+_TRIGRAM_SCHEMA = """\
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_trigram USING fts5(
+    content,
+    content='memories',
+    content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+# Trigram MATCH needs at least this many characters; shorter queries use LIKE
+_TRIGRAM_MIN_CHARS = 3
+
 
 class MemoryDB:
     """SQLite index for workspace memory files."""
@@ -160,6 +257,7 @@ class MemoryDB:
         self.db_path = workspace_dir / "memory.db"
         self._conn: sqlite3.Connection | None = None
         self._fts_available: bool = True
+        self._trigram_available: bool = True
         self._migration_done: bool = False
 
     # ------------------------------------------------------------------
@@ -188,11 +286,13 @@ class MemoryDB:
             # ⚠️ NEVER DROP: todos (sole data source is DB, no markdown backup)
             conn.executescript(
                 "DROP TABLE IF EXISTS memories_fts;\n"
+                "DROP TABLE IF EXISTS memories_trigram;\n"
                 "DROP TABLE IF EXISTS attachment_meta;\n"
                 "DROP TABLE IF EXISTS memories;\n"
                 "DROP TABLE IF EXISTS file_meta;\n"
                 "DROP TABLE IF EXISTS paragraphs;\n"
                 "DROP TABLE IF EXISTS embedding_cache;\n"
+                "DROP TABLE IF EXISTS query_embedding_cache;\n"
             )
             try:
                 conn.executescript(_SCHEMA)
@@ -208,14 +308,24 @@ class MemoryDB:
                     and "content_rowid" not in line
                 )
                 conn.executescript(schema_no_fts)
+            try:
+                conn.executescript(_TRIGRAM_SCHEMA)
+            except sqlite3.OperationalError:
+                # FTS5 or the trigram tokenizer missing — CJK queries use LIKE
+                self._trigram_available = False
             conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
             conn.commit()
         else:
-            # Check if FTS5 table exists
-            fts_check = conn.execute(
-                "SELECT name FROM sqlite_master WHERE name = 'memories_fts'"
-            ).fetchone()
-            self._fts_available = fts_check is not None
+            # Check which FTS5 tables exist
+            names = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE name IN ('memories_fts', 'memories_trigram')"
+                )
+            }
+            self._fts_available = "memories_fts" in names
+            self._trigram_available = "memories_trigram" in names
 
     def close(self) -> None:
         if self._conn is not None:
@@ -293,9 +403,9 @@ class MemoryDB:
             stripped = line.strip()
             if stripped:  # skip blank lines
                 conn.execute(
-                    "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?, ?)",
-                    (rel, source, date, i, stripped, now),
+                    "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (rel, source, date, i, stripped, now, _minhash_blob(stripped)),
                 )
 
         # Parse and store attachment metadata
@@ -362,8 +472,8 @@ class MemoryDB:
 
         conn.commit()
 
-        # Rebuild FTS index if anything changed
-        if synced and self._fts_available:
+        # Rebuild FTS indexes if anything changed
+        if synced and (self._fts_available or self._trigram_available):
             self._rebuild_fts(conn)
 
         if synced:
@@ -371,12 +481,21 @@ class MemoryDB:
         return synced
 
     def _rebuild_fts(self, conn: sqlite3.Connection) -> None:
-        """Rebuild the FTS5 index from the memories table."""
-        try:
-            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
-            conn.commit()
-        except sqlite3.OperationalError:
-            self._fts_available = False
+        """Rebuild the FTS5 indexes from the memories table."""
+        if self._fts_available:
+            try:
+                conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
+                conn.commit()
+            except sqlite3.OperationalError:
+                self._fts_available = False
+        if self._trigram_available:
+            try:
+                conn.execute(
+                    "INSERT INTO memories_trigram(memories_trigram) VALUES('rebuild')"
+                )
+                conn.commit()
+            except sqlite3.OperationalError:
+                self._trigram_available = False
 
     def _cleanup_deleted(self, conn: sqlite3.Connection) -> int:
         """Remove index entries for files that no longer exist on disk."""
@@ -403,6 +522,9 @@ class MemoryDB:
     ) -> list[dict]:
         """Search memories using FTS5 (with LIKE fallback).
 
+        ASCII queries use the word index (``memories_fts``); other queries
+        use the trigram index when they are long enough to match.
+
         Args:
             query: Search string.
             days: Optional — limit to daily memories from the last N days.
@@ -414,12 +536,20 @@ class MemoryDB:
         self.sync()
         conn = self.connect()
 
-        # FTS5's default tokenizer doesn't handle CJK; use LIKE directly
-        # for non-ASCII queries.  For ASCII queries, trust FTS results.
-        use_fts = self._fts_available and query.isascii()
-        if use_fts:
+        # FTS5's default tokenizer doesn't handle CJK; non-ASCII queries go
+        # to the trigram index, which can't match fewer than 3 characters
+        # (e.g. a two-character CJK word) — those still use LIKE.
+        if query.isascii():
+            table = "memories_fts" if self._fts_available else None
+        elif self._trigram_available and len(query.strip()) >= _TRIGRAM_MIN_CHARS:
+            table = "memories_trigram"
+        else:
+            table = None
+        if table is not None:
             try:
-                return _dedup_results(self._search_fts(conn, query, days, tag))
+                return _dedup_results(
+                    self._search_fts(conn, query, days, tag, table=table)
+                )
             except sqlite3.OperationalError:
                 pass
 
@@ -431,18 +561,19 @@ class MemoryDB:
         query: str,
         days: int | None,
         tag: str | None,
+        table: str = "memories_fts",
     ) -> list[dict]:
-        """Search using FTS5 MATCH with BM25 ranking."""
+        """Search using FTS5 MATCH on *table* with BM25 ranking."""
         # Phrase search: wrap in quotes for exact substring matching
-        escaped = query.replace('"', '""')
+        escaped = query.strip().replace('"', '""')
         fts_query = f'"{escaped}"'
 
         sql = (
-            "SELECT m.source, m.date, m.line_num, m.content "
-            "FROM memories_fts fts "
+            "SELECT m.source, m.date, m.line_num, m.content, m.minhash AS _minhash "
+            f"FROM {table} fts "
             "JOIN memories m ON m.id = fts.rowid"
         )
-        conditions = ["memories_fts MATCH ?"]
+        conditions = [f"{table} MATCH ?"]
         params: list[str] = [fts_query]
 
         if tag is not None:
@@ -470,7 +601,10 @@ class MemoryDB:
         tag: str | None,
     ) -> list[dict]:
         """Search using LIKE (fallback when FTS5 is unavailable)."""
-        sql = "SELECT m.source, m.date, m.line_num, m.content FROM memories m"
+        sql = (
+            "SELECT m.source, m.date, m.line_num, m.content, m.minhash AS _minhash "
+            "FROM memories m"
+        )
         conditions = ["m.content LIKE ?"]
         params: list[str] = [f"%{query}%"]
 
@@ -0,0 +1,219 @@
+"""Background embedding backfill for workspace memory indexes.
+
+``memory-search`` and ``session-init`` no longer compute paragraph
+embeddings inline; instead the bot periodically runs
+``memory-reindex --json --timeout N`` for each workspace, one at a time,
+so API batches never delay a user-facing command.  The script is run as a
+subprocess because the bin helpers keep per-process module state (one DB
+per run).
+
+Workspaces whose ``memory.db`` hasn't changed since a pass that left
+nothing missing are skipped, so an idle bot doesn't spawn processes.
+
+Key class: EmbeddingBackfill.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+_BIN_DIR = Path(__file__).resolve().parent.parent / "workspace" / "bin"
+
+# Extra wall time allowed on top of the compute budget (sync + start-up)
+_PROCESS_GRACE = 30.0
+
+
+def _db_mtime(ws_dir: Path) -> float:
+    """Latest mtime of memory.db and its WAL (0.0 if missing)."""
+    latest = 0.0
+    for name in ("memory.db", "memory.db-wal"):
+        try:
+            latest = max(latest, (ws_dir / name).stat().st_mtime)
+        except OSError:
+            pass
+    return latest
+
+
+@dataclass
+class _WorkspaceProgress:
+    """Last known backfill counters for one workspace."""
+
+    paragraphs: int = 0
+    embedded: int = 0
+    missing: int = 0
+    computed_total: int = 0
+    enabled: bool = False
+    model: str = ""
+    last_run: float = 0.0
+    db_mtime: float = 0.0
+    error: str = ""
+
+
+class EmbeddingBackfill:
+    """Periodically fills missing paragraph embeddings, one workspace at a time."""
+
+    def __init__(
+        self,
+        iter_workspace_dirs: Callable[[], list[Path]],
+        *,
+        interval: float = 300.0,
+        batch_timeout: float = 60.0,
+        script: Path | None = None,
+    ) -> None:
+        self._iter_workspace_dirs = iter_workspace_dirs
+        self._interval = interval
+        self._batch_timeout = batch_timeout
+        self._script = script or _BIN_DIR / "memory-reindex"
+        self._progress: dict[Path, _WorkspaceProgress] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._current: Path | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Embedding backfill pass failed")
+            await asyncio.sleep(self._interval)
+
+    async def run_once(self) -> int:
+        """One pass over all workspaces.  Returns embeddings computed."""
+        computed = 0
+        for ws_dir in self._iter_workspace_dirs():
+            if not (ws_dir / "memory.db").exists():
+                continue
+            prog = self._progress.get(ws_dir)
+            if (
+                prog is not None
+                and not prog.error
+                and (prog.missing == 0 or not prog.enabled)
+                and _db_mtime(ws_dir) <= prog.db_mtime
+            ):
+                continue
+            computed += await self._backfill(ws_dir)
+        return computed
+
+    async def _backfill(self, ws_dir: Path) -> int:
+        prog = self._progress.setdefault(ws_dir, _WorkspaceProgress())
+        self._current = ws_dir
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(self._script),
+                "--json",
+                "--timeout",
+                str(self._batch_timeout),
+                "--workspace",
+                str(ws_dir),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=self._batch_timeout + _PROCESS_GRACE
+                )
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                prog.error = "timeout"
+                logger.warning("Embedding backfill timed out for %s", ws_dir.name)
+                return 0
+            if proc.returncode != 0:
+                prog.error = stderr.decode(errors="replace").strip()[-200:] or (
+                    f"exit {proc.returncode}"
+                )
+                logger.warning(
+                    "Embedding backfill failed for %s: %s", ws_dir.name, prog.error
+                )
+                return 0
+            try:
+                data = json.loads(stdout.decode().strip().splitlines()[-1])
+            except (IndexError, ValueError):
+                prog.error = "unparseable output"
+                return 0
+        finally:
+            self._current = None
+            prog.last_run = time.time()
+
+        computed = int(data.get("computed", 0))
+        prog.paragraphs = int(data.get("paragraphs", 0))
+        prog.embedded = int(data.get("embedded", 0))
+        prog.missing = int(data.get("missing", 0))
+        prog.enabled = bool(data.get("enabled", False))
+        prog.model = str(data.get("model", ""))
+        prog.computed_total += computed
+        prog.db_mtime = _db_mtime(ws_dir)
+        prog.error = ""
+        if computed:
+            logger.info(
+                "Embedding backfill: %s +%d (%d missing)",
+                ws_dir.name,
+                computed,
+                prog.missing,
+            )
+        return computed
+
+    def stats(self) -> dict[str, object]:
+        """Backfill progress, totals plus per workspace."""
+        workspaces = {
+            ws.name: {
+                "paragraphs": p.paragraphs,
+                "embedded": p.embedded,
+                "missing": p.missing,
+                "computed_total": p.computed_total,
+                "enabled": p.enabled,
+                "model": p.model,
+                "last_run": p.last_run,
+                "running": ws == self._current,
+                "error": p.error,
+            }
+            for ws, p in sorted(self._progress.items())
+        }
+        return {
+            "running": self._current.name if self._current else None,
+            "paragraphs": sum(p.paragraphs for p in self._progress.values()),
+            "embedded": sum(p.embedded for p in self._progress.values()),
+            "missing": sum(p.missing for p in self._progress.values()),
+            "workspaces": workspaces,
+        }
+
+    def summary(self) -> str:
+        """One line per workspace, for the /system metrics panel."""
+        lines = []
+        for name, w in self.stats()["workspaces"].items():  # type: ignore[union-attr]
+            if not w["enabled"] and not w["error"]:
+                lines.append(f"{name}: embeddings off")
+                continue
+            line = f"{name}: {w['embedded']}/{w['paragraphs']} embedded"
+            if w["missing"]:
+                line += f" · {w['missing']} missing"
+            if w["running"]:
+                line += " · running"
+            if w["error"]:
+                line += f" · error: {w['error'][:60]}"
+            lines.append(line)
+        return "\n".join(lines)
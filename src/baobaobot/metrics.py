@@ -0,0 +1,419 @@
+"""Lightweight in-process metrics: counters, gauges and histograms.
+
+Instruments the message pipeline (transcript write → SessionMonitor detect →
+handle_new_message → queue → Telegram send) plus tmux calls, poll loops,
+flood-control hits and headless jobs.  Metrics are process-wide (a single
+``registry``) so hot paths can record with one call and no context plumbing;
+per-agent values carry an ``agent`` label.
+
+Values that already live elsewhere (queue depths, headless pool, embedding
+backfill, transcription worker) are not mirrored on every change; instead a
+*collector* callback refreshes the matching gauges right before each
+snapshot.
+
+``registry.render()`` produces the Prometheus text format served by
+ShareServer's ``/metrics`` route; ``registry.summary()`` is the compact text
+shown in /system → Metrics.
+
+Key objects: registry, MetricsRegistry, Counter, Gauge, Histogram.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) for latency histograms
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, object]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: _LabelKey, extra: tuple[str, str] | None = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(
+            k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _render(self) -> list[str]:
+        """Sample lines, without the HELP/TYPE header."""
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+        return lines + self._render()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        super().__init__(name, help_text)
+        self._values: dict[_LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def total(self) -> float:
+        return sum(self._values.values())
+
+    def _render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Point-in-time value (usually refreshed by a collector)."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        super().__init__(name, help_text)
+        self._values: dict[_LabelKey, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def remove(self, **labels: object) -> None:
+        """Drop every series whose labels include *labels*."""
+        want = set(_label_key(labels))
+        with self._lock:
+            for key in [k for k in self._values if want <= set(k)]:
+                del self._values[key]
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def total(self) -> float:
+        return sum(self._values.values())
+
+    def _render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(k)} {_format_value(v)}" for k, v in items]
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self, n_buckets: int) -> None:
+        self.counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observations (latencies, in seconds)."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help_text)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[_LabelKey, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _HistogramSeries(len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series.counts[i] += 1
+                    break
+            series.sum += value
+            series.count += 1
+            series.max = max(series.max, value)
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observe the wall time spent inside the ``with`` block."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(time.monotonic() - started, **labels)
+
+    def _merged(self, labels: dict[str, object]) -> _HistogramSeries:
+        want = set(_label_key(labels))
+        merged = _HistogramSeries(len(self.buckets))
+        with self._lock:
+            for key, s in self._series.items():
+                if not want <= set(key):
+                    continue
+                merged.counts = [a + b for a, b in zip(merged.counts, s.counts)]
+                merged.sum += s.sum
+                merged.count += s.count
+                merged.max = max(merged.max, s.max)
+        return merged
+
+    def count(self, **labels: object) -> int:
+        """Observations across every series matching *labels*."""
+        return self._merged(labels).count
+
+    def quantile(self, q: float, **labels: object) -> float:
+        """Bucket upper bound at quantile *q* (capped at the observed max)."""
+        s = self._merged(labels)
+        if not s.count:
+            return 0.0
+        rank = q * s.count
+        seen = 0
+        for bound, n in zip(self.buckets, s.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, s.max)
+        return s.max
+
+    def mean(self, **labels: object) -> float:
+        s = self._merged(labels)
+        return s.sum / s.count if s.count else 0.0
+
+    def _render(self) -> list[str]:
+        lines: list[str] = []
+        with self._lock:
+            items = sorted(self._series.items())
+            for key, s in items:
+                cumulative = 0
+                for bound, n in zip(self.buckets, s.counts):
+                    cumulative += n
+                    le = ("le", _format_value(bound))
+                    lines.append(f"{self.name}_bucket{_format_labels(key, le)} {cumulative}")
+                inf = ("le", "+Inf")
+                lines.append(f"{self.name}_bucket{_format_labels(key, inf)} {s.count}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(s.sum)}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {s.count}")
+        return lines
+
+
+_M = TypeVar("_M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Named metrics plus collectors that refresh gauges before snapshots."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self, cls: type[_M], name: str, help_text: str, **kwargs: object
+    ) -> _M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                created = cls(name, help_text, **kwargs)
+                self._metrics[name] = created
+                return created
+            if not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text)
+
+    def histogram(
+        self, name: str, help_text: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets=buckets)
+
+    def add_collector(self, fn: Callable[[], None]) -> None:
+        self._collectors.append(fn)
+
+    def remove_collector(self, fn: Callable[[], None]) -> None:
+        try:
+            self._collectors.remove(fn)
+        except ValueError:
+            pass
+
+    def collect(self) -> None:
+        """Run every collector (errors are logged, not raised)."""
+        for fn in list(self._collectors):
+            try:
+                fn()
+            except Exception:
+                logger.exception("Metrics collector failed")
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        self.collect()
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        """Short human-readable overview of the pipeline metrics."""
+        self.collect()
+        lines: list[str] = []
+
+        def _latency(label: str, name: str, **labels: object) -> None:
+            h = self._metrics.get(name)
+            if not isinstance(h, Histogram) or not h.count(**labels):
+                return
+            lines.append(
+                f"{label}: p50 {h.quantile(0.5, **labels):.2f}s · "
+                f"p95 {h.quantile(0.95, **labels):.2f}s · n={h.count(**labels)}"
+            )
+
+        _latency("Detect lag", "baobaobot_monitor_detect_lag_seconds")
+        _latency("Handle", "baobaobot_handle_message_seconds")
+        _latency("Queue wait", "baobaobot_queue_wait_seconds")
+        _latency("Send", "baobaobot_telegram_send_seconds")
+        _latency("End-to-end", "baobaobot_message_end_to_end_seconds")
+        _latency("Monitor poll", "baobaobot_poll_loop_seconds", loop="monitor")
+        _latency("Status poll", "baobaobot_poll_loop_seconds", loop="status")
+        _latency("tmux", "baobaobot_tmux_call_seconds")
+        _latency("Headless job", "baobaobot_headless_job_seconds")
+        _latency("Loop lag", "baobaobot_event_loop_lag_seconds")
+
+        def _total(name: str) -> float:
+            m = self._metrics.get(name)
+            return m.total() if isinstance(m, (Counter, Gauge)) else 0.0
+
+        lines.append(
+            f"Queued: {int(_total('baobaobot_message_queue_depth'))} msgs · "
+            f"RetryAfter: {int(_total('baobaobot_telegram_retry_after_total'))} · "
+            f"Sent: {int(_total('baobaobot_messages_sent_total'))}"
+        )
+        extra = []
+        if "baobaobot_headless_queued" in self._metrics:
+            extra.append(
+                f"headless {int(_total('baobaobot_headless_active'))} running / "
+                f"{int(_total('baobaobot_headless_queued'))} queued"
+            )
+        if "baobaobot_transcription_queue_depth" in self._metrics:
+            extra.append(
+                f"whisper {int(_total('baobaobot_transcription_queue_depth'))}"
+            )
+        stalls = self._metrics.get("baobaobot_event_loop_stalls_total")
+        if isinstance(stalls, Counter) and stalls.total():
+            extra.append(f"loop stalls {int(stalls.total())}")
+        if "baobaobot_embedding_missing" in self._metrics:
+            extra.append(
+                f"embeddings missing {int(_total('baobaobot_embedding_missing'))}"
+            )
+        if extra:
+            lines.append(" · ".join(extra))
+        return "\n".join(lines)
+
+
+registry = MetricsRegistry()
+
+# --- Pipeline metrics (shared by the instrumented modules) ---
+
+MONITOR_DETECT_LAG = registry.histogram(
+    "baobaobot_monitor_detect_lag_seconds",
+    "Transcript file mtime to SessionMonitor reading the new entries",
+)
+HANDLE_MESSAGE_SECONDS = registry.histogram(
+    "baobaobot_handle_message_seconds",
+    "Time spent in the new-message callback (handle_new_message)",
+)
+POLL_LOOP_SECONDS = registry.histogram(
+    "baobaobot_poll_loop_seconds",
+    "Duration of one poll loop iteration",
+)
+MESSAGES_DETECTED = registry.counter(
+    "baobaobot_messages_detected_total",
+    "Transcript messages emitted by SessionMonitor",
+)
+QUEUE_WAIT_SECONDS = registry.histogram(
+    "baobaobot_queue_wait_seconds",
+    "Time a message task spent in its queue before processing",
+)
+TELEGRAM_SEND_SECONDS = registry.histogram(
+    "baobaobot_telegram_send_seconds",
+    "Time to process one message task (Telegram API calls)",
+)
+MESSAGE_END_TO_END = registry.histogram(
+    "baobaobot_message_end_to_end_seconds",
+    "Transcript write to Telegram delivery",
+)
+MESSAGES_SENT = registry.counter(
+    "baobaobot_messages_sent_total",
+    "Content message tasks delivered to Telegram",
+)
+RETRY_AFTER = registry.counter(
+    "baobaobot_telegram_retry_after_total",
+    "Telegram flood-control (RetryAfter) responses",
+)
+QUEUE_DEPTH = registry.gauge(
+    "baobaobot_message_queue_depth",
+    "Pending message tasks across an agent's queues",
+)
+TMUX_CALL_SECONDS = registry.histogram(
+    "baobaobot_tmux_call_seconds",
+    "Latency of tmux operations",
+)
+HEADLESS_JOB_SECONDS = registry.histogram(
+    "baobaobot_headless_job_seconds",
+    "Run time of headless CLI jobs",
+    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0),
+)
@@ -5,7 +5,8 @@ Manages the key mappings:
   User→Thread→Window (thread_bindings): topic-to-window bindings (1 topic = 1 window_id).
 
 Responsibilities:
-  - Persist/load state to state.json.
+  - Persist/load state to state.json (debounced snapshots plus an append-only
+    journal for hot mutations such as read offsets and topic bindings).
   - Sync window↔session bindings from session_map.json (written by hook).
   - Resolve window IDs to ClaudeSession objects (JSONL file reading).
   - Track per-user read offsets for unread-message detection.
@@ -26,11 +27,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from collections.abc import Iterator
-from typing import TYPE_CHECKING, Any, Callable
+from typing import IO, TYPE_CHECKING, Any, Callable
 
 import aiofiles
 
@@ -43,6 +46,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Delay before a dirty state is snapshotted to state.json. Mutations inside
+# the window only append a line to the journal.
+_STATE_FLUSH_DELAY = 1.0
+
 
 @dataclass
 class WindowState:
@@ -166,6 +173,18 @@ class SessionManager:
         # In-memory interaction timestamps for idle detection (not persisted)
         self._last_interaction: dict[str, float] = {}
 
+        # Persistence: state.json is a periodic snapshot; mutations since the
+        # last snapshot live in the journal (the ".old" file is the journal
+        # retired by a snapshot that is still being written).
+        self._journal_file = state_file.with_name(state_file.name + ".journal")
+        self._journal_old_file = state_file.with_name(state_file.name + ".journal.old")
+        self._journal_fh: IO[str] | None = None
+        self._state_generation = 0
+        self._written_generation = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+        self._write_lock = threading.Lock()
+
         self._load_state()
         self._rebuild_reverse_index()
 
@@ -200,18 +219,20 @@ class SessionManager:
         """Return the last interaction timestamp for a window, or 0.0 if unknown."""
         return self._last_interaction.get(window_id, 0.0)
 
-    def _save_state(self) -> None:
-        state: dict[str, Any] = {
+    def _snapshot_state(self) -> dict[str, Any]:
+        """Build the state.json payload (copied, safe to serialize off-loop)."""
+        return {
             "window_states": {k: v.to_dict() for k, v in self.window_states.items()},
             "user_window_offsets": {
-                str(uid): offsets for uid, offsets in self.user_window_offsets.items()
+                str(uid): dict(offsets)
+                for uid, offsets in self.user_window_offsets.items()
             },
             "thread_bindings": {
                 str(uid): {str(tid): wid for tid, wid in bindings.items()}
                 for uid, bindings in self.thread_bindings.items()
             },
-            "group_chat_ids": self.group_chat_ids,
-            "window_display_names": self.window_display_names,
+            "group_chat_ids": dict(self.group_chat_ids),
+            "window_display_names": dict(self.window_display_names),
             "topic_names": {str(tid): name for tid, name in self.topic_names.items()},
             "group_bindings": {
                 str(cid): wid for cid, wid in self.group_bindings.items()
@@ -224,9 +245,135 @@ class SessionManager:
                 for uid, threads in self.user_verbosity.items()
             },
         }
-        atomic_write_json(self._state_file, state)
+
+    def _save_state(self) -> None:
+        """Mark state dirty and schedule a debounced state.json snapshot.
+
+        Without a running event loop (startup, CLI, tests) the snapshot is
+        written immediately.
+        """
+        self._state_generation += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_state()
+            return
+        self._schedule_flush()
+
+    def _journal(self, section: str, keys: tuple[Any, ...], value: Any) -> None:
+        """Record a single mutation of ``state[section][keys...]`` and mark dirty.
+
+        ``value`` None deletes the key. The append costs one buffered write,
+        so hot paths (read offsets, bindings) no longer rewrite state.json.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._save_state()
+            return
+        entry = [section, [str(k) for k in keys], value]
+        try:
+            if self._journal_fh is None:
+                self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._journal_fh = self._journal_file.open("a", encoding="utf-8")
+            self._journal_fh.write(json.dumps(entry) + "\n")
+            self._journal_fh.flush()
+        except OSError as e:
+            logger.warning("Failed to append state journal: %s", e)
+        self._save_state()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is not None or self._flush_task is not None:
+            return  # a pending/running flush picks up the new generation
+        loop = asyncio.get_running_loop()
+        self._flush_handle = loop.call_later(_STATE_FLUSH_DELAY, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self._flush_async())
+
+    async def _flush_async(self) -> None:
+        generation = self._state_generation
+        state = self._snapshot_state()
+        try:
+            self._rotate_journal()
+            await asyncio.to_thread(self._write_snapshot, state, generation)
+        except OSError as e:
+            logger.error("Failed to save state: %s", e)
+        finally:
+            self._flush_task = None
+            if self._state_generation > self._written_generation:
+                self._schedule_flush()
+
+    def flush_state(self) -> None:
+        """Write any pending state to state.json now (blocking).
+
+        Called on shutdown and whenever no event loop is running.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._state_generation <= self._written_generation:
+            return
+        generation = self._state_generation
+        state = self._snapshot_state()
+        self._rotate_journal()
+        self._write_snapshot(state, generation)
+
+    def _rotate_journal(self) -> None:
+        """Retire the active journal; the snapshot being written covers it."""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+        if not self._journal_file.exists():
+            return
+        if self._journal_old_file.exists():
+            # The previous snapshot never landed: keep its entries, in order
+            with self._journal_old_file.open("a", encoding="utf-8") as dst:
+                dst.write(self._journal_file.read_text(encoding="utf-8"))
+            self._journal_file.unlink()
+        else:
+            os.replace(self._journal_file, self._journal_old_file)
+
+    def _write_snapshot(self, state: dict[str, Any], generation: int) -> None:
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return  # a newer snapshot already landed
+            atomic_write_json(self._state_file, state)
+            self._written_generation = generation
+            self._journal_old_file.unlink(missing_ok=True)
         logger.debug("State saved to %s", self._state_file)
 
+    def _replay_journal(self, state: dict[str, Any]) -> int:
+        """Apply journal entries on top of a raw state.json dict.
+
+        Returns the number of entries applied. A torn last line (crash
+        mid-append) is skipped.
+        """
+        applied = 0
+        for path in (self._journal_old_file, self._journal_file):
+            try:
+                lines = path.read_text(encoding="utf-8").splitlines()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning("Failed to read state journal %s: %s", path, e)
+                continue
+            for line in lines:
+                try:
+                    section, keys, value = json.loads(line)
+                    node = state.setdefault(section, {})
+                    for key in keys[:-1]:
+                        node = node.setdefault(key, {})
+                except (json.JSONDecodeError, ValueError, TypeError, AttributeError):
+                    continue
+                if value is None:
+                    node.pop(keys[-1], None)
+                else:
+                    node[keys[-1]] = value
+                applied += 1
+        return applied
+
     def _is_window_id(self, key: str) -> bool:
         """Check if a key looks like a tmux window ID (e.g. '@0', '@12')."""
         return key.startswith("@") and len(key) > 1 and key[1:].isdigit()
@@ -237,9 +384,18 @@ class SessionManager:
         Detects old-format state (window_name keys without '@' prefix) and
         marks for migration on next startup re-resolution.
         """
-        if self._state_file.exists():
+        if (
+            self._state_file.exists()
+            or self._journal_file.exists()
+            or self._journal_old_file.exists()
+        ):
             try:
-                state = json.loads(self._state_file.read_text())
+                state: dict[str, Any] = (
+                    json.loads(self._state_file.read_text())
+                    if self._state_file.exists()
+                    else {}
+                )
+                replayed = self._replay_journal(state)
                 self.window_states = {
                     k: WindowState.from_dict(v)
                     for k, v in state.get("window_states", {}).items()
@@ -303,6 +459,12 @@ class SessionManager:
                 else:
                     self._needs_migration = False
 
+                if replayed:
+                    logger.info("Replayed %d state journal entries", replayed)
+                    # Compact: fold the journal into a fresh snapshot
+                    self._state_generation += 1
+                    self.flush_state()
+
             except (json.JSONDecodeError, ValueError) as e:
                 logger.warning("Failed to load state: %s", e)
                 self.window_states = {}
@@ -577,12 +739,12 @@ class SessionManager:
         """Persist a topic name for a thread_id."""
         if self.topic_names.get(thread_id) != name:
             self.topic_names[thread_id] = name
-            self._save_state()
+            self._journal("topic_names", (thread_id,), name)
 
     def remove_topic_name(self, thread_id: int) -> None:
         """Remove a persisted topic name."""
         if self.topic_names.pop(thread_id, None) is not None:
-            self._save_state()
+            self._journal("topic_names", (thread_id,), None)
 
     # --- Display name management ---
 
@@ -879,7 +1041,7 @@ class SessionManager:
         if user_id not in self.user_window_offsets:
             self.user_window_offsets[user_id] = {}
         self.user_window_offsets[user_id][window_id] = offset
-        self._save_state()
+        self._journal("user_window_offsets", (user_id, window_id), offset)
 
     async def get_unread_info(self, user_id: int, window_id: str) -> UnreadInfo | None:
         """Get unread message info for a user's window.
@@ -940,9 +1102,10 @@ class SessionManager:
             self.thread_bindings[user_id] = {}
         self.thread_bindings[user_id][thread_id] = window_id
         self._window_to_thread[(user_id, window_id)] = thread_id
+        self._journal("thread_bindings", (user_id, thread_id), window_id)
         if window_name:
             self.window_display_names[window_id] = window_name
-        self._save_state()
+            self._journal("window_display_names", (window_id,), window_name)
         display = window_name or self.get_display_name(window_id)
         logger.info(
             "Bound thread %d -> window_id %s (%s) for user %d",
@@ -961,7 +1124,9 @@ class SessionManager:
         self._window_to_thread.pop((user_id, window_id), None)
         if not bindings:
             del self.thread_bindings[user_id]
-        self._save_state()
+            self._journal("thread_bindings", (user_id,), None)
+        else:
+            self._journal("thread_bindings", (user_id, thread_id), None)
         logger.info(
             "Unbound thread %d (was %s) for user %d",
             thread_id,
@@ -1089,8 +1254,15 @@ class SessionManager:
 
     VERBOSITY_LEVELS = ("quiet", "normal", "verbose")
 
-    def _resolve_workspace_dir(self, user_id: int, thread_id: int) -> Path | None:
-        """Resolve workspace directory from user_id + thread_id."""
+    def _resolve_workspace_dir(
+        self, user_id: int, thread_id: int, *, must_exist: bool = True
+    ) -> Path | None:
+        """Resolve workspace directory from user_id + thread_id.
+
+        With *must_exist* False the directory isn't stat'ed; callers that
+        only read workspace.toml (which is absent for a missing dir) use
+        this to stay I/O-free.
+        """
         wid = self.get_window_for_thread(user_id, thread_id)
         # Fallback: group bindings (group mode uses chat_id as user_id, thread_id=0)
         if not wid:
@@ -1100,7 +1272,7 @@ class SessionManager:
         state = self.window_states.get(wid)
         if state and state.cwd:
             p = Path(state.cwd)
-            if p.is_dir():
+            if not must_exist or p.is_dir():
                 return p
         return None
 
@@ -1110,8 +1282,8 @@ class SessionManager:
         Reads from workspace.toml first; falls back to legacy state.json,
         then defaults to 'normal'.
         """
-        # Try workspace.toml
-        ws_dir = self._resolve_workspace_dir(user_id, thread_id)
+        # Try workspace.toml (cached; called for every delivered message)
+        ws_dir = self._resolve_workspace_dir(user_id, thread_id, must_exist=False)
         if ws_dir:
             from . import workspace_config
 
@@ -20,12 +20,19 @@ import hashlib
 import json
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Awaitable
 
 import aiofiles
 
+from .metrics import (
+    HANDLE_MESSAGE_SECONDS,
+    MESSAGES_DETECTED,
+    MONITOR_DETECT_LAG,
+    POLL_LOOP_SECONDS,
+)
 from .monitor_state import MonitorState, TrackedSession
 from .transcript_parser import TranscriptParser
 from .utils import read_cwd_from_jsonl
@@ -98,6 +105,7 @@ class NewMessage:
     upload_links: list[str] = field(default_factory=list)  # [UPLOAD_LINK] matches
     code_links: list[str] = field(default_factory=list)  # [CODE_LINK:path] matches
     todo_links: list[str] = field(default_factory=list)  # [TODO_LINK] matches
+    written_at: float = 0.0  # transcript mtime when read (wall clock)
 
 
 class SessionMonitor:
@@ -593,6 +601,7 @@ class SessionMonitor:
                 self._file_mtimes[session_info.session_id] = current_mtime
 
                 if new_entries:
+                    MONITOR_DETECT_LAG.observe(max(0.0, time.time() - current_mtime))
                     logger.debug(
                         f"Read {len(new_entries)} new entries for "
                         f"session {session_info.session_id}"
@@ -659,8 +668,10 @@ class SessionMonitor:
                             upload_links=upload_links,
                             code_links=code_links,
                             todo_links=todo_links,
+                            written_at=current_mtime,
                         )
                     )
+                    MESSAGES_DETECTED.inc()
 
                 self.state.update_session(tracked)
 
@@ -781,6 +792,7 @@ class SessionMonitor:
         self._last_session_map = await self._load_current_session_map()
 
         while self._running:
+            loop_started = time.monotonic()
             try:
                 # Load hook-based session map updates
                 await self._session_manager.load_session_map()
@@ -798,12 +810,14 @@ class SessionMonitor:
                     logger.info("[%s] session=%s: %s", status, msg.session_id, preview)
                     if self._message_callback:
                         try:
-                            await self._message_callback(msg)
+                            with HANDLE_MESSAGE_SECONDS.time():
+                                await self._message_callback(msg)
                         except Exception as e:
                             logger.error(f"Message callback error: {e}")
 
             except Exception as e:
                 logger.error(f"Monitor loop error: {e}")
+            POLL_LOOP_SECONDS.observe(time.monotonic() - loop_started, loop="monitor")
 
             await asyncio.sleep(self.poll_interval)
 
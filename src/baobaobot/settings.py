@@ -45,6 +45,9 @@ class SchedulerConfig:
     summary_idle: int = 3600            # 60 min
     subprocess_timeout: int = 300       # 5 min
 
+    # Headless CLI workers (0 = derive from CPU count and memory)
+    headless_concurrency: int = 0
+
     # Heartbeat
     heartbeat_interval: int = 1800      # 30 min
     heartbeat_idle: int = 300           # 5 min
@@ -59,6 +62,60 @@ class SchedulerConfig:
     # Tmp cleanup (used by CronService)
     tmp_cleanup_interval: int = 86400     # 1 day
 
+    # Cron dispatch (used by CronService)
+    cron_max_concurrent: int = 8          # due jobs in flight across workspaces
+    cron_workspace_concurrent: int = 1    # per workspace (jobs share one window)
+
+    # Memory embedding backfill (0 = disabled)
+    embedding_backfill_interval: int = 300  # 5 min between passes
+    embedding_backfill_timeout: int = 60    # compute budget per workspace
+
+
+# ---------------------------------------------------------------------------
+# ShareConfig
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ShareConfig:
+    """Tuning parameters for the ShareServer (web terminal, proxies).
+
+    Parsed from the [share] section of settings.toml.
+    If the section is missing, all defaults are used (backward-compatible).
+    """
+
+    # Negotiate permessage-deflate on web terminal WebSockets
+    terminal_ws_compress: bool = True
+
+    # Idle code-server instances kept running so VS Code Web opens instantly
+    code_server_warm_pool: int = 0
+
+
+# ---------------------------------------------------------------------------
+# WatchdogConfig
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class WatchdogConfig:
+    """Event-loop stall detector (LoopWatchdog), off by default.
+
+    Parsed from the [watchdog] section of settings.toml.
+    If the section is missing, all defaults are used (backward-compatible).
+    """
+
+    enabled: bool = False
+
+    # Heartbeat delay that counts as a stall (ms)
+    threshold_ms: int = 250
+
+    # Heartbeat period and stack-sampling period while stalled (ms)
+    interval_ms: int = 100
+    sample_interval_ms: int = 50
+
+    # Log each call site's stack at most once per this many seconds
+    log_interval: int = 60
+
 
 # ---------------------------------------------------------------------------
 # AgentConfig
@@ -115,6 +172,12 @@ class AgentConfig:
     # Scheduler timing config
     scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
 
+    # Share server tuning
+    share: ShareConfig = field(default_factory=ShareConfig)
+
+    # Event-loop watchdog
+    watchdog: WatchdogConfig = field(default_factory=WatchdogConfig)
+
     # --- Derived path helpers (use agent_dir) ---
 
     @property
@@ -226,9 +289,24 @@ def load_settings(config_dir: Path | None = None) -> list[AgentConfig]:
     scheduler_raw = raw.get("scheduler", {})
     scheduler_config = SchedulerConfig(**scheduler_raw) if scheduler_raw else SchedulerConfig()
 
+    # Parse [share] section (global only — one share server per process)
+    share_raw = raw.get("share", {})
+    share_config = ShareConfig(**share_raw) if share_raw else ShareConfig()
+
+    # Parse [watchdog] section (global only — one event loop per process)
+    watchdog_raw = raw.get("watchdog", {})
+    watchdog_config = WatchdogConfig(**watchdog_raw) if watchdog_raw else WatchdogConfig()
+
     results: list[AgentConfig] = []
     for agent_raw in agents_list:
-        cfg = _build_agent_config(config_dir, global_section, agent_raw, scheduler_config)
+        cfg = _build_agent_config(
+            config_dir,
+            global_section,
+            agent_raw,
+            scheduler_config,
+            share_config,
+            watchdog_config,
+        )
         results.append(cfg)
 
     return results
@@ -239,6 +317,8 @@ def _build_agent_config(
     global_section: dict,
     agent_raw: dict,
     scheduler_config: SchedulerConfig,
+    share_config: ShareConfig | None = None,
+    watchdog_config: WatchdogConfig | None = None,
 ) -> AgentConfig:
     """Merge global + per-agent settings into an AgentConfig."""
     name = agent_raw.get("name")
@@ -299,4 +379,6 @@ def _build_agent_config(
         locale=str(_get("locale", "en-US")),
         restart_notify=bool(_get("restart_notify", True)),
         scheduler=scheduler_config,
+        share=share_config or ShareConfig(),
+        watchdog=watchdog_config or WatchdogConfig(),
     )
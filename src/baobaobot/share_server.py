@@ -11,11 +11,13 @@ Routes:
   GET  /term/{token}/        — web terminal page (xterm.js)
   GET  /term/{token}/ws      — web terminal WebSocket (PTY bridge)
   GET  /tmux/{token}/        — tmux attach page (xterm.js)
-  GET  /tmux/{token}/ws      — tmux attach WebSocket (grouped session)
+  GET  /tmux/{token}/ws      — tmux attach WebSocket (shared per-window mirror)
   GET  /code/{token}/        — VS Code Web (code-server reverse proxy)
   *    /code/{token}/{path}  — code-server HTTP/WebSocket proxy
   GET  /port/{token}/        — reverse proxy to local port (landing)
   *    /port/{token}/{path}  — local port HTTP/WebSocket proxy
+  GET  /metrics              — Prometheus metrics (bearer or ?token= auth)
+  GET  /debug/loop           — event-loop stall report (same auth as /metrics)
 """
 
 from __future__ import annotations
@@ -23,6 +25,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import fcntl
+import gzip
 import hashlib
 import hmac
 import html as html_mod
@@ -31,6 +34,7 @@ import logging
 import mimetypes
 import os
 import pty
+import re
 import shutil
 import signal
 import struct
@@ -38,13 +42,21 @@ import subprocess
 import termios
 import time
 import urllib.parse
-from collections.abc import Awaitable, Callable
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
 
 from contextlib import contextmanager
+from typing import TYPE_CHECKING
 
 import aiohttp
 from aiohttp import WSMsgType, web
+from multidict import CIMultiDict
+
+if TYPE_CHECKING:
+    from .settings import ShareConfig
 
 
 @contextmanager
@@ -62,6 +74,9 @@ logger = logging.getLogger(__name__)
 _DEFAULT_TTL = 1800  # 30 minutes
 _SIG_LENGTH = 32  # 128-bit HMAC truncation (32 hex chars)
 
+# Token payload for /metrics (signed like any share link)
+METRICS_TOKEN_PATH = "metrics"
+
 # Upload limits
 _MAX_UPLOAD_FILES = 20
 _MAX_UPLOAD_FILE_SIZE = 50 * 1024 * 1024  # 50MB per file
@@ -208,6 +223,421 @@ def _safe_resolve(base: Path, rel_path: str) -> Path | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Reverse proxy helpers (/code and /port)
+# ---------------------------------------------------------------------------
+
+# Hop-by-hop headers (RFC 7230 §6.1) are never forwarded in either direction
+_HOP_BY_HOP_HEADERS = frozenset({
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+})
+
+_PROXY_CHUNK_SIZE = 65536
+_PROXY_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=300)
+
+# Content-Encodings the HTML rewriter can decode with zlib ("" = identity)
+_DECODABLE_ENCODINGS = ("", "identity", "gzip", "x-gzip", "deflate")
+
+# How many bytes of HTML to buffer while looking for <head> before giving up
+_HEAD_SCAN_LIMIT = 65536
+_HEAD_TAG_RE = re.compile(rb"<head(?:\s[^>]*)?>", re.IGNORECASE)
+
+
+def _forward_headers(
+    headers: Mapping[str, str], drop: tuple[str, ...] = ()
+) -> CIMultiDict[str]:
+    """Copy headers minus hop-by-hop ones, keeping repeated keys (Set-Cookie)."""
+    return CIMultiDict(
+        (key, value)
+        for key, value in headers.items()
+        if key.lower() not in _HOP_BY_HOP_HEADERS and key.lower() not in drop
+    )
+
+
+class _HeadInjector:
+    """Streaming HTML rewriter that inserts a snippet right after ``<head>``.
+
+    Only the prefix up to the opening head tag is buffered; everything after
+    it is passed through unchanged.  If no head tag shows up within
+    ``_HEAD_SCAN_LIMIT`` bytes (or before EOF), the snippet is prepended.
+    """
+
+    def __init__(self, snippet: bytes) -> None:
+        self._snippet = snippet
+        self._buf = b""
+        self._done = False
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Consume a chunk and return the bytes that are ready to send."""
+        if self._done:
+            return chunk
+        self._buf += chunk
+        m = _HEAD_TAG_RE.search(self._buf)
+        if m:
+            return self._release(
+                self._buf[: m.end()] + self._snippet + self._buf[m.end() :]
+            )
+        if len(self._buf) >= _HEAD_SCAN_LIMIT:
+            return self._release(self._snippet + self._buf)
+        return b""
+
+    def finish(self) -> bytes:
+        """Flush whatever is still buffered at end of stream."""
+        if self._done:
+            return b""
+        return self._release(self._snippet + self._buf)
+
+    def _release(self, data: bytes) -> bytes:
+        self._done = True
+        self._buf = b""
+        return data
+
+
+# ---------------------------------------------------------------------------
+# PTY bridge (web terminal / tmux attach)
+# ---------------------------------------------------------------------------
+
+_PTY_READ_SIZE = 65536
+# Output is held this long after the first byte so bursts go out as one frame
+_PTY_COALESCE_DELAY = 0.008
+# Flush immediately once this much output is pending
+_PTY_FLUSH_BYTES = 64 * 1024
+# Stop reading the PTY while this much output is waiting on a slow WebSocket
+_PTY_MAX_BUFFER = 256 * 1024
+
+
+class _PtyBridge:
+    """Relay PTY output to a sink with coalescing and backpressure.
+
+    The master fd stays registered with the event loop for the whole
+    session; each readable event appends to a buffer that a single sender
+    loop flushes as one frame.  While the sink is slow (``send`` awaiting a
+    WebSocket drain) output keeps accumulating up to ``_PTY_MAX_BUFFER``,
+    after which the reader is detached so the kernel PTY buffer throttles
+    the producer instead of our memory.
+    """
+
+    def __init__(self, master_fd: int, send: Callable[[bytes], Awaitable[None]]) -> None:
+        self._fd = master_fd
+        self._send = send
+        self._loop = asyncio.get_running_loop()
+        self._buf = bytearray()
+        self._ready = asyncio.Event()
+        self._reading = False
+        self._eof = False
+
+    def _resume_reading(self) -> None:
+        if not self._reading and not self._eof:
+            self._loop.add_reader(self._fd, self._on_readable)
+            self._reading = True
+
+    def _pause_reading(self) -> None:
+        if self._reading:
+            with _suppress_os():
+                self._loop.remove_reader(self._fd)
+            self._reading = False
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, _PTY_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""  # EIO once the child side is gone
+        if not data:
+            self._eof = True
+            self._pause_reading()
+        else:
+            self._buf += data
+            if len(self._buf) >= _PTY_MAX_BUFFER:
+                self._pause_reading()
+        self._ready.set()
+
+    async def run(self) -> None:
+        """Pump output until the PTY hits EOF (or the task is cancelled)."""
+        self._resume_reading()
+        try:
+            while True:
+                await self._ready.wait()
+                if not self._eof and len(self._buf) < _PTY_FLUSH_BYTES:
+                    await asyncio.sleep(_PTY_COALESCE_DELAY)
+                self._ready.clear()
+                if self._buf:
+                    data = bytes(self._buf)
+                    self._buf.clear()
+                    self._resume_reading()
+                    await self._send(data)
+                if self._eof and not self._buf:
+                    return
+        finally:
+            self._pause_reading()
+
+
+async def _ws_keepalive(ws: web.WebSocketResponse) -> None:
+    """Send WebSocket ping every 20s to prevent idle timeout."""
+    while not ws.closed:
+        try:
+            await asyncio.sleep(20)
+            if not ws.closed:
+                await ws.ping()
+        except (asyncio.CancelledError, ConnectionResetError):
+            break
+        except Exception:
+            break
+
+
+# A viewer that cannot take a frame within this many seconds is dropped
+# so it does not stall the mirror for everyone else.
+_MIRROR_SEND_TIMEOUT = 10.0
+
+
+class _TmuxMirror:
+    """Shared read-only view of one tmux window for any number of viewers.
+
+    Owns a single grouped ``web-*`` session, one PTY and one
+    ``tmux attach-session`` process.  PTY output is fanned out to every
+    connected WebSocket; input and resize are accepted only from the
+    controller, which is the longest-connected viewer.  The mirror shuts
+    itself down when the last viewer leaves or the attach exits.
+    """
+
+    def __init__(
+        self,
+        tmux_session: str,
+        window_id: str | None,
+        on_close: Callable[[_TmuxMirror], object],
+    ) -> None:
+        import secrets as _secrets
+
+        self.tmux_session = tmux_session
+        self.window_id = window_id
+        self.key = f"{tmux_session}:{window_id or ''}"
+        self.temp_session = f"web-{_secrets.token_hex(4)}"
+        self._on_close = on_close
+        # Insertion-ordered: the first key is the controller
+        self._viewers: dict[web.WebSocketResponse, None] = {}
+        self._master_fd = -1
+        self._client_tty = ""
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._pump_task: asyncio.Task[None] | None = None
+        self._closing: set[asyncio.Task[None]] = set()
+        self.closed = False
+
+    async def start(self) -> bool:
+        """Create the grouped session and attach process. Returns success."""
+        # tmux calls block for up to seconds each; keep them off the loop
+        if not await asyncio.to_thread(self._spawn):
+            return False
+        self._pump_task = asyncio.create_task(self._pump())
+        return True
+
+    def _spawn(self) -> bool:
+        # Build tmux new-session command that groups with the target session
+        cmd = [
+            "tmux", "new-session", "-d", "-s", self.temp_session,
+            "-t", self.tmux_session,
+        ]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=5)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
+            logger.error("Failed to create grouped tmux session: %s", exc)
+            return False
+
+        # Select the target window
+        if self.window_id:
+            try:
+                subprocess.run(
+                    [
+                        "tmux", "select-window", "-t",
+                        f"{self.temp_session}:{self.window_id}",
+                    ],
+                    check=True,
+                    capture_output=True,
+                    timeout=5,
+                )
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                logger.warning(
+                    "Failed to select window %s, using default", self.window_id
+                )
+
+        # Create PTY and spawn tmux attach
+        master_fd, slave_fd = pty.openpty()
+        winsize = struct.pack("HHHH", 24, 80, 0, 0)
+        fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)
+        self._client_tty = os.ttyname(slave_fd)
+
+        env = os.environ.copy()
+        env["TERM"] = "xterm-256color"
+        self._proc = subprocess.Popen(
+            ["tmux", "attach-session", "-t", self.temp_session],
+            stdin=slave_fd,
+            stdout=slave_fd,
+            stderr=slave_fd,
+            env=env,
+            start_new_session=True,
+        )
+        os.close(slave_fd)
+        os.set_blocking(master_fd, False)
+        self._master_fd = master_fd
+        logger.info(
+            "Tmux mirror started: PID %d, session=%s, target=%s:%s",
+            self._proc.pid,
+            self.temp_session,
+            self.tmux_session,
+            self.window_id or "__main__",
+        )
+        return True
+
+    async def _pump(self) -> None:
+        try:
+            await _PtyBridge(self._master_fd, self._broadcast).run()
+        finally:
+            # Attach exited (window/session gone) — disconnect everyone
+            if not self.closed:
+                for ws in list(self._viewers):
+                    with _suppress_os():
+                        await ws.close()
+                await self._stop()
+
+    async def _broadcast(self, data: bytes) -> None:
+        viewers = list(self._viewers)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(ws.send_bytes(data), _MIRROR_SEND_TIMEOUT)
+                for ws in viewers
+            ),
+            return_exceptions=True,
+        )
+        for ws, result in zip(viewers, results):
+            if isinstance(result, BaseException) and not ws.closed:
+                # The handler's finally (remove_viewer) does the bookkeeping
+                logger.info("Dropping slow/closed tmux viewer: %r", result)
+                task = asyncio.create_task(ws.close())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    def is_controller(self, ws: web.WebSocketResponse) -> bool:
+        return next(iter(self._viewers), None) is ws
+
+    def join(self, ws: web.WebSocketResponse) -> None:
+        """Register *ws* without any I/O (safe under the mirror lock)."""
+        self._viewers[ws] = None
+
+    async def greet(self) -> None:
+        """Tell viewers their roles and repaint the screen for newcomers."""
+        await self._announce_roles()
+        # Full redraw so the newcomer does not start from a half-painted screen
+        await self._refresh_client()
+
+    async def add_viewer(self, ws: web.WebSocketResponse) -> None:
+        self.join(ws)
+        await self.greet()
+
+    async def remove_viewer(self, ws: web.WebSocketResponse) -> None:
+        was_controller = self.is_controller(ws)
+        self._viewers.pop(ws, None)
+        if not self._viewers:
+            await self._stop()
+        elif was_controller:
+            await self._announce_roles()
+
+    def write(self, data: bytes) -> bool:
+        """Forward controller input to the attach process."""
+        try:
+            os.write(self._master_fd, data)
+            return True
+        except OSError:
+            return False
+
+    def resize(self, rows: int, cols: int) -> None:
+        ws_pack = struct.pack("HHHH", rows, cols, 0, 0)
+        try:
+            fcntl.ioctl(self._master_fd, termios.TIOCSWINSZ, ws_pack)
+            if self._proc is not None:
+                os.kill(self._proc.pid, signal.SIGWINCH)
+        except OSError:
+            pass
+
+    async def _announce_roles(self) -> None:
+        count = len(self._viewers)
+        for ws in list(self._viewers):
+            msg = {"type": "role", "controller": self.is_controller(ws), "viewers": count}
+            try:
+                await ws.send_str(json.dumps(msg))
+            except (ConnectionResetError, RuntimeError):
+                pass
+
+    async def _refresh_client(self) -> None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "tmux", "refresh-client", "-t", self._client_tty,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+    async def _stop(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._on_close(self)
+        if self._pump_task is not None and self._pump_task is not asyncio.current_task():
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        try:
+            os.close(self._master_fd)
+        except OSError:
+            pass
+        await asyncio.to_thread(self._reap)
+
+    def _reap(self) -> None:
+        proc = self._proc
+        if proc is not None:
+            try:
+                proc.terminate()
+                proc.wait(timeout=3)
+            except (OSError, subprocess.TimeoutExpired):
+                try:
+                    proc.kill()
+                    proc.wait(timeout=1)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+        # Kill the temporary grouped session
+        try:
+            subprocess.run(
+                ["tmux", "kill-session", "-t", self.temp_session],
+                capture_output=True,
+                timeout=5,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            pass
+        logger.info(
+            "Tmux mirror ended: PID %d, session=%s",
+            proc.pid if proc else -1,
+            self.temp_session,
+        )
+
+    async def close(self) -> None:
+        """Disconnect all viewers and tear the mirror down."""
+        for ws in list(self._viewers):
+            with _suppress_os():
+                await ws.close()
+        self._viewers.clear()
+        await self._stop()
+
+
 # ---------------------------------------------------------------------------
 # HTML templates — loaded once at import time from templates/ directory
 # ---------------------------------------------------------------------------
@@ -223,6 +653,160 @@ _TODO_HTML = (_TEMPLATES_DIR / "todo.html").read_text(encoding="utf-8")
 _CRON_HTML = (_TEMPLATES_DIR / "cron.html").read_text(encoding="utf-8")
 
 
+# ---------------------------------------------------------------------------
+# Rendered page cache — ETag + precompressed variants of template pages
+# ---------------------------------------------------------------------------
+
+_PAGE_CACHE_SIZE = 256
+# Pages smaller than this are not worth compressing
+_COMPRESS_MIN_SIZE = 1024
+# Shared directories can change at any time — always revalidate (cheap 304)
+_REVALIDATE = "private, no-cache"
+
+
+# Static templates are compressed once at import with the slowest settings;
+# per-request variants use cheaper ones (brotli 11 costs tens of ms per page)
+_BROTLI_STATIC_QUALITY = 11
+_BROTLI_DYNAMIC_QUALITY = 5
+_GZIP_STATIC_LEVEL = 9
+_GZIP_DYNAMIC_LEVEL = 6
+
+
+def _brotli_compress(data: bytes, quality: int) -> bytes | None:
+    """Compress with brotli if the optional ``brotli`` package is installed."""
+    try:
+        import brotli  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=quality)
+
+
+@dataclass(frozen=True)
+class _RenderedPage:
+    """An HTML page encoded once, with its ETag and compressed variants."""
+
+    etag: str
+    body: bytes
+    gzip: bytes | None = None
+    br: bytes | None = None
+
+
+def _render_page(html: str, *, static: bool = False) -> _RenderedPage:
+    body = html.encode("utf-8")
+    etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+    if len(body) < _COMPRESS_MIN_SIZE:
+        return _RenderedPage(etag, body)
+    return _RenderedPage(
+        etag,
+        body,
+        gzip=gzip.compress(
+            body,
+            compresslevel=_GZIP_STATIC_LEVEL if static else _GZIP_DYNAMIC_LEVEL,
+            mtime=0,
+        ),
+        br=_brotli_compress(
+            body, _BROTLI_STATIC_QUALITY if static else _BROTLI_DYNAMIC_QUALITY
+        ),
+    )
+
+
+_TERMINAL_PAGE = _render_page(_TERMINAL_HTML, static=True)
+
+
+class _PageCache:
+    """Small LRU of rendered pages keyed by their template inputs.
+
+    Misses are rendered and compressed in a worker thread, off the event loop.
+    """
+
+    def __init__(self, maxsize: int = _PAGE_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._pages: OrderedDict[tuple[str, ...], _RenderedPage] = OrderedDict()
+
+    async def get(
+        self, key: tuple[str, ...], render: Callable[[], str]
+    ) -> _RenderedPage:
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+            return page
+        page = await asyncio.to_thread(lambda: _render_page(render()))
+        self._pages[key] = page
+        if len(self._pages) > self._maxsize:
+            self._pages.popitem(last=False)
+        return page
+
+
+def _accepted_encodings(request: web.Request) -> set[str]:
+    """Parse Accept-Encoding into the set of codings with a non-zero q."""
+    accepted: set[str] = set()
+    for item in request.headers.get("Accept-Encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        if params in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    """True if the request's If-None-Match covers *etag* (weak comparison)."""
+    header = request.headers.get("If-None-Match", "")
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _page_response(
+    request: web.Request,
+    page: _RenderedPage,
+    *,
+    cache_control: str,
+    headers: dict[str, str] | None = None,
+) -> web.Response:
+    """Serve a rendered page: 304 on a matching ETag, else the best encoding."""
+    out = {
+        "ETag": page.etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        **(headers or {}),
+    }
+    if _etag_matches(request, page.etag):
+        return web.Response(status=304, headers=out)
+    accepted = _accepted_encodings(request)
+    body = page.body
+    if page.br is not None and "br" in accepted:
+        body = page.br
+        out["Content-Encoding"] = "br"
+    elif page.gzip is not None and "gzip" in accepted:
+        body = page.gzip
+        out["Content-Encoding"] = "gzip"
+    return web.Response(
+        body=body, content_type="text/html", charset="utf-8", headers=out
+    )
+
+
+def _token_expires(token: str) -> int | None:
+    """Return the expiry timestamp embedded in a token (None if malformed)."""
+    try:
+        return int(token.split("-", 2)[1])
+    except (ValueError, IndexError):
+        return None
+
+
+def _token_cache_control(token: str) -> str:
+    """Cache-Control for content fully determined by a signed token.
+
+    The URL (and thus the content) can't change before the token expires,
+    so the browser may keep it as immutable until then.
+    """
+    expires = _token_expires(token)
+    remaining = max(0, expires - int(time.time())) if expires else 0
+    return f"private, max-age={remaining}, immutable"
+
+
 # ---------------------------------------------------------------------------
 # HTTP Handlers
 # ---------------------------------------------------------------------------
@@ -233,27 +817,43 @@ class CodeServerManager:
 
     Each directory gets its own code-server instance on a unique port.
     Uses code-server's built-in idle timeout for auto-shutdown.
+
+    Startups for different directories run concurrently (one lock per
+    directory).  Optionally keeps ``warm_pool_size`` folder-less instances
+    running; the first open of a workspace adopts one of them instead of
+    paying the cold start (the folder is selected via ``?folder=``).
     """
 
     _BASE_PORT = 13370
     _MAX_INSTANCES = 10
     _DEFAULT_IDLE_TIMEOUT = 3600  # 1 hour
+    _POOL_CHECK_INTERVAL = 60.0  # re-spawn warm instances that idled out
 
-    def __init__(self, idle_timeout: int = _DEFAULT_IDLE_TIMEOUT) -> None:
+    def __init__(
+        self, idle_timeout: int = _DEFAULT_IDLE_TIMEOUT, warm_pool_size: int = 0
+    ) -> None:
         self._idle_timeout = idle_timeout
+        self._warm_pool_size = max(0, warm_pool_size)
         # directory_abs -> (port, process)
         self._instances: dict[str, tuple[int, asyncio.subprocess.Process]] = {}
-        self._lock = asyncio.Lock()
+        # Ready, unassigned instances (no folder argument)
+        self._warm: list[tuple[int, asyncio.subprocess.Process]] = []
+        # Ports of instances that are spawned but not ready yet
+        self._starting_ports: set[int] = set()
+        self._dir_locks: dict[str, asyncio.Lock] = {}
+        self._pool_task: asyncio.Task[None] | None = None
+        self._pool_wakeup = asyncio.Event()
         self._install_lock = asyncio.Lock()
         self._install_checked = False
 
     async def get_or_start(self, directory: Path) -> int:
         """Get or start a code-server for the given directory. Returns port."""
-        async with self._lock:
-            return await self._get_or_start_locked(directory)
-
-    async def _get_or_start_locked(self, directory: Path) -> int:
         key = str(directory.resolve())
+        lock = self._dir_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            return await self._get_or_start_locked(key)
+
+    async def _get_or_start_locked(self, key: str) -> int:
         if key in self._instances:
             port, proc = self._instances[key]
             if proc.returncode is None:  # still running
@@ -261,60 +861,137 @@ class CodeServerManager:
             # Process died, clean up
             del self._instances[key]
 
-        if len(self._instances) >= self._MAX_INSTANCES:
+        warm = self._take_warm()
+        if warm is not None:
+            self._instances[key] = warm
+            logger.info("Assigned warm code-server on port %d to %s", warm[0], key)
+            self._pool_wakeup.set()  # replenish in the background
+            return warm[0]
+
+        self._instances[key] = await self._spawn(key)
+        return self._instances[key][0]
+
+    def _take_warm(self) -> tuple[int, asyncio.subprocess.Process] | None:
+        while self._warm:
+            port, proc = self._warm.pop(0)
+            if proc.returncode is None:
+                return port, proc
+        return None
+
+    async def _spawn(
+        self, directory: str | None
+    ) -> tuple[int, asyncio.subprocess.Process]:
+        """Start a code-server and wait until it accepts connections."""
+        total = len(self._instances) + len(self._warm) + len(self._starting_ports)
+        if total >= self._MAX_INSTANCES:
             raise RuntimeError("Maximum code-server instances reached")
 
         port = self._allocate_port()
-        cs_bin = self._find_code_server_bin() or "code-server"
-        proc = await asyncio.create_subprocess_exec(
-            cs_bin,
-            "--auth", "none",
-            "--bind-addr", f"127.0.0.1:{port}",
-            "--disable-telemetry", "--disable-update-check",
-            "--idle-timeout-seconds", str(self._idle_timeout),
-            "--trusted-origins", "*",
-            str(directory),
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
-        self._instances[key] = (port, proc)
-        logger.info(
-            "Starting code-server on port %d for %s (PID %d)", port, key, proc.pid
-        )
-        await self._wait_ready(port)
-        return port
+        self._starting_ports.add(port)
+        try:
+            cs_bin = self._find_code_server_bin() or "code-server"
+            folder_args = [directory] if directory else []
+            proc = await asyncio.create_subprocess_exec(
+                cs_bin,
+                "--auth", "none",
+                "--bind-addr", f"127.0.0.1:{port}",
+                "--disable-telemetry", "--disable-update-check",
+                "--idle-timeout-seconds", str(self._idle_timeout),
+                "--trusted-origins", "*",
+                *folder_args,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            logger.info(
+                "Starting code-server on port %d for %s (PID %d)",
+                port, directory or "<warm pool>", proc.pid,
+            )
+            try:
+                await self._wait_ready(port, proc)
+            except BaseException:
+                # Not registered yet: a failed or cancelled start must not
+                # leave an untracked process holding the port
+                with _suppress_os():
+                    proc.kill()
+                await asyncio.shield(proc.wait())
+                raise
+            return port, proc
+        finally:
+            self._starting_ports.discard(port)
 
     def _allocate_port(self) -> int:
         """Find the next available port."""
         used = {p for p, _ in self._instances.values()}
+        used.update(p for p, _ in self._warm)
+        used.update(self._starting_ports)
         for port in range(self._BASE_PORT, self._BASE_PORT + self._MAX_INSTANCES):
             if port not in used:
                 return port
         raise RuntimeError("No available ports for code-server")
 
-    async def _wait_ready(self, port: int, timeout: float = 30.0) -> None:
-        """Wait for code-server to respond to HTTP requests."""
-        deadline = asyncio.get_event_loop().time() + timeout
-        session = aiohttp.ClientSession()
-        try:
-            while asyncio.get_event_loop().time() < deadline:
-                try:
-                    async with session.get(
-                        f"http://127.0.0.1:{port}/healthz",
-                        timeout=aiohttp.ClientTimeout(total=2),
-                    ) as resp:
-                        if resp.status == 200:
-                            logger.info("code-server ready on port %d", port)
-                            return
-                except (aiohttp.ClientError, OSError, asyncio.TimeoutError):
-                    pass
-                await asyncio.sleep(0.5)
-        finally:
-            await session.close()
+    async def _wait_ready(
+        self,
+        port: int,
+        proc: asyncio.subprocess.Process,
+        timeout: float = 30.0,
+    ) -> None:
+        """Wait until code-server accepts TCP connections on its port.
+
+        A bare connect probe with short exponential backoff; no HTTP
+        session per attempt.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while loop.time() < deadline:
+            if proc.returncode is not None:
+                raise RuntimeError(
+                    f"code-server on port {port} exited with code {proc.returncode}"
+                )
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection("127.0.0.1", port), timeout=1
+                )
+            except (OSError, asyncio.TimeoutError):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.5)
+                continue
+            writer.close()
+            with _suppress_os():
+                await writer.wait_closed()
+            logger.info("code-server ready on port %d", port)
+            return
         raise RuntimeError(
             f"code-server on port {port} failed to start within {timeout}s"
         )
 
+    def start_warm_pool(self) -> None:
+        """Begin keeping ``warm_pool_size`` idle instances ready (no-op if 0)."""
+        if self._warm_pool_size and self._pool_task is None:
+            self._pool_task = asyncio.create_task(self._maintain_warm_pool())
+
+    async def _maintain_warm_pool(self) -> None:
+        try:
+            await self.ensure_installed()
+        except (RuntimeError, OSError, asyncio.TimeoutError) as e:
+            logger.warning("code-server warm pool disabled: %s", e)
+            return
+        while True:
+            self._warm = [(p, proc) for p, proc in self._warm if proc.returncode is None]
+            while len(self._warm) < self._warm_pool_size:
+                try:
+                    self._warm.append(await self._spawn(None))
+                except (RuntimeError, OSError) as e:
+                    logger.warning("Failed to pre-warm code-server: %s", e)
+                    break
+            self._pool_wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._pool_wakeup.wait(), timeout=self._POOL_CHECK_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+
     def _find_code_server_bin(self) -> str | None:
         """Find code-server binary, checking PATH and standalone install."""
         import shutil
@@ -354,9 +1031,18 @@ class CodeServerManager:
             self._install_checked = True
 
     async def stop_all(self) -> None:
-        """Stop all running code-server instances."""
-        for key in list(self._instances):
-            port, proc = self._instances.pop(key)
+        """Stop all running code-server instances (including the warm pool)."""
+        if self._pool_task is not None:
+            self._pool_task.cancel()
+            try:
+                await self._pool_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._pool_task = None
+        running = list(self._instances.values()) + self._warm
+        self._instances.clear()
+        self._warm.clear()
+        for port, proc in running:
             try:
                 proc.terminate()
                 await asyncio.wait_for(proc.wait(), timeout=5)
@@ -398,14 +1084,24 @@ class ShareServer:
         port: int = 8787,
         workspace_roots: list[Path] | None = None,
         on_upload: Callable[[Path, list[str], str], Awaitable[None]] | None = None,
+        share_config: ShareConfig | None = None,
     ) -> None:
+        from .settings import ShareConfig as _SC
+
+        self._config: _SC = share_config or _SC()
         self._port = port
         self._workspace_roots = workspace_roots or []
         self._on_upload = on_upload
         self._app = web.Application(client_max_size=100 * 1024 * 1024)  # 100MB
         self._runner: web.AppRunner | None = None
-        self._code_manager = CodeServerManager()
+        self._code_manager = CodeServerManager(
+            warm_pool_size=self._config.code_server_warm_pool
+        )
         self._proxy_session: aiohttp.ClientSession | None = None
+        # "{tmux_session}:{window_id}" -> shared attach for /tmux viewers
+        self._tmux_mirrors: dict[str, _TmuxMirror] = {}
+        self._tmux_mirror_lock = asyncio.Lock()
+        self._pages = _PageCache()
         self._setup_routes()
 
     def _setup_routes(self) -> None:
@@ -424,6 +1120,8 @@ class ShareServer:
         self._app.router.add_route("*", "/code/{token}/{path:.*}", self._handle_code_proxy)
         self._app.router.add_get("/port/{token}", self._handle_port_redirect)
         self._app.router.add_route("*", "/port/{token}/{path:.*}", self._handle_port_proxy)
+        self._app.router.add_get("/metrics", self._handle_metrics)
+        self._app.router.add_get("/debug/loop", self._handle_loop_report)
         self._app.router.add_get("/hub/{token}/urls", self._handle_hub_urls)
         self._app.router.add_get("/hub/{token}/stats", self._handle_hub_stats)
         self._app.router.add_get("/hub/{token}/", self._handle_hub_page)
@@ -507,8 +1205,15 @@ class ShareServer:
     # -- Shared file response --
 
     @staticmethod
-    def _file_response(file_path: Path) -> web.FileResponse:
-        """Build a FileResponse with appropriate headers for any file type."""
+    def _file_response(
+        file_path: Path, cache_control: str = _REVALIDATE
+    ) -> web.FileResponse:
+        """Build a FileResponse with appropriate headers for any file type.
+
+        aiohttp's FileResponse already answers Range, If-None-Match and
+        If-Modified-Since (ETag from mtime_ns + size) and serves ``.br`` /
+        ``.gz`` siblings when present; we only add Cache-Control.
+        """
         content_type, _ = mimetypes.guess_type(str(file_path))
         if not content_type:
             content_type = "application/octet-stream"
@@ -521,6 +1226,7 @@ class ShareServer:
             "Content-Type": content_type,
             "Content-Disposition": f"{disposition}; filename*=UTF-8''{safe_filename}",
             "X-Content-Type-Options": "nosniff",
+            "Cache-Control": cache_control,
         }
         if content_type.startswith("text/html"):
             headers["Content-Disposition"] = "inline"
@@ -555,7 +1261,8 @@ class ShareServer:
         if not file_path:
             raise web.HTTPNotFound()
 
-        return self._file_response(file_path)
+        # A file token names one file until it expires — cache it for that long
+        return self._file_response(file_path, _token_cache_control(token))
 
     # -- Directory preview --
 
@@ -624,6 +1331,7 @@ class ShareServer:
                 headers={
                     "Content-Security-Policy": "default-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; script-src 'self';",
                     "X-Content-Type-Options": "nosniff",
+                    "Cache-Control": _REVALIDATE,
                 },
             )
 
@@ -653,13 +1361,18 @@ class ShareServer:
             "items": items_data,
             "source": source_name,
         }
-        page_html = _DIRECTORY_HTML.replace(
-            '/*__DATA__*/{"title":"","token":"","path":"","items":[]}/*__END__*/',
-            json.dumps(data, ensure_ascii=False),
+        data_json = json.dumps(data, ensure_ascii=False)
+        page = await self._pages.get(
+            ("dir", hashlib.blake2b(data_json.encode(), digest_size=16).hexdigest()),
+            lambda: _DIRECTORY_HTML.replace(
+                '/*__DATA__*/{"title":"","token":"","path":"","items":[]}/*__END__*/',
+                data_json,
+            ),
         )
-        return web.Response(
-            text=page_html,
-            content_type="text/html",
+        return _page_response(
+            request,
+            page,
+            cache_control=_REVALIDATE,
             headers={
                 "Content-Security-Policy": "default-src 'self' 'unsafe-inline'; img-src 'self' data: blob:;",
                 "X-Content-Type-Options": "nosniff",
@@ -726,11 +1439,16 @@ class ShareServer:
 
         # Display name embedded in token
         source_name = extract_token_name(token)
-        page_html = _UPLOAD_HTML.replace(
-            "/*__SOURCE__*/''/*__END__*/",
-            json.dumps(source_name, ensure_ascii=False),
+        page = await self._pages.get(
+            ("upload", source_name),
+            lambda: _UPLOAD_HTML.replace(
+                "/*__SOURCE__*/''/*__END__*/",
+                json.dumps(source_name, ensure_ascii=False),
+            ),
+        )
+        return _page_response(
+            request, page, cache_control=_token_cache_control(token)
         )
-        return web.Response(text=page_html, content_type="text/html")
 
     # -- Upload handler --
 
@@ -842,7 +1560,9 @@ class ShareServer:
         workspace, ws_status = self._verify_terminal_workspace(token)
         if workspace is None:
             return _deny_response(ws_status)
-        return web.Response(text=_TERMINAL_HTML, content_type="text/html")
+        return _page_response(
+            request, _TERMINAL_PAGE, cache_control=_token_cache_control(token)
+        )
 
     async def _handle_terminal_ws(self, request: web.Request) -> web.WebSocketResponse:
         """WebSocket handler: bridge browser ↔ PTY."""
@@ -851,7 +1571,7 @@ class ShareServer:
         if workspace is None:
             raise web.HTTPForbidden()
 
-        ws = web.WebSocketResponse()
+        ws = web.WebSocketResponse(compress=self._config.terminal_ws_compress)
         await ws.prepare(request)
 
         # Create PTY
@@ -883,46 +1603,10 @@ class ShareServer:
         flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
         fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
-        loop = asyncio.get_event_loop()
-
-        async def pty_reader() -> None:
-            """Read PTY output and send to WebSocket using event loop I/O."""
-            while not ws.closed:
-                # Wait for data using event loop's I/O multiplexer
-                readable = loop.create_future()
-                loop.add_reader(master_fd, readable.set_result, True)
-                try:
-                    await readable
-                except asyncio.CancelledError:
-                    with _suppress_os():
-                        loop.remove_reader(master_fd)
-                    raise
-                finally:
-                    with _suppress_os():
-                        loop.remove_reader(master_fd)
-                # Read available data
-                try:
-                    data = os.read(master_fd, 32768)
-                    if not data:
-                        break
-                    await ws.send_bytes(data)
-                except OSError:
-                    break
-
-        async def ping_sender() -> None:
-            """Send WebSocket ping every 20s to prevent idle timeout."""
-            while not ws.closed:
-                try:
-                    await asyncio.sleep(20)
-                    if not ws.closed:
-                        await ws.ping()
-                except (asyncio.CancelledError, ConnectionResetError):
-                    break
-                except Exception:
-                    break
+        bridge = _PtyBridge(master_fd, ws.send_bytes)
 
-        reader_task = asyncio.create_task(pty_reader())
-        ping_task = asyncio.create_task(ping_sender())
+        reader_task = asyncio.create_task(bridge.run())
+        ping_task = asyncio.create_task(_ws_keepalive(ws))
 
         try:
             async for msg in ws:
@@ -948,11 +1632,7 @@ class ShareServer:
                 elif msg.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
                     break
         finally:
-            # Cleanup: close PTY, cancel reader, terminate shell
-            try:
-                os.close(master_fd)
-            except OSError:
-                pass
+            # Cleanup: stop reader (unregisters fd), close PTY, terminate shell
             reader_task.cancel()
             ping_task.cancel()
             try:
@@ -963,6 +1643,10 @@ class ShareServer:
                 await ping_task
             except (asyncio.CancelledError, Exception):
                 pass
+            try:
+                os.close(master_fd)
+            except OSError:
+                pass
             try:
                 proc.terminate()
                 proc.wait(timeout=3)
@@ -1016,10 +1700,17 @@ class ShareServer:
         payload, status = self._verify_tmux_token(token)
         if payload is None:
             return _deny_response(status)
-        return web.Response(text=_TERMINAL_HTML, content_type="text/html")
+        return _page_response(
+            request, _TERMINAL_PAGE, cache_control=_token_cache_control(token)
+        )
 
     async def _handle_tmux_ws(self, request: web.Request) -> web.WebSocketResponse:
-        """WebSocket handler: bridge browser ↔ tmux attach via PTY."""
+        """WebSocket handler: attach a viewer to the shared mirror of a window.
+
+        All viewers of one window share a single grouped tmux session and
+        attach process; output is fanned out, input and resize are accepted
+        only from the mirror's controller (the longest-connected viewer).
+        """
         token = request.match_info["token"]
         payload, status = self._verify_tmux_token(token)
         if payload is None:
@@ -1042,161 +1733,145 @@ class ShareServer:
         else:
             raise web.HTTPForbidden()
 
-        ws = web.WebSocketResponse()
+        ws = web.WebSocketResponse(compress=self._config.terminal_ws_compress)
         await ws.prepare(request)
 
-        # Create a grouped session for isolated attach
-        import secrets as _secrets
-
-        temp_session = f"web-{_secrets.token_hex(4)}"
-
-        # Build tmux new-session command that groups with the target session
-        # and selects the target window
-        cmd = ["tmux", "new-session", "-d", "-s", temp_session, "-t", tmux_session]
-        try:
-            subprocess.run(cmd, check=True, capture_output=True, timeout=5)
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as exc:
-            logger.error("Failed to create grouped tmux session: %s", exc)
+        mirror = await self._join_tmux_mirror(tmux_session, window_id, ws)
+        if mirror is None:
             await ws.close(message=b"Failed to create tmux session")
             return ws
 
-        # Select the target window
-        if window_id:
-            try:
-                subprocess.run(
-                    ["tmux", "select-window", "-t", f"{temp_session}:{window_id}"],
-                    check=True,
-                    capture_output=True,
-                    timeout=5,
-                )
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                logger.warning("Failed to select window %s, using default", window_id)
-
-        # Create PTY and spawn tmux attach
-        master_fd, slave_fd = pty.openpty()
-        winsize = struct.pack("HHHH", 24, 80, 0, 0)
-        fcntl.ioctl(slave_fd, termios.TIOCSWINSZ, winsize)
-
-        env = os.environ.copy()
-        env["TERM"] = "xterm-256color"
-        proc = subprocess.Popen(
-            ["tmux", "attach-session", "-t", temp_session],
-            stdin=slave_fd,
-            stdout=slave_fd,
-            stderr=slave_fd,
-            env=env,
-            start_new_session=True,
-        )
-        os.close(slave_fd)
-        logger.info(
-            "Tmux web session started: PID %d, session=%s, target=%s:%s",
-            proc.pid,
-            temp_session,
-            tmux_session,
-            window_id or "__main__",
-        )
-
-        # Set master_fd to non-blocking
-        flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-        fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-
-        loop = asyncio.get_event_loop()
-
-        async def pty_reader() -> None:
-            while not ws.closed:
-                readable = loop.create_future()
-                loop.add_reader(master_fd, readable.set_result, True)
-                try:
-                    await readable
-                except asyncio.CancelledError:
-                    with _suppress_os():
-                        loop.remove_reader(master_fd)
-                    raise
-                finally:
-                    with _suppress_os():
-                        loop.remove_reader(master_fd)
-                try:
-                    data = os.read(master_fd, 32768)
-                    if not data:
-                        break
-                    await ws.send_bytes(data)
-                except OSError:
-                    break
-
-        async def ping_sender() -> None:
-            while not ws.closed:
-                try:
-                    await asyncio.sleep(20)
-                    if not ws.closed:
-                        await ws.ping()
-                except (asyncio.CancelledError, ConnectionResetError):
-                    break
-                except Exception:
-                    break
-
-        reader_task = asyncio.create_task(pty_reader())
-        ping_task = asyncio.create_task(ping_sender())
+        ping_task = asyncio.create_task(_ws_keepalive(ws))
 
         try:
             async for msg in ws:
                 if msg.type == WSMsgType.TEXT:
                     try:
                         data = json.loads(msg.data)
-                        if data.get("type") == "resize":
-                            cols = data.get("cols", 80)
-                            rows = data.get("rows", 24)
-                            ws_pack = struct.pack("HHHH", rows, cols, 0, 0)
-                            try:
-                                fcntl.ioctl(master_fd, termios.TIOCSWINSZ, ws_pack)
-                                os.kill(proc.pid, signal.SIGWINCH)
-                            except OSError:
-                                pass
+                        if data.get("type") == "resize" and mirror.is_controller(ws):
+                            mirror.resize(data.get("rows", 24), data.get("cols", 80))
                     except (json.JSONDecodeError, KeyError):
                         pass
                 elif msg.type == WSMsgType.BINARY:
-                    try:
-                        os.write(master_fd, msg.data)
-                    except OSError:
+                    if mirror.is_controller(ws) and not mirror.write(msg.data):
                         break
                 elif msg.type in (WSMsgType.CLOSE, WSMsgType.ERROR):
                     break
         finally:
-            try:
-                os.close(master_fd)
-            except OSError:
-                pass
-            reader_task.cancel()
             ping_task.cancel()
-            try:
-                await reader_task
-            except (asyncio.CancelledError, Exception):
-                pass
             try:
                 await ping_task
             except (asyncio.CancelledError, Exception):
                 pass
-            try:
-                proc.terminate()
-                proc.wait(timeout=3)
-            except (OSError, subprocess.TimeoutExpired):
-                try:
-                    proc.kill()
-                    proc.wait(timeout=1)
-                except (OSError, subprocess.TimeoutExpired):
-                    pass
-            # Kill the temporary grouped session
-            try:
-                subprocess.run(
-                    ["tmux", "kill-session", "-t", temp_session],
-                    capture_output=True,
-                    timeout=5,
-                )
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                pass
-            logger.info("Tmux web session ended: PID %d, session=%s", proc.pid, temp_session)
+            await mirror.remove_viewer(ws)
 
         return ws
 
+    async def _join_tmux_mirror(
+        self, tmux_session: str, window_id: str | None, ws: web.WebSocketResponse
+    ) -> _TmuxMirror | None:
+        """Add a viewer to the window's mirror, starting the mirror if needed."""
+        key = f"{tmux_session}:{window_id or ''}"
+        async with self._tmux_mirror_lock:
+            mirror = self._tmux_mirrors.get(key)
+            if mirror is None or mirror.closed:
+                mirror = _TmuxMirror(
+                    tmux_session, window_id, on_close=self._forget_tmux_mirror
+                )
+                if not await mirror.start():
+                    return None
+                self._tmux_mirrors[key] = mirror
+            # Registered under the lock so a leaving viewer cannot stop the
+            # mirror in between; the refresh-client round trip runs outside it
+            mirror.join(ws)
+        await mirror.greet()
+        return mirror
+
+    def _forget_tmux_mirror(self, mirror: _TmuxMirror) -> None:
+        if self._tmux_mirrors.get(mirror.key) is mirror:
+            del self._tmux_mirrors[mirror.key]
+
+    # -- Streaming reverse proxy (shared by /code and /port) --
+
+    def _get_proxy_session(self) -> aiohttp.ClientSession:
+        """Return the shared upstream session (bodies relayed undecoded)."""
+        if self._proxy_session is None or self._proxy_session.closed:
+            self._proxy_session = aiohttp.ClientSession(auto_decompress=False)
+        return self._proxy_session
+
+    async def _proxy_http(
+        self, request: web.Request, target_url: str, *, prefix: str, label: str
+    ) -> web.StreamResponse:
+        """Stream an HTTP request to a local upstream and relay the response.
+
+        The request body is piped to upstream without buffering.  Response
+        bodies are relayed chunk by chunk with their original Content-Encoding
+        (gzip/br/zstd pass through untouched).  HTML pages get a ``<base>``
+        tag inserted by a streaming head injector; for page navigations the
+        upstream is asked for gzip/deflate only so the HTML can be decoded,
+        rewritten and re-compressed on the fly.
+        """
+        headers = _forward_headers(request.headers, drop=("host",))
+        if "text/html" in request.headers.get("Accept", ""):
+            headers["Accept-Encoding"] = "gzip, deflate"
+
+        data = request.content if request.body_exists else None
+        response: web.StreamResponse | None = None
+        try:
+            async with self._get_proxy_session().request(
+                request.method,
+                target_url,
+                headers=headers,
+                data=data,
+                allow_redirects=False,
+                timeout=_PROXY_TIMEOUT,
+            ) as upstream:
+                resp_headers = _forward_headers(upstream.headers)
+                encoding = upstream.headers.get("Content-Encoding", "").strip().lower()
+
+                injector: _HeadInjector | None = None
+                decoder = None
+                if (
+                    "text/html" in upstream.headers.get("Content-Type", "")
+                    and request.method != "HEAD"
+                    and upstream.status not in (204, 304)
+                    and encoding in _DECODABLE_ENCODINGS
+                ):
+                    injector = _HeadInjector(f'<base href="{prefix}/">'.encode())
+                    if encoding not in ("", "identity"):
+                        decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+                    resp_headers.popall("Content-Length", None)
+                    resp_headers.popall("Content-Encoding", None)
+
+                response = web.StreamResponse(
+                    status=upstream.status, reason=upstream.reason, headers=resp_headers
+                )
+                if injector is not None:
+                    # Rewritten HTML is re-compressed if the browser accepts it
+                    response.enable_compression()
+                await response.prepare(request)
+
+                async for chunk in upstream.content.iter_chunked(_PROXY_CHUNK_SIZE):
+                    if injector is not None:
+                        if decoder is not None:
+                            chunk = decoder.decompress(chunk)
+                        chunk = injector.feed(chunk)
+                    if chunk:
+                        await response.write(chunk)
+                if injector is not None:
+                    tail = injector.feed(decoder.flush()) if decoder else b""
+                    tail += injector.finish()
+                    if tail:
+                        await response.write(tail)
+                await response.write_eof()
+                return response
+        except (aiohttp.ClientError, asyncio.TimeoutError, zlib.error) as e:
+            logger.error("%s proxy error: %s", label, e)
+            if response is not None and response.prepared:
+                # Headers already sent — nothing useful left to tell the client
+                return response
+            return web.Response(text="Bad Gateway", status=502)
+
     # -- VS Code Web (code-server reverse proxy) --
 
     def _verify_code_workspace(self, token: str) -> tuple[Path | None, str]:
@@ -1263,92 +1938,9 @@ class ShareServer:
         if request.headers.get("Upgrade", "").lower() == "websocket":
             return await self._proxy_code_ws(request, target_url)
 
-        return await self._proxy_code_http(request, target_url, token)
-
-    async def _proxy_code_http(
-        self, request: web.Request, target_url: str, token: str
-    ) -> web.StreamResponse:
-        """Forward HTTP request to code-server and return response."""
-        if self._proxy_session is None or self._proxy_session.closed:
-            self._proxy_session = aiohttp.ClientSession()
-
-        # Forward headers (skip hop-by-hop and encoding negotiation)
-        headers: dict[str, str] = {}
-        for key, value in request.headers.items():
-            if key.lower() not in (
-                "host", "content-length", "transfer-encoding", "accept-encoding",
-            ):
-                headers[key] = value
-        # Request uncompressed responses to avoid brotli/zstd decode issues
-        headers["Accept-Encoding"] = "gzip, deflate"
-
-        body = await request.read() if request.can_read_body else None
-
-        try:
-            async with self._proxy_session.request(
-                request.method,
-                target_url,
-                headers=headers,
-                data=body,
-                allow_redirects=False,
-                timeout=aiohttp.ClientTimeout(total=300),
-            ) as upstream:
-                # Filter response headers
-                resp_headers: dict[str, str] = {}
-                for key, value in upstream.headers.items():
-                    if key.lower() in (
-                        "transfer-encoding",
-                        "content-encoding",
-                        "content-length",
-                    ):
-                        continue
-                    resp_headers[key] = value
-
-                content_type = upstream.headers.get("Content-Type", "")
-                prefix = f"/code/{token}"
-
-                if "text/html" in content_type:
-                    # Read full body for HTML path rewriting
-                    raw = await upstream.read()
-                    text = raw.decode("utf-8", errors="replace")
-                    # Inject <base> tag for relative URL resolution
-                    if "<head>" in text:
-                        text = text.replace(
-                            "<head>", f'<head><base href="{prefix}/">', 1
-                        )
-                    elif "<HEAD>" in text:
-                        text = text.replace(
-                            "<HEAD>", f'<HEAD><base href="{prefix}/">', 1
-                        )
-                    else:
-                        text = f'<base href="{prefix}/">' + text
-                    # Remove Content-Type from forwarded headers to avoid conflict
-                    html_headers = {
-                        k: v for k, v in resp_headers.items()
-                        if k.lower() != "content-type"
-                    }
-                    return web.Response(
-                        body=text.encode("utf-8"),
-                        status=upstream.status,
-                        headers=html_headers,
-                        content_type="text/html",
-                        charset="utf-8",
-                    )
-
-                # Stream non-HTML response
-                response = web.StreamResponse(
-                    status=upstream.status, headers=resp_headers
-                )
-                if content_type:
-                    response.content_type = content_type
-                await response.prepare(request)
-                async for chunk in upstream.content.iter_chunked(32768):
-                    await response.write(chunk)
-                await response.write_eof()
-                return response
-        except aiohttp.ClientError as e:
-            logger.error("code-server proxy error: %s", e)
-            return web.Response(text="Bad Gateway", status=502)
+        return await self._proxy_http(
+            request, target_url, prefix=f"/code/{token}", label="code-server"
+        )
 
     async def _proxy_code_ws(
         self, request: web.Request, target_url: str
@@ -1361,11 +1953,8 @@ class ShareServer:
 
         ws_url = target_url.replace("http://", "ws://")
 
-        if self._proxy_session is None or self._proxy_session.closed:
-            self._proxy_session = aiohttp.ClientSession()
-
         try:
-            async with self._proxy_session.ws_connect(
+            async with self._get_proxy_session().ws_connect(
                 ws_url,
                 protocols=request.headers.getall("Sec-WebSocket-Protocol", []),
             ) as ws_upstream:
@@ -1435,87 +2024,9 @@ class ShareServer:
         if request.headers.get("Upgrade", "").lower() == "websocket":
             return await self._proxy_port_ws(request, target_url)
 
-        return await self._proxy_port_http(request, target_url, token)
-
-    async def _proxy_port_http(
-        self, request: web.Request, target_url: str, token: str
-    ) -> web.StreamResponse:
-        """Forward HTTP request to local port and return response."""
-        if self._proxy_session is None or self._proxy_session.closed:
-            self._proxy_session = aiohttp.ClientSession()
-
-        headers: dict[str, str] = {}
-        for key, value in request.headers.items():
-            if key.lower() not in (
-                "host", "content-length", "transfer-encoding", "accept-encoding",
-            ):
-                headers[key] = value
-        headers["Accept-Encoding"] = "gzip, deflate"
-
-        body = await request.read() if request.can_read_body else None
-
-        try:
-            async with self._proxy_session.request(
-                request.method,
-                target_url,
-                headers=headers,
-                data=body,
-                allow_redirects=False,
-                timeout=aiohttp.ClientTimeout(total=300),
-            ) as upstream:
-                resp_headers: dict[str, str] = {}
-                for key, value in upstream.headers.items():
-                    if key.lower() in (
-                        "transfer-encoding",
-                        "content-encoding",
-                        "content-length",
-                    ):
-                        continue
-                    resp_headers[key] = value
-
-                content_type = upstream.headers.get("Content-Type", "")
-                prefix = f"/port/{token}"
-
-                if "text/html" in content_type:
-                    raw = await upstream.read()
-                    text = raw.decode("utf-8", errors="replace")
-                    # Inject <base> tag for relative URL resolution
-                    if "<head>" in text:
-                        text = text.replace(
-                            "<head>", f'<head><base href="{prefix}/">', 1
-                        )
-                    elif "<HEAD>" in text:
-                        text = text.replace(
-                            "<HEAD>", f'<HEAD><base href="{prefix}/">', 1
-                        )
-                    else:
-                        text = f'<base href="{prefix}/">' + text
-                    html_headers = {
-                        k: v for k, v in resp_headers.items()
-                        if k.lower() != "content-type"
-                    }
-                    return web.Response(
-                        body=text.encode("utf-8"),
-                        status=upstream.status,
-                        headers=html_headers,
-                        content_type="text/html",
-                        charset="utf-8",
-                    )
-
-                # Stream non-HTML response
-                response = web.StreamResponse(
-                    status=upstream.status, headers=resp_headers
-                )
-                if content_type:
-                    response.content_type = content_type
-                await response.prepare(request)
-                async for chunk in upstream.content.iter_chunked(32768):
-                    await response.write(chunk)
-                await response.write_eof()
-                return response
-        except aiohttp.ClientError as e:
-            logger.error("port proxy error: %s", e)
-            return web.Response(text="Bad Gateway", status=502)
+        return await self._proxy_http(
+            request, target_url, prefix=f"/port/{token}", label="port"
+        )
 
     async def _proxy_port_ws(
         self, request: web.Request, target_url: str
@@ -1528,11 +2039,8 @@ class ShareServer:
 
         ws_url = target_url.replace("http://", "ws://")
 
-        if self._proxy_session is None or self._proxy_session.closed:
-            self._proxy_session = aiohttp.ClientSession()
-
         try:
-            async with self._proxy_session.ws_connect(
+            async with self._get_proxy_session().ws_connect(
                 ws_url,
                 protocols=request.headers.getall("Sec-WebSocket-Protocol", []),
             ) as ws_upstream:
@@ -1627,18 +2135,80 @@ class ShareServer:
         ws_path = payload["workspace"]
         display = Path(ws_path).name.removeprefix("workspace_")
 
-        # Compute remaining TTL for the JS countdown
-        try:
-            parts = token.split("-", 2)
-            expires = int(parts[1])
-            remaining = max(0, expires - int(time.time()))
-        except (ValueError, IndexError):
-            remaining = 600
+        # Absolute expiry for the JS countdown keeps the page token-constant
+        expires = _token_expires(token) or int(time.time()) + 600
 
-        html = _HUB_HTML.replace("{{NAME}}", display).replace(
-            "{{TTL}}", str(remaining)
+        page = await self._pages.get(
+            ("hub", display, str(expires)),
+            lambda: _HUB_HTML.replace("{{NAME}}", display).replace(
+                "{{EXPIRES}}", str(expires)
+            ),
+        )
+        return _page_response(
+            request, page, cache_control=_token_cache_control(token)
+        )
+
+    @staticmethod
+    def _metrics_authorized(request: web.Request) -> bool:
+        """Check ``Authorization: Bearer <token>`` or ``?token=``.
+
+        The token is either a signed ``metrics`` token or, for long-lived
+        scrapers, the value of the ``METRICS_TOKEN`` env var.
+        """
+        auth = request.headers.get("Authorization", "")
+        token = auth[7:].strip() if auth.lower().startswith("bearer ") else ""
+        token = token or request.query.get("token", "")
+        static = os.environ.get("METRICS_TOKEN", "")
+        return bool(token) and (
+            (bool(static) and hmac.compare_digest(token, static))
+            or check_token(token, METRICS_TOKEN_PATH) == "ok"
+        )
+
+    @staticmethod
+    def _unauthorized() -> web.Response:
+        return web.Response(
+            status=401,
+            text="unauthorized\n",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Prometheus text exposition of the process-wide metrics registry."""
+        if not self._metrics_authorized(request):
+            return self._unauthorized()
+        from .metrics import registry
+
+        return web.Response(
+            text=registry.render(),
+            headers={
+                "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+                "Cache-Control": "no-store",
+            },
+        )
+
+    async def _handle_loop_report(self, request: web.Request) -> web.Response:
+        """Event-loop stall offenders from LoopWatchdog (``?format=json``)."""
+        if not self._metrics_authorized(request):
+            return self._unauthorized()
+        from .loop_watchdog import get_active
+
+        watchdog = get_active()
+        if watchdog is None:
+            return web.Response(
+                status=404,
+                text="event-loop watchdog disabled ([watchdog] enabled = true)\n",
+            )
+        if request.query.get("format") == "json":
+            return web.json_response(
+                watchdog.snapshot(), headers={"Cache-Control": "no-store"}
+            )
+        return web.Response(
+            text=watchdog.report(),
+            headers={
+                "Content-Type": "text/plain; charset=utf-8",
+                "Cache-Control": "no-store",
+            },
         )
-        return web.Response(text=html, content_type="text/html")
 
     async def _handle_hub_urls(self, request: web.Request) -> web.Response:
         """Return JSON with sub-URLs for each tool."""
@@ -1880,8 +2450,12 @@ class ShareServer:
         if name.startswith("lang:"):
             lang = name[5:]
 
-        html = _TODO_HTML.replace("{{LANG}}", lang)
-        return web.Response(text=html, content_type="text/html")
+        page = await self._pages.get(
+            ("todo", lang), lambda: _TODO_HTML.replace("{{LANG}}", lang)
+        )
+        return _page_response(
+            request, page, cache_control=_token_cache_control(token)
+        )
 
     async def _handle_todo_list(self, request: web.Request) -> web.Response:
         token = request.match_info["token"]
@@ -2051,8 +2625,12 @@ class ShareServer:
         if name.startswith("lang:"):
             lang = name[5:]
 
-        html = _CRON_HTML.replace("{{LANG}}", lang)
-        return web.Response(text=html, content_type="text/html")
+        page = await self._pages.get(
+            ("cron", lang), lambda: _CRON_HTML.replace("{{LANG}}", lang)
+        )
+        return _page_response(
+            request, page, cache_control=_token_cache_control(token)
+        )
 
     async def _handle_cron_list(self, request: web.Request) -> web.Response:
         token = request.match_info["token"]
@@ -2129,6 +2707,9 @@ class ShareServer:
                                 "status": h["status"],
                                 "error": h["error"],
                                 "duration_s": h["duration_s"],
+                                "lag_s": (
+                                    h["lag_s"] if "lag_s" in h.keys() else 0.0
+                                ),
                             }
                             for h in h_rows
                         ]
@@ -2174,8 +2755,11 @@ class ShareServer:
         site = web.TCPSite(self._runner, "127.0.0.1", self._port)
         await site.start()
         logger.info("Share server listening on http://localhost:%d", self._port)
+        self._code_manager.start_warm_pool()
 
     async def stop(self) -> None:
+        for mirror in list(self._tmux_mirrors.values()):
+            await mirror.close()
         await self._code_manager.stop_all()
         if self._proxy_session and not self._proxy_session.closed:
             await self._proxy_session.close()
@@ -7,7 +7,9 @@ heartbeat) by spawning one-shot headless subprocesses (e.g. `claude -p`,
 Current tasks:
   - Hourly summary: reads transcript, writes to memory/summaries/
 
-State is stored in each workspace's memory.db `cron_meta` table.
+State is stored in each workspace's memory.db `cron_meta` table, accessed
+through _MetaStore: one long-lived WAL connection per workspace, with all
+scheduler keys read in a single query per tick.
 """
 
 from __future__ import annotations
@@ -16,6 +18,7 @@ import asyncio
 import hashlib
 import logging
 import os
+import re
 import sqlite3
 import time
 from datetime import datetime
@@ -23,6 +26,9 @@ from zoneinfo import ZoneInfo
 from pathlib import Path
 from typing import TYPE_CHECKING, Awaitable, Callable
 
+from .headless_pool import PRIORITY_BACKGROUND, PRIORITY_USER, HeadlessPool
+from .transcript_parser import TranscriptParser
+
 if TYPE_CHECKING:
     from .backends.base import TmuxCliBackend
     from .session import SessionManager
@@ -35,8 +41,9 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-# Max concurrent headless CLI processes (internal, not configurable)
-_MAX_CONCURRENT = 2
+# Extra seconds on top of subprocess_timeout before the pool abandons a job,
+# so the subprocess's own timeout (which kills the process) fires first
+_JOB_TIMEOUT_GRACE = 30
 
 # Notify admin after this many consecutive errors
 _ADMIN_NOTIFY_THRESHOLD = 5
@@ -52,6 +59,44 @@ _META_KEY_HEARTBEAT_LAST_TIME = "system_scheduler.heartbeat_last_time"
 _META_KEY_HEARTBEAT_CONTENT_HASH = "system_scheduler.heartbeat_content_hash"
 _META_KEY_HEARTBEAT_NEXT_RUN = "system_scheduler.heartbeat_next_run"
 
+# Transcript digest passed to the summary prompt. The whole prompt travels as
+# one argv string (Linux caps a single argument at 128 KiB), so the digest
+# keeps the most recent entries that fit.
+_DIGEST_MAX_BYTES = 96 * 1024
+_DIGEST_TOOL_CHARS = 400  # per tool call/result
+_DIGEST_TEXT_CHARS = 4000  # per user/assistant message
+
+# Step 1 of summary_prompt.md: a digest of the new JSONL entries is embedded
+# in the prompt; whole-file JSON transcripts (rewritten in place, so byte
+# offsets are meaningless) are read by the CLI itself.
+_DIGEST_STEP = """\
+Review the **Transcript digest** at the end of this prompt. It contains only the entries
+   added since the last summary (`{last_summary_time}`, {timezone} local time).
+   Digest timestamps use UTC (ending in `Z`) — convert to {timezone} before writing.
+   Thinking is omitted and tool output is truncated. If you need more detail, or earlier
+   context (e.g. a conversation that started before the cutoff), read the JSONL transcript
+   at `{jsonl_path}` (new entries start at byte offset {digest_offset})."""
+_RAW_STEP = """\
+Read the transcript at `{jsonl_path}` — focus on entries **after** `{last_summary_time}` ({timezone} local time).
+   Transcript timestamps use UTC (ending in `Z`) — convert to {timezone} before comparing.
+   You may read earlier entries when needed to understand incomplete context
+   (e.g. a conversation that started before the cutoff)."""
+_DIGEST_SECTION = """\
+## Transcript digest
+
+Format: `[timestamp] role: text` (role is `user`, `assistant` or `tool`).
+
+<transcript>
+{digest}
+</transcript>
+"""
+
+_EXPQUOTE_RE = re.compile(
+    re.escape(TranscriptParser.EXPANDABLE_QUOTE_START)
+    + r"([\s\S]*?)"
+    + re.escape(TranscriptParser.EXPANDABLE_QUOTE_END)
+)
+
 _HEARTBEAT_MESSAGE = (
     "[NO_NOTIFY] [System Heartbeat]\n"
     "1. Read HEARTBEAT.md (if exists) and process items needing action. Remove completed items.\n"
@@ -97,27 +142,203 @@ def _parse_output(stdout: str) -> tuple[str, str | None]:
     return "silent", None
 
 
-def _get_meta(conn: sqlite3.Connection, key: str, default: str = "") -> str:
-    row = conn.execute("SELECT value FROM cron_meta WHERE key = ?", (key,)).fetchone()
-    return row[0] if row else default
+def _clip(text: str, limit: int) -> str:
+    return text if len(text) <= limit else text[:limit] + "…"
 
 
-def _set_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
-    conn.execute(
-        "INSERT OR REPLACE INTO cron_meta (key, value) VALUES (?, ?)",
-        (key, value),
-    )
+def _build_transcript_digest(
+    jsonl_path: Path, offset: int, backend: TmuxCliBackend | None = None
+) -> tuple[str, int]:
+    """Build a compact text digest of a JSONL transcript from byte ``offset`` to EOF.
+
+    Entries go through *backend*'s transcript parser (TranscriptParser when
+    there is none): thinking is dropped, tool calls are
+    reduced to their summary line plus a truncated result, and long messages
+    are clipped. If the result exceeds _DIGEST_MAX_BYTES, the oldest entries
+    are omitted (with a marker line).
+
+    Returns ``(digest, end_offset)`` where ``end_offset`` is the byte just
+    past the last complete line read — the summary covers the transcript up
+    to there, and anything appended later is left for the next run.
+    """
+    try:
+        with jsonl_path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if offset > size:
+                offset = 0  # file was truncated or replaced
+            if offset > 0:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    f.readline()  # skip the partial line at the offset
+            start = f.tell()
+            raw = f.read()
+    except OSError:
+        return "", offset
+
+    # A trailing line without newline is still being written
+    raw = raw[: raw.rfind(b"\n") + 1]
+    end_offset = start + len(raw)
+
+    if backend is not None:
+        parse_line = backend.parse_transcript_line
+        parse_entries = backend.parse_transcript_entries
+    else:
+        parse_line = TranscriptParser.parse_line
+        parse_entries = TranscriptParser.parse_entries
+    entries = [
+        data
+        for line in raw.decode("utf-8", errors="replace").splitlines()
+        if (data := parse_line(line)) is not None
+    ]
+    parsed, pending, _ = parse_entries(entries)
+
+    lines: list[str] = []
+    for entry in parsed:
+        if entry.content_type == "thinking":
+            continue
+        # A completed tool call is repeated by its tool_result entry
+        if entry.content_type == "tool_use" and entry.tool_use_id not in pending:
+            continue
+        text = _EXPQUOTE_RE.sub(lambda m: m.group(1), entry.text).strip()
+        if not text:
+            continue
+        if entry.content_type in ("tool_use", "tool_result"):
+            label, text = "tool", _clip(text, _DIGEST_TOOL_CHARS)
+        else:
+            label, text = entry.role, _clip(text, _DIGEST_TEXT_CHARS)
+        lines.append(f"[{entry.timestamp or '?'}] {label}: {text}")
+
+    kept: list[str] = []
+    total = 0
+    for line in reversed(lines):
+        total += len(line.encode("utf-8")) + 1
+        if total > _DIGEST_MAX_BYTES:
+            break
+        kept.append(line)
+    kept.reverse()
+    omitted = len(lines) - len(kept)
+    if omitted:
+        kept.insert(0, f"[… {omitted} earlier entries omitted]")
+    return "\n".join(kept), end_offset
 
 
 def _connect(ws_dir: Path) -> sqlite3.Connection:
     db_path = ws_dir / "memory.db"
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), timeout=5.0)
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute(
         "CREATE TABLE IF NOT EXISTS cron_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
     )
     return conn
 
 
+class _MetaStore:
+    """Pooled, cached access to the scheduler's keys in each memory.db.
+
+    Keeps one long-lived WAL-mode connection per workspace. Between
+    begin_tick() and end_tick(), all ``system_scheduler.*`` keys (and the
+    open TODO ids) of a workspace are read once and served from a snapshot;
+    writes go through to the DB and update the snapshot. Outside a tick
+    every read hits the DB, so changes made elsewhere are always visible.
+    """
+
+    def __init__(self) -> None:
+        self._conns: dict[Path, sqlite3.Connection] = {}
+        self._meta: dict[Path, dict[str, str]] | None = None
+        self._todos: dict[Path, list[str]] | None = None
+
+    def _conn(self, ws_dir: Path) -> sqlite3.Connection:
+        conn = self._conns.get(ws_dir)
+        if conn is None:
+            conn = _connect(ws_dir)
+            self._conns[ws_dir] = conn
+        return conn
+
+    def _discard(self, ws_dir: Path) -> None:
+        conn = self._conns.pop(ws_dir, None)
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def begin_tick(self, ws_dirs: list[Path]) -> None:
+        self._meta = {}
+        self._todos = {}
+        # Drop connections to workspaces that no longer exist
+        for stale in set(self._conns) - set(ws_dirs):
+            self._discard(stale)
+
+    def end_tick(self) -> None:
+        self._meta = None
+        self._todos = None
+
+    def _load(self, ws_dir: Path) -> dict[str, str]:
+        try:
+            rows = (
+                self._conn(ws_dir)
+                .execute(
+                    "SELECT key, value FROM cron_meta "
+                    "WHERE key LIKE 'system_scheduler.%'"
+                )
+                .fetchall()
+            )
+        except sqlite3.Error:
+            self._discard(ws_dir)
+            raise
+        return dict(rows)
+
+    def read(self, ws_dir: Path) -> dict[str, str]:
+        """Return all scheduler keys for a workspace."""
+        if self._meta is not None and ws_dir in self._meta:
+            return self._meta[ws_dir]
+        meta = self._load(ws_dir)
+        if self._meta is not None:
+            self._meta[ws_dir] = meta
+        return meta
+
+    def write(self, ws_dir: Path, values: dict[str, str]) -> None:
+        """Write keys in one transaction (write-through to the snapshot)."""
+        conn = self._conn(ws_dir)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cron_meta (key, value) VALUES (?, ?)",
+                    list(values.items()),
+                )
+        except sqlite3.Error:
+            self._discard(ws_dir)
+            raise
+        if self._meta is not None and ws_dir in self._meta:
+            self._meta[ws_dir].update(values)
+
+    def open_todo_ids(self, ws_dir: Path) -> list[str]:
+        """Return ids of open TODOs (empty if memory.db has no todos table)."""
+        if self._todos is not None and ws_dir in self._todos:
+            return self._todos[ws_dir]
+        if ws_dir not in self._conns and not (ws_dir / "memory.db").exists():
+            return []
+        try:
+            rows = (
+                self._conn(ws_dir)
+                .execute("SELECT id FROM todos WHERE status = 'open' ORDER BY id")
+                .fetchall()
+            )
+            ids = [r[0] for r in rows]
+        except sqlite3.OperationalError:
+            ids = []  # todos table doesn't exist
+        except sqlite3.Error:
+            self._discard(ws_dir)
+            raise
+        if self._todos is not None:
+            self._todos[ws_dir] = ids
+        return ids
+
+    def close(self) -> None:
+        for ws_dir in list(self._conns):
+            self._discard(ws_dir)
+
+
 # ---------------------------------------------------------------------------
 # SystemScheduler
 # ---------------------------------------------------------------------------
@@ -162,7 +383,13 @@ class SystemScheduler:
         self._active_start = _parse_time(self._cfg.heartbeat_active_start)
         self._active_end = _parse_time(self._cfg.heartbeat_active_end)
 
-        self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT)
+        self._pool = HeadlessPool(
+            self._cfg.headless_concurrency,
+            default_timeout=self._cfg.subprocess_timeout + _JOB_TIMEOUT_GRACE,
+        )
+        # Workspaces with a background summary queued or running
+        self._queued_summaries: set[Path] = set()
+        self._meta_store = _MetaStore()
         self._running = False
         self._timer_task: asyncio.Task[None] | None = None
         self._pending_tasks: set[asyncio.Task[None]] = set()
@@ -206,6 +433,7 @@ class SystemScheduler:
             except asyncio.CancelledError:
                 pass
             self._timer_task = None
+        self._meta_store.close()
         logger.info("SystemScheduler stopped")
 
     # --- Public API ---
@@ -237,10 +465,13 @@ class SystemScheduler:
             logger.info("trigger_summary: no new content for %r", workspace_name)
             return False
 
-        async with self._semaphore:
-            return await self._run_summary(
-                workspace_name, ws_dir, window_id, jsonl_path
-            )
+        return await self._run_summary(
+            workspace_name, ws_dir, window_id, jsonl_path, priority=PRIORITY_USER
+        )
+
+    def headless_stats(self) -> dict[str, object]:
+        """Queue depth, worker count and latency counters of the headless pool."""
+        return self._pool.stats()
 
     # --- Timer loop ---
 
@@ -258,10 +489,21 @@ class SystemScheduler:
                 break
 
     async def _check_all_workspaces(self) -> None:
+        ws_dirs = self._iter_workspace_dirs()
+        self._meta_store.begin_tick(ws_dirs)
+        try:
+            await self._check_workspaces(ws_dirs)
+        finally:
+            self._meta_store.end_tick()
+
+    async def _check_workspaces(self, ws_dirs: list[Path]) -> None:
         now = time.time()
         tasks = []
-        for ws_dir in self._iter_workspace_dirs():
+        for ws_dir in ws_dirs:
             ws_name = ws_dir.name.removeprefix("workspace_")
+            if ws_dir in self._queued_summaries:
+                # Still waiting for a worker from an earlier tick
+                continue
             if not self._is_summary_due(ws_dir, now):
                 continue
             window_id = self._resolve_window(ws_name)
@@ -290,24 +532,35 @@ class SystemScheduler:
             tasks.append((ws_name, ws_dir, window_id, jsonl_path))
 
         for ws_name, ws_dir, window_id, jsonl_path in tasks:
+            self._queued_summaries.add(ws_dir)
             task = asyncio.create_task(
-                self._run_with_semaphore(ws_name, ws_dir, window_id, jsonl_path)
+                self._run_background_summary(ws_name, ws_dir, window_id, jsonl_path)
             )
             self._pending_tasks.add(task)
             task.add_done_callback(self._pending_tasks.discard)
+        if tasks:
+            logger.info(
+                "SystemScheduler: queued %d summaries (active=%d, waiting=%d, workers=%d)",
+                len(tasks),
+                self._pool.active,
+                self._pool.queued,
+                self._pool.max_workers,
+            )
 
         # Check heartbeats after summary tasks are queued
         await self._check_heartbeats(now)
 
-    async def _run_with_semaphore(
+    async def _run_background_summary(
         self,
         workspace_name: str,
         ws_dir: Path,
         window_id: str,
         jsonl_path: Path,
     ) -> None:
-        async with self._semaphore:
+        try:
             await self._run_summary(workspace_name, ws_dir, window_id, jsonl_path)
+        finally:
+            self._queued_summaries.discard(ws_dir)
 
     # --- Core summary logic ---
 
@@ -317,9 +570,12 @@ class SystemScheduler:
         ws_dir: Path,
         window_id: str,
         jsonl_path: Path,
+        *,
+        priority: int = PRIORITY_BACKGROUND,
     ) -> bool:
         """Run headless CLI for summary, parse output, deliver notifications.
 
+        The CLI call waits for a HeadlessPool slot at ``priority``.
         Returns True on success (even if [SILENT]), False on error.
         """
         now = time.time()
@@ -327,13 +583,47 @@ class SystemScheduler:
         today_date = datetime.fromtimestamp(now, tz=ZoneInfo(self._timezone)).strftime("%Y-%m-%d")
         summary_path = ws_dir / "memory" / "summaries" / f"{today_date}.md"
 
+        wb = self._effective_backend(window_id)
+        step_vars = {
+            "jsonl_path": str(jsonl_path),
+            "last_summary_time": last_summary_time,
+            "timezone": self._timezone,
+        }
+        if wb is not None and wb.is_full_json:
+            # Single JSON document: let the CLI read it. The size only marks
+            # how much has been seen, for _has_new_content.
+            try:
+                end_offset = jsonl_path.stat().st_size
+            except OSError:
+                end_offset = 0
+            transcript_step = _RAW_STEP.format(**step_vars)
+            digest_section = ""
+        else:
+            digest_offset = self._get_digest_offset(ws_dir, jsonl_path)
+            digest, end_offset = await asyncio.to_thread(
+                _build_transcript_digest, jsonl_path, digest_offset, wb
+            )
+            if not digest:
+                # Only non-message entries were appended — nothing to summarize
+                logger.info(
+                    "SystemScheduler: no new messages for %s, skipping summary",
+                    workspace_name,
+                )
+                self._update_state_after_summary(ws_dir, now, jsonl_path, end_offset)
+                return True
+            transcript_step = _DIGEST_STEP.format(
+                digest_offset=digest_offset, **step_vars
+            )
+            digest_section = _DIGEST_SECTION.format(digest=digest)
+
         from .utils import baobaobot_dir
 
         memory_save_bin = baobaobot_dir() / "shared" / "bin" / "memory-save"
         continuation_path = ws_dir / "memory" / "continuations.md"
 
         prompt = self._summary_template.format(
-            jsonl_path=str(jsonl_path),
+            transcript_step=transcript_step,
+            digest_section=digest_section,
             workspace_path=str(ws_dir),
             last_summary_time=last_summary_time,
             locale=self._locale,
@@ -351,8 +641,10 @@ class SystemScheduler:
         )
 
         try:
-            wb = self._effective_backend(window_id)
-            stdout = await self._run_headless(prompt, cwd=ws_dir, backend=wb)
+            stdout = await self._pool.run(
+                lambda: self._run_headless(prompt, cwd=ws_dir, backend=wb),
+                priority=priority,
+            )
         except asyncio.TimeoutError:
             logger.warning("Summary timeout for %s", workspace_name)
             self._record_error(ws_dir, "timeout")
@@ -365,8 +657,9 @@ class SystemScheduler:
 
         action, content = _parse_output(stdout)
 
-        # Update state in a single transaction
-        self._update_state_after_summary(ws_dir, now, jsonl_path)
+        # Update state in a single transaction. Only the digested bytes count
+        # as summarized: lines appended while the job waited or ran are not.
+        self._update_state_after_summary(ws_dir, now, jsonl_path, end_offset)
 
         # Summary does not notify users — it's a silent housekeeping task.
         # The on_notify callback is preserved for other system tasks.
@@ -539,40 +832,35 @@ class SystemScheduler:
     # --- State helpers (cron_meta in memory.db) ---
 
     def _update_state_after_summary(
-        self, ws_dir: Path, now: float, jsonl_path: Path
+        self, ws_dir: Path, now: float, jsonl_path: Path, offset: int
     ) -> None:
-        """Update all state keys after a successful summary in one transaction."""
+        """Update all state keys after a successful summary in one transaction.
+
+        ``offset`` is where the summarized digest ended in ``jsonl_path``.
+        """
         dt = datetime.fromtimestamp(now, tz=ZoneInfo(self._timezone))
         time_val = dt.strftime("%Y-%m-%dT%H:%M:%S")
         try:
-            size = jsonl_path.stat().st_size
-        except OSError:
-            size = 0
-        try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_LAST_SUMMARY_TIME, time_val)
-                _set_meta(conn, _META_KEY_LAST_SUMMARY_JSONL, str(jsonl_path))
-                _set_meta(conn, _META_KEY_LAST_SUMMARY_OFFSET, str(size))
-                _set_meta(conn, _META_KEY_NEXT_SUMMARY_RUN, str(now + self._cfg.summary_interval))
-                _set_meta(conn, _META_KEY_SUMMARY_ERRORS, "0")
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(
+                ws_dir,
+                {
+                    _META_KEY_LAST_SUMMARY_TIME: time_val,
+                    _META_KEY_LAST_SUMMARY_JSONL: str(jsonl_path),
+                    _META_KEY_LAST_SUMMARY_OFFSET: str(offset),
+                    _META_KEY_NEXT_SUMMARY_RUN: str(now + self._cfg.summary_interval),
+                    _META_KEY_SUMMARY_ERRORS: "0",
+                },
+            )
         except Exception:
             logger.warning("Failed to update state after summary for %s", ws_dir)
 
     def _get_last_summary_time(self, ws_dir: Path) -> str:
         """Return last summary time as ISO string, or epoch start."""
         try:
-            conn = _connect(ws_dir)
-            try:
-                val = _get_meta(conn, _META_KEY_LAST_SUMMARY_TIME)
-                return val if val else "1970-01-01T00:00:00"
-            finally:
-                conn.close()
+            val = self._meta_store.read(ws_dir).get(_META_KEY_LAST_SUMMARY_TIME, "")
         except Exception:
             return "1970-01-01T00:00:00"
+        return val if val else "1970-01-01T00:00:00"
 
     def _has_new_content(self, ws_dir: Path, jsonl_path: Path) -> bool:
         """Return True if JSONL has new content since last summary."""
@@ -582,14 +870,11 @@ class SystemScheduler:
             return False
 
         try:
-            conn = _connect(ws_dir)
-            try:
-                last_jsonl = _get_meta(conn, _META_KEY_LAST_SUMMARY_JSONL)
-                last_offset_str = _get_meta(conn, _META_KEY_LAST_SUMMARY_OFFSET, "0")
-            finally:
-                conn.close()
+            meta = self._meta_store.read(ws_dir)
         except Exception:
             return True  # Assume new content on DB error
+        last_jsonl = meta.get(_META_KEY_LAST_SUMMARY_JSONL, "")
+        last_offset_str = meta.get(_META_KEY_LAST_SUMMARY_OFFSET, "0")
 
         # Session changed (new JSONL path) — reset offset
         # but skip tiny files (< 4KB) that are just initialization junk
@@ -603,13 +888,19 @@ class SystemScheduler:
 
         return current_size > last_offset
 
+    def _get_digest_offset(self, ws_dir: Path, jsonl_path: Path) -> int:
+        """Byte offset where the last summary stopped in this transcript (0 if new)."""
+        try:
+            meta = self._meta_store.read(ws_dir)
+            if meta.get(_META_KEY_LAST_SUMMARY_JSONL, "") != str(jsonl_path):
+                return 0
+            return max(0, int(meta.get(_META_KEY_LAST_SUMMARY_OFFSET, "0")))
+        except Exception:
+            return 0
+
     def _is_summary_due(self, ws_dir: Path, now: float) -> bool:
         try:
-            conn = _connect(ws_dir)
-            try:
-                val = _get_meta(conn, _META_KEY_NEXT_SUMMARY_RUN, "0")
-            finally:
-                conn.close()
+            val = self._meta_store.read(ws_dir).get(_META_KEY_NEXT_SUMMARY_RUN, "0")
         except Exception:
             return True
 
@@ -622,45 +913,26 @@ class SystemScheduler:
 
     def _set_next_run(self, ws_dir: Path, next_run: float) -> None:
         try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_NEXT_SUMMARY_RUN, str(next_run))
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(ws_dir, {_META_KEY_NEXT_SUMMARY_RUN: str(next_run)})
         except Exception:
             pass
 
     def _record_error(self, ws_dir: Path, error: str) -> None:
         try:
-            conn = _connect(ws_dir)
-            try:
-                errors = int(_get_meta(conn, _META_KEY_SUMMARY_ERRORS, "0")) + 1
-                _set_meta(conn, _META_KEY_SUMMARY_ERRORS, str(errors))
-                conn.commit()
-            finally:
-                conn.close()
+            errors = self._get_consecutive_errors(ws_dir) + 1
+            self._meta_store.write(ws_dir, {_META_KEY_SUMMARY_ERRORS: str(errors)})
         except Exception:
             pass
 
     def _reset_errors(self, ws_dir: Path) -> None:
         try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_SUMMARY_ERRORS, "0")
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(ws_dir, {_META_KEY_SUMMARY_ERRORS: "0"})
         except Exception:
             pass
 
     def _get_consecutive_errors(self, ws_dir: Path) -> int:
         try:
-            conn = _connect(ws_dir)
-            try:
-                return int(_get_meta(conn, _META_KEY_SUMMARY_ERRORS, "0"))
-            finally:
-                conn.close()
+            return int(self._meta_store.read(ws_dir).get(_META_KEY_SUMMARY_ERRORS, "0"))
         except Exception:
             return 0
 
@@ -715,49 +987,22 @@ class SystemScheduler:
 
     # --- Heartbeat logic ---
 
-    @staticmethod
-    def _has_open_todos(ws_dir: Path) -> bool:
+    def _has_open_todos(self, ws_dir: Path) -> bool:
         """Check if workspace has any open TODOs in memory.db."""
-        db_path = ws_dir / "memory.db"
-        if not db_path.exists():
-            return False
         try:
-            conn = sqlite3.connect(str(db_path))
-            try:
-                row = conn.execute(
-                    "SELECT 1 FROM todos WHERE status = 'open' LIMIT 1"
-                ).fetchone()
-                return row is not None
-            except sqlite3.OperationalError:
-                # todos table doesn't exist
-                return False
-            finally:
-                conn.close()
+            return bool(self._meta_store.open_todo_ids(ws_dir))
         except Exception:
             return False
 
-    @staticmethod
-    def _get_todo_ids_hash(ws_dir: Path) -> str:
+    def _get_todo_ids_hash(self, ws_dir: Path) -> str:
         """Get a hash of open TODO IDs for dedup."""
-        db_path = ws_dir / "memory.db"
-        if not db_path.exists():
-            return ""
         try:
-            conn = sqlite3.connect(str(db_path))
-            try:
-                rows = conn.execute(
-                    "SELECT id FROM todos WHERE status = 'open' ORDER BY id"
-                ).fetchall()
-                if not rows:
-                    return ""
-                ids_str = ",".join(r[0] for r in rows)
-                return hashlib.md5(ids_str.encode("utf-8")).hexdigest()
-            except sqlite3.OperationalError:
-                return ""
-            finally:
-                conn.close()
+            ids = self._meta_store.open_todo_ids(ws_dir)
         except Exception:
             return ""
+        if not ids:
+            return ""
+        return hashlib.md5(",".join(ids).encode("utf-8")).hexdigest()
 
     def _is_within_active_hours(self) -> bool:
         """Check if current time is within active hours."""
@@ -793,62 +1038,49 @@ class SystemScheduler:
         return hashlib.md5(content.encode("utf-8")).hexdigest()
 
     def _get_heartbeat_state(self, ws_dir: Path) -> dict[str, str]:
-        """Read all heartbeat meta keys in a single DB connection."""
-        defaults = {
-            "enabled": "1",
-            "next_run": "0",
-            "last_time": "0",
-            "content_hash": "",
-        }
+        """Read all heartbeat meta keys from the workspace's meta snapshot."""
         try:
-            conn = _connect(ws_dir)
-            try:
-                defaults["enabled"] = _get_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "1")
-                defaults["next_run"] = _get_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0")
-                defaults["last_time"] = _get_meta(conn, _META_KEY_HEARTBEAT_LAST_TIME, "0")
-                defaults["content_hash"] = _get_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, "")
-            finally:
-                conn.close()
+            meta = self._meta_store.read(ws_dir)
         except Exception:
-            pass
-        return defaults
+            meta = {}
+        return {
+            "enabled": meta.get(_META_KEY_HEARTBEAT_ENABLED, "1"),
+            "next_run": meta.get(_META_KEY_HEARTBEAT_NEXT_RUN, "0"),
+            "last_time": meta.get(_META_KEY_HEARTBEAT_LAST_TIME, "0"),
+            "content_hash": meta.get(_META_KEY_HEARTBEAT_CONTENT_HASH, ""),
+        }
 
     def _is_heartbeat_enabled(self, ws_dir: Path) -> bool:
         """Check heartbeat enabled (standalone, used by public API)."""
         try:
-            conn = _connect(ws_dir)
-            try:
-                val = _get_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "1")
-                return val == "1"
-            finally:
-                conn.close()
+            val = self._meta_store.read(ws_dir).get(_META_KEY_HEARTBEAT_ENABLED, "1")
         except Exception:
             return True
+        return val == "1"
 
     def _update_heartbeat_state(
         self, ws_dir: Path, now: float, content_hash: str
     ) -> None:
         try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_HEARTBEAT_LAST_TIME, str(now))
-                _set_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, content_hash)
-                _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, str(now + self._cfg.heartbeat_interval))
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(
+                ws_dir,
+                {
+                    _META_KEY_HEARTBEAT_LAST_TIME: str(now),
+                    _META_KEY_HEARTBEAT_CONTENT_HASH: content_hash,
+                    _META_KEY_HEARTBEAT_NEXT_RUN: str(
+                        now + self._cfg.heartbeat_interval
+                    ),
+                },
+            )
         except Exception:
             logger.warning("Failed to update heartbeat state for %s", ws_dir)
 
     def set_heartbeat_enabled(self, ws_dir: Path, enabled: bool) -> None:
         """Public API: enable/disable heartbeat for a workspace."""
         try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "1" if enabled else "0")
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(
+                ws_dir, {_META_KEY_HEARTBEAT_ENABLED: "1" if enabled else "0"}
+            )
         except Exception:
             logger.warning("Failed to set heartbeat enabled for %s", ws_dir)
 
@@ -974,12 +1206,7 @@ class SystemScheduler:
 
     def _set_heartbeat_next_run(self, ws_dir: Path, next_run: float) -> None:
         try:
-            conn = _connect(ws_dir)
-            try:
-                _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, str(next_run))
-                conn.commit()
-            finally:
-                conn.close()
+            self._meta_store.write(ws_dir, {_META_KEY_HEARTBEAT_NEXT_RUN: str(next_run)})
         except Exception:
             pass
 
@@ -1025,22 +1252,10 @@ class SystemScheduler:
                 if stripped and not stripped.startswith("#"):
                     hb_count += 1
 
-        todo_count = 0
-        db_path = ws_dir / "memory.db"
-        if db_path.exists():
-            try:
-                conn = sqlite3.connect(str(db_path))
-                try:
-                    row = conn.execute(
-                        "SELECT COUNT(*) FROM todos WHERE status = 'open'"
-                    ).fetchone()
-                    todo_count = row[0] if row else 0
-                except sqlite3.OperationalError:
-                    pass
-                finally:
-                    conn.close()
-            except Exception:
-                pass
+        try:
+            todo_count = len(self._meta_store.open_todo_ids(ws_dir))
+        except Exception:
+            todo_count = 0
 
         return hb_count, todo_count
 
@@ -14,21 +14,42 @@ Key class: TmuxManager.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 import signal
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable, TypeVar
 
 import libtmux
 
+from .metrics import TMUX_CALL_SECONDS
+
 if TYPE_CHECKING:
     from .backends.base import TmuxCliBackend
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def _timed(
+    op: str,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Record the latency of a TmuxManager coroutine under ``op``."""
+
+    def decorator(fn: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: object, **kwargs: object) -> _T:
+            with TMUX_CALL_SECONDS.time(op=op):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 @dataclass
 class TmuxWindow:
@@ -102,6 +123,7 @@ class TmuxManager:
             session.windows[0].rename_window(self.main_window_name)
         return session
 
+    @_timed("list_windows")
     async def list_windows(self) -> list[TmuxWindow]:
         """List all windows in the session with their working directories.
 
@@ -163,6 +185,7 @@ class TmuxManager:
         logger.debug("Window not found by name: %s", window_name)
         return None
 
+    @_timed("rename_window")
     async def rename_window(self, window_id: str, new_name: str) -> bool:
         """Rename a tmux window.
 
@@ -203,6 +226,7 @@ class TmuxManager:
         logger.debug("Window not found by id: %s", window_id)
         return None
 
+    @_timed("capture_pane")
     async def capture_pane(self, window_id: str, with_ansi: bool = False) -> str | None:
         """Capture the visible text content of a window's active pane.
 
@@ -257,6 +281,7 @@ class TmuxManager:
 
         return await asyncio.to_thread(_sync_capture)
 
+    @_timed("send_keys")
     async def send_keys(
         self, window_id: str, text: str, enter: bool = True, literal: bool = True
     ) -> bool:
@@ -358,6 +383,7 @@ class TmuxManager:
 
         return await asyncio.to_thread(_sync_send_keys)
 
+    @_timed("get_pane_pid")
     async def get_pane_pid(self, window_id: str) -> int | None:
         """Get the shell PID of the active pane in the given window.
 
@@ -509,6 +535,7 @@ class TmuxManager:
             logger.error("Failed to restart CLI in window %s", window_id)
         return success
 
+    @_timed("kill_window")
     async def kill_window(self, window_id: str) -> bool:
         """Kill a tmux window by its ID."""
 
@@ -529,6 +556,7 @@ class TmuxManager:
 
         return await asyncio.to_thread(_sync_kill)
 
+    @_timed("create_window")
     async def create_window(
         self,
         work_dir: str,
@@ -1,8 +1,14 @@
 """Voice-to-text transcription using faster-whisper.
 
-Lazy-loads the WhisperModel singleton on first use.  If ``faster-whisper``
-is not installed the module degrades gracefully — ``transcribe_voice()``
-returns *None* and the caller falls back to the default file-only flow.
+Inference runs on a single dedicated worker thread fed by a bounded queue,
+so concurrent voice notes are transcribed one at a time instead of piling
+whisper runs onto the default executor (which the bot also uses for file
+and database work).  ``preload_model()`` loads the model on that thread at
+startup so the first voice note doesn't pay for it.
+
+If ``faster-whisper`` is not installed the module degrades gracefully —
+``transcribe_voice()`` returns *None* and the caller falls back to the
+default file-only flow.  The same happens when the queue is full.
 """
 
 from __future__ import annotations
@@ -10,7 +16,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+from collections import deque
 from pathlib import Path
+from typing import Callable
+
+from .metrics import registry
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +28,9 @@ _models: dict[str, object] = {}
 _model_lock = threading.Lock()
 _load_failed = False
 
+# Voice notes waiting for the worker beyond this are not transcribed
+_QUEUE_MAX = 8
+
 
 def _get_model(whisper_model: str = "small") -> object | None:
     """Return the cached WhisperModel for *whisper_model*, creating it on first call."""
@@ -51,20 +64,192 @@ def _get_model(whisper_model: str = "small") -> object | None:
             return None
 
 
-def _transcribe_sync(path: Path, whisper_model: str = "small") -> str | None:
-    """Synchronous transcription.  Returns text or *None* on failure."""
+def _transcribe_sync(
+    path: Path,
+    whisper_model: str = "small",
+    on_segment: Callable[[str], None] | None = None,
+) -> str | None:
+    """Synchronous transcription.  Returns text or *None* on failure.
+
+    *on_segment* is called with the text decoded so far after each segment.
+    """
     model = _get_model(whisper_model)
     if model is None:
         return None
     try:
         segments, _info = model.transcribe(str(path), vad_filter=True)  # type: ignore[union-attr]
-        text = "".join(seg.text for seg in segments).strip()
+        parts: list[str] = []
+        for seg in segments:
+            parts.append(seg.text)
+            if on_segment is not None:
+                on_segment("".join(parts).strip())
+        text = "".join(parts).strip()
         return text if text else None
     except Exception:
         logger.exception("Transcription failed for %s", path)
         return None
 
 
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+
+class TranscriptionJob:
+    """A queued transcription.  Await ``wait()`` for the transcript."""
+
+    def __init__(
+        self,
+        path: Path | None,
+        whisper_model: str,
+        on_partial: Callable[[str], None] | None = None,
+    ) -> None:
+        self.path = path  # None = preload only
+        self.whisper_model = whisper_model
+        self.position = 0  # jobs ahead of this one when submitted
+        self._on_partial = on_partial
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._future: asyncio.Future[str | None] | None = None
+        if path is not None:
+            self._loop = asyncio.get_running_loop()
+            self._future = self._loop.create_future()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    async def wait(self) -> str | None:
+        assert self._future is not None
+        return await self._future
+
+    # Called on the worker thread
+
+    def _call_soon(self, fn: Callable[..., object], *args: object) -> None:
+        assert self._loop is not None
+        try:
+            self._loop.call_soon_threadsafe(fn, *args)
+        except RuntimeError:
+            pass  # event loop already closed
+
+    def _partial(self, text: str) -> None:
+        if self._on_partial is not None:
+            self._call_soon(self._on_partial, text)
+
+    def _resolve(self, result: str | None) -> None:
+        fut = self._future
+        if fut is None:
+            return
+        self._call_soon(lambda: fut.done() or fut.set_result(result))
+
+
+class _TranscriptionWorker:
+    """Single daemon thread draining a bounded FIFO of TranscriptionJobs."""
+
+    def __init__(self, max_pending: int) -> None:
+        self._max_pending = max_pending
+        self._pending: deque[TranscriptionJob] = deque()
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job: TranscriptionJob) -> bool:
+        """Queue *job*; returns False if the queue is full."""
+        with self._cond:
+            if len(self._pending) >= self._max_pending:
+                return False
+            job.position = len(self._pending) + (1 if self._busy else 0)
+            self._pending.append(job)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="whisper-worker", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    @property
+    def depth(self) -> int:
+        """Jobs waiting or running."""
+        with self._cond:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._busy = False
+                    self._cond.wait()
+                job = self._pending.popleft()
+                self._busy = True
+            transcribe = job.path is not None and not job.cancelled
+            result: str | None = None
+            try:
+                if job.path is None:
+                    _get_model(job.whisper_model)
+                elif transcribe:
+                    if job._on_partial is not None:
+                        result = _transcribe_sync(
+                            job.path, job.whisper_model, job._partial
+                        )
+                    else:
+                        result = _transcribe_sync(job.path, job.whisper_model)
+            except Exception:
+                logger.exception("Transcription worker error")
+                transcribe = True
+            finally:
+                # Before resolving: the awaiting coroutine may submit() right
+                # away and must not count this finished job as running
+                with self._cond:
+                    self._busy = False
+            if transcribe:
+                job._resolve(result)
+
+
+_worker = _TranscriptionWorker(_QUEUE_MAX)
+
+_DEPTH_GAUGE = registry.gauge(
+    "baobaobot_transcription_queue_depth", "Voice notes waiting or being transcribed"
+)
+
+
+def _collect_metrics() -> None:
+    _DEPTH_GAUGE.set(_worker.depth)
+
+
+registry.add_collector(_collect_metrics)
+
+
+def preload_model(whisper_model: str) -> None:
+    """Load *whisper_model* on the worker thread ahead of the first voice note."""
+    if not whisper_model or _load_failed or whisper_model in _models:
+        return
+    _worker.submit(TranscriptionJob(None, whisper_model))
+
+
+def submit_transcription(
+    path: Path,
+    whisper_model: str = "small",
+    *,
+    on_partial: Callable[[str], None] | None = None,
+) -> TranscriptionJob | None:
+    """Queue *path* for transcription; returns *None* if the queue is full.
+
+    *on_partial* is called on the event loop with the text decoded so far as
+    segments arrive.  The returned job's ``position`` is the number of jobs
+    ahead of it.
+    """
+    if _load_failed:
+        return None
+    job = TranscriptionJob(path, whisper_model, on_partial)
+    if not _worker.submit(job):
+        logger.warning("Voice transcription queue full — skipping %s", path)
+        return None
+    return job
+
+
 async def transcribe_voice(path: Path, whisper_model: str = "small") -> str | None:
-    """Transcribe an audio file without blocking the event loop."""
-    return await asyncio.to_thread(_transcribe_sync, path, whisper_model)
+    """Transcribe an audio file on the worker thread without blocking the event loop."""
+    job = submit_transcription(path, whisper_model)
+    if job is None:
+        return None
+    return await job.wait()
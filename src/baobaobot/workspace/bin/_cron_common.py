@@ -2,7 +2,7 @@
 
 Provides SQLite-backed cron job management: create, list, update, delete,
 and execution history queries.  Stores cron data in the existing memory.db
-(adds cron_jobs / cron_meta / cron_history tables).
+(adds cron_jobs / cron_meta / cron_history / cron_version tables).
 
 IMPORTANT: This module must be self-contained (no imports from baobaobot.*)
 since bin scripts run outside the package.
@@ -65,14 +65,45 @@ CREATE TABLE IF NOT EXISTS cron_history (
     finished_at REAL,
     status      TEXT NOT NULL DEFAULT '',
     error       TEXT NOT NULL DEFAULT '',
-    duration_s  REAL NOT NULL DEFAULT 0.0
+    duration_s  REAL NOT NULL DEFAULT 0.0,
+    scheduled_at REAL,
+    lag_s       REAL NOT NULL DEFAULT 0.0
 );
 
 CREATE INDEX IF NOT EXISTS idx_cron_jobs_enabled ON cron_jobs(enabled);
 CREATE INDEX IF NOT EXISTS idx_cron_history_job ON cron_history(job_id);
 CREATE INDEX IF NOT EXISTS idx_cron_history_time ON cron_history(started_at);
+-- Bumped by the triggers below whenever cron jobs or workspace_meta change,
+-- so the scheduler can tell those writes apart from other memory.db traffic.
+CREATE TABLE IF NOT EXISTS cron_version (
+    id      INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cron_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_ins AFTER INSERT ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_upd AFTER UPDATE ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_jobs_version_del AFTER DELETE ON cron_jobs
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_ins AFTER INSERT ON cron_meta
+WHEN NEW.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_upd AFTER UPDATE ON cron_meta
+WHEN NEW.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
+CREATE TRIGGER IF NOT EXISTS cron_meta_version_del AFTER DELETE ON cron_meta
+WHEN OLD.key LIKE 'workspace_meta.%'
+BEGIN UPDATE cron_version SET version = version + 1; END;
 """
 
+# Columns added to cron_history after its first release: name → definition
+_HISTORY_ADDED_COLUMNS = {
+    "scheduled_at": "REAL",
+    "lag_s": "REAL NOT NULL DEFAULT 0.0",
+}
+
 
 # ---------------------------------------------------------------------------
 # DB connection & migration
@@ -87,6 +118,10 @@ def connect_db(workspace: Path) -> sqlite3.Connection:
 
     # Ensure all cron tables exist (safe to run every time due to IF NOT EXISTS)
     conn.executescript(_CRON_SCHEMA)
+    have = {r[1] for r in conn.execute("PRAGMA table_info(cron_history)")}
+    for name, decl in _HISTORY_ADDED_COLUMNS.items():
+        if name not in have:
+            conn.execute(f"ALTER TABLE cron_history ADD COLUMN {name} {decl}")
     conn.commit()
 
     # Auto-migrate from jobs.json if DB is empty and JSON exists
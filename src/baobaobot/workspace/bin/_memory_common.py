@@ -26,6 +26,7 @@ import shutil
 import sqlite3
 import struct
 import subprocess
+from abc import ABC, abstractmethod
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
@@ -37,7 +38,13 @@ logger = logging.getLogger(__name__)
 _EMBEDDING_MODEL = "text-embedding-3-small"
 _EMBEDDING_DIMS = 512
 _EMBEDDING_BATCH_SIZE = 100  # max paragraphs per API call
-_EMBEDDING_SYNC_TIMEOUT = 5.0  # seconds — stop embedding after this during sync
+_EMBEDDING_SYNC_TIMEOUT = 5.0  # seconds — default budget for one backfill pass
+
+# Embedding provider: "openai" (default), "hash" (offline), or "none"
+_EMBEDDING_PROVIDER_ENV = "BAOBAOBOT_EMBEDDING_PROVIDER"
+
+# Query embeddings kept in query_embedding_cache (least recently used evicted)
+_QUERY_CACHE_MAX = 500
 
 # Regex to strip YAML frontmatter (--- ... ---) from the beginning of a file
 _FRONTMATTER_RE = re.compile(r"\A---\n.*?\n---\n?", re.DOTALL)
@@ -68,7 +75,7 @@ def _pad_cjk_ascii(text: str) -> str:
 
 
 # Schema version — MUST match baobaobot.memory.db._SCHEMA_VERSION
-_SCHEMA_VERSION = 6
+_SCHEMA_VERSION = 9
 
 # Heading regex for paragraph splitting
 _HEADING_RE = re.compile(r"^#{1,6}\s+", re.MULTILINE)
@@ -269,27 +276,98 @@ def _jaccard(a: set[str], b: set[str]) -> float:
     return len(a & b) / len(a | b)
 
 
+# MinHash signatures over the same character bigrams.  Stored per memories
+# row at sync time; LSH bands over them pick the pairs worth an exact check.
+_MINHASH_PERM = 32
+_MINHASH_MASKS = tuple(
+    int.from_bytes(hashlib.blake2b(b"minhash%d" % i, digest_size=4).digest(), "little")
+    for i in range(_MINHASH_PERM)
+)
+_MINHASH_EMPTY = (0xFFFFFFFF,) * _MINHASH_PERM
+_MINHASH_STRUCT = struct.Struct(f"<{_MINHASH_PERM}I")
+# Up to this many results every pair is compared; LSH only pays off beyond
+_EXACT_DEDUP_MAX = 64
+
+
+def _minhash(text: str) -> tuple[int, ...]:
+    """MinHash signature (``_MINHASH_PERM`` 32-bit values) of *text*'s bigrams."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=4).digest(), "little")
+        for g in _char_bigrams(text)
+    ]
+    if not hashes:
+        return _MINHASH_EMPTY
+    return tuple(min(h ^ m for h in hashes) for m in _MINHASH_MASKS)
+
+
+def _minhash_blob(text: str) -> bytes:
+    """Serialized ``_minhash`` for the memories.minhash column."""
+    return _MINHASH_STRUCT.pack(*_minhash(text))
+
+
+def _result_signature(result: dict) -> tuple[int, ...]:
+    """Pop the stored ``_minhash`` blob off *result*, or compute it."""
+    blob = result.pop("_minhash", None)
+    if blob and len(blob) == _MINHASH_STRUCT.size:
+        return _MINHASH_STRUCT.unpack(blob)
+    return _minhash(result["content"])
+
+
+def _lsh_candidates(
+    signatures: list[tuple[int, ...]], threshold: float
+) -> list[set[int]]:
+    """For each index, the later indices sharing at least one LSH band."""
+    # Narrower bands for low thresholds so dissimilar-ish pairs still collide
+    rows = 1 if threshold < 0.3 else 2
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    candidates: list[set[int]] = [set() for _ in signatures]
+    for idx, sig in enumerate(signatures):
+        for band in range(0, _MINHASH_PERM, rows):
+            members = buckets.setdefault((band, sig[band : band + rows]), [])
+            for other in members:
+                candidates[other].add(idx)
+            members.append(idx)
+    return candidates
+
+
 def _dedup_results(results: list[dict], threshold: float = 0.55) -> list[dict]:
     """Remove near-duplicate search results, keeping higher-priority sources.
 
     Priority: experience > daily > summary.
-    Uses character-bigram Jaccard similarity.
-    O(n²) pairwise comparison — fine for typical search result sizes (<200).
+    Uses character-bigram Jaccard similarity.  Up to ``_EXACT_DEDUP_MAX``
+    results every pair is compared.  Larger sets only compare pairs that
+    share an LSH band of their MinHash signatures, which is approximate:
+    a small fraction of pairs just above the threshold never share a band
+    and are both kept.
     """
-    if len(results) <= 1:
-        return results
+    n = len(results)
+    if n <= _EXACT_DEDUP_MAX:
+        for r in results:
+            r.pop("_minhash", None)
+        if n <= 1:
+            return results
+        candidates = [set(range(i + 1, n)) for i in range(n)]
+    else:
+        candidates = _lsh_candidates(
+            [_result_signature(r) for r in results], threshold
+        )
+
+    bigrams: dict[int, set[str]] = {}
+
+    def grams(idx: int) -> set[str]:
+        if idx not in bigrams:
+            bigrams[idx] = _char_bigrams(results[idx]["content"])
+        return bigrams[idx]
 
-    # Pre-compute bigrams
-    bigrams = [_char_bigrams(r["content"]) for r in results]
     keep = [True] * len(results)
 
     for i in range(len(results)):
         if not keep[i]:
             continue
-        for j in range(i + 1, len(results)):
+        for j in sorted(candidates[i]):
             if not keep[j]:
                 continue
-            if _jaccard(bigrams[i], bigrams[j]) >= threshold:
+            if _jaccard(grams(i), grams(j)) >= threshold:
                 # Drop the lower-priority one
                 pri_i = _SOURCE_PRIORITY.get(results[i]["source"], 9)
                 pri_j = _SOURCE_PRIORITY.get(results[j]["source"], 9)
@@ -310,7 +388,8 @@ CREATE TABLE IF NOT EXISTS memories (
     date        TEXT    NOT NULL,
     line_num    INTEGER NOT NULL,
     content     TEXT    NOT NULL,
-    updated_at  TEXT    NOT NULL
+    updated_at  TEXT    NOT NULL,
+    minhash     BLOB             -- _minhash() signature for dedup
 );
 
 CREATE TABLE IF NOT EXISTS file_meta (
@@ -355,6 +434,14 @@ CREATE TABLE IF NOT EXISTS embedding_cache (
     PRIMARY KEY (content_hash, model_name)
 );
 
+CREATE TABLE IF NOT EXISTS query_embedding_cache (
+    query_norm   TEXT    NOT NULL,
+    model_name   TEXT    NOT NULL,
+    embedding    BLOB    NOT NULL,
+    last_used    REAL    NOT NULL,
+    PRIMARY KEY (query_norm, model_name)
+);
+
 CREATE INDEX IF NOT EXISTS idx_memories_date    ON memories(date);
 CREATE INDEX IF NOT EXISTS idx_memories_source  ON memories(source);
 CREATE INDEX IF NOT EXISTS idx_memories_path    ON memories(path);
@@ -363,14 +450,29 @@ CREATE INDEX IF NOT EXISTS idx_paragraphs_path  ON paragraphs(path);
 CREATE INDEX IF NOT EXISTS idx_paragraphs_hash  ON paragraphs(content_hash);
 """
 
+# Trigram index for non-ASCII (CJK) queries — created separately because the
+# trigram tokenizer needs SQLite 3.34+.
+_TRIGRAM_SCHEMA = """\
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_trigram USING fts5(
+    content,
+    content='memories',
+    content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+# Trigram MATCH needs at least this many characters; shorter queries use LIKE
+_TRIGRAM_MIN_CHARS = 3
+
 # Track FTS5 availability at module level.
 # Acceptable for short-lived bin scripts (one DB connection per process).
 _fts_available = True
+_trigram_available = True
 
 
 def connect_db(workspace: Path) -> sqlite3.Connection:
     """Open (or create) the memory SQLite database with unified schema."""
-    global _fts_available
+    global _fts_available, _trigram_available
     db_path = workspace / "memory.db"
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
@@ -385,11 +487,13 @@ def connect_db(workspace: Path) -> sqlite3.Connection:
         # ⚠️ NEVER DROP: todos (sole data source is DB, no markdown backup)
         conn.executescript(
             "DROP TABLE IF EXISTS memories_fts;\n"
+            "DROP TABLE IF EXISTS memories_trigram;\n"
             "DROP TABLE IF EXISTS attachment_meta;\n"
             "DROP TABLE IF EXISTS memories;\n"
             "DROP TABLE IF EXISTS file_meta;\n"
             "DROP TABLE IF EXISTS paragraphs;\n"
             "DROP TABLE IF EXISTS embedding_cache;\n"
+            "DROP TABLE IF EXISTS query_embedding_cache;\n"
         )
         try:
             conn.executescript(_SCHEMA)
@@ -404,13 +508,23 @@ def connect_db(workspace: Path) -> sqlite3.Connection:
                 and "content_rowid" not in line
             )
             conn.executescript(schema_no_fts)
+        try:
+            conn.executescript(_TRIGRAM_SCHEMA)
+            _trigram_available = True
+        except sqlite3.OperationalError:
+            _trigram_available = False
         conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         conn.commit()
     else:
-        fts_check = conn.execute(
-            "SELECT name FROM sqlite_master WHERE name = 'memories_fts'"
-        ).fetchone()
-        _fts_available = fts_check is not None
+        names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master "
+                "WHERE name IN ('memories_fts', 'memories_trigram')"
+            )
+        }
+        _fts_available = "memories_fts" in names
+        _trigram_available = "memories_trigram" in names
 
     # Check embedding capabilities (sqlite-vec + API key)
     _check_embedding_capabilities(conn)
@@ -502,10 +616,11 @@ def _sync_file(
     for i, line in enumerate(content.splitlines(), 1):
         stripped = line.strip()
         if stripped:
+            padded = _pad_cjk_ascii(stripped)  # MinHash must cover the stored text
             conn.execute(
-                "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (rel, source, date_str, i, _pad_cjk_ascii(stripped), now),
+                "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (rel, source, date_str, i, padded, now, _minhash_blob(padded)),
             )
 
     # --- Paragraph-level indexing (for vector search) ---
@@ -536,25 +651,106 @@ def _sync_file(
 
 
 def _rebuild_fts(conn: sqlite3.Connection) -> None:
-    """Rebuild the FTS5 index from the memories table."""
-    global _fts_available
-    if not _fts_available:
-        return
-    try:
-        conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
-        conn.commit()
-    except sqlite3.OperationalError:
-        _fts_available = False
+    """Rebuild the FTS5 indexes from the memories table."""
+    global _fts_available, _trigram_available
+    if _fts_available:
+        try:
+            conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
+            conn.commit()
+        except sqlite3.OperationalError:
+            _fts_available = False
+    if _trigram_available:
+        try:
+            conn.execute(
+                "INSERT INTO memories_trigram(memories_trigram) VALUES('rebuild')"
+            )
+            conn.commit()
+        except sqlite3.OperationalError:
+            _trigram_available = False
 
 
 # ---------------------------------------------------------------------------
-# Embedding: OpenAI API + sqlite-vec
+# Embedding providers
 # ---------------------------------------------------------------------------
 
 # Module-level capability flag (set once per process in connect_db via
-# _check_embedding_capabilities).  Only requires openai + API key;
-# cosine similarity is computed in pure Python (no sqlite-vec needed).
+# _check_embedding_capabilities).  Cosine similarity is computed in pure
+# Python, so only the provider itself needs to be usable.
 _embedding_enabled = False
+_provider: _EmbeddingProvider | None = None
+
+
+class _EmbeddingProvider(ABC):
+    """Turns texts into ``_EMBEDDING_DIMS``-dimensional vectors.
+
+    ``name`` is stored as ``embedding_cache.model_name``, so vectors from
+    different providers never mix.
+    """
+
+    name = ""
+
+    def unavailable_reason(self) -> str:
+        """Return why the provider can't be used, or "" if it can."""
+        return ""
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> tuple[list[list[float]], int]:
+        """Return (vectors, total_tokens) for *texts*, in input order."""
+
+
+class _OpenAIEmbedder(_EmbeddingProvider):
+    """OpenAI embeddings API (needs the openai package and OPENAI_API_KEY)."""
+
+    name = _EMBEDDING_MODEL
+
+    def unavailable_reason(self) -> str:
+        reasons = []
+        try:
+            import openai as _oa  # noqa: F401
+        except ImportError:
+            reasons.append("openai package not installed")
+        if not os.environ.get("OPENAI_API_KEY"):
+            reasons.append("OPENAI_API_KEY not set")
+        return ", ".join(reasons)
+
+    def embed(self, texts: list[str]) -> tuple[list[list[float]], int]:
+        return _get_openai_embeddings(texts)
+
+
+class _HashingEmbedder(_EmbeddingProvider):
+    """Offline embedder: feature-hashed words and character n-grams.
+
+    No semantics beyond shared surface forms, but deterministic and free —
+    useful without network access and in tests.
+    """
+
+    name = "hash-ngram-v1"
+
+    def embed(self, texts: list[str]) -> tuple[list[list[float]], int]:
+        return [self._embed_one(t) for t in texts], sum(len(t) for t in texts)
+
+    @staticmethod
+    def _features(text: str) -> list[str]:
+        cleaned = _normalize_query(_MD_STRIP_RE.sub(" ", text))
+        feats = [f"w:{w}" for w in cleaned.split()]
+        compact = cleaned.replace(" ", "")
+        for n in (2, 3):
+            feats.extend(f"{n}:{compact[i : i + n]}" for i in range(len(compact) - n + 1))
+        return feats
+
+    def _embed_one(self, text: str) -> list[float]:
+        vec = [0.0] * _EMBEDDING_DIMS
+        for feat in self._features(text):
+            h = int.from_bytes(hashlib.blake2b(feat.encode(), digest_size=8).digest(), "little")
+            vec[h % _EMBEDDING_DIMS] += 1.0 if (h >> 63) & 1 else -1.0
+        norm = sum(x * x for x in vec) ** 0.5
+        return [x / norm for x in vec] if norm else vec
+
+
+_PROVIDERS: dict[str, type[_EmbeddingProvider]] = {
+    "openai": _OpenAIEmbedder,
+    "hash": _HashingEmbedder,
+}
 
 
 def _load_dotenv_once() -> None:
@@ -581,37 +777,36 @@ def _load_dotenv_once() -> None:
 
 
 def _check_embedding_capabilities(conn: sqlite3.Connection) -> None:
-    """Detect whether vector search is available (openai + API key).
+    """Select the embedding provider and detect whether vector search is usable.
 
-    Note: We compute cosine similarity in pure Python, so sqlite-vec
-    extension loading is NOT required.  Only the ``openai`` package
-    and a valid API key are needed.
+    The provider comes from ``BAOBAOBOT_EMBEDDING_PROVIDER`` (default
+    ``openai``); ``none`` disables vector search.
     """
-    global _embedding_enabled
+    global _embedding_enabled, _provider
 
     # Ensure API key is loaded from .env if not in environment
     _load_dotenv_once()
 
-    has_openai = False
-    try:
-        import openai as _oa  # noqa: F401
+    choice = os.environ.get(_EMBEDDING_PROVIDER_ENV, "openai").strip().lower() or "openai"
+    provider_cls = _PROVIDERS.get(choice)
+    if provider_cls is None:
+        _provider = None
+        reason = f"embedding provider {choice!r} disabled"
+    else:
+        _provider = provider_cls()
+        reason = _provider.unavailable_reason()
+    _embedding_enabled = _provider is not None and not reason
 
-        has_openai = True
-    except ImportError:
-        pass
+    if _embedding_enabled:
+        assert _provider is not None
+        logger.info("Vector search: enabled (%s)", _provider.name)
+    else:
+        logger.info("Vector search: disabled (%s)", reason)
 
-    _embedding_enabled = has_openai and bool(os.environ.get("OPENAI_API_KEY"))
 
-    status = "enabled" if _embedding_enabled else "disabled"
-    reason = ""
-    if not _embedding_enabled:
-        reasons = []
-        if not has_openai:
-            reasons.append("openai package not installed")
-        if not os.environ.get("OPENAI_API_KEY"):
-            reasons.append("OPENAI_API_KEY not set")
-        reason = f" ({', '.join(reasons)})"
-    logger.info("Vector search: %s%s", status, reason)
+def _embedding_model_name() -> str:
+    """Model name of the active provider (``embedding_cache.model_name``)."""
+    return _provider.name if _provider is not None else _EMBEDDING_MODEL
 
 
 def _get_openai_embeddings(texts: list[str]) -> tuple[list[list[float]], int]:
@@ -640,18 +835,111 @@ def _deserialize_embedding(blob: bytes) -> list[float]:
     return list(struct.unpack(f"<{_EMBEDDING_DIMS}f", blob))
 
 
+def _normalize_query(text: str) -> str:
+    """Normalise text for query-cache keys: NFKC, casefold, single spaces."""
+    import unicodedata
+
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+# In-process LRU in front of query_embedding_cache (key: (query_norm, model))
+_query_lru: dict[tuple[str, str], list[float]] = {}
+_QUERY_LRU_MAX = 64
+
+
+def _embed_query(conn: sqlite3.Connection, query: str) -> list[float] | None:
+    """Return the embedding for *query*, reusing cached vectors when possible.
+
+    Looks in the in-process LRU, then ``query_embedding_cache``; only a miss
+    in both calls the provider.  Returns *None* if the provider fails.
+    """
+    if _provider is None:
+        return None
+    import time
+
+    key = (_normalize_query(query), _provider.name)
+    vec = _query_lru.pop(key, None)
+    if vec is None:
+        row = conn.execute(
+            "SELECT embedding FROM query_embedding_cache "
+            "WHERE query_norm = ? AND model_name = ?",
+            key,
+        ).fetchone()
+        if row is not None:
+            vec = _deserialize_embedding(row["embedding"])
+            conn.execute(
+                "UPDATE query_embedding_cache SET last_used = ? "
+                "WHERE query_norm = ? AND model_name = ?",
+                (time.time(), *key),
+            )
+        else:
+            try:
+                vecs, _ = _provider.embed([query])
+                vec = vecs[0]
+            except Exception as exc:
+                logger.warning("Embedding query failed: %s", exc)
+                return None
+            conn.execute(
+                "INSERT OR REPLACE INTO query_embedding_cache "
+                "(query_norm, model_name, embedding, last_used) VALUES (?, ?, ?, ?)",
+                (*key, _serialize_embedding(vec), time.time()),
+            )
+            conn.execute(
+                "DELETE FROM query_embedding_cache WHERE rowid IN ("
+                "SELECT rowid FROM query_embedding_cache "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (_QUERY_CACHE_MAX,),
+            )
+        conn.commit()
+
+    _query_lru[key] = vec
+    while len(_query_lru) > _QUERY_LRU_MAX:
+        del _query_lru[next(iter(_query_lru))]
+    return vec
+
+
+def embedding_stats(conn: sqlite3.Connection) -> dict:
+    """Embedding backfill progress for the active provider."""
+    model_name = _embedding_model_name()
+    unique = conn.execute(
+        "SELECT COUNT(DISTINCT content_hash) FROM paragraphs"
+    ).fetchone()[0]
+    missing = conn.execute(
+        "SELECT COUNT(DISTINCT p.content_hash) "
+        "FROM paragraphs p "
+        "LEFT JOIN embedding_cache e "
+        "  ON p.content_hash = e.content_hash "
+        "  AND e.model_name = ? "
+        "WHERE e.content_hash IS NULL",
+        (model_name,),
+    ).fetchone()[0]
+    cached_queries = conn.execute(
+        "SELECT COUNT(*) FROM query_embedding_cache WHERE model_name = ?",
+        (model_name,),
+    ).fetchone()[0]
+    return {
+        "enabled": _embedding_enabled,
+        "model": model_name,
+        "paragraphs": unique,
+        "embedded": unique - missing,
+        "missing": missing,
+        "cached_queries": cached_queries,
+    }
+
+
 def _compute_embeddings(conn: sqlite3.Connection, timeout: float = _EMBEDDING_SYNC_TIMEOUT) -> int:
     """Compute embeddings for paragraphs that don't have one yet.
 
     Uses LEFT JOIN to find paragraphs missing from embedding_cache,
     independent of file_meta state. Returns number of new embeddings computed.
     """
-    if not _embedding_enabled:
+    if not _embedding_enabled or _provider is None:
         return 0
 
     import time
 
     start_time = time.monotonic()
+    model_name = _provider.name
 
     # Find paragraphs missing embeddings (deduplicated by content_hash)
     rows = conn.execute(
@@ -661,7 +949,7 @@ def _compute_embeddings(conn: sqlite3.Connection, timeout: float = _EMBEDDING_SY
         "  ON p.content_hash = e.content_hash "
         "  AND e.model_name = ? "
         "WHERE e.content_hash IS NULL",
-        (_EMBEDDING_MODEL,),
+        (model_name,),
     ).fetchall()
 
     if not rows:
@@ -686,7 +974,7 @@ def _compute_embeddings(conn: sqlite3.Connection, timeout: float = _EMBEDDING_SY
         hashes = [r["content_hash"] for r in batch]
 
         try:
-            vectors, batch_tokens = _get_openai_embeddings(texts)
+            vectors, batch_tokens = _provider.embed(texts)
         except Exception as exc:
             logger.warning("Embedding API error: %s — skipping batch, will retry next sync", exc)
             continue
@@ -701,7 +989,7 @@ def _compute_embeddings(conn: sqlite3.Connection, timeout: float = _EMBEDDING_SY
                 "INSERT OR REPLACE INTO embedding_cache "
                 "(content_hash, model_name, embedding, token_count, created_at) "
                 "VALUES (?, ?, ?, ?, ?)",
-                (content_hash, _EMBEDDING_MODEL, blob, per_item_tokens, now),
+                (content_hash, model_name, blob, per_item_tokens, now),
             )
             total_computed += 1
 
@@ -799,10 +1087,11 @@ def _sync_todos(conn: sqlite3.Connection) -> int:
         title_line = f"[{r['id']}] [{r['type']}] {r['title']} ({status_mark})"
         if r["created_by"]:
             title_line += f" @{r['created_by']}"
+        padded = _pad_cjk_ascii(title_line)
         conn.execute(
-            "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-            "VALUES (?, 'todo', ?, ?, ?, ?)",
-            (virtual_path, r["id"], line_num, _pad_cjk_ascii(title_line), now),
+            "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+            "VALUES (?, 'todo', ?, ?, ?, ?, ?)",
+            (virtual_path, r["id"], line_num, padded, now, _minhash_blob(padded)),
         )
         # Index content lines if present
         if r["content"]:
@@ -810,10 +1099,11 @@ def _sync_todos(conn: sqlite3.Connection) -> int:
                 stripped = content_line.strip()
                 if stripped:
                     line_num += 1
+                    padded = _pad_cjk_ascii(stripped)
                     conn.execute(
-                        "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-                        "VALUES (?, 'todo', ?, ?, ?, ?)",
-                        (virtual_path, r["id"], line_num, _pad_cjk_ascii(stripped), now),
+                        "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+                        "VALUES (?, 'todo', ?, ?, ?, ?, ?)",
+                        (virtual_path, r["id"], line_num, padded, now, _minhash_blob(padded)),
                     )
 
         # Write to paragraphs table for vector search
@@ -892,17 +1182,19 @@ def _sync_cron(conn: sqlite3.Connection, workspace: Path) -> int:
 
         line_num += 1
         title_line = f"[{job_id}] {name} ({status})"
+        padded = _pad_cjk_ascii(title_line)
         conn.execute(
-            "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-            "VALUES (?, 'cron', ?, ?, ?, ?)",
-            (virtual_path, job_id, line_num, _pad_cjk_ascii(title_line), now),
+            "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+            "VALUES (?, 'cron', ?, ?, ?, ?, ?)",
+            (virtual_path, job_id, line_num, padded, now, _minhash_blob(padded)),
         )
         if message:
             line_num += 1
+            padded = _pad_cjk_ascii(message)
             conn.execute(
-                "INSERT INTO memories (path, source, date, line_num, content, updated_at) "
-                "VALUES (?, 'cron', ?, ?, ?, ?)",
-                (virtual_path, job_id, line_num, _pad_cjk_ascii(message), now),
+                "INSERT INTO memories (path, source, date, line_num, content, updated_at, minhash) "
+                "VALUES (?, 'cron', ?, ?, ?, ?, ?)",
+                (virtual_path, job_id, line_num, padded, now, _minhash_blob(padded)),
             )
 
         # Write to paragraphs table for vector search
@@ -995,10 +1287,8 @@ def sync_workspace(conn: sqlite3.Connection, workspace: Path) -> int:
     if synced:
         _rebuild_fts(conn)
 
-    # Compute embeddings for paragraphs that don't have one yet.
-    # Runs even when synced==0 (catches paragraphs from previous failed attempts).
-    _compute_embeddings(conn)
-
+    # Embeddings for new paragraphs are backfilled by the bot in the
+    # background (memory-reindex --json); vector search uses what's cached.
     return synced
 
 
@@ -1057,11 +1347,22 @@ def _search_keyword(
     days: int | None,
     tag: str | None,
 ) -> list[dict]:
-    """Original keyword search (FTS5 with LIKE fallback)."""
-    use_fts = _fts_available and query.isascii()
-    if use_fts:
+    """Original keyword search (FTS5 with LIKE fallback).
+
+    ASCII queries use the word index; other queries use the trigram index
+    when they have at least ``_TRIGRAM_MIN_CHARS`` characters.
+    """
+    if query.isascii():
+        table = "memories_fts" if _fts_available else None
+    elif _trigram_available and len(query.strip()) >= _TRIGRAM_MIN_CHARS:
+        table = "memories_trigram"
+        # Indexed lines are padded at CJK ↔ ASCII boundaries; match that
+        query = _pad_cjk_ascii(query)
+    else:
+        table = None
+    if table is not None:
         try:
-            rows = _search_fts(conn, query, days, tag)
+            rows = _search_fts(conn, query, days, tag, table=table)
             return _dedup_results([dict(r) for r in rows])
         except sqlite3.OperationalError:
             pass
@@ -1085,15 +1386,10 @@ def _search_vector(
     if not _embedding_enabled:
         return []
 
-    try:
-        vecs, _ = _get_openai_embeddings([query])
-        query_vec = vecs[0]
-    except Exception as exc:
-        logger.warning("Embedding query failed: %s", exc)
+    query_vec = _embed_query(conn, query)
+    if query_vec is None:
         return []
 
-    query_blob = _serialize_embedding(query_vec)
-
     # Compute cosine similarity in Python (avoids vec0 virtual table complexity)
     # Fetch all cached embeddings and compute dot product
     rows = conn.execute(
@@ -1102,7 +1398,7 @@ def _search_vector(
         "FROM paragraphs p "
         "JOIN embedding_cache e ON p.content_hash = e.content_hash "
         "  AND e.model_name = ?",
-        (_EMBEDDING_MODEL,),
+        (_embedding_model_name(),),
     ).fetchall()
 
     if not rows:
@@ -1171,22 +1467,38 @@ def _cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
-def _line_to_paragraph(conn: sqlite3.Connection, row: dict) -> int | None:
-    """Map a line-level result to its paragraph ID."""
-    # Use the path from the memories row to find the paragraph
-    mem_row = conn.execute(
-        "SELECT path FROM memories WHERE source = ? AND date = ? AND line_num = ? LIMIT 1",
-        (row["source"], row["date"], row["line_num"]),
-    ).fetchone()
-    if not mem_row:
-        return None
+def _lines_to_paragraphs(conn: sqlite3.Connection, rows: list[dict]) -> list[int]:
+    """Map line-level results to paragraph IDs in one query.
 
-    para = conn.execute(
-        "SELECT id FROM paragraphs "
-        "WHERE path = ? AND line_start <= ? AND line_end >= ? LIMIT 1",
-        (mem_row["path"], row["line_num"], row["line_num"]),
-    ).fetchone()
-    return para["id"] if para else None
+    Returns distinct paragraph IDs in the order of the first line that hit
+    each one.  Lines without a paragraph (todo/cron rows) are skipped.
+    """
+    if not rows:
+        return []
+    values = ",".join("(?, ?, ?, ?)" for _ in rows)
+    params: list[object] = []
+    for rank, r in enumerate(rows):
+        params.extend((rank, r["source"], r["date"], r["line_num"]))
+
+    mapped = conn.execute(
+        f"WITH hits(rank, source, date, line_num) AS (VALUES {values}) "
+        "SELECT hits.rank, MIN(p.id) AS para_id FROM hits "
+        "JOIN memories m ON m.source = hits.source AND m.date = hits.date "
+        "AND m.line_num = hits.line_num "
+        "JOIN paragraphs p ON p.path = m.path "
+        "AND p.line_start <= m.line_num AND p.line_end >= m.line_num "
+        "GROUP BY hits.rank ORDER BY hits.rank",
+        params,
+    ).fetchall()
+
+    para_ids: list[int] = []
+    seen: set[int] = set()
+    for row in mapped:
+        pid = row["para_id"]
+        if pid not in seen:
+            para_ids.append(pid)
+            seen.add(pid)
+    return para_ids
 
 
 def _rrf_merge(
@@ -1226,13 +1538,7 @@ def _search_hybrid(
         return vec_results
 
     # 3. Map keyword results to paragraph IDs
-    fts_para_ids: list[int] = []
-    fts_seen: set[int] = set()
-    for r in kw_results:
-        pid = _line_to_paragraph(conn, r)
-        if pid and pid not in fts_seen:
-            fts_para_ids.append(pid)
-            fts_seen.add(pid)
+    fts_para_ids = _lines_to_paragraphs(conn, kw_results)
 
     vec_para_ids = [r["_para_id"] for r in vec_results]
 
@@ -1298,17 +1604,18 @@ def _search_fts(
     query: str,
     days: int | None,
     tag: str | None,
+    table: str = "memories_fts",
 ) -> list[sqlite3.Row]:
-    """Search using FTS5 MATCH with BM25 ranking."""
-    escaped = query.replace('"', '""')
+    """Search using FTS5 MATCH on *table* with BM25 ranking."""
+    escaped = query.strip().replace('"', '""')
     fts_query = f'"{escaped}"'
 
     sql = (
-        "SELECT m.source, m.date, m.line_num, m.content "
-        "FROM memories_fts fts "
+        "SELECT m.source, m.date, m.line_num, m.content, m.minhash AS _minhash "
+        f"FROM {table} fts "
         "JOIN memories m ON m.id = fts.rowid"
     )
-    conditions: list[str] = ["memories_fts MATCH ?"]
+    conditions: list[str] = [f"{table} MATCH ?"]
     params: list[str] = [fts_query]
 
     if tag is not None:
@@ -1335,7 +1642,10 @@ def _search_like(
     tag: str | None,
 ) -> list[sqlite3.Row]:
     """Search using LIKE (fallback when FTS5 is unavailable)."""
-    sql = "SELECT m.source, m.date, m.line_num, m.content FROM memories m"
+    sql = (
+        "SELECT m.source, m.date, m.line_num, m.content, m.minhash AS _minhash "
+        "FROM memories m"
+    )
     conditions: list[str] = ["m.content LIKE ?"]
     params: list[str] = [f"%{query}%"]
 
@@ -11,12 +11,19 @@ Format::
 
     [users.7022938281]
     verbosity = "quiet"
+
+Reads go through an in-process cache of parsed files (see ``load()``):
+each file is parsed once, re-validated by mtime at most every
+``_STAT_INTERVAL`` seconds, and refreshed immediately on our own writes,
+so per-message lookups such as ``get_verbosity`` normally do no I/O.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 import tomllib
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +34,76 @@ _FILENAME = "workspace.toml"
 # Valid values
 _VALID_VERBOSITY = {"quiet", "normal", "verbose"}
 
+# Seconds a cached entry is trusted before its mtime is checked again
+_STAT_INTERVAL = 2.0
+
+
+@dataclass(frozen=True)
+class WorkspaceConfig:
+    """Parsed, read-only view of one workspace.toml."""
+
+    agent_type: str = ""
+    verbosity: dict[str, str] = field(default_factory=dict)  # user id -> level
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> WorkspaceConfig:
+        ws = data.get("workspace")
+        users = data.get("users")
+        verbosity: dict[str, str] = {}
+        if isinstance(users, dict):
+            for uid, settings in users.items():
+                if isinstance(settings, dict) and settings.get("verbosity"):
+                    verbosity[str(uid)] = str(settings["verbosity"])
+        return cls(
+            agent_type=str(ws.get("agent_type", "")) if isinstance(ws, dict) else "",
+            verbosity=verbosity,
+        )
+
+    def verbosity_for(self, user_id: int) -> str:
+        """Verbosity for *user_id*, or empty string if unset."""
+        return self.verbosity.get(str(user_id), "")
+
+
+@dataclass
+class _CacheEntry:
+    config: WorkspaceConfig
+    mtime_ns: int | None  # None = file missing
+    checked_at: float
+
+
+_cache: dict[Path, _CacheEntry] = {}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def load(ws_dir: Path) -> WorkspaceConfig:
+    """Return the cached WorkspaceConfig for *ws_dir*, re-parsing if it changed."""
+    now = time.monotonic()
+    entry = _cache.get(ws_dir)
+    if entry is not None and now - entry.checked_at < _STAT_INTERVAL:
+        return entry.config
+    path = ws_dir / _FILENAME
+    mtime = _mtime_ns(path)
+    if entry is not None and entry.mtime_ns == mtime:
+        entry.checked_at = now
+        return entry.config
+    config = WorkspaceConfig.from_data(_read_toml(ws_dir) if mtime is not None else {})
+    _cache[ws_dir] = _CacheEntry(config, mtime, now)
+    return config
+
+
+def invalidate(ws_dir: Path | None = None) -> None:
+    """Drop the cached entry for *ws_dir* (or every entry)."""
+    if ws_dir is None:
+        _cache.clear()
+    else:
+        _cache.pop(ws_dir, None)
+
 
 def _read_toml(ws_dir: Path) -> dict[str, Any]:
     """Read workspace.toml, returning empty dict if missing or invalid."""
@@ -52,6 +129,11 @@ def _write_toml(ws_dir: Path, data: dict[str, Any]) -> None:
     except Exception as e:
         logger.warning("Failed to write %s: %s", path, e)
         tmp.unlink(missing_ok=True)
+        _cache.pop(ws_dir, None)
+        return
+    _cache[ws_dir] = _CacheEntry(
+        WorkspaceConfig.from_data(data), _mtime_ns(path), time.monotonic()
+    )
 
 
 def _serialize_toml(data: dict[str, Any]) -> str:
@@ -89,8 +171,7 @@ def _serialize_toml(data: dict[str, Any]) -> str:
 
 def get_agent_type(ws_dir: Path) -> str:
     """Get workspace backend type. Returns empty string for default."""
-    data = _read_toml(ws_dir)
-    return data.get("workspace", {}).get("agent_type", "")
+    return load(ws_dir).agent_type
 
 
 def set_agent_type(ws_dir: Path, agent_type: str) -> None:
@@ -104,9 +185,7 @@ def set_agent_type(ws_dir: Path, agent_type: str) -> None:
 
 def get_verbosity(ws_dir: Path, user_id: int) -> str:
     """Get verbosity for a user in this workspace. Returns empty string if unset."""
-    data = _read_toml(ws_dir)
-    user_key = str(user_id)
-    level = data.get("users", {}).get(user_key, {}).get("verbosity", "")
+    level = load(ws_dir).verbosity_for(user_id)
     if level and level not in _VALID_VERBOSITY:
         logger.warning("Invalid verbosity %r in %s for user %s", level, ws_dir, user_id)
         return ""
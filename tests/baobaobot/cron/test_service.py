@@ -273,6 +273,7 @@ class TestCronServiceExecuteDueJobs:
             state=CronJobState(next_run_at=now - 10),
         )
         service._stores["test"].jobs.append(job)
+        service._index_store("test")
 
         mock_sm.iter_thread_bindings.return_value = [(1, 2, "@0")]
         mock_sm.get_display_name.return_value = "test"
@@ -293,6 +294,7 @@ class TestCronServiceExecuteDueJobs:
             state=CronJobState(next_run_at=now - 10),
         )
         service._stores["test"].jobs.append(job)
+        service._index_store("test")
 
         mock_sm.send_to_window = AsyncMock()
 
@@ -311,6 +313,7 @@ class TestCronServiceExecuteDueJobs:
             state=CronJobState(next_run_at=future),
         )
         service._stores["test"].jobs.append(job)
+        service._index_store("test")
 
         mock_sm.send_to_window = AsyncMock()
 
@@ -330,6 +333,7 @@ class TestCronServiceExecuteDueJobs:
             state=CronJobState(next_run_at=now - 10),
         )
         service._stores["test"].jobs.append(job)
+        service._index_store("test")
 
         mock_sm.iter_thread_bindings.return_value = [(1, 2, "@0")]
         mock_sm.get_display_name.return_value = "test"
@@ -353,6 +357,7 @@ class TestCronServiceExecuteDueJobs:
             ),
         )
         service._stores["test"].jobs.append(job)
+        service._index_store("test")
 
         mock_sm.send_to_window = AsyncMock()
 
@@ -376,3 +381,261 @@ class TestCronServiceProperties:
         assert svc.is_running is False
         assert svc.total_jobs == 0
         assert svc.workspace_count == 0
+
+
+class TestCronServiceSchedule:
+    """Tests for the next_run_at heap and dirty-only persistence."""
+
+    @pytest.fixture
+    def mock_sm(self) -> MagicMock:
+        sm = MagicMock()
+        sm.iter_thread_bindings.return_value = [(1, 2, "@0")]
+        sm.get_display_name.return_value = "test"
+        sm.send_to_window = AsyncMock(return_value=(True, "ok"))
+        return sm
+
+    @pytest.fixture
+    def service(self, tmp_path: Path, mock_sm: MagicMock) -> CronService:
+        ws_dir = tmp_path / "workspace_test"
+        ws_dir.mkdir()
+        svc = CronService(
+            session_manager=mock_sm,
+            tmux_manager=MagicMock(),
+            cron_default_tz="",
+            users_dir=tmp_path / "users",
+            workspace_dir_for=lambda name: ws_dir,
+            iter_workspace_dirs=lambda: [ws_dir],
+        )
+        svc._workspace_dirs["test"] = ws_dir
+        svc._stores["test"] = CronStoreFile(
+            jobs=[
+                CronJob(
+                    id=f"j{i}",
+                    name=f"job{i}",
+                    schedule=CronSchedule(kind="every", every_seconds=3600),
+                    message="m",
+                    state=CronJobState(next_run_at=time.time() + 600 + i),
+                )
+                for i in range(1000)
+            ]
+        )
+        svc._index_store("test")
+        return svc
+
+    async def test_only_due_job_runs_and_is_saved(
+        self, service: CronService, mock_sm: MagicMock, monkeypatch
+    ):
+        saved: list[tuple[list[str], set[str]]] = []
+
+        def fake_save(ws_dir, *, jobs=(), deleted_ids=(), meta=None):
+            saved.append(([j.id for j in jobs], set(deleted_ids)))
+
+        monkeypatch.setattr("baobaobot.cron.service.save_changes", fake_save)
+
+        # Nothing due: no sends, no writes
+        await service._execute_due_jobs()
+        assert saved == []
+        assert service._find_next_due_time() == service._find_job(
+            "test", "j0"
+        ).state.next_run_at
+
+        due = service._find_job("test", "j500")
+        due.state.next_run_at = time.time() - 1
+        service._schedule("test", due)
+        assert service._find_next_due_time() == due.state.next_run_at
+
+        await service._execute_due_jobs()
+        mock_sm.send_to_window.assert_awaited_once()
+        assert saved == [(["j500"], set())]
+        assert due.state.next_run_at > time.time() + 3000
+
+    async def test_disable_and_remove_drop_from_heap(self, service: CronService):
+        await service.disable_job("test", "j0")
+        await service.remove_job("test", "j1")
+        assert service._find_next_due_time() == service._find_job(
+            "test", "j2"
+        ).state.next_run_at
+
+        # Re-enabling recomputes next_run_at an interval from now
+        first = await service.enable_job("test", "j0")
+        assert first.state.next_run_at > time.time() + 3000
+        assert service._heap_seqs["test"]["j0"]
+
+    async def test_moved_later_is_requeued(
+        self, service: CronService, mock_sm: MagicMock
+    ):
+        job = service._find_job("test", "j0")
+        job.state.next_run_at = time.time() - 1
+        service._schedule("test", job)
+        # Changed without rescheduling — the stale entry must not fire it
+        job.state.next_run_at = time.time() + 60
+        await service._execute_due_jobs()
+        mock_sm.send_to_window.assert_not_called()
+        assert service._find_next_due_time() == job.state.next_run_at
+
+    async def test_changes_persisted(self, service: CronService, tmp_path: Path):
+        from baobaobot.cron.store import load_store, save_store
+
+        ws_dir = tmp_path / "workspace_test"
+        save_store(ws_dir, service._stores["test"])
+
+        await service.disable_job("test", "j3")
+        await service.remove_job("test", "j4")
+        stored = {j.id: j for j in load_store(ws_dir).jobs}
+        assert len(stored) == 999
+        assert stored["j3"].enabled is False
+        assert "j4" not in stored
+
+    def test_reload_only_on_cron_changes(
+        self, service: CronService, tmp_path: Path, monkeypatch
+    ):
+        import os
+        import sqlite3
+
+        import baobaobot.cron.service as service_mod
+        from baobaobot.cron.store import save_store
+
+        ws_dir = tmp_path / "workspace_test"
+        save_store(ws_dir, service._stores["test"])
+        service._stores.clear()
+        service._scan_workspaces()
+
+        loads: list[Path] = []
+        real_load = service_mod.load_store
+        monkeypatch.setattr(
+            service_mod,
+            "load_store",
+            lambda d: loads.append(d) or real_load(d),
+        )
+
+        stamps = iter(range(4_000_000_000, 4_000_000_100))
+
+        def touch() -> None:
+            # Writes within one timestamp tick can leave the mtime unchanged
+            stamp = next(stamps)
+            os.utime(ws_dir / "memory.db", (stamp, stamp))
+
+        # A memory sync write moves the mtime but not the cron version
+        conn = sqlite3.connect(str(ws_dir / "memory.db"))
+        conn.execute("CREATE TABLE paragraphs (text TEXT)")
+        conn.execute("INSERT INTO paragraphs VALUES ('x')")
+        conn.commit()
+        touch()
+        service._reload_changed_stores()
+        assert loads == []
+
+        # Editing a job from outside the service does reload
+        conn.execute("UPDATE cron_jobs SET message = 'edited' WHERE id = 'j7'")
+        conn.commit()
+        conn.close()
+        touch()
+        service._reload_changed_stores()
+        assert loads == [ws_dir]
+        assert service._find_job("test", "j7").message == "edited"
+
+        # The service's own saves are not mistaken for external edits
+        service._mark_dirty("test", service._find_job("test", "j8"))
+        service._save("test")
+        touch()
+        service._reload_changed_stores()
+        assert loads == [ws_dir]
+
+
+class TestCronServiceConcurrentDispatch:
+    """Tests for concurrent due-job dispatch and lag tracking."""
+
+    @pytest.fixture
+    def service(self, tmp_path: Path) -> CronService:
+        from baobaobot.settings import SchedulerConfig
+
+        sm = MagicMock()
+        sm.iter_thread_bindings.return_value = [
+            (1, i, f"@{i}") for i in range(3)
+        ]
+        sm.get_display_name.side_effect = lambda wid: f"ws{wid[1:]}"
+        svc = CronService(
+            session_manager=sm,
+            tmux_manager=MagicMock(),
+            cron_default_tz="",
+            users_dir=tmp_path / "users",
+            workspace_dir_for=lambda name: tmp_path / f"workspace_{name}",
+            iter_workspace_dirs=lambda: [],
+            scheduler_config=SchedulerConfig(cron_max_concurrent=2),
+        )
+        for i in range(3):
+            ws_dir = tmp_path / f"workspace_ws{i}"
+            ws_dir.mkdir()
+            svc._workspace_dirs[f"ws{i}"] = ws_dir
+            svc._stores[f"ws{i}"] = CronStoreFile(
+                jobs=[
+                    CronJob(
+                        id=f"w{i}j{k}",
+                        name="job",
+                        schedule=CronSchedule(kind="every", every_seconds=60),
+                        message=f"ws{i}-{k}",
+                        state=CronJobState(next_run_at=time.time() - 5),
+                    )
+                    for k in range(2)
+                ]
+            )
+            svc._index_store(f"ws{i}")
+        return svc
+
+    async def test_slow_workspace_does_not_block_others(self, service: CronService):
+        import asyncio
+
+        gate = asyncio.Event()
+        sent: list[str] = []
+        running = 0
+        peak = 0
+
+        async def send(wid: str, text: str):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            if wid == "@0":
+                await gate.wait()
+            sent.append(text)
+            running -= 1
+            return True, "ok"
+
+        service._session_manager.send_to_window = send
+        tasks = service._dispatch_due_jobs()
+        assert len(tasks) == 6
+
+        for _ in range(50):
+            await asyncio.sleep(0)
+        # ws0 holds one global slot; the other slot drains ws1 and ws2 in turn
+        assert sorted(sent) == ["ws1-0", "ws1-1", "ws2-0", "ws2-1"]
+        # Per-workspace limit 1 → the second ws0 job waits for the first
+        assert service.running_jobs == 2
+        assert peak == 2
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert len(sent) == 6
+        assert service.running_jobs == 0
+        assert service._find_next_due_time() > time.time()
+
+    async def test_lag_recorded_in_history(self, service: CronService):
+        import sqlite3
+
+        service._session_manager.send_to_window = AsyncMock(return_value=(True, "ok"))
+        await service._execute_due_jobs()
+
+        stats = service.lag_stats()
+        assert stats["count"] == 6
+        assert stats["max"] >= 5
+
+        conn = sqlite3.connect(str(service._workspace_dirs["ws0"] / "memory.db"))
+        rows = conn.execute(
+            "SELECT scheduled_at, lag_s FROM cron_history ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert len(rows) == 2
+        assert all(sched is not None and lag >= 5 for sched, lag in rows)
+
+    async def test_manual_run_has_no_lag(self, service: CronService):
+        service._session_manager.send_to_window = AsyncMock(return_value=(True, "ok"))
+        await service.run_job_now("ws0", "w0j0")
+        assert service.lag_stats()["count"] == 0
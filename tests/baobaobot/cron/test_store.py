@@ -5,7 +5,13 @@ from pathlib import Path
 
 import pytest
 
-from baobaobot.cron.store import load_store, save_store, store_mtime
+from baobaobot.cron.store import (
+    load_store,
+    record_history,
+    save_store,
+    store_mtime,
+    store_version,
+)
 from baobaobot.cron.types import (
     CronJob,
     CronSchedule,
@@ -90,3 +96,133 @@ class TestStoreMtime:
         save_store(workspace_dir, CronStoreFile())
         mt = store_mtime(workspace_dir)
         assert mt > 0
+
+
+class TestSaveChanges:
+    def test_only_given_rows_written(self, workspace_dir: Path):
+        from baobaobot.cron.store import save_changes
+
+        jobs = [
+            CronJob(
+                id=f"j{i}",
+                name=f"job{i}",
+                schedule=CronSchedule(kind="every", every_seconds=60),
+                message="m",
+            )
+            for i in range(3)
+        ]
+        save_store(workspace_dir, CronStoreFile(jobs=jobs))
+
+        jobs[0].message = "changed"
+        jobs[1].message = "not saved"
+        save_changes(
+            workspace_dir,
+            jobs=[jobs[0]],
+            deleted_ids=["j2"],
+            meta=WorkspaceMeta(user_id=7),
+        )
+
+        reloaded = load_store(workspace_dir)
+        assert {j.id: j.message for j in reloaded.jobs} == {
+            "j0": "changed",
+            "j1": "m",
+        }
+        assert reloaded.workspace_meta.user_id == 7
+
+    def test_mtime_includes_wal(self, workspace_dir: Path):
+        import os
+        import sqlite3
+
+        save_store(workspace_dir, CronStoreFile())
+        conn = sqlite3.connect(str(workspace_dir / "memory.db"))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("INSERT INTO cron_meta (key, value) VALUES ('k', 'v')")
+        conn.commit()
+        wal = workspace_dir / "memory.db-wal"
+        os.utime(wal, (4_000_000_000, 4_000_000_000))
+        assert store_mtime(workspace_dir) == 4_000_000_000
+        conn.close()
+
+
+class TestHistoryMigration:
+    def test_adds_timing_columns_to_old_table(self, workspace_dir: Path):
+        import sqlite3
+
+        from baobaobot.cron.store import record_history
+
+        conn = sqlite3.connect(str(workspace_dir / "memory.db"))
+        conn.execute(
+            "CREATE TABLE cron_history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "job_id TEXT NOT NULL, started_at REAL NOT NULL, finished_at REAL, "
+            "status TEXT NOT NULL DEFAULT '', error TEXT NOT NULL DEFAULT '', "
+            "duration_s REAL NOT NULL DEFAULT 0.0)"
+        )
+        conn.execute("INSERT INTO cron_history (job_id, started_at) VALUES ('old', 1)")
+        conn.commit()
+        conn.close()
+
+        record_history(
+            workspace_dir, job_id="new", started_at=10.0, scheduled_at=8.0, lag_s=2.0
+        )
+
+        conn = sqlite3.connect(str(workspace_dir / "memory.db"))
+        rows = conn.execute(
+            "SELECT job_id, scheduled_at, lag_s FROM cron_history ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert rows == [("old", None, 0.0), ("new", 8.0, 2.0)]
+
+
+class TestStoreVersion:
+    def test_missing(self, workspace_dir: Path):
+        assert store_version(workspace_dir) == 0
+
+    def test_bumped_only_by_cron_rows(self, workspace_dir: Path):
+        import sqlite3
+
+        job = CronJob(
+            id="j1",
+            name="job",
+            schedule=CronSchedule(kind="every", every_seconds=60),
+            message="m",
+        )
+        save_store(workspace_dir, CronStoreFile(jobs=[job]))
+        v = store_version(workspace_dir)
+        assert v > 0
+
+        # Memory sync, system scheduler state and run history are not cron changes
+        record_history(workspace_dir, job_id="j1", started_at=1.0, status="ok")
+        conn = sqlite3.connect(str(workspace_dir / "memory.db"))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE paragraphs (text TEXT)")
+        conn.execute("INSERT INTO paragraphs VALUES ('x')")
+        conn.execute(
+            "INSERT OR REPLACE INTO cron_meta (key, value) "
+            "VALUES ('system_scheduler.next_summary_run', '1')"
+        )
+        conn.commit()
+        assert store_version(workspace_dir) == v
+
+        # An external writer (the cron bin script) editing a job is
+        conn.execute("UPDATE cron_jobs SET message = 'edited' WHERE id = 'j1'")
+        conn.commit()
+        assert store_version(workspace_dir) == v + 1
+        conn.execute(
+            "INSERT OR REPLACE INTO cron_meta (key, value) "
+            "VALUES ('workspace_meta.user_id', '9')"
+        )
+        conn.commit()
+        assert store_version(workspace_dir) == v + 2
+        conn.close()
+
+    def test_save_changes_returns_version(self, workspace_dir: Path):
+        from baobaobot.cron.store import save_changes
+
+        job = CronJob(
+            id="j1",
+            name="job",
+            schedule=CronSchedule(kind="every", every_seconds=60),
+            message="m",
+        )
+        version = save_changes(workspace_dir, jobs=[job])
+        assert version == store_version(workspace_dir) > 0
@@ -0,0 +1,138 @@
+"""Tests for memory_handler.py — indexed /memory search with pagination."""
+
+from __future__ import annotations
+
+import random
+import string
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from baobaobot.handlers.callback_data import CB_MEMORY_PAGE
+from baobaobot.handlers.memory_handler import (
+    MEMORY_SEARCH_KEY,
+    _SEARCH_PAGE_SIZE,
+    build_search_page,
+    handle_memory_search_callback,
+    memory_command,
+)
+from baobaobot.memory.search import MemorySearchResult
+
+
+def _results(n: int) -> list[MemorySearchResult]:
+    return [MemorySearchResult(file="memory/x.md", line_num=i, line=f"hit {i}") for i in range(n)]
+
+
+class TestBuildSearchPage:
+    def test_single_page_has_no_keyboard(self):
+        text, keyboard = build_search_page("q", _results(3), 0)
+        assert keyboard is None
+        assert "3 results" in text
+        assert "hit 2" in text
+
+    def test_pages(self):
+        results = _results(_SEARCH_PAGE_SIZE * 2 + 1)
+        text, keyboard = build_search_page("q", results, 1)
+        assert f"hit {_SEARCH_PAGE_SIZE}" in text
+        assert f"hit {_SEARCH_PAGE_SIZE - 1}" not in text
+        buttons = keyboard.inline_keyboard[0]
+        assert [b.text for b in buttons] == ["◀", "2/3", "▶"]
+        assert buttons[0].callback_data == f"{CB_MEMORY_PAGE}0"
+        assert buttons[2].callback_data == f"{CB_MEMORY_PAGE}2"
+
+    def test_page_clamped(self):
+        _, keyboard = build_search_page("q", _results(_SEARCH_PAGE_SIZE + 1), 9)
+        assert [b.text for b in keyboard.inline_keyboard[0]] == ["◀", "2/2"]
+
+
+class TestMemorySearchCommand:
+    @pytest.fixture
+    def workspace(self, tmp_path: Path) -> Path:
+        ws = tmp_path / "workspace_test"
+        daily = ws / "memory" / "daily" / "2026-02" / "2026-02-15.md"
+        daily.parent.mkdir(parents=True)
+        rng = random.Random(3)
+        words = ["".join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(100)]
+        daily.write_text(
+            "".join(f"- deploy {' '.join(rng.sample(words, 5))}\n" for _ in range(25))
+        )
+        return ws
+
+    async def test_searches_index_off_loop(self, workspace):
+        update = MagicMock()
+        update.message.text = "/memory search deploy"
+        context = MagicMock()
+        context.user_data = {}
+
+        import baobaobot.handlers.memory_handler as mod
+
+        threads: list[str] = []
+        real = mod._search_index
+
+        def spy(ws, q):
+            threads.append(threading.current_thread().name)
+            return real(ws, q)
+
+        with (
+            patch.object(mod, "_resolve_workspace_for_thread", return_value=workspace),
+            patch.object(mod, "_search_index", spy),
+            patch.object(mod, "safe_reply", new=AsyncMock()) as reply,
+        ):
+            await memory_command(update, context)
+
+        assert threads and threads[0] != threading.main_thread().name
+        state = context.user_data[MEMORY_SEARCH_KEY]
+        assert state["query"] == "deploy"
+        assert len(state["results"]) == 25
+        assert state["message_id"] == reply.return_value.message_id
+        _, kwargs = reply.await_args
+        assert kwargs["reply_markup"] is not None
+
+    @staticmethod
+    def _state(message_id: int = 7) -> dict:
+        return {"query": "q", "results": _results(15), "chat_id": -100,
+                "message_id": message_id}
+
+    @staticmethod
+    def _query(message_id: int = 7) -> MagicMock:
+        query = MagicMock()
+        query.data = f"{CB_MEMORY_PAGE}1"
+        query.answer = AsyncMock()
+        query.message.chat_id = -100
+        query.message.message_id = message_id
+        return query
+
+    async def test_callback_pages_stored_results(self):
+        query = self._query()
+        context = MagicMock()
+        context.user_data = {MEMORY_SEARCH_KEY: self._state()}
+        import baobaobot.handlers.memory_handler as mod
+
+        with patch.object(mod, "safe_edit", new=AsyncMock()) as edit:
+            await handle_memory_search_callback(query, context)
+        text = edit.await_args.args[1]
+        assert "hit 14" in text and "hit 0" not in text
+        query.answer.assert_awaited_once_with()
+
+    async def test_callback_without_state(self):
+        query = MagicMock()
+        query.data = f"{CB_MEMORY_PAGE}1"
+        query.answer = AsyncMock()
+        context = MagicMock()
+        context.user_data = {}
+        await handle_memory_search_callback(query, context)
+        assert query.answer.await_args.kwargs.get("show_alert") is True
+
+    async def test_callback_from_older_message_expires(self):
+        # The user searched again (e.g. in another topic) after this message
+        query = self._query(message_id=7)
+        context = MagicMock()
+        context.user_data = {MEMORY_SEARCH_KEY: self._state(message_id=9)}
+        import baobaobot.handlers.memory_handler as mod
+
+        with patch.object(mod, "safe_edit", new=AsyncMock()) as edit:
+            await handle_memory_search_callback(query, context)
+        edit.assert_not_awaited()
+        assert query.answer.await_args.kwargs.get("show_alert") is True
@@ -129,7 +129,7 @@ class TestBuildSystemKeyboard:
     def test_has_expected_buttons(self):
         kb = _build_system_keyboard("@1")
         buttons = [btn for row in kb.inline_keyboard for btn in row]
-        assert len(buttons) == 10
+        assert len(buttons) == 11
 
     def test_button_labels(self):
         kb = _build_system_keyboard("@1")
@@ -145,6 +145,7 @@ class TestBuildSystemKeyboard:
             "🔗 ShareLink",
             "📝 Summary",
             "💓 Heartbeat",
+            "📈 Metrics",
         ]
         for label in expected:
             assert label in labels
@@ -0,0 +1,214 @@
+"""Tests for the deque-backed per-destination MessageQueue."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from baobaobot.agent_context import MessageQueueState
+from baobaobot.handlers.message_queue import (
+    MERGE_MAX_LENGTH,
+    MessageQueue,
+    MessageTask,
+    _check_and_send_status,
+    _merge_content_tasks,
+    _message_queue_worker,
+    record_window_status,
+)
+
+
+def _content(text: str, wid: str = "@1", content_type: str = "text") -> MessageTask:
+    return MessageTask(
+        task_type="content", window_id=wid, parts=[text], content_type=content_type
+    )
+
+
+def _status(text: str | None, thread_id: int | None = None) -> MessageTask:
+    if text is None:
+        return MessageTask(task_type="status_clear", thread_id=thread_id)
+    return MessageTask(
+        task_type="status_update", text=text, window_id="@1", thread_id=thread_id
+    )
+
+
+class TestMessageQueue:
+    async def test_fifo_and_join(self):
+        q = MessageQueue()
+        for i in range(3):
+            q.put_nowait(_content(str(i)))
+        assert q.qsize() == 3
+
+        got = [(await q.get()).parts[0] for _ in range(3)]
+        assert got == ["0", "1", "2"]
+        assert q.empty()
+
+        join = asyncio.create_task(q.join())
+        q.task_done()
+        q.task_done()
+        await asyncio.sleep(0)
+        assert not join.done()
+        q.task_done()
+        await asyncio.wait_for(join, 1)
+        with pytest.raises(ValueError):
+            q.task_done()
+
+    async def test_get_waits_for_put(self):
+        q = MessageQueue()
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+        q.put_nowait(_content("x"))
+        assert (await asyncio.wait_for(getter, 1)).parts == ["x"]
+
+    async def test_push_front_keeps_join_count(self):
+        q = MessageQueue()
+        q.put_nowait(_content("a"))
+        q.put_nowait(_content("b"))
+        task = await q.get()
+        q.push_front(task)  # retry
+        q.task_done()  # worker's finally for the failed attempt
+
+        assert [(await q.get()).parts[0] for _ in range(2)] == ["a", "b"]
+        q.task_done()
+        q.task_done()
+        await asyncio.wait_for(q.join(), 1)
+
+    async def test_status_replaces_pending_tail(self):
+        q = MessageQueue()
+        q.put_status(_status("one", thread_id=5))
+        q.put_status(_status("two", thread_id=5))
+        q.put_status(_status("other", thread_id=6))
+        assert q.qsize() == 2
+        assert (await q.get()).text == "two"
+
+        q.put_status(_status(None, thread_id=6))
+        assert q.qsize() == 1
+        assert (await q.get()).task_type == "status_clear"
+
+    async def test_status_behind_content_supersedes_older(self):
+        q = MessageQueue()
+        q.put_status(_status("one", thread_id=5))
+        q.put_nowait(
+            MessageTask(task_type="content", window_id="@1", parts=["c"], thread_id=5)
+        )
+        q.put_status(_status("two", thread_id=5))
+        q.put_status(_status("three", thread_id=5))
+        assert q.qsize() == 3
+        order = [(await q.get()) for _ in range(3)]
+        assert [t.text or t.parts[0] for t in order] == ["one", "c", "three"]
+        assert [t.superseded for t in order] == [True, False, False]
+
+    async def test_dequeued_status_not_replaced(self):
+        q = MessageQueue()
+        q.put_status(_status("one"))
+        first = await q.get()
+        q.put_status(_status("two"))
+        assert first.text == "one"
+        assert (await q.get()).text == "two"
+
+
+class TestMergeContentTasks:
+    def test_merges_head_until_breaker(self):
+        q = MessageQueue()
+        first = _content("a")
+        q.put_nowait(_content("b"))
+        q.put_nowait(_content("c"))
+        q.put_nowait(_content("tool", content_type="tool_use"))
+        q.put_nowait(_content("d"))
+
+        merged, count = _merge_content_tasks(q, first)
+        assert count == 2
+        assert merged.parts == ["a", "b", "c"]
+        assert q.qsize() == 2
+        assert q.peek().content_type == "tool_use"
+
+    def test_respects_length_and_window(self):
+        q = MessageQueue()
+        q.put_nowait(_content("x" * MERGE_MAX_LENGTH))
+        merged, count = _merge_content_tasks(q, _content("a"))
+        assert count == 0 and merged.parts == ["a"]
+
+        q = MessageQueue()
+        q.put_nowait(_content("b", wid="@2"))
+        assert _merge_content_tasks(q, _content("a"))[1] == 0
+        assert q.qsize() == 1
+
+
+class TestCheckAndSendStatus:
+    @pytest.fixture
+    def agent_ctx(self):
+        ctx = MagicMock()
+        ctx.queue_state = MessageQueueState()
+        ctx.tmux_manager.find_window_by_id = AsyncMock(
+            return_value=MagicMock(window_id="@1")
+        )
+        ctx.tmux_manager.capture_pane = AsyncMock(return_value="pane")
+        return ctx
+
+    async def test_reuses_recent_poller_status(self, agent_ctx):
+        record_window_status(agent_ctx, "@1", "✻ Working…")
+        with patch(
+            "baobaobot.handlers.message_queue._do_send_status_message",
+            new_callable=AsyncMock,
+        ) as send:
+            await _check_and_send_status(MagicMock(), 1, "@1", 7, agent_ctx)
+        agent_ctx.tmux_manager.capture_pane.assert_not_awaited()
+        assert send.await_args.args[2:5] == (7, "@1", "✻ Working…")
+
+    async def test_stale_status_captures_pane(self, agent_ctx):
+        agent_ctx.queue_state.latest_status["@1"] = (0.0, "old")
+        with (
+            patch(
+                "baobaobot.handlers.message_queue.parse_status_line",
+                return_value=None,
+            ),
+            patch(
+                "baobaobot.handlers.message_queue._do_send_status_message",
+                new_callable=AsyncMock,
+            ) as send,
+        ):
+            await _check_and_send_status(MagicMock(), 1, "@1", 7, agent_ctx)
+        agent_ctx.tmux_manager.capture_pane.assert_awaited_once()
+        send.assert_not_awaited()
+        assert agent_ctx.queue_state.latest_status["@1"][1] is None
+
+
+class TestWorkerMetrics:
+    async def test_records_pipeline_latencies(self):
+        import time
+
+        from baobaobot.metrics import (
+            MESSAGE_END_TO_END,
+            MESSAGES_SENT,
+            QUEUE_WAIT_SECONDS,
+            TELEGRAM_SEND_SECONDS,
+        )
+
+        ctx = MagicMock()
+        ctx.queue_state = MessageQueueState()
+        q = MessageQueue()
+        ctx.queue_state.queues[1] = q
+        task = _content("hello")
+        task.written_at = time.time() - 2.0
+        q.put_nowait(task)
+
+        before = (
+            QUEUE_WAIT_SECONDS.count(kind="content"),
+            TELEGRAM_SEND_SECONDS.count(kind="content"),
+            MESSAGE_END_TO_END.count(),
+            MESSAGES_SENT.total(),
+        )
+        with patch(
+            "baobaobot.handlers.message_queue._process_content_task",
+            new_callable=AsyncMock,
+        ):
+            worker = asyncio.create_task(_message_queue_worker(MagicMock(), 1, ctx))
+            await asyncio.wait_for(q.join(), 5)
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert QUEUE_WAIT_SECONDS.count(kind="content") == before[0] + 1
+        assert TELEGRAM_SEND_SECONDS.count(kind="content") == before[1] + 1
+        assert MESSAGE_END_TO_END.count() == before[2] + 1
+        assert MESSAGES_SENT.total() == before[3] + 1
+        assert MESSAGE_END_TO_END.quantile(1.0) >= 2.0
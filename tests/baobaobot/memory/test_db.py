@@ -415,6 +415,134 @@ class TestSearch:
         assert len(results) >= 2
 
 
+class TestTrigramSearch:
+    """Non-ASCII queries use the trigram FTS index instead of LIKE."""
+
+    @pytest.fixture
+    def notes(self, workspace: Path) -> None:
+        write_daily(
+            workspace,
+            "2026-02-15",
+            "- 今天用Python寫了爬蟲\n"
+            "- 爬蟲被網站封鎖了，改用代理\n"
+            "- 晚餐吃了拉麵\n",
+        )
+        write_daily(workspace, "2026-02-16", "- 架構重構：把爬蟲拆成三個服務\n")
+
+    def test_index_created(self, db: MemoryDB) -> None:
+        conn = db.connect()
+        row = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'memories_trigram'"
+        ).fetchone()
+        assert row is not None
+        assert db._trigram_available
+
+    def test_cjk_query_uses_index(
+        self, db: MemoryDB, workspace: Path, notes: None, monkeypatch
+    ) -> None:
+        like = []
+        monkeypatch.setattr(db, "_search_like", lambda *a: like.append(a) or [])
+        results = db.search("寫了爬蟲")
+        assert [r["content"] for r in results] == ["- 今天用Python寫了爬蟲"]
+        assert like == []
+
+    def test_mixed_cjk_ascii(self, db: MemoryDB, notes: None) -> None:
+        results = db.search("用python寫")
+        assert len(results) == 1
+        assert "Python" in results[0]["content"]
+
+    def test_bm25_ranking(self, db: MemoryDB, workspace: Path) -> None:
+        write_daily(
+            workspace,
+            "2026-02-17",
+            "- 提到一次資料庫然後談別的事情很久很久很久很久很久\n"
+            "- 資料庫資料庫資料庫\n",
+        )
+        results = db.search("資料庫")
+        assert len(results) == 2
+        assert results[0]["content"] == "- 資料庫資料庫資料庫"
+
+    def test_filters_apply(self, db: MemoryDB, notes: None) -> None:
+        results = db.search("爬蟲拆成", days=10_000)
+        assert len(results) == 1
+        assert db.search("爬蟲拆成", tag="nonexistent") == []
+
+    def test_short_query_falls_back_to_like(
+        self, db: MemoryDB, notes: None
+    ) -> None:
+        # Two characters can't form a trigram
+        contents = {r["content"] for r in db.search("爬蟲")}
+        assert contents == {
+            "- 今天用Python寫了爬蟲",
+            "- 爬蟲被網站封鎖了，改用代理",
+            "- 架構重構：把爬蟲拆成三個服務",
+        }
+
+    def test_index_follows_changes(
+        self, db: MemoryDB, workspace: Path, notes: None
+    ) -> None:
+        assert db.search("吃了拉麵")
+        write_daily(workspace, "2026-02-15", "- 晚餐吃了壽司\n")
+        assert db.search("吃了拉麵") == []
+        assert len(db.search("吃了壽司")) == 1
+
+    def test_common_module_matches(self, workspace: Path, notes: None) -> None:
+        mod = TestSchemaSync._load_common_module()
+        conn = mod.connect_db(workspace)
+        try:
+            mod.sync_workspace(conn, workspace)
+            assert mod._trigram_available
+            rows = mod._search_keyword(conn, "用Python寫", None, None)
+            assert len(rows) == 1
+            assert "Python" in rows[0]["content"]
+            rows = mod._search_keyword(conn, "寫了爬蟲", None, None)
+            assert len(rows) == 1
+        finally:
+            conn.close()
+
+
+class TestHybridParagraphMapping:
+    """Keyword hits map to paragraphs in a single statement."""
+
+    def test_maps_lines_in_one_query(self, workspace: Path) -> None:
+        write_daily(
+            workspace,
+            "2026-02-15",
+            "## Deploy\n- rolled out the keyword service to staging\n"
+            "- the keyword migration finished without errors\n\n"
+            "## Lunch\n- tried the ramen place near the keyword office\n",
+        )
+        write_daily(
+            workspace,
+            "2026-02-16",
+            "## Plans\n- write the keyword design doc for next sprint\n",
+        )
+        mod = TestSchemaSync._load_common_module()
+        conn = mod.connect_db(workspace)
+        try:
+            mod.sync_workspace(conn, workspace)
+            hits = [dict(r) for r in mod._search_like(conn, "keyword", None, None)]
+            hits.append({"source": "todo", "date": "x", "line_num": 1})
+
+            statements: list[str] = []
+            conn.set_trace_callback(statements.append)
+            para_ids = mod._lines_to_paragraphs(conn, hits)
+            conn.set_trace_callback(None)
+            assert len(statements) == 1
+
+            headings = [
+                conn.execute(
+                    "SELECT heading FROM paragraphs WHERE id = ?", (pid,)
+                ).fetchone()[0]
+                for pid in para_ids
+            ]
+            # LIKE orders newest date first; both Deploy lines share a paragraph
+            assert headings == ["## Plans", "## Deploy", "## Lunch"]
+            assert mod._lines_to_paragraphs(conn, []) == []
+        finally:
+            conn.close()
+
+
 class TestListDates:
     def test_empty(self, db: MemoryDB) -> None:
         dates = db.list_dates()
@@ -737,6 +865,127 @@ class TestDedupHelpers:
         assert _jaccard({"ab"}, set()) == 0.0
 
 
+class TestMinHashDedup:
+    """Every pair is compared for small sets; LSH picks candidates above that."""
+
+    @staticmethod
+    def _pairwise(results: list[dict], threshold: float = 0.55) -> list[dict]:
+        from baobaobot.memory.db import _SOURCE_PRIORITY, _char_bigrams, _jaccard
+
+        grams = [_char_bigrams(r["content"]) for r in results]
+        keep = [True] * len(results)
+        for i in range(len(results)):
+            if not keep[i]:
+                continue
+            for j in range(i + 1, len(results)):
+                if keep[j] and _jaccard(grams[i], grams[j]) >= threshold:
+                    pri_i = _SOURCE_PRIORITY.get(results[i]["source"], 9)
+                    pri_j = _SOURCE_PRIORITY.get(results[j]["source"], 9)
+                    if pri_i <= pri_j:
+                        keep[j] = False
+                    else:
+                        keep[i] = False
+                        break
+        return [r for r, k in zip(results, keep) if k]
+
+    @staticmethod
+    def _corpus() -> list[dict]:
+        import random
+
+        rng = random.Random(7)
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        words = ["".join(rng.choices(letters, k=5)) for _ in range(400)]
+        sources = ["experience", "daily", "summary"]
+        results = []
+        for i in range(150):
+            line = " ".join(rng.sample(words, 8))
+            results.append({"source": rng.choice(sources), "date": "d",
+                            "line_num": i, "content": line})
+            if i % 5 == 0:
+                # Near duplicate: one word swapped
+                near = line.rsplit(" ", 1)[0] + " " + rng.choice(words)
+                results.append({"source": rng.choice(sources), "date": "d",
+                                "line_num": i + 1000, "content": near})
+        return results
+
+    def test_matches_pairwise(self) -> None:
+        from baobaobot.memory.db import _dedup_results
+
+        for threshold in (0.55, 0.2):
+            corpus = self._corpus()
+            expected = self._pairwise([dict(r) for r in corpus], threshold)
+            assert _dedup_results(corpus, threshold) == expected
+
+    def test_small_sets_are_exact(self) -> None:
+        import random
+
+        from baobaobot.memory.db import _EXACT_DEDUP_MAX, _dedup_results
+
+        common_dedup = TestSchemaSync._load_common_module()._dedup_results
+        rng = random.Random(11)
+        words = ["".join(rng.choices("abcdefgh", k=4)) for _ in range(60)]
+        sources = ["experience", "daily", "summary"]
+        for _ in range(200):
+            corpus = []
+            size = rng.randint(2, _EXACT_DEDUP_MAX)
+            while len(corpus) < size:
+                line = rng.sample(words, 8)
+                corpus.append(" ".join(line))
+                # Near duplicates around the threshold
+                line[rng.randrange(8)] = rng.choice(words)
+                corpus.append(" ".join(line))
+            results = [
+                {"source": rng.choice(sources), "date": "d", "line_num": i,
+                 "content": c}
+                for i, c in enumerate(corpus[:size])
+            ]
+            expected = self._pairwise([dict(r) for r in results])
+            assert _dedup_results([dict(r) for r in results]) == expected
+            assert common_dedup([dict(r) for r in results]) == expected
+
+    def test_compares_few_pairs(self, monkeypatch) -> None:
+        import baobaobot.memory.db as db_mod
+
+        calls = 0
+        real = db_mod._jaccard
+
+        def counting(a, b):
+            nonlocal calls
+            calls += 1
+            return real(a, b)
+
+        monkeypatch.setattr(db_mod, "_jaccard", counting)
+        corpus = self._corpus()
+        db_mod._dedup_results(corpus)
+        n = len(corpus)
+        assert calls < n * (n - 1) // 2 // 20
+
+    def test_stored_signature_used(self, db: MemoryDB, workspace: Path) -> None:
+        from baobaobot.memory.db import _MINHASH_STRUCT, _minhash
+
+        write_daily(workspace, "2026-02-15", "- 討論了架構重構方案\n")
+        db.sync()
+        blob = db.connect().execute("SELECT minhash FROM memories").fetchone()[0]
+        assert _MINHASH_STRUCT.unpack(blob) == _minhash("- 討論了架構重構方案")
+
+        results = db.search("架構重構方案")
+        assert results and all("_minhash" not in r for r in results)
+
+    def test_common_signs_stored_content(self, workspace: Path) -> None:
+        mod = TestSchemaSync._load_common_module()
+        write_daily(workspace, "2026-02-15", "- 用Python寫了爬蟲\n")
+        conn = mod.connect_db(workspace)
+        try:
+            mod.sync_workspace(conn, workspace)
+            content, blob = conn.execute(
+                "SELECT content, minhash FROM memories"
+            ).fetchone()
+        finally:
+            conn.close()
+        assert content == "- 用 Python 寫了爬蟲"
+        assert mod._MINHASH_STRUCT.unpack(blob) == mod._minhash(content)
+
+
 class TestDedup:
     """Integration tests for _dedup_results."""
 
@@ -0,0 +1,189 @@
+"""Tests for embedding providers, the query-embedding cache, and EmbeddingBackfill."""
+
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from baobaobot.memory.embedding_backfill import EmbeddingBackfill
+
+from .conftest import write_daily
+
+BIN_DIR = Path(__file__).resolve().parents[3] / "src" / "baobaobot" / "workspace" / "bin"
+
+
+def _load_common():
+    spec = importlib.util.spec_from_file_location(
+        "_memory_common", BIN_DIR / "_memory_common.py"
+    )
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def hash_provider(monkeypatch):
+    monkeypatch.setenv("BAOBAOBOT_EMBEDDING_PROVIDER", "hash")
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    ws = tmp_path / "workspace_test"
+    write_daily(
+        ws,
+        "2026-02-15",
+        "## Deploy\n- rolled out the billing service to staging today\n\n"
+        "## Lunch\n- tried the new ramen place near the office\n",
+    )
+    return ws
+
+
+class TestHashingEmbedder:
+    def test_deterministic_and_normalised(self):
+        mod = _load_common()
+        emb = mod._HashingEmbedder()
+        (a, b), tokens = emb.embed(["billing service", "billing service"])
+        assert a == b
+        assert len(a) == mod._EMBEDDING_DIMS
+        assert abs(sum(x * x for x in a) - 1.0) < 1e-9
+        assert tokens > 0
+
+    def test_overlap_scores_higher(self):
+        mod = _load_common()
+        emb = mod._HashingEmbedder()
+        (q, near, far), _ = emb.embed(
+            ["billing deploy", "deployed the billing service", "ramen for lunch"]
+        )
+        assert mod._cosine_similarity(q, near) > mod._cosine_similarity(q, far)
+
+    def test_incomplete_provider_rejected(self):
+        mod = _load_common()
+
+        class NoEmbed(mod._EmbeddingProvider):
+            name = "broken"
+
+        with pytest.raises(TypeError):
+            NoEmbed()
+
+    def test_provider_selection(self, monkeypatch, tmp_path):
+        mod = _load_common()
+        conn = mod.connect_db(tmp_path)
+        monkeypatch.setenv("BAOBAOBOT_EMBEDDING_PROVIDER", "hash")
+        mod._check_embedding_capabilities(conn)
+        assert mod._embedding_enabled
+        assert mod._embedding_model_name() == "hash-ngram-v1"
+
+        monkeypatch.setenv("BAOBAOBOT_EMBEDDING_PROVIDER", "none")
+        mod._check_embedding_capabilities(conn)
+        assert not mod._embedding_enabled
+        conn.close()
+
+
+class TestQueryCache:
+    def test_repeated_query_embeds_once(self, workspace, hash_provider):
+        mod = _load_common()
+        conn = mod.connect_db(workspace)
+        calls: list[list[str]] = []
+        real_embed = mod._provider.embed
+        mod._provider.embed = lambda texts: calls.append(texts) or real_embed(texts)
+
+        first = mod._embed_query(conn, "Billing  Service")
+        assert mod._embed_query(conn, "billing service") == first
+        assert len(calls) == 1
+
+        # A new process (empty LRU) is served from query_embedding_cache
+        mod._query_lru.clear()
+        assert mod._embed_query(conn, "BILLING service") == pytest.approx(first)
+        assert len(calls) == 1
+        assert mod.embedding_stats(conn)["cached_queries"] == 1
+        conn.close()
+
+    def test_cache_bounded(self, workspace, hash_provider, monkeypatch):
+        mod = _load_common()
+        monkeypatch.setattr(mod, "_QUERY_CACHE_MAX", 3)
+        conn = mod.connect_db(workspace)
+        for i in range(5):
+            mod._embed_query(conn, f"query {i}")
+        rows = conn.execute("SELECT query_norm FROM query_embedding_cache").fetchall()
+        assert sorted(r[0] for r in rows) == ["query 2", "query 3", "query 4"]
+        conn.close()
+
+
+class TestBackfill:
+    def test_sync_does_not_embed_inline(self, workspace, hash_provider):
+        mod = _load_common()
+        conn = mod.connect_db(workspace)
+        mod.sync_workspace(conn, workspace)
+        stats = mod.embedding_stats(conn)
+        assert stats["paragraphs"] == 2
+        assert stats["missing"] == 2
+        conn.close()
+
+    def test_reindex_json(self, workspace, hash_provider):
+        result = subprocess.run(
+            [sys.executable, str(BIN_DIR / "memory-reindex"), "--json",
+             "--workspace", str(workspace)],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        data = json.loads(result.stdout)
+        assert data["computed"] == 2
+        assert data["missing"] == 0
+        assert data["model"] == "hash-ngram-v1"
+
+    def test_reindex_force_recomputes(self, workspace, hash_provider):
+        cmd = [sys.executable, str(BIN_DIR / "memory-reindex"),
+               "--workspace", str(workspace)]
+        first = subprocess.run(cmd, capture_output=True, text=True)
+        assert first.returncode == 0, first.stderr
+        assert "Computed 2 new embedding(s)" in first.stdout
+
+        forced = subprocess.run(cmd + ["--force"], capture_output=True, text=True)
+        assert forced.returncode == 0, forced.stderr
+        assert "Cleared 2 cached embeddings" in forced.stderr
+        assert "Computed 2 new embedding(s)" in forced.stdout
+
+    async def test_run_once_fills_and_then_skips(self, workspace, hash_provider):
+        backfill = EmbeddingBackfill(lambda: [workspace, workspace.parent / "none"])
+        mod = _load_common()
+        conn = mod.connect_db(workspace)
+        mod.sync_workspace(conn, workspace)
+        conn.close()
+
+        assert await backfill.run_once() == 2
+        stats = backfill.stats()
+        assert stats["missing"] == 0
+        assert stats["embedded"] == 2
+        assert stats["workspaces"]["workspace_test"]["computed_total"] == 2
+
+        last_run = stats["workspaces"]["workspace_test"]["last_run"]
+        assert await backfill.run_once() == 0
+        assert backfill.stats()["workspaces"]["workspace_test"]["last_run"] == last_run
+
+    async def test_summary_reports_workspace_progress(self, workspace, hash_provider):
+        backfill = EmbeddingBackfill(lambda: [workspace])
+        mod = _load_common()
+        conn = mod.connect_db(workspace)
+        mod.sync_workspace(conn, workspace)
+        conn.close()
+
+        await backfill.run_once()
+        ws = backfill.stats()["workspaces"]["workspace_test"]
+        assert ws["running"] is False
+        assert ws["error"] == ""
+        assert backfill.summary() == "workspace_test: 2/2 embedded"
+
+    async def test_vector_search_after_backfill(self, workspace, hash_provider):
+        mod = _load_common()
+        conn = mod.connect_db(workspace)
+        mod.sync_workspace(conn, workspace)
+        await EmbeddingBackfill(lambda: [workspace]).run_once()
+        results = mod._search_vector(conn, "billing service staging")
+        assert results
+        assert results[0]["heading"] == "## Deploy"
+        conn.close()
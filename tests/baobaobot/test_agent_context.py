@@ -1,6 +1,7 @@
 """Tests for agent_context.py — AgentContext creation."""
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
 from baobaobot.agent_context import AgentContext, create_agent_context
 from baobaobot.cron.service import CronService
@@ -70,3 +71,54 @@ class TestCreateAgentContext:
         assert ctx.session_manager._state_file == agent_dir / "state.json"
         assert ctx.session_manager._session_map_file == agent_dir / "session_map.json"
         assert ctx.session_manager._tmux_session_name == "test"
+
+
+class TestCollectMetrics:
+    def test_embedding_progress_per_workspace(self, tmp_path: Path):
+        from baobaobot.metrics import registry
+
+        agent_dir = tmp_path / "agents" / "test"
+        agent_dir.mkdir(parents=True)
+        cfg = AgentConfig(
+            name="metrics-test",
+            bot_token="123:abc",
+            allowed_users=frozenset({1}),
+            tmux_session_name="test-tmux",
+            cli_command="claude",
+            config_dir=tmp_path,
+            agent_dir=agent_dir,
+        )
+        ctx = create_agent_context(cfg)
+        ctx.embedding_backfill = MagicMock()
+        ctx.embedding_backfill.stats.return_value = {
+            "workspaces": {
+                "workspace_a": {
+                    "missing": 3,
+                    "embedded": 7,
+                    "running": True,
+                    "error": "",
+                },
+                "workspace_b": {
+                    "missing": 0,
+                    "embedded": 4,
+                    "running": False,
+                    "error": "timeout",
+                },
+            }
+        }
+
+        ctx.collect_metrics()
+
+        labels = {"agent": "metrics-test"}
+        missing = registry.gauge("baobaobot_embedding_missing", "")
+        assert missing.value(**labels, workspace="workspace_a") == 3
+        embedded = registry.gauge("baobaobot_embedding_embedded", "")
+        assert embedded.value(**labels, workspace="workspace_b") == 4
+        running = registry.gauge("baobaobot_embedding_backfill_running", "")
+        assert running.value(**labels, workspace="workspace_a") == 1
+        failed = registry.gauge("baobaobot_embedding_backfill_error", "")
+        assert failed.value(**labels, workspace="workspace_b") == 1
+
+        ctx.embedding_backfill.stats.return_value = {"workspaces": {}}
+        ctx.collect_metrics()
+        assert missing.value(**labels, workspace="workspace_a") == 0
@@ -0,0 +1,67 @@
+"""Smoke tests for the benchmark runner and the end-to-end load harness."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[2]
+
+
+def test_runner_writes_results_json(tmp_path):
+    out = tmp_path / "bench.json"
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--scale", "0.005", "--repeat", "1",
+         "--warmup", "0", "--only", "parse", "--only", "markdown", "--only", "status",
+         "--json", str(out)],
+        cwd=REPO,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    data = json.loads(out.read_text())
+    names = {r["name"] for r in data["results"]}
+    assert {"transcript.parse_entries", "markdown.convert", "status_polling.tick"} <= names
+    assert all(r["median"] > 0 and r["runs"] == 1 for r in data["results"])
+
+    # Comparing against itself never flags a regression
+    again = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run", "--scale", "0.005", "--repeat", "1",
+         "--warmup", "0", "--only", "markdown", "--compare", str(out),
+         "--threshold", "100"],
+        cwd=REPO,
+        capture_output=True,
+        text=True,
+    )
+    assert again.returncode == 0, again.stderr
+    assert "markdown.convert" in again.stdout
+
+
+def test_load_smoke_delivers_every_reply(tmp_path):
+    out = tmp_path / "load.json"
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.load", "smoke", "--json", str(out)],
+        cwd=REPO,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    (scenario,) = json.loads(out.read_text())["scenarios"]
+    assert scenario["written"] > 0
+    assert scenario["delivered"] == scenario["written"]
+    assert scenario["api_calls"]["sendMessage"] >= scenario["written"]
+    assert scenario["latency"]["max"] > 0
+
+
+def test_rejected_write_keeps_global_tokens(monkeypatch):
+    monkeypatch.syspath_prepend(str(REPO))
+    from benchmarks.fake_bot_api import FakeBotAPI, FloodLimits
+
+    api = FakeBotAPI(limits=FloodLimits(global_per_sec=3, chat_per_sec=1, chat_burst=1))
+    assert api._retry_after(1) == 0
+    # Chat 1 is over its limit; its 429s must not drain the global bucket
+    for _ in range(10):
+        assert api._retry_after(1) > 0
+    assert api._retry_after(2) == 0
+    assert api._retry_after(3) == 0
@@ -0,0 +1,171 @@
+"""Tests for HeadlessPool and its use by SystemScheduler."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import baobaobot.headless_pool as pool_mod
+from baobaobot.headless_pool import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_USER,
+    HeadlessPool,
+    default_concurrency,
+)
+from baobaobot.settings import SchedulerConfig
+from baobaobot.system_scheduler import SystemScheduler
+
+
+class TestDefaultConcurrency:
+    def test_bounded_by_cpu_and_memory(self, monkeypatch):
+        monkeypatch.setattr(pool_mod.os, "cpu_count", lambda: 32)
+        pages = {"SC_PAGE_SIZE": 4096, "SC_PHYS_PAGES": 4 * 1024**3 // 4096}
+        monkeypatch.setattr(pool_mod.os, "sysconf", lambda name: pages[name])
+        # 16 by CPU, 2 by memory (half of 4 GiB / 768 MiB)
+        assert default_concurrency() == 2
+
+    def test_clamped(self, monkeypatch):
+        monkeypatch.setattr(pool_mod.os, "cpu_count", lambda: None)
+        assert default_concurrency() == 1
+        monkeypatch.setattr(pool_mod.os, "cpu_count", lambda: 256)
+        monkeypatch.setattr(pool_mod.os, "sysconf", lambda name: 1 << 40)
+        assert default_concurrency() == 8
+
+
+class TestHeadlessPool:
+    async def test_user_priority_jumps_queue(self):
+        pool = HeadlessPool(1)
+        gate = asyncio.Event()
+        order: list[str] = []
+
+        def job(name: str):
+            async def run():
+                if name == "blocker":
+                    await gate.wait()
+                order.append(name)
+                return name
+
+            return run
+
+        tasks = [asyncio.create_task(pool.run(job("blocker")))]
+        await asyncio.sleep(0)
+        for name in ("bg1", "bg2"):
+            tasks.append(
+                asyncio.create_task(pool.run(job(name), priority=PRIORITY_BACKGROUND))
+            )
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(pool.run(job("user"), priority=PRIORITY_USER)))
+        await asyncio.sleep(0)
+        assert pool.active == 1 and pool.queued == 3
+
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert order == ["blocker", "user", "bg1", "bg2"]
+        assert pool.active == 0 and pool.queued == 0
+
+    async def test_concurrency_limit(self):
+        pool = HeadlessPool(3)
+        running = 0
+        peak = 0
+
+        async def job():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        await asyncio.gather(*(pool.run(job) for _ in range(10)))
+        assert peak == 3
+
+    async def test_timeout_and_failure_release_slot(self):
+        pool = HeadlessPool(1)
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(slow, timeout=0.01)
+        with pytest.raises(RuntimeError):
+            await pool.run(boom)
+        assert await pool.run(AsyncMock(return_value="ok")) == "ok"
+
+        stats = pool.stats()["classes"]["background"]
+        assert stats["timeouts"] == 1
+        assert stats["failed"] == 1
+        assert stats["completed"] == 1
+        assert pool.active == 0
+
+    async def test_cancelled_waiter_gives_up_place(self):
+        pool = HeadlessPool(1)
+        gate = asyncio.Event()
+        blocker = asyncio.create_task(pool.run(gate.wait))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(pool.run(AsyncMock()))
+        await asyncio.sleep(0)
+        assert pool.queued == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert pool.queued == 0
+
+        gate.set()
+        await blocker
+        assert pool.active == 0
+
+
+class TestSchedulerUsesPool:
+    @pytest.fixture
+    def scheduler(self, tmp_path: Path) -> SystemScheduler:
+        session_mgr = MagicMock()
+        session_mgr.get_last_interaction_time.return_value = None
+        return SystemScheduler(
+            session_manager=session_mgr,
+            agent_name="test",
+            timezone="UTC",
+            iter_workspace_dirs=lambda: [tmp_path / "workspace_ws"],
+            on_notify=AsyncMock(),
+            scheduler_config=SchedulerConfig(headless_concurrency=3),
+        )
+
+    def test_concurrency_from_config(self, scheduler):
+        assert scheduler.headless_stats()["max_workers"] == 3
+
+    async def test_waiting_workspace_not_requeued(self, scheduler, tmp_path):
+        ws_dir = tmp_path / "workspace_ws"
+        gate = asyncio.Event()
+        calls = 0
+
+        async def fake_summary(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            await gate.wait()
+            return True
+
+        scheduler._run_summary = fake_summary
+        scheduler._is_summary_due = MagicMock(return_value=True)
+        scheduler._resolve_window = MagicMock(return_value="@1")
+        jsonl = tmp_path / "s.jsonl"
+        jsonl.write_text("{}\n")
+        scheduler._get_jsonl_path = MagicMock(return_value=jsonl)
+        scheduler._has_new_content = MagicMock(return_value=True)
+        scheduler._cfg = SchedulerConfig(summary_idle=0, headless_concurrency=3)
+        scheduler._check_heartbeats = AsyncMock()
+
+        await scheduler._check_workspaces([ws_dir])
+        await scheduler._check_workspaces([ws_dir])
+        await asyncio.sleep(0)
+        assert calls == 1
+
+        gate.set()
+        await asyncio.gather(*scheduler._pending_tasks)
+        assert ws_dir not in scheduler._queued_summaries
+        await scheduler._check_workspaces([ws_dir])
+        await asyncio.gather(*scheduler._pending_tasks)
+        assert calls == 2
+        await scheduler.stop()
@@ -0,0 +1,91 @@
+"""Tests for loop_watchdog.py — event-loop stall detection and attribution."""
+
+import asyncio
+import sys
+import time
+
+from baobaobot import loop_watchdog
+from baobaobot.loop_watchdog import LoopWatchdog, call_site
+
+
+def _block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class TestCallSite:
+    def test_prefers_innermost_package_frame(self):
+        # The collector (test code) runs inside MetricsRegistry.collect
+        from baobaobot.metrics import MetricsRegistry
+
+        seen: list[str] = []
+        reg = MetricsRegistry()
+        reg.add_collector(lambda: seen.append(call_site(sys._getframe())))
+        reg.collect()
+        assert seen[0].startswith("baobaobot/metrics.py:")
+        assert seen[0].endswith("in collect")
+
+    def test_falls_back_to_innermost_frame(self):
+        assert call_site(sys._getframe()).endswith(
+            "in test_falls_back_to_innermost_frame"
+        )
+
+
+class TestRecord:
+    def test_aggregates_by_site(self):
+        wd = LoopWatchdog(log_interval=3600)
+        wd.record("a.py:1 in f", 0.3, "stack-a")
+        wd.record("a.py:1 in f", 0.5, "stack-a2")
+        wd.record("b.py:2 in g", 0.2, "stack-b")
+        sites = wd.sites()
+        assert [s.site for s in sites] == ["a.py:1 in f", "b.py:2 in g"]
+        assert sites[0].count == 2
+        assert sites[0].max == 0.5
+        assert sites[0].stack == "stack-a2"  # longest stall's stack
+
+    def test_logs_stack_once_per_interval(self, caplog):
+        wd = LoopWatchdog(log_interval=3600)
+        with caplog.at_level("WARNING", logger="baobaobot.loop_watchdog"):
+            wd.record("a.py:1 in f", 0.3, "stack-a")
+            wd.record("a.py:1 in f", 0.3, "stack-a")
+        assert len(caplog.records) == 1
+        assert "stack-a" in caplog.text
+
+    def test_bounded_sites(self):
+        wd = LoopWatchdog(max_sites=3)
+        for i in range(5):
+            wd.record(f"s{i}", 0.1 * (i + 1), "")
+        assert {s.site for s in wd.sites()} == {"s2", "s3", "s4"}
+
+
+class TestLoopWatchdog:
+    async def test_detects_blocking_call(self):
+        wd = LoopWatchdog(threshold=0.1, interval=0.02, sample_interval=0.01)
+        await wd.start()
+        try:
+            assert loop_watchdog.get_active() is wd
+            await asyncio.sleep(0.05)
+            _block(0.4)
+            # Let the heartbeat run and the sampler close the stall
+            await asyncio.sleep(0.1)
+        finally:
+            await wd.stop()
+        assert loop_watchdog.get_active() is None
+
+        sites = wd.sites()
+        assert sites, wd.report()
+        assert sites[0].site.endswith("in _block")
+        assert 0.3 < sites[0].max < 1.0
+        assert "_block" in sites[0].stack
+        snap = wd.snapshot()
+        assert snap["lag_max"] >= 0.3
+        assert "_block" in wd.report()
+
+    async def test_idle_loop_has_no_stalls(self):
+        wd = LoopWatchdog(threshold=0.1, interval=0.02, sample_interval=0.01)
+        await wd.start()
+        try:
+            await asyncio.sleep(0.2)
+        finally:
+            await wd.stop()
+        assert wd.sites() == []
+        assert "No stalls" in wd.report()
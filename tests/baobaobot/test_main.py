@@ -8,6 +8,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from baobaobot.main import _check_optional_deps, main
+from baobaobot.settings import WatchdogConfig
 
 # Patches needed when main() reaches the bot startup path (past tmux check).
 _BOT_STARTUP_PATCHES = (
@@ -62,6 +63,7 @@ def _enter_bot_patches():
     mock_cfg = MagicMock()
     mock_cfg.shared_dir = config_dir / "shared"
     mock_cfg.agent_dir = config_dir / "agents" / "test"
+    mock_cfg.watchdog = WatchdogConfig()
     mocks["baobaobot.settings.load_settings"].return_value = [mock_cfg]
     # create_agent_context must return a mock AgentContext with tmux_manager
     mock_ctx = MagicMock()
@@ -2,7 +2,12 @@
 
 import pytest
 
-from baobaobot.markdown_v2 import _escape_mdv2, convert_markdown
+import baobaobot.markdown_v2 as md
+from baobaobot.markdown_v2 import (
+    _escape_mdv2,
+    convert_markdown,
+    convert_markdown_async,
+)
 from baobaobot.transcript_parser import TranscriptParser
 
 EXP_START = TranscriptParser.EXPANDABLE_QUOTE_START
@@ -56,3 +61,67 @@ class TestConvertMarkdown:
         assert ">inside quote||" in result
         assert "before" in result
         assert "after" in result
+
+
+class TestConversionCache:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "hello world",
+            "a\nb",
+            "a\n\n\nb",
+            "\nx\n",
+            "中文 測試，好",
+            "a, b; c: d? e' f\" g/h % @ $ ^",
+            "emoji 😀 and 1 2 3",
+        ],
+    )
+    def test_fast_path_matches_renderer(self, text: str) -> None:
+        assert md._plain_fast_path(text) is not None
+        assert md._plain_fast_path(text) == md._convert(text)
+
+    @pytest.mark.parametrize(
+        "text", ["  indented", "trail  ", "1. item", "a\tb", "<b>x</b>", ""]
+    )
+    def test_fast_path_declines(self, text: str) -> None:
+        assert md._plain_fast_path(text) is None
+
+    def test_rendered_once(self, monkeypatch) -> None:
+        calls: list[str] = []
+        real = md._convert
+
+        def counting(text: str) -> str:
+            calls.append(text)
+            return real(text)
+
+        monkeypatch.setattr(md, "_convert", counting)
+        text = "**cached** once"
+        first = convert_markdown(text)
+        assert convert_markdown(text) == first
+        assert calls == [text]
+
+    def test_lru_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr(md, "_CACHE_SIZE", 3)
+        for i in range(10):
+            convert_markdown(f"**item {i}**")
+        assert len(md._cache) <= 3
+
+    async def test_async_large_input_uses_thread(self, monkeypatch) -> None:
+        import threading
+
+        threads: list[str] = []
+        real = md._convert
+
+        def recording(text: str) -> str:
+            threads.append(threading.current_thread().name)
+            return real(text)
+
+        monkeypatch.setattr(md, "_convert", recording)
+        big = "```\n" + "x = 1\n" * 600 + "```"
+        result = await convert_markdown_async(big)
+        assert result == convert_markdown(big)
+        assert threads and threads[0] != threading.main_thread().name
+
+        small = "*small* input"
+        assert await convert_markdown_async(small) == real(small)
+        assert threads[-1] == threading.main_thread().name
@@ -0,0 +1,86 @@
+"""Tests for the in-process metrics registry."""
+
+import pytest
+
+from baobaobot.metrics import MetricsRegistry
+
+
+class TestRegistry:
+    def test_counter_and_gauge_render(self):
+        reg = MetricsRegistry()
+        hits = reg.counter("hits_total", "Hits")
+        hits.inc(kind="a")
+        hits.inc(2, kind="b")
+        reg.gauge("depth", "Depth").set(3, agent='x"y')
+
+        text = reg.render()
+        assert "# TYPE hits_total counter" in text
+        assert 'hits_total{kind="a"} 1' in text
+        assert 'hits_total{kind="b"} 2' in text
+        assert 'depth{agent="x\\"y"} 3' in text
+        assert hits.total() == 3
+
+    def test_histogram_buckets_are_cumulative(self):
+        reg = MetricsRegistry()
+        h = reg.histogram("lat_seconds", "Latency", buckets=(0.1, 1.0))
+        for v in (0.05, 0.5, 0.7, 5.0):
+            h.observe(v, op="x")
+
+        text = reg.render()
+        assert 'lat_seconds_bucket{op="x",le="0.1"} 1' in text
+        assert 'lat_seconds_bucket{op="x",le="1"} 3' in text
+        assert 'lat_seconds_bucket{op="x",le="+Inf"} 4' in text
+        assert 'lat_seconds_count{op="x"} 4' in text
+        assert h.count() == 4
+        assert h.quantile(0.5) == 1.0
+        assert h.quantile(1.0) == 5.0
+
+    def test_time_context_manager(self):
+        reg = MetricsRegistry()
+        h = reg.histogram("t_seconds", "t")
+        with h.time(op="a"):
+            pass
+        assert h.count(op="a") == 1
+        assert h.count(op="b") == 0
+
+    def test_same_name_returns_same_metric(self):
+        reg = MetricsRegistry()
+        assert reg.counter("c", "c") is reg.counter("c", "c")
+        with pytest.raises(ValueError):
+            reg.gauge("c", "c")
+
+    def test_collectors_run_before_snapshot(self):
+        reg = MetricsRegistry()
+        depth = reg.gauge("baobaobot_message_queue_depth", "d")
+        pending = [1, 2, 3]
+
+        def collect() -> None:
+            depth.set(len(pending))
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        reg.add_collector(broken)
+        reg.add_collector(collect)
+        assert "baobaobot_message_queue_depth 3" in reg.render()
+        pending.pop()
+        assert "Queued: 2 msgs" in reg.summary()
+        reg.remove_collector(collect)
+        pending.pop()
+        assert "baobaobot_message_queue_depth 2" in reg.render()
+
+    def test_summary_lists_pipeline_latencies(self):
+        reg = MetricsRegistry()
+        reg.histogram("baobaobot_queue_wait_seconds", "w").observe(0.2)
+        summary = reg.summary()
+        assert "Queue wait: p50 0.20s" in summary
+        assert "Send" not in summary
+
+    def test_metric_without_render_rejected(self):
+        from baobaobot.metrics import _Metric
+
+        class Incomplete(_Metric):
+            type_name = "untyped"
+
+        with pytest.raises(TypeError):
+            Incomplete("x", "X")
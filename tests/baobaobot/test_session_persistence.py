@@ -0,0 +1,100 @@
+"""Tests for SessionManager's debounced, journaled state persistence."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+import baobaobot.session as session_mod
+from baobaobot.session import SessionManager
+
+
+def _make_mgr(tmp_path: Path) -> SessionManager:
+    return SessionManager(
+        state_file=tmp_path / "state.json",
+        session_map_file=tmp_path / "session_map.json",
+        tmux_session_name="test",
+        tmux_manager=MagicMock(),
+    )
+
+
+@pytest.fixture
+def slow_flush(monkeypatch):
+    """Keep the debounced snapshot from firing during the test."""
+    monkeypatch.setattr(session_mod, "_STATE_FLUSH_DELAY", 60.0)
+
+
+class TestJournal:
+    async def test_hot_updates_only_append_journal(self, tmp_path, slow_flush):
+        mgr = _make_mgr(tmp_path)
+        mgr.bind_thread(1, 100, "@3", "proj")
+        for offset in range(50):
+            mgr.update_user_window_offset(1, "@3", offset)
+
+        assert not (tmp_path / "state.json").exists()
+        lines = (tmp_path / "state.json.journal").read_text().splitlines()
+        assert len(lines) == 52
+        assert json.loads(lines[-1]) == ["user_window_offsets", ["1", "@3"], 49]
+
+    async def test_replay_after_crash(self, tmp_path, slow_flush):
+        mgr = _make_mgr(tmp_path)
+        mgr.bind_thread(1, 100, "@3", "proj")
+        mgr.bind_thread(1, 200, "@4")
+        mgr.unbind_thread(1, 200)
+        mgr.set_topic_name(100, "Topic")
+        mgr.update_user_window_offset(1, "@3", 1234)
+        # Simulate a crash mid-append
+        with (tmp_path / "state.json.journal").open("a") as f:
+            f.write('["user_window_offsets", ["1", "@3"')
+
+        mgr2 = _make_mgr(tmp_path)
+        assert mgr2.thread_bindings == {1: {100: "@3"}}
+        assert mgr2.get_thread_for_window(1, "@3") == 100
+        assert mgr2.get_display_name("@3") == "proj"
+        assert mgr2.get_topic_name(100) == "Topic"
+        assert mgr2.get_user_window_offset(1, "@3") == 1234
+
+        # Replay compacted the journal into state.json
+        assert not (tmp_path / "state.json.journal").exists()
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert state["user_window_offsets"] == {"1": {"@3": 1234}}
+
+
+class TestDebouncedFlush:
+    async def test_flush_after_delay(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(session_mod, "_STATE_FLUSH_DELAY", 0.01)
+        mgr = _make_mgr(tmp_path)
+        mgr.bind_thread(1, 100, "@3")
+        mgr.set_verbosity(1, 100, "quiet")
+        mgr.update_user_window_offset(1, "@3", 7)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if (tmp_path / "state.json").exists() and mgr._flush_task is None:
+                break
+
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert state["thread_bindings"] == {"1": {"100": "@3"}}
+        assert state["user_verbosity"] == {"1": {"100": "quiet"}}
+        assert state["user_window_offsets"] == {"1": {"@3": 7}}
+        assert not (tmp_path / "state.json.journal").exists()
+        assert not (tmp_path / "state.json.journal.old").exists()
+
+    async def test_flush_state_writes_pending(self, tmp_path, slow_flush):
+        mgr = _make_mgr(tmp_path)
+        mgr.update_user_window_offset(5, "@1", 42)
+        mgr.flush_state()
+
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert state["user_window_offsets"] == {"5": {"@1": 42}}
+        assert mgr._flush_handle is None
+
+    def test_sync_context_writes_immediately(self, tmp_path):
+        mgr = _make_mgr(tmp_path)
+        mgr.update_user_window_offset(5, "@1", 42)
+
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert state["user_window_offsets"] == {"5": {"@1": 42}}
+        assert not (tmp_path / "state.json.journal").exists()
@@ -189,6 +189,30 @@ tmux_session = "beta-tmux"
         assert beta.allowed_users == frozenset({222})  # overridden
         assert beta.tmux_session_name == "baobaobot"  # always single session
 
+    def test_watchdog_section(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("MY_TOKEN", "123:abc")
+        _write_settings(
+            tmp_path,
+            """\
+[global]
+allowed_users = [111]
+
+[watchdog]
+enabled = true
+threshold_ms = 500
+
+[[agents]]
+name = "baobao"
+bot_token_env = "MY_TOKEN"
+""",
+        )
+
+        cfg = load_settings(config_dir=tmp_path)[0]
+        assert cfg.watchdog.enabled is True
+        assert cfg.watchdog.threshold_ms == 500
+        assert cfg.watchdog.interval_ms == 100  # default
+        assert AgentConfig(name="x").watchdog.enabled is False
+
     def test_missing_toml_raises(self, tmp_path: Path):
         with pytest.raises(FileNotFoundError, match="settings.toml"):
             load_settings(config_dir=tmp_path)
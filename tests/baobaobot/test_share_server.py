@@ -0,0 +1,547 @@
+"""Tests for share_server proxies, terminals, code-server pool and HTTP caching."""
+
+import asyncio
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from baobaobot.share_server import (
+    _HEAD_SCAN_LIMIT,
+    _PTY_MAX_BUFFER,
+    _PTY_READ_SIZE,
+    CodeServerManager,
+    ShareServer,
+    _HeadInjector,
+    _PageCache,
+    _PtyBridge,
+    _render_page,
+    _TmuxMirror,
+    generate_token,
+)
+
+_BASE = b'<base href="/p/x/">'
+
+
+class TestHeadInjector:
+    def test_inserts_after_head(self):
+        inj = _HeadInjector(_BASE)
+        out = inj.feed(b"<html><head><title>t</title></head>") + inj.finish()
+        assert out == b"<html><head>" + _BASE + b"<title>t</title></head>"
+
+    def test_head_with_attributes_and_uppercase(self):
+        inj = _HeadInjector(_BASE)
+        out = inj.feed(b'<HEAD lang="en"><x>') + inj.finish()
+        assert out == b'<HEAD lang="en">' + _BASE + b"<x>"
+
+    def test_does_not_match_header_element(self):
+        inj = _HeadInjector(_BASE)
+        out = inj.feed(b"<header>hi</header>") + inj.finish()
+        assert out == _BASE + b"<header>hi</header>"
+
+    def test_tag_split_across_chunks(self):
+        inj = _HeadInjector(_BASE)
+        parts = [inj.feed(b"<html><he"), inj.feed(b"ad>body"), inj.feed(b" more")]
+        assert parts[0] == b""
+        assert b"".join(parts) + inj.finish() == b"<html><head>" + _BASE + b"body more"
+
+    def test_passthrough_after_injection(self):
+        inj = _HeadInjector(_BASE)
+        inj.feed(b"<head>")
+        assert inj.feed(b"<head>again") == b"<head>again"
+        assert inj.finish() == b""
+
+    def test_gives_up_after_scan_limit(self):
+        inj = _HeadInjector(_BASE)
+        blob = b"x" * _HEAD_SCAN_LIMIT
+        assert inj.feed(blob) == _BASE + blob
+        assert inj.feed(b"<head>") == b"<head>"
+
+
+@pytest.fixture
+def share_secret(monkeypatch):
+    monkeypatch.setenv("SHARE_SECRET", "test-secret")
+    return "test-secret"
+
+
+async def _upstream_app() -> web.Application:
+    async def page(request: web.Request) -> web.Response:
+        body = gzip.compress(b"<html><head><title>p</title></head><body>ok</body></html>")
+        return web.Response(
+            body=body,
+            headers={"Content-Type": "text/html", "Content-Encoding": "gzip"},
+        )
+
+    async def asset(request: web.Request) -> web.Response:
+        return web.Response(
+            body=b"\x0b\x02\x80brotli-bytes",
+            headers={"Content-Type": "application/javascript", "Content-Encoding": "br"},
+        )
+
+    async def echo(request: web.Request) -> web.Response:
+        return web.Response(body=await request.read())
+
+    app = web.Application()
+    app.router.add_get("/", page)
+    app.router.add_get("/app.js", asset)
+    app.router.add_post("/echo", echo)
+    return app
+
+
+class TestStreamingProxy:
+    async def test_port_proxy_streams_and_rewrites(self, share_secret):
+        upstream = TestServer(await _upstream_app())
+        await upstream.start_server()
+        port = upstream.port
+        token = generate_token(f"port:{port}", name=f"port:{port}", secret=share_secret)
+
+        share = ShareServer(port=0)
+        front = TestServer(share._app)
+        await front.start_server()
+        try:
+            async with ClientSession(auto_decompress=False) as client:
+                # Compressed asset passes through byte-for-byte
+                async with client.get(
+                    front.make_url(f"/port/{token}/app.js"),
+                    headers={"Accept-Encoding": "br"},
+                ) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["Content-Encoding"] == "br"
+                    assert await resp.read() == b"\x0b\x02\x80brotli-bytes"
+
+            async with ClientSession() as client:
+                # HTML is decoded, rewritten and delivered intact
+                async with client.get(
+                    front.make_url(f"/port/{token}/"),
+                    headers={"Accept": "text/html"},
+                ) as resp:
+                    text = await resp.text()
+                    assert f'<head><base href="/port/{token}/"><title>' in text
+                    assert text.endswith("</html>")
+
+                # Request bodies are piped to upstream
+                payload = b"z" * 200_000
+                async with client.post(
+                    front.make_url(f"/port/{token}/echo"), data=payload
+                ) as resp:
+                    assert await resp.read() == payload
+        finally:
+            await share.stop()
+            await front.close()
+            await upstream.close()
+
+
+class TestPtyBridge:
+    async def test_coalesces_burst_into_one_frame(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        frames: list[bytes] = []
+
+        async def send(data: bytes) -> None:
+            frames.append(data)
+
+        task = asyncio.create_task(_PtyBridge(r, send).run())
+        for i in range(50):
+            os.write(w, b"line %d\n" % i)
+        await asyncio.sleep(0.1)
+        os.close(w)
+        await asyncio.wait_for(task, 1)
+        os.close(r)
+
+        assert b"".join(frames) == b"".join(b"line %d\n" % i for i in range(50))
+        assert len(frames) < 5
+
+    async def test_pauses_reader_when_sink_is_slow(self):
+        r, w = os.pipe()
+        os.set_blocking(r, False)
+        os.set_blocking(w, False)
+        gate = asyncio.Event()
+        received = bytearray()
+
+        async def send(data: bytes) -> None:
+            await gate.wait()
+            received.extend(data)
+
+        bridge = _PtyBridge(r, send)
+        task = asyncio.create_task(bridge.run())
+        written = 0
+        chunk = b"x" * 65536
+        for _ in range(200):
+            try:
+                written += os.write(w, chunk)
+            except BlockingIOError:
+                await asyncio.sleep(0.01)
+            else:
+                await asyncio.sleep(0)
+        # Writer got blocked by the pipe because the bridge stopped reading
+        assert written < 200 * len(chunk)
+        assert len(bridge._buf) <= _PTY_MAX_BUFFER + _PTY_READ_SIZE
+
+        gate.set()
+        os.close(w)
+        await asyncio.wait_for(task, 2)
+        os.close(r)
+        assert len(received) == written
+
+
+class _FakeWS:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.closed = False
+        self.frames: list[bytes] = []
+        self.texts: list[dict] = []
+
+    async def send_bytes(self, data: bytes) -> None:
+        if self.fail:
+            raise ConnectionResetError("gone")
+        self.frames.append(data)
+
+    async def send_str(self, data: str) -> None:
+        self.texts.append(json.loads(data))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mirror(monkeypatch):
+    stopped: list[_TmuxMirror] = []
+    m = _TmuxMirror("sess", "@1", on_close=stopped.append)
+
+    async def _noop(self) -> None:
+        return None
+
+    async def _fake_stop(self) -> None:
+        self.closed = True
+        self._on_close(self)
+
+    monkeypatch.setattr(_TmuxMirror, "_refresh_client", _noop)
+    monkeypatch.setattr(_TmuxMirror, "_stop", _fake_stop)
+    m.stopped = stopped  # type: ignore[attr-defined]
+    return m
+
+
+class TestTmuxMirror:
+    async def test_first_viewer_controls_and_roles_are_announced(self, mirror):
+        a, b = _FakeWS(), _FakeWS()
+        await mirror.add_viewer(a)
+        await mirror.add_viewer(b)
+        assert mirror.is_controller(a)
+        assert not mirror.is_controller(b)
+        assert a.texts[-1] == {"type": "role", "controller": True, "viewers": 2}
+        assert b.texts[-1] == {"type": "role", "controller": False, "viewers": 2}
+
+    async def test_control_passes_on_when_controller_leaves(self, mirror):
+        a, b = _FakeWS(), _FakeWS()
+        await mirror.add_viewer(a)
+        await mirror.add_viewer(b)
+        await mirror.remove_viewer(a)
+        assert mirror.is_controller(b)
+        assert b.texts[-1]["controller"] is True
+        assert not mirror.closed
+
+    async def test_broadcast_fans_out_and_drops_broken_viewer(self, mirror):
+        a, b = _FakeWS(), _FakeWS(fail=True)
+        await mirror.add_viewer(a)
+        await mirror.add_viewer(b)
+        await mirror._broadcast(b"frame")
+        await asyncio.sleep(0)
+        assert a.frames == [b"frame"]
+        assert b.closed and not a.closed
+        await asyncio.sleep(0)  # done callbacks run one loop turn later
+        assert not mirror._closing  # close task was held, then released
+
+    async def test_join_repaints_outside_mirror_lock(self, mirror, monkeypatch):
+        share = ShareServer(port=0)
+        held: list[bool] = []
+
+        async def _start(self) -> bool:
+            return True
+
+        async def _refresh(self) -> None:
+            held.append(share._tmux_mirror_lock.locked())
+
+        monkeypatch.setattr(_TmuxMirror, "start", _start)
+        monkeypatch.setattr(_TmuxMirror, "_refresh_client", _refresh)
+        a = _FakeWS()
+        joined = await share._join_tmux_mirror("sess", "@1", a)  # type: ignore[arg-type]
+        assert joined is not None and joined.is_controller(a)
+        assert held == [False]
+
+    async def test_last_viewer_leaving_stops_mirror(self, mirror):
+        a = _FakeWS()
+        await mirror.add_viewer(a)
+        await mirror.remove_viewer(a)
+        assert mirror.closed
+        assert mirror.stopped == [mirror]
+
+
+_FAKE_CODE_SERVER = """#!{python}
+import socket, sys, time
+time.sleep({delay})
+addr = sys.argv[sys.argv.index("--bind-addr") + 1]
+host, port = addr.rsplit(":", 1)
+s = socket.socket()
+s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+s.bind((host, int(port)))
+s.listen()
+with open({log!r}, "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+while True:
+    conn, _ = s.accept()
+    conn.close()
+"""
+
+
+@pytest.fixture
+def fake_code_server(tmp_path, monkeypatch):
+    log = tmp_path / "spawns.log"
+    script = tmp_path / "code-server"
+    script.write_text(
+        _FAKE_CODE_SERVER.format(python=sys.executable, delay=1.0, log=str(log))
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr(
+        CodeServerManager, "_find_code_server_bin", lambda self: str(script)
+    )
+    # Keep clear of a real code-server that may be running on the host
+    monkeypatch.setattr(CodeServerManager, "_BASE_PORT", 23370)
+    return log
+
+
+class TestCodeServerManager:
+    async def test_different_directories_start_concurrently(self, fake_code_server, tmp_path):
+        mgr = CodeServerManager()
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        try:
+            t0 = time.monotonic()
+            ports = await asyncio.gather(
+                mgr.get_or_start(tmp_path / "a"), mgr.get_or_start(tmp_path / "b")
+            )
+            elapsed = time.monotonic() - t0
+            assert len(set(ports)) == 2
+            # Two serial cold starts would take at least 2s
+            assert elapsed < 1.8
+            # Same directory reuses the running instance
+            assert await mgr.get_or_start(tmp_path / "a") == ports[0]
+        finally:
+            await mgr.stop_all()
+
+    async def test_warm_instance_is_adopted(self, fake_code_server, tmp_path):
+        mgr = CodeServerManager(warm_pool_size=1)
+        mgr._install_checked = True
+        try:
+            mgr.start_warm_pool()
+            for _ in range(100):
+                if mgr._warm:
+                    break
+                await asyncio.sleep(0.05)
+            warm_port = mgr._warm[0][0]
+
+            t0 = time.monotonic()
+            port = await mgr.get_or_start(tmp_path)
+            assert port == warm_port
+            assert time.monotonic() - t0 < 0.2
+
+            # Pool is replenished in the background
+            for _ in range(100):
+                if mgr._warm:
+                    break
+                await asyncio.sleep(0.05)
+            assert mgr._warm and mgr._warm[0][0] != port
+            spawned = fake_code_server.read_text().splitlines()
+            assert all(str(tmp_path) not in line for line in spawned)
+        finally:
+            await mgr.stop_all()
+
+    async def test_cancelled_start_kills_process(
+        self, fake_code_server, tmp_path, monkeypatch
+    ):
+        mgr = CodeServerManager()
+        started: list[asyncio.subprocess.Process] = []
+        real_wait_ready = CodeServerManager._wait_ready
+
+        async def wait_ready(self, port, proc, timeout=30.0):
+            started.append(proc)
+            await real_wait_ready(self, port, proc, timeout)
+
+        monkeypatch.setattr(CodeServerManager, "_wait_ready", wait_ready)
+        task = asyncio.create_task(mgr.get_or_start(tmp_path))
+        for _ in range(100):
+            if started:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert started[0].returncode is not None
+        assert not mgr._instances and not mgr._starting_ports
+
+
+class TestHttpCaching:
+    async def _serve(self, tmp_path):
+        ws = tmp_path / "workspace_demo"
+        ws.mkdir()
+        (ws / "report.txt").write_text("hello " * 500)
+        share = ShareServer(port=0, workspace_roots=[ws])
+        front = TestServer(share._app)
+        await front.start_server()
+        return ws.resolve(), share, front
+
+    async def test_directory_listing_revalidates_with_etag(self, share_secret, tmp_path):
+        ws, share, front = await self._serve(tmp_path)
+        token = generate_token(f"p:{ws}:", secret=share_secret)
+        try:
+            async with ClientSession() as client:
+                async with client.get(
+                    front.make_url(f"/p/{token}/"), headers={"Accept-Encoding": "gzip"}
+                ) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["Content-Encoding"] == "gzip"
+                    assert resp.headers["Cache-Control"] == "private, no-cache"
+                    etag = resp.headers["ETag"]
+                    assert "report.txt" in await resp.text()
+
+                async with client.get(
+                    front.make_url(f"/p/{token}/"), headers={"If-None-Match": etag}
+                ) as resp:
+                    assert resp.status == 304
+
+                # Directory content changes -> new ETag, full response
+                (ws / "new.txt").write_text("x")
+                async with client.get(
+                    front.make_url(f"/p/{token}/"), headers={"If-None-Match": etag}
+                ) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["ETag"] != etag
+        finally:
+            await share.stop()
+            await front.close()
+
+    async def test_file_token_is_immutable_and_supports_ranges(self, share_secret, tmp_path):
+        ws, share, front = await self._serve(tmp_path)
+        token = generate_token(f"f:{ws}:report.txt", ttl=600, secret=share_secret)
+        url = front.make_url(f"/f/{token}/report.txt")
+        try:
+            async with ClientSession() as client:
+                async with client.get(url) as resp:
+                    assert resp.status == 200
+                    cc = resp.headers["Cache-Control"]
+                    assert cc.startswith("private, max-age=") and cc.endswith("immutable")
+                    assert 590 <= int(cc.split("max-age=")[1].split(",")[0]) <= 600
+                    etag = resp.headers["ETag"]
+                    last_modified = resp.headers["Last-Modified"]
+
+                async with client.get(url, headers={"If-None-Match": etag}) as resp:
+                    assert resp.status == 304
+                async with client.get(
+                    url, headers={"If-Modified-Since": last_modified}
+                ) as resp:
+                    assert resp.status == 304
+                async with client.get(url, headers={"Range": "bytes=0-4"}) as resp:
+                    assert resp.status == 206
+                    assert await resp.read() == b"hello"
+        finally:
+            await share.stop()
+            await front.close()
+
+
+class TestPageCache:
+    async def test_renders_once_per_key(self):
+        cache = _PageCache(maxsize=2)
+        calls: list[tuple[str, bool]] = []
+
+        def render(text: str):
+            def _r() -> str:
+                on_loop_thread = threading.current_thread() is threading.main_thread()
+                calls.append((text, on_loop_thread))
+                return text * 2000
+            return _r
+
+        first = await cache.get(("a",), render("a"))
+        assert await cache.get(("a",), render("a")) is first
+        assert calls == [("a", False)]
+        assert first.gzip is not None and len(first.gzip) < len(first.body)
+
+        await cache.get(("b",), render("b"))
+        await cache.get(("c",), render("c"))  # evicts "a"
+        await cache.get(("a",), render("a"))
+        assert [text for text, _ in calls] == ["a", "b", "c", "a"]
+
+    def test_small_pages_are_not_compressed(self):
+        page = _render_page("<p>tiny</p>")
+        assert page.gzip is None and page.br is None
+        assert page.etag.startswith('"') and page.etag.endswith('"')
+
+
+class TestMetricsEndpoint:
+    async def test_requires_token(self, share_secret, tmp_path, monkeypatch):
+        from baobaobot.metrics import registry
+
+        monkeypatch.setenv("METRICS_TOKEN", "scrape-me")
+        registry.counter("baobaobot_test_hits_total", "test").inc()
+        share = ShareServer(port=0, workspace_roots=[tmp_path])
+        front = TestServer(share._app)
+        await front.start_server()
+        token = generate_token("metrics", ttl=60, secret=share_secret)
+        try:
+            async with ClientSession() as client:
+                async with client.get(front.make_url("/metrics")) as resp:
+                    assert resp.status == 401
+                async with client.get(
+                    front.make_url("/metrics"), params={"token": "bogus"}
+                ) as resp:
+                    assert resp.status == 401
+                async with client.get(
+                    front.make_url("/metrics"), params={"token": token}
+                ) as resp:
+                    assert resp.status == 200
+                    assert resp.headers["Content-Type"].startswith("text/plain")
+                    assert "baobaobot_test_hits_total" in await resp.text()
+                async with client.get(
+                    front.make_url("/metrics"),
+                    headers={"Authorization": "Bearer scrape-me"},
+                ) as resp:
+                    assert resp.status == 200
+        finally:
+            await share.stop()
+            await front.close()
+
+    async def test_loop_report(self, share_secret, tmp_path):
+        from baobaobot.loop_watchdog import LoopWatchdog
+
+        share = ShareServer(port=0, workspace_roots=[tmp_path])
+        front = TestServer(share._app)
+        await front.start_server()
+        token = generate_token("metrics", ttl=60, secret=share_secret)
+        url = front.make_url("/debug/loop")
+        watchdog = LoopWatchdog()
+        try:
+            async with ClientSession() as client:
+                async with client.get(url) as resp:
+                    assert resp.status == 401
+                async with client.get(url, params={"token": token}) as resp:
+                    assert resp.status == 404  # watchdog not running
+
+                await watchdog.start()
+                watchdog.record("baobaobot/session.py:1 in _save_state", 0.4, "stack\n")
+                async with client.get(url, params={"token": token}) as resp:
+                    assert resp.status == 200
+                    assert "_save_state" in await resp.text()
+                async with client.get(
+                    url, params={"token": token, "format": "json"}
+                ) as resp:
+                    data = await resp.json()
+                    assert data["sites"][0]["count"] == 1
+        finally:
+            await watchdog.stop()
+            await share.stop()
+            await front.close()
@@ -13,8 +13,6 @@ from baobaobot.settings import SchedulerConfig
 from baobaobot.system_scheduler import (
     SystemScheduler,
     _connect,
-    _get_meta,
-    _set_meta,
     _META_KEY_HEARTBEAT_CONTENT_HASH,
     _META_KEY_HEARTBEAT_ENABLED,
     _META_KEY_HEARTBEAT_LAST_TIME,
@@ -66,13 +64,15 @@ class TestGetHeartbeatState:
 
     def test_reads_written_values(self, scheduler: SystemScheduler, ws_dir: Path):
         """Values written to DB are read back correctly."""
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "0")
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "1700000000")
-        _set_meta(conn, _META_KEY_HEARTBEAT_LAST_TIME, "1699999000")
-        _set_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, "abc123")
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(
+            ws_dir,
+            {
+                _META_KEY_HEARTBEAT_ENABLED: "0",
+                _META_KEY_HEARTBEAT_NEXT_RUN: "1700000000",
+                _META_KEY_HEARTBEAT_LAST_TIME: "1699999000",
+                _META_KEY_HEARTBEAT_CONTENT_HASH: "abc123",
+            },
+        )
 
         state = scheduler._get_heartbeat_state(ws_dir)
         assert state["enabled"] == "0"
@@ -82,10 +82,7 @@ class TestGetHeartbeatState:
 
     def test_partial_values(self, scheduler: SystemScheduler, ws_dir: Path):
         """Only some keys set — others get defaults."""
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "0")
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(ws_dir, {_META_KEY_HEARTBEAT_ENABLED: "0"})
 
         state = scheduler._get_heartbeat_state(ws_dir)
         assert state["enabled"] == "0"
@@ -110,10 +107,7 @@ class TestCheckSingleHeartbeat:
         self, scheduler: SystemScheduler, ws_dir: Path
     ):
         """Heartbeat disabled → skip, no tmux send."""
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_ENABLED, "0")
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(ws_dir, {_META_KEY_HEARTBEAT_ENABLED: "0"})
 
         scheduler._tmux_manager = MagicMock()
         scheduler._tmux_manager.send_keys = AsyncMock(return_value=True)
@@ -127,10 +121,9 @@ class TestCheckSingleHeartbeat:
     ):
         """next_run in the future → skip."""
         future = time.time() + 99999
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, str(future))
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(
+            ws_dir, {_META_KEY_HEARTBEAT_NEXT_RUN: str(future)}
+        )
 
         scheduler._tmux_manager = MagicMock()
         scheduler._tmux_manager.send_keys = AsyncMock(return_value=True)
@@ -152,9 +145,8 @@ class TestCheckSingleHeartbeat:
         scheduler._tmux_manager.send_keys.assert_not_called()
 
         # Verify next_run was rescheduled
-        conn = _connect(ws_dir)
-        next_run = float(_get_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0"))
-        conn.close()
+        meta = scheduler._meta_store.read(ws_dir)
+        next_run = float(meta.get(_META_KEY_HEARTBEAT_NEXT_RUN, "0"))
         assert next_run >= now + _CFG.heartbeat_interval - 1
 
     @pytest.mark.asyncio
@@ -200,12 +192,14 @@ class TestCheckSingleHeartbeat:
         content_hash = scheduler._compute_content_hash("- Track deployment status")
         now = time.time()
 
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, content_hash)
-        _set_meta(conn, _META_KEY_HEARTBEAT_LAST_TIME, str(now - 600))  # 10 min ago
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0")  # due
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(
+            ws_dir,
+            {
+                _META_KEY_HEARTBEAT_CONTENT_HASH: content_hash,
+                _META_KEY_HEARTBEAT_LAST_TIME: str(now - 600),  # 10 min ago
+                _META_KEY_HEARTBEAT_NEXT_RUN: "0",  # due
+            },
+        )
 
         scheduler._tmux_manager = MagicMock()
         scheduler._tmux_manager.send_keys = AsyncMock(return_value=True)
@@ -222,12 +216,14 @@ class TestCheckSingleHeartbeat:
         hb_file.write_text("- New item to track\n", encoding="utf-8")
 
         now = time.time()
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, "old_hash")
-        _set_meta(conn, _META_KEY_HEARTBEAT_LAST_TIME, str(now - 600))
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0")
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(
+            ws_dir,
+            {
+                _META_KEY_HEARTBEAT_CONTENT_HASH: "old_hash",
+                _META_KEY_HEARTBEAT_LAST_TIME: str(now - 600),
+                _META_KEY_HEARTBEAT_NEXT_RUN: "0",
+            },
+        )
 
         scheduler._tmux_manager = MagicMock()
         scheduler._tmux_manager.send_keys = AsyncMock(return_value=True)
@@ -253,15 +249,15 @@ class TestCheckSingleHeartbeat:
         content_hash = scheduler._compute_content_hash("- Track deployment status")
         now = time.time()
 
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_CONTENT_HASH, content_hash)
-        _set_meta(
-            conn, _META_KEY_HEARTBEAT_LAST_TIME,
-            str(now - _CFG.heartbeat_dedup - 100),  # > 2h ago
+        scheduler._meta_store.write(
+            ws_dir,
+            {
+                _META_KEY_HEARTBEAT_CONTENT_HASH: content_hash,
+                # > 2h ago
+                _META_KEY_HEARTBEAT_LAST_TIME: str(now - _CFG.heartbeat_dedup - 100),
+                _META_KEY_HEARTBEAT_NEXT_RUN: "0",
+            },
         )
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0")
-        conn.commit()
-        conn.close()
 
         scheduler._tmux_manager = MagicMock()
         scheduler._tmux_manager.send_keys = AsyncMock(return_value=True)
@@ -281,10 +277,7 @@ class TestCheckSingleHeartbeat:
         hb_file.write_text("- Active item\n", encoding="utf-8")
 
         now = time.time()
-        conn = _connect(ws_dir)
-        _set_meta(conn, _META_KEY_HEARTBEAT_NEXT_RUN, "0")
-        conn.commit()
-        conn.close()
+        scheduler._meta_store.write(ws_dir, {_META_KEY_HEARTBEAT_NEXT_RUN: "0"})
 
         # Session had interaction 1 minute ago (< 5 min idle threshold)
         scheduler._session_manager.get_last_interaction_time.return_value = now - 60
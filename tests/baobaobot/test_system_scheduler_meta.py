@@ -0,0 +1,308 @@
+"""Tests for SystemScheduler's meta store and summary transcript digest."""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import baobaobot.system_scheduler as sched_mod
+from baobaobot.settings import SchedulerConfig
+from baobaobot.system_scheduler import (
+    SystemScheduler,
+    _connect,
+    _build_transcript_digest,
+    _META_KEY_HEARTBEAT_NEXT_RUN,
+    _META_KEY_LAST_SUMMARY_JSONL,
+    _META_KEY_LAST_SUMMARY_OFFSET,
+    _META_KEY_NEXT_SUMMARY_RUN,
+    _MetaStore,
+)
+
+
+def _read_meta(ws_dir: Path) -> dict[str, str]:
+    """Read the scheduler keys through a fresh store (no shared snapshot)."""
+    store = _MetaStore()
+    try:
+        return store.read(ws_dir)
+    finally:
+        store.close()
+
+
+def _write_meta(ws_dir: Path, values: dict[str, str]) -> None:
+    store = _MetaStore()
+    try:
+        store.write(ws_dir, values)
+    finally:
+        store.close()
+
+
+@pytest.fixture
+def ws_dirs(tmp_path: Path) -> list[Path]:
+    dirs = []
+    for i in range(60):
+        ws = tmp_path / f"workspace_ws{i}"
+        ws.mkdir()
+        dirs.append(ws)
+    return dirs
+
+
+def _make_scheduler(ws_dirs: list[Path]) -> SystemScheduler:
+    session_mgr = MagicMock()
+    session_mgr.get_last_interaction_time.return_value = None
+    session_mgr.iter_thread_bindings.return_value = iter(())
+    session_mgr.window_display_names = {}
+    return SystemScheduler(
+        session_manager=session_mgr,
+        tmux_manager=MagicMock(),
+        agent_name="test",
+        timezone="UTC",
+        iter_workspace_dirs=lambda: list(ws_dirs),
+        on_notify=AsyncMock(),
+        scheduler_config=SchedulerConfig(
+            heartbeat_active_start="00:00", heartbeat_active_end="23:59"
+        ),
+    )
+
+
+class TestTickCost:
+    async def test_one_connection_and_one_read_per_workspace(
+        self, ws_dirs, monkeypatch
+    ):
+        connects: list[Path] = []
+        loads: list[Path] = []
+        real_connect = sched_mod._connect
+        real_load = _MetaStore._load
+
+        def counting_connect(ws_dir):
+            connects.append(ws_dir)
+            return real_connect(ws_dir)
+
+        def counting_load(self, ws_dir):
+            loads.append(ws_dir)
+            return real_load(self, ws_dir)
+
+        monkeypatch.setattr(sched_mod, "_connect", counting_connect)
+        monkeypatch.setattr(_MetaStore, "_load", counting_load)
+
+        scheduler = _make_scheduler(ws_dirs)
+        await scheduler._check_all_workspaces()
+        await scheduler._check_all_workspaces()
+
+        assert len(connects) == len(ws_dirs)
+        assert len(loads) == 2 * len(ws_dirs)
+        await scheduler.stop()
+
+
+class TestMetaStore:
+    def test_write_through_and_wal(self, tmp_path: Path):
+        store = _MetaStore()
+        store.begin_tick([tmp_path])
+        assert store.read(tmp_path) == {}
+        store.write(tmp_path, {_META_KEY_NEXT_SUMMARY_RUN: "42"})
+        assert store.read(tmp_path)[_META_KEY_NEXT_SUMMARY_RUN] == "42"
+        store.end_tick()
+
+        conn = _connect(tmp_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+        store.close()
+        assert _read_meta(tmp_path)[_META_KEY_NEXT_SUMMARY_RUN] == "42"
+
+    def test_external_writes_visible_outside_tick(self, tmp_path: Path):
+        store = _MetaStore()
+        assert store.read(tmp_path) == {}
+
+        _write_meta(tmp_path, {_META_KEY_HEARTBEAT_NEXT_RUN: "7"})
+
+        assert store.read(tmp_path) == {_META_KEY_HEARTBEAT_NEXT_RUN: "7"}
+        store.close()
+
+    def test_stale_workspace_connection_dropped(self, tmp_path: Path):
+        a, b = tmp_path / "a", tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        store = _MetaStore()
+        store.read(a)
+        store.read(b)
+        store.begin_tick([a])
+        assert set(store._conns) == {a}
+        store.end_tick()
+        store.close()
+
+    def test_open_todo_ids_without_db(self, tmp_path: Path):
+        store = _MetaStore()
+        assert store.open_todo_ids(tmp_path) == []
+        assert not (tmp_path / "memory.db").exists()
+
+
+class TestTranscriptDigest:
+    @pytest.fixture
+    def transcript(
+        self,
+        tmp_path,
+        make_jsonl_entry,
+        make_text_block,
+        make_tool_use_block,
+        make_tool_result_block,
+        make_thinking_block,
+    ):
+        def write(path: Path, entries: list[dict]) -> int:
+            with path.open("a", encoding="utf-8") as f:
+                for e in entries:
+                    f.write(json.dumps(e) + "\n")
+            return path.stat().st_size
+
+        path = tmp_path / "session.jsonl"
+        old = write(
+            path,
+            [
+                make_jsonl_entry("user", "summarized already"),
+                make_jsonl_entry("assistant", [make_text_block("old answer")]),
+            ],
+        )
+        write(
+            path,
+            [
+                make_jsonl_entry(
+                    "user", "plan the trip", timestamp="2026-03-01T05:30:00.000Z"
+                ),
+                make_jsonl_entry(
+                    "assistant",
+                    [
+                        make_thinking_block("secret reasoning"),
+                        make_tool_use_block("t1", "Bash", {"command": "ls"}),
+                    ],
+                ),
+                make_jsonl_entry(
+                    "user", [make_tool_result_block("t1", "x" * 10_000)]
+                ),
+                make_jsonl_entry(
+                    "assistant", [make_text_block("Itinerary: Kyoto day 1")]
+                ),
+            ],
+        )
+        return path, old
+
+    def test_digest_from_offset(self, transcript):
+        path, offset = transcript
+        digest, end = _build_transcript_digest(path, offset)
+
+        assert end == path.stat().st_size
+        assert "summarized already" not in digest
+        assert "secret reasoning" not in digest
+        assert "[2026-03-01T05:30:00.000Z] user: plan the trip" in digest
+        assert "assistant: Itinerary: Kyoto day 1" in digest
+        assert "tool: **Bash**(ls)" in digest
+        assert digest.count("**Bash**(ls)") == 1
+        assert len(digest) < 1000  # tool output truncated
+
+    def test_offset_mid_line_and_past_eof(self, transcript):
+        path, offset = transcript
+        assert "plan the trip" not in _build_transcript_digest(path, offset + 5)[0]
+        assert "summarized already" in _build_transcript_digest(path, 10**9)[0]
+
+    def test_partial_trailing_line_not_consumed(self, transcript):
+        path, _ = transcript
+        size = path.stat().st_size
+        with path.open("a") as f:
+            f.write('{"type": "user", "mess')
+        digest, end = _build_transcript_digest(path, 0)
+        assert end == size
+        assert "Itinerary" in digest
+
+    def test_size_cap_keeps_newest(self, tmp_path, monkeypatch, make_jsonl_entry):
+        monkeypatch.setattr(sched_mod, "_DIGEST_MAX_BYTES", 300)
+        path = tmp_path / "s.jsonl"
+        path.write_text(
+            "".join(
+                json.dumps(make_jsonl_entry("user", f"message {i:03d}")) + "\n"
+                for i in range(50)
+            )
+        )
+        digest, _ = _build_transcript_digest(path, 0)
+        assert digest.startswith("[… ")
+        assert "message 049" in digest
+        assert "message 000" not in digest
+
+    async def test_run_summary_passes_digest(self, transcript, tmp_path):
+        path, offset = transcript
+        ws = tmp_path / "workspace_ws"
+        ws.mkdir()
+        _write_meta(
+            ws,
+            {
+                _META_KEY_LAST_SUMMARY_JSONL: str(path),
+                _META_KEY_LAST_SUMMARY_OFFSET: str(offset),
+            },
+        )
+
+        scheduler = _make_scheduler([ws])
+        scheduler._run_headless = AsyncMock(return_value="[SILENT]")
+        assert await scheduler._run_summary("ws", ws, "@1", path)
+
+        prompt = scheduler._run_headless.await_args.args[0]
+        assert "plan the trip" in prompt
+        assert "summarized already" not in prompt
+        assert f"byte offset {offset}" in prompt
+
+    async def test_lines_appended_during_run_are_kept(
+        self, transcript, tmp_path, make_jsonl_entry
+    ):
+        path, _ = transcript
+        ws = tmp_path / "workspace_ws"
+        ws.mkdir()
+        digested = path.stat().st_size
+
+        async def late_headless(prompt, **kwargs):
+            # The agent keeps talking while the summary waits for / holds a slot
+            with path.open("a") as f:
+                f.write(json.dumps(make_jsonl_entry("user", "arrived late")) + "\n")
+            return "[SILENT]"
+
+        scheduler = _make_scheduler([ws])
+        scheduler._run_headless = late_headless
+        assert await scheduler._run_summary("ws", ws, "@1", path)
+
+        assert int(_read_meta(ws)[_META_KEY_LAST_SUMMARY_OFFSET]) == digested
+        assert scheduler._has_new_content(ws, path)
+
+        scheduler._run_headless = AsyncMock(return_value="[SILENT]")
+        assert await scheduler._run_summary("ws", ws, "@1", path)
+        prompt = scheduler._run_headless.await_args.args[0]
+        assert "arrived late" in prompt
+        assert "plan the trip" not in prompt
+
+    async def test_gemini_chat_file_uses_raw_path(self, tmp_path):
+        from baobaobot.backends.gemini import GeminiBackend
+
+        chat = tmp_path / "session-2026-03-01.json"
+        chat.write_text(
+            json.dumps(
+                {
+                    "sessionId": "g1",
+                    "messages": [
+                        {"id": "m1", "type": "user", "content": "plan the trip",
+                         "timestamp": "2026-03-01T05:30:00.000Z"},
+                        {"id": "m2", "type": "gemini", "content": "Kyoto day 1",
+                         "timestamp": "2026-03-01T05:31:00.000Z"},
+                    ],
+                },
+                indent=2,
+            )
+        )
+        ws = tmp_path / "workspace_ws"
+        ws.mkdir()
+
+        scheduler = _make_scheduler([ws])
+        scheduler._backend = GeminiBackend()
+        scheduler._run_headless = AsyncMock(return_value="[SILENT]")
+        assert await scheduler._run_summary("ws", ws, "@1", chat)
+
+        # The CLI still runs and is pointed at the whole chat file
+        prompt = scheduler._run_headless.await_args.args[0]
+        assert f"Read the transcript at `{chat}`" in prompt
+        assert "<transcript>" not in prompt
+        assert "byte offset" not in prompt
+        offset = int(_read_meta(ws)[_META_KEY_LAST_SUMMARY_OFFSET])
+        assert offset == chat.stat().st_size
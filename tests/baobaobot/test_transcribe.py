@@ -145,3 +145,122 @@ def test_load_failed_prevents_retry() -> None:
 
     mod._load_failed = True
     assert mod._get_model() is None
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+
+async def test_worker_runs_one_at_a_time_and_reports_position() -> None:
+    """Jobs run serially on the worker thread; positions count jobs ahead."""
+    import asyncio
+    import threading
+
+    import baobaobot.transcribe as mod
+
+    gate = threading.Event()
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_sync(path: Path, whisper_model: str = "small") -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        gate.wait(5)
+        with lock:
+            running -= 1
+        return path.stem
+
+    with patch.object(mod, "_transcribe_sync", side_effect=fake_sync):
+        jobs = [mod.submit_transcription(Path(f"/tmp/v{i}.ogg")) for i in range(3)]
+        assert [j.position for j in jobs] == [0, 1, 2]
+        gate.set()
+        results = await asyncio.wait_for(
+            asyncio.gather(*(j.wait() for j in jobs)), 5
+        )
+
+    assert results == ["v0", "v1", "v2"]
+    assert peak == 1
+
+
+async def test_queue_full_returns_none() -> None:
+    """Submissions beyond the queue bound are rejected."""
+    import asyncio
+    import threading
+
+    import baobaobot.transcribe as mod
+
+    gate = threading.Event()
+    worker = mod._TranscriptionWorker(max_pending=1)
+
+    def fake_sync(path: Path, whisper_model: str = "small") -> str:
+        gate.wait(5)
+        return "ok"
+
+    with (
+        patch.object(mod, "_worker", worker),
+        patch.object(mod, "_transcribe_sync", side_effect=fake_sync),
+    ):
+        first = mod.submit_transcription(Path("/tmp/a.ogg"))
+        # Wait until the worker has taken the first job off the queue
+        for _ in range(100):
+            if worker.depth == 1 and not worker._pending:
+                break
+            await asyncio.sleep(0.01)
+        second = mod.submit_transcription(Path("/tmp/b.ogg"))
+        assert mod.submit_transcription(Path("/tmp/c.ogg")) is None
+        assert await mod.transcribe_voice(Path("/tmp/d.ogg")) is None
+        gate.set()
+        assert await asyncio.wait_for(first.wait(), 5) == "ok"
+        assert await asyncio.wait_for(second.wait(), 5) == "ok"
+
+
+async def test_partial_segments_streamed() -> None:
+    """on_partial receives the accumulated text on the event loop."""
+    import asyncio
+
+    import baobaobot.transcribe as mod
+
+    fake_model = MagicMock()
+    segments = [_make_segment("Hello "), _make_segment("there "), _make_segment("world")]
+    fake_model.transcribe.return_value = (iter(segments), MagicMock())
+    loop_thread: list[bool] = []
+    partials: list[str] = []
+
+    def on_partial(text: str) -> None:
+        loop_thread.append(asyncio.get_running_loop() is not None)
+        partials.append(text)
+
+    with patch.object(mod, "_get_model", return_value=fake_model):
+        job = mod.submit_transcription(Path("/tmp/v.ogg"), on_partial=on_partial)
+        result = await asyncio.wait_for(job.wait(), 5)
+
+    assert result == "Hello there world"
+    assert partials == ["Hello", "Hello there", "Hello there world"]
+    assert all(loop_thread)
+
+
+async def test_preload_loads_on_worker() -> None:
+    """preload_model() loads the model off the event loop thread."""
+    import asyncio
+    import threading
+
+    import baobaobot.transcribe as mod
+
+    loaded_on: list[str] = []
+
+    def fake_get_model(whisper_model: str = "small") -> object:
+        loaded_on.append(threading.current_thread().name)
+        return MagicMock()
+
+    with patch.object(mod, "_get_model", side_effect=fake_get_model):
+        mod.preload_model("tiny")
+        for _ in range(100):
+            if loaded_on:
+                break
+            await asyncio.sleep(0.01)
+
+    assert loaded_on == ["whisper-worker"]
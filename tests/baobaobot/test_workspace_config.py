@@ -1,11 +1,17 @@
 """Tests for workspace_config module."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
+from baobaobot import workspace_config
 from baobaobot.workspace_config import (
+    WorkspaceConfig,
     ensure_defaults,
     get_agent_type,
     get_verbosity,
+    invalidate,
+    load,
     set_agent_type,
     set_verbosity,
     _read_toml,
@@ -94,3 +100,53 @@ class TestWorkspaceConfig:
         # Existing agent_type preserved, new user gets default
         assert get_agent_type(tmp_path) == "claude"
         assert get_verbosity(tmp_path, 456) == "normal"
+
+
+class TestWorkspaceConfigCache:
+    def setup_method(self):
+        invalidate()
+
+    def test_parses_once(self, tmp_path: Path):
+        set_verbosity(tmp_path, 123, "quiet")
+        invalidate(tmp_path)
+        with patch.object(
+            workspace_config, "_read_toml", wraps=workspace_config._read_toml
+        ) as read:
+            for _ in range(5):
+                assert get_verbosity(tmp_path, 123) == "quiet"
+                assert get_agent_type(tmp_path) == ""
+        assert read.call_count == 1
+
+    def test_no_io_within_stat_interval(self, tmp_path: Path):
+        set_agent_type(tmp_path, "gemini")
+        with patch.object(workspace_config, "_mtime_ns") as stat:
+            assert get_agent_type(tmp_path) == "gemini"
+        stat.assert_not_called()
+
+    def test_internal_write_refreshes(self, tmp_path: Path):
+        set_verbosity(tmp_path, 123, "quiet")
+        assert get_verbosity(tmp_path, 123) == "quiet"
+        set_verbosity(tmp_path, 123, "verbose")
+        assert get_verbosity(tmp_path, 123) == "verbose"
+
+    def test_external_edit_detected_by_mtime(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(workspace_config, "_STAT_INTERVAL", 0.0)
+        set_agent_type(tmp_path, "claude")
+        assert get_agent_type(tmp_path) == "claude"
+        path = tmp_path / "workspace.toml"
+        path.write_text('[workspace]\nagent_type = "gemini"\n')
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert get_agent_type(tmp_path) == "gemini"
+        path.unlink()
+        assert get_agent_type(tmp_path) == ""
+
+    def test_load_typed(self, tmp_path: Path):
+        set_agent_type(tmp_path, "gemini")
+        set_verbosity(tmp_path, 7, "quiet")
+        invalidate(tmp_path)
+        config = load(tmp_path)
+        assert isinstance(config, WorkspaceConfig)
+        assert config.agent_type == "gemini"
+        assert config.verbosity_for(7) == "quiet"
+        assert config.verbosity_for(8) == ""